@@ -0,0 +1,88 @@
+# Copyright (c) 2021-2022 Johnathan P. Irvin
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+Compares translating AW_EVENT_AVATAR_ADD through the per-call switcher
+dispatch get_data used to do against the precompiled reader table.
+
+    python -m benchmarks.bench_attributes
+"""
+from timeit import repeat
+
+import korth_spirit.sdk.get_data as get_data_module
+from korth_spirit.events.translations import TRANSLATIONS
+from korth_spirit.sdk import (SDK, EventEnum, aw_bool, aw_data, aw_float,
+                              aw_int, aw_string)
+from korth_spirit.sdk.enums import ATTRIBUTE_TYPES
+
+from .stub import StubLibrary
+
+NUMBER = 20_000
+
+
+# The dispatch get_data used before the reader table.
+def switcher_get_data(attribute, aw_type=None):
+    aw_type = ATTRIBUTE_TYPES[attribute]
+
+    args = []
+    if type(aw_type) == tuple:
+        aw_type, *args = aw_type
+
+    switcher = {
+        int: aw_int,
+        str: aw_string,
+        bool: aw_bool,
+        float: aw_float,
+        bytes: aw_data
+    }
+
+    return switcher[aw_type](attribute, *args)
+
+def time_translation(get_data: callable) -> float:
+    """
+    Times reading every attribute of an avatar add event with a given get_data.
+
+    Args:
+        get_data (callable): The get_data implementation to time.
+
+    Returns:
+        float: The best time per event in microseconds.
+    """
+    translations = TRANSLATIONS[EventEnum.AW_EVENT_AVATAR_ADD]
+
+    return min(repeat(
+        lambda: [get_data(attribute, data_type) for data_type, attribute in translations],
+        number=NUMBER,
+        repeat=5
+    )) / NUMBER * 1e6
+
+def main() -> None:
+    SDK.use(StubLibrary())
+
+    before = time_translation(switcher_get_data)
+    after = time_translation(get_data_module.get_data)
+
+    print("AW_EVENT_AVATAR_ADD translation")
+    print(f"  switcher dispatch: {before:8.2f}us")
+    print(f"  reader table:      {after:8.2f}us ({before / after:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+# Copyright (c) 2021-2022 Johnathan P. Irvin
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+Times publishing AW_EVENT_AVATAR_ADD when handlers read every attribute
+(what every event used to cost), a single attribute, or when nobody
+subscribed.
+
+    python -m benchmarks.bench_events
+"""
+from timeit import repeat
+
+from korth_spirit.events import EventBus
+from korth_spirit.sdk import SDK, EventEnum
+
+from .stub import StubLibrary
+
+NUMBER = 20_000
+EVENT = EventEnum.AW_EVENT_AVATAR_ADD
+
+def time_publish(bus: EventBus) -> float:
+    """
+    Times publishing an avatar add event on a bus.
+
+    Args:
+        bus (EventBus): The bus.
+
+    Returns:
+        float: The best time per event in microseconds.
+    """
+    return min(repeat(lambda: bus.publish(EVENT), number=NUMBER, repeat=5)) / NUMBER * 1e6
+
+def main() -> None:
+    SDK.use(StubLibrary())
+
+    eager = EventBus().subscribe(EVENT, lambda event: event.snapshot())
+    lazy = EventBus().subscribe(EVENT, lambda event: event.avatar_name)
+    idle = EventBus()
+
+    print("AW_EVENT_AVATAR_ADD publish")
+    print(f"  every attribute: {time_publish(eager):8.2f}us")
+    print(f"  one attribute:   {time_publish(lazy):8.2f}us")
+    print(f"  no subscribers:  {time_publish(idle):8.2f}us")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,164 @@
+# Copyright (c) 2021-2022 Johnathan P. Irvin
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+Compares per-bus trampolines set with the global aw_event_set against the
+shared, instance-routed handlers, with 500 simulated instances.
+
+    python -m benchmarks.bench_routing
+"""
+import tracemalloc
+from time import perf_counter
+
+from korth_spirit.events import ROUTER, EventBus
+from korth_spirit.sdk import AW_CALLBACK, SDK, EventEnum, aw_event_set
+
+from .stub import StubLibrary
+
+INSTANCES = 500
+ROUNDS = 20
+EVENTS = (
+    EventEnum.AW_EVENT_AVATAR_ADD,
+    EventEnum.AW_EVENT_AVATAR_CHANGE,
+    EventEnum.AW_EVENT_AVATAR_DELETE,
+    EventEnum.AW_EVENT_CHAT,
+    EventEnum.AW_EVENT_CELL_OBJECT,
+)
+
+
+class InstanceStub(StubLibrary):
+    def __init__(self) -> None:
+        """
+        A stub library that keeps a current instance and its handlers,
+        like the SDK does for instances it created.
+        """
+        super().__init__()
+        self.current = None
+        self.handlers = {}
+
+        # Plain functions, as bound methods can not carry ctypes signatures.
+        def instance_set(instance: int) -> int:
+            self.current = instance
+            return 0
+
+        def event_set(event: int, handler) -> int:
+            self.handlers[None, event] = handler
+            return 0
+
+        def instance_event_set(event: int, handler) -> int:
+            self.handlers[self.current, event] = handler
+            return 0
+
+        self.aw_instance = lambda: self.current
+        self.aw_instance_set = instance_set
+        self.aw_event_set = event_set
+        self.aw_instance_event_set = instance_event_set
+
+    def fire(self, instance: int, event: int) -> None:
+        """
+        Delivers an event to an instance, falling back to the global handler.
+
+        Args:
+            instance (int): The receiving instance.
+            event (int): The event.
+        """
+        self.current = instance
+        handler = self.handlers.get((instance, event)) or self.handlers.get((None, event))
+        handler()
+
+
+def legacy_hook(bus: EventBus, event: EventEnum) -> None:
+    """
+    The hook buses used before routing: a trampoline per bus and event,
+    set globally so the last bus wins.
+    """
+    @AW_CALLBACK
+    def mini_pub() -> None:
+        bus.publish(event)
+
+    bus._legacy = getattr(bus, '_legacy', {})
+    bus._legacy[event] = mini_pub
+    aw_event_set(event, mini_pub)
+
+def measure(stub: InstanceStub, hook: callable, instances: range) -> dict:
+    """
+    Subscribes a bus per instance, then fires every event at every instance.
+
+    Args:
+        stub (InstanceStub): The stub library.
+        hook (callable): Subscribes a bus of an instance to an event.
+        instances (range): The instance handles.
+
+    Returns:
+        dict: The memory used by the hooks, the dispatch rate and the buses reached.
+    """
+    buses = []
+
+    tracemalloc.start()
+    for instance in instances:
+        bus = EventBus()
+        buses.append(bus)
+        for event in EVENTS:
+            hook(instance, bus, event)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    received = [0] * len(buses)
+    for index, bus in enumerate(buses):
+        for event in EVENTS:
+            bus.subscribe(
+                event, lambda e, index=index: received.__setitem__(index, received[index] + 1)
+            )
+
+    start = perf_counter()
+    for _ in range(ROUNDS):
+        for instance in instances:
+            for event in EVENTS:
+                stub.fire(instance, event.value)
+    elapsed = perf_counter() - start
+
+    return {
+        'memory': memory,
+        'rate': ROUNDS * len(instances) * len(EVENTS) / elapsed,
+        'reached': sum(1 for count in received if count),
+    }
+
+def main() -> None:
+    stub = InstanceStub()
+    SDK.use(stub)
+    instances = range(1, INSTANCES + 1)
+
+    legacy = measure(stub, lambda instance, bus, event: legacy_hook(bus, event), instances)
+
+    stub.handlers.clear()
+    def routed_hook(instance, bus, event):
+        if bus._instance is None:
+            bus.bind(instance)
+        bus._hook_aw_event(event)
+    routed = measure(stub, routed_hook, instances)
+
+    print(f"{INSTANCES} instances, {len(EVENTS)} events each")
+    print(f"  per-bus trampolines: {legacy['memory'] / 1024:8.1f}KiB, {legacy['rate']:9.0f} events/s, {legacy['reached']} buses reached")
+    print(f"  routed handlers:     {routed['memory'] / 1024:8.1f}KiB, {routed['rate']:9.0f} events/s, {routed['reached']} buses reached")
+    print(f"  shared handlers: {ROUTER.handlers}, routed instances: {ROUTER.instances}")
+
+
+if __name__ == '__main__':
+    main()
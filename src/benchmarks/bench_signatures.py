@@ -0,0 +1,92 @@
+# Copyright (c) 2021-2022 Johnathan P. Irvin
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+Compares the cost of an SDK call that sets its ctypes signature on every
+call, as the wrappers used to, against a call bound once at load.
+
+    python -m benchmarks.bench_signatures
+"""
+from ctypes import POINTER, byref, c_char, c_char_p, c_int, c_uint
+from timeit import repeat
+
+from korth_spirit.sdk.signatures import bind_signatures
+
+from .stub import StubLibrary
+
+NUMBER = 100_000
+
+
+def per_call_aw_string(sdk: StubLibrary) -> str:
+    sdk.aw_string.restype = c_char_p
+    return sdk.aw_string(1).decode('utf-8')
+
+def bound_aw_string(sdk: StubLibrary) -> str:
+    return sdk.aw_string(1).decode('utf-8')
+
+def per_call_aw_data(sdk: StubLibrary) -> None:
+    sdk.aw_data.restype = POINTER(c_char)
+    sdk.aw_data.argtypes = [c_int, POINTER(c_uint)]
+    length = c_uint()
+    return sdk.aw_data(1, byref(length))
+
+def bound_aw_data(sdk: StubLibrary) -> None:
+    length = c_uint()
+    return sdk.aw_data(1, byref(length))
+
+def per_call_aw_check_right(sdk: StubLibrary) -> bool:
+    sdk.aw_check_right.argtypes = [c_int, c_char_p]
+    sdk.aw_check_right.restype = c_int
+    return bool(sdk.aw_check_right(1, b'*'))
+
+def bound_aw_check_right(sdk: StubLibrary) -> bool:
+    return bool(sdk.aw_check_right(1, b'*'))
+
+CASES = {
+    'aw_string': (per_call_aw_string, bound_aw_string),
+    'aw_data': (per_call_aw_data, bound_aw_data),
+    'aw_check_right': (per_call_aw_check_right, bound_aw_check_right),
+}
+
+def time_per_call(function: callable, sdk: StubLibrary) -> float:
+    """
+    Times a function against the stub library.
+
+    Args:
+        function (callable): The function to time.
+        sdk (StubLibrary): The library to call into.
+
+    Returns:
+        float: The best time per call in nanoseconds.
+    """
+    return min(repeat(lambda: function(sdk), number=NUMBER, repeat=5)) / NUMBER * 1e9
+
+def main() -> None:
+    sdk = bind_signatures(StubLibrary())
+
+    print(f"{'function':<16}{'per call':>12}{'prebound':>12}{'saving':>12}")
+    for name, (per_call, bound) in CASES.items():
+        before = time_per_call(per_call, sdk)
+        after = time_per_call(bound, sdk)
+        print(f"{name:<16}{before:>10.0f}ns{after:>10.0f}ns{before - after:>10.0f}ns")
+
+
+if __name__ == '__main__':
+    main()
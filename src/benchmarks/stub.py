@@ -0,0 +1,88 @@
+# Copyright (c) 2021-2022 Johnathan P. Irvin
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+from ctypes import (CFUNCTYPE, addressof, create_string_buffer,
+                    create_unicode_buffer)
+
+from korth_spirit.sdk.signatures import SIGNATURES
+
+
+class StubLibrary:
+    def __init__(self, text: str = 'stub', data: int = 0) -> None:
+        """
+        Stands in for the SDK library when benchmarking.
+        Every known SDK function is a ctypes callback returning a constant,
+        so calls still cross the ctypes boundary like the real library.
+
+        Args:
+            text (str, optional): The value returned by string functions. Defaults to 'stub'.
+            data (int, optional): The length of the buffer returned by aw_data. Defaults to 0, none.
+        """
+        self._text = create_string_buffer(text.encode('utf-8'))
+        self._unicode = create_unicode_buffer(text)
+        self._data = create_string_buffer(data)
+
+        for name, (restype, argtypes) in SIGNATURES.items():
+            prototype = CFUNCTYPE(restype, *argtypes)
+            setattr(self, name, prototype(self._returns(restype)))
+
+        if data:
+            restype, argtypes = SIGNATURES['aw_data']
+            self.aw_data = CFUNCTYPE(restype, *argtypes)(self._aw_data)
+
+    def _aw_data(self, attribute: int, length: object) -> int:
+        """
+        Returns the data buffer, as aw_data does.
+
+        Args:
+            attribute (int): The attribute, which is ignored.
+            length (object): Pointer set to the length of the buffer.
+
+        Returns:
+            int: The address of the buffer.
+        """
+        length[0] = len(self._data)
+
+        return addressof(self._data)
+
+    def _returns(self, restype: type) -> callable:
+        """
+        Builds the python side of a stub function.
+
+        Args:
+            restype (type): The ctypes return type of the function.
+
+        Returns:
+            callable: A function ignoring its arguments and returning a constant.
+        """
+        name = getattr(restype, '__name__', None)
+
+        if name == 'c_char_p':
+            value = addressof(self._text)
+        elif name == 'c_wchar_p':
+            value = addressof(self._unicode)
+        elif name == 'c_float':
+            value = 0.0
+        elif name in (None, 'c_void_p'):
+            value = None
+        else:
+            value = 0
+
+        return lambda *args: value
@@ -0,0 +1,228 @@
+# Copyright (c) 2021-2022 Johnathan P. Irvin
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+Times the wrapper's hot paths against the stub SDK and saves the results
+as JSON, to compare across releases.
+
+    python -m benchmarks.suite [--output results.json] [--baseline old.json]
+"""
+import argparse
+import json
+import platform
+import sys
+from ctypes import c_int32
+from datetime import datetime, timezone
+from timeit import repeat
+from typing import Callable, Dict, List, Tuple
+
+from korth_spirit.data import ObjectCreateData
+from korth_spirit.events import EventBus
+from korth_spirit.events.event_types import EVENT_CLASSES
+from korth_spirit.events.translations import TRANSLATIONS
+from korth_spirit.query.objects import ObjectQuery
+from korth_spirit.sdk import (SDK, AttributeEnum, EventEnum, aw_data,
+                              aw_object_add)
+from korth_spirit.sdk.get_data import get_data
+from korth_spirit.sdk.write_data import write_data
+
+from .stub import StubLibrary
+
+REPEAT = 5
+# A 32 by 32 terrain node of c_int32 heights.
+TERRAIN_NODE = 32 * 32 * 4
+# An attribute of each type, with a value to write.
+ATTRIBUTES = {
+    'int': (AttributeEnum.AW_MY_X, 1000),
+    'str': (AttributeEnum.AW_CHAT_MESSAGE, 'hello'),
+    'bool': (AttributeEnum.AW_CELL_COMBINE, True),
+    'float': (AttributeEnum.AW_WORLD_BUOYANCY, 0.5),
+    'bytes': (AttributeEnum.AW_OBJECT_DATA, b'\0' * 64),
+}
+SUBSCRIBERS = (1, 10, 100)
+
+Case = Tuple[str, Callable[[], object], int]
+
+
+def largest_events(count: int = 3) -> List[EventEnum]:
+    """
+    Gets the event types with the most attributes.
+
+    Args:
+        count (int, optional): The number of event types. Defaults to 3.
+
+    Returns:
+        List[EventEnum]: The event types.
+    """
+    events = [event for event in TRANSLATIONS if event in EVENT_CLASSES]
+
+    return sorted(events, key=lambda event: -len(TRANSLATIONS[event]))[:count]
+
+def publish_bus(subscribers: int) -> EventBus:
+    """
+    Creates a bus with subscribers to AW_EVENT_AVATAR_CHANGE that each read one attribute.
+
+    Args:
+        subscribers (int): The number of subscribers.
+
+    Returns:
+        EventBus: The bus.
+    """
+    bus = EventBus()
+
+    for _ in range(subscribers):
+        bus.subscribe(EventEnum.AW_EVENT_AVATAR_CHANGE, lambda event: event.avatar_x)
+
+    return bus
+
+def receive_object(query: ObjectQuery) -> None:
+    """
+    Receives a cell object into a query, as its subscription would.
+
+    Args:
+        query (ObjectQuery): The query.
+    """
+    event = EVENT_CLASSES[EventEnum.AW_EVENT_CELL_OBJECT]()
+    query.on_receive_object(event)
+    event.close()
+
+def cases() -> List[Case]:
+    """
+    Gets the benchmark cases, each with a name, the code to time and how many calls a run makes.
+
+    Returns:
+        List[Case]: The cases.
+    """
+    found = []
+
+    for name, (attribute, value) in ATTRIBUTES.items():
+        found.append((f"get_data[{name}]", lambda attribute=attribute: get_data(attribute), 20_000))
+        found.append((f"write_data[{name}]", lambda attribute=attribute, value=value: write_data(attribute, value), 20_000))
+
+    for event in largest_events():
+        event_class = EVENT_CLASSES[event]
+        found.append((f"event[{event.name}]", event_class, 100_000))
+        found.append((f"event_snapshot[{event.name}]", lambda event_class=event_class: event_class().snapshot(), 5_000))
+
+    for subscribers in SUBSCRIBERS:
+        bus = publish_bus(subscribers)
+        found.append((f"publish[{subscribers}]", lambda bus=bus: bus.publish(EventEnum.AW_EVENT_AVATAR_CHANGE), 50_000 // subscribers))
+
+    query = ObjectQuery(None)
+    query.data = []
+    found.append(("object_query.on_receive_object", lambda: receive_object(query), 5_000))
+
+    found.append(("aw_data[terrain_node_bytes]", lambda: aw_data(AttributeEnum.AW_TERRAIN_NODE_HEIGHTS), 20_000))
+    found.append(("aw_data[terrain_node_int32]", lambda: aw_data(AttributeEnum.AW_TERRAIN_NODE_HEIGHTS, c_int32), 20_000))
+
+    create = ObjectCreateData(x=100, y=0, z=100, yaw=900, model='wall.rwx', description='sign', action='create sign')
+    found.append(("aw_object_add", lambda: aw_object_add(create), 5_000))
+
+    return found
+
+def run(scale: float = 1.0, only: str = None) -> Dict[str, dict]:
+    """
+    Runs the cases.
+
+    Args:
+        scale (float, optional): Scales the number of calls of each case. Defaults to 1.0.
+        only (str, optional): Runs only the cases with this in their name. Defaults to None.
+
+    Returns:
+        Dict[str, dict]: The best time per call in microseconds and the calls timed, by case.
+    """
+    SDK.use(StubLibrary(data=TERRAIN_NODE))
+    results = {}
+
+    for name, function, number in cases():
+        if only is not None and only not in name:
+            continue
+
+        number = max(1, int(number * scale))
+        best = min(repeat(function, number=number, repeat=REPEAT)) / number
+        results[name] = {'us': round(best * 1e6, 4), 'number': number}
+
+    return results
+
+def report(results: Dict[str, dict], baseline: Dict[str, dict] = None) -> None:
+    """
+    Prints the results, with the change from a baseline.
+
+    Args:
+        results (Dict[str, dict]): The results.
+        baseline (Dict[str, dict], optional): Earlier results. Defaults to None.
+    """
+    width = max(map(len, results))
+
+    for name, result in results.items():
+        line = f"  {name:<{width}} {result['us']:10.3f}us"
+        before = (baseline or {}).get(name)
+
+        if before:
+            line += f" ({result['us'] / before['us']:5.2f}x)"
+
+        print(line)
+
+def package_version() -> str:
+    """
+    Gets the installed version of the package.
+
+    Returns:
+        str: The version, or None when running from a checkout.
+    """
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version('korth-spirit')
+    except PackageNotFoundError:
+        return None
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.suite', description=__doc__.split('\n\n')[0])
+    parser.add_argument('--output', '-o', default='benchmark-results.json', help="The JSON file to write.")
+    parser.add_argument('--baseline', '-b', help="Earlier results to compare against.")
+    parser.add_argument('--scale', type=float, default=1.0, help="Scales the number of calls of each case.")
+    parser.add_argument('--only', help="Runs only the cases with this in their name.")
+    args = parser.parse_args(argv)
+
+    results = run(args.scale, args.only)
+    baseline = None
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)['results']
+
+    report(results, baseline)
+
+    with open(args.output, 'w') as file:
+        json.dump({
+            'version': package_version(),
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'time': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'results': results,
+        }, file, indent=2)
+
+    print(f"Saved {len(results)} results to {args.output}", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -18,17 +18,53 @@
 # LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
 # WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
-from atexit import register
+from importlib import import_module
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .instance import AsyncInstance, ConfigurableInstance, Instance
+    from .sdk.enums import AttributeEnum, CallBackEnum, EventEnum, RightsEnum
+    from .sdk.errors import AwError
 
-from .instance import ConfigurableInstance, Instance
-from .sdk import AW_BUILD, aw_init, aw_term
-from .sdk.enums import AttributeEnum, CallBackEnum, EventEnum, RightsEnum
+# The SDK is loaded and initialized on the first SDK call, see sdk.library.
+_LAZY_ATTRIBUTES = {
+    'AsyncInstance': '.instance',
+    'AttributeEnum': '.sdk.enums',
+    'AwError': '.sdk.errors',
+    'CallBackEnum': '.sdk.enums',
+    'ConfigurableInstance': '.instance',
+    'EventEnum': '.sdk.enums',
+    'Instance': '.instance',
+    'RightsEnum': '.sdk.enums',
+}
 
-aw_init(AW_BUILD)
-register(aw_term)
+def __getattr__(name: str) -> object:
+    """
+    Imports public attributes on first access (PEP 562).
+
+    Args:
+        name (str): The attribute name.
+
+    Raises:
+        AttributeError: If the attribute does not exist.
+
+    Returns:
+        object: The attribute.
+    """
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    globals()[name] = value
+
+    return value
+
+def __dir__() -> list:
+    return sorted([*globals(), *_LAZY_ATTRIBUTES])
 
 __all__ = [
+    'AsyncInstance',
     'AttributeEnum',
+    'AwError',
     'CallBackEnum',
     "ConfigurableInstance",
     "EventEnum",
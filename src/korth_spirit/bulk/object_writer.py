@@ -0,0 +1,361 @@
+# Copyright (c) 2021-2022 Johnathan P. Irvin
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+from collections import deque
+from dataclasses import dataclass, field
+from heapq import heappop, heappush
+from time import perf_counter
+from typing import Collection, Iterable, Iterator, Optional, Union
+
+from ..data import ObjectChangeData, ObjectCreateData, ObjectDeleteData
+from ..events import Event
+from ..sdk import (SDK, AttributeEnum, CallBackEnum, aw_instance_set,
+                   aw_int_set, aw_wait)
+from ..sdk.errors import RC_NOT_AVAILABLE, RC_TIMEOUT, AwError
+
+Operation = Union[ObjectCreateData, ObjectChangeData, ObjectDeleteData]
+
+# The SDK call of each operation and whether its None fields are left untouched.
+OPERATIONS = {
+    ObjectCreateData: ('aw_object_add', False),
+    ObjectChangeData: ('aw_object_change', False),
+    ObjectDeleteData: ('aw_object_delete', True),
+}
+
+TRANSIENT = frozenset({RC_NOT_AVAILABLE, RC_TIMEOUT})
+
+def send_operation(operation: Operation, reference: int) -> int:
+    """
+    Sends an object operation without waiting for its result,
+    which arrives through the object result callback.
+
+    Args:
+        operation (Operation): The object to create, change or delete.
+        reference (int): The callback reference of the request.
+
+    Raises:
+        ValueError: If the operation is not supported.
+
+    Returns:
+        int: The reason code of sending the request.
+    """
+    from ..sdk.marshalling import write_fields
+
+    if type(operation) not in OPERATIONS:
+        raise ValueError(f"Unsupported object operation: {type(operation).__name__}")
+
+    name, skip_none = OPERATIONS[type(operation)]
+    write_fields(operation, 'AW_OBJECT_', skip_none=skip_none)
+    aw_int_set(AttributeEnum.AW_OBJECT_CALLBACK_REFERENCE, reference)
+
+    return getattr(SDK, name)()
+
+
+@dataclass
+class ObjectResult:
+    operation: Operation
+    rc: int
+    attempts: int
+    latency: float
+    number: int = None
+    id: int = None
+    cell_x: int = None
+    cell_z: int = None
+
+    @property
+    def ok(self) -> bool:
+        """
+        Whether the operation succeeded.
+
+        Returns:
+            bool: True if the reason code is zero.
+        """
+        return not self.rc
+
+    @property
+    def error(self) -> Optional[AwError]:
+        """
+        The error of a failed operation.
+
+        Returns:
+            Optional[AwError]: The error, or None if the operation succeeded.
+        """
+        return AwError.from_rc(self.rc, "Failed to write object") if self.rc else None
+
+
+@dataclass
+class WriteStats:
+    submitted: int = 0
+    sent: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    retried: int = 0
+    in_flight: int = 0
+    peak_in_flight: int = 0
+    latency: float = 0.0
+    started: float = field(default_factory=perf_counter)
+    finished: float = None
+
+    @property
+    def completed(self) -> int:
+        """
+        The number of operations with a final result.
+
+        Returns:
+            int: The succeeded and failed operations.
+        """
+        return self.succeeded + self.failed
+
+    @property
+    def elapsed(self) -> float:
+        """
+        The time spent writing, up to now if still running.
+
+        Returns:
+            float: The elapsed seconds.
+        """
+        return (self.finished or perf_counter()) - self.started
+
+    @property
+    def throughput(self) -> float:
+        """
+        The completed operations per second.
+
+        Returns:
+            float: The throughput.
+        """
+        elapsed = self.elapsed
+
+        return self.completed / elapsed if elapsed else 0.0
+
+    @property
+    def mean_latency(self) -> float:
+        """
+        The mean time between sending a request and receiving its result.
+
+        Returns:
+            float: The mean latency in seconds.
+        """
+        return self.latency / self.completed if self.completed else 0.0
+
+
+class ObjectWriter:
+    def __init__(
+        self,
+        instance: "Instance",
+        window: int = 64,
+        retries: int = 3,
+        backoff: float = 0.05,
+        max_backoff: float = 2.0,
+        timeout: float = 30.0,
+        poll: int = 10,
+        transient: Collection[int] = TRANSIENT,
+    ) -> None:
+        """
+        Writes objects in bulk, keeping a window of requests in flight
+        instead of waiting for each round trip.
+
+        Args:
+            instance (Instance): The instance to write with.
+            window (int, optional): The maximum number of requests in flight. Defaults to 64.
+            retries (int, optional): The retries of a transient failure. Defaults to 3.
+            backoff (float, optional): The delay before the first retry in seconds, doubled on each retry. Defaults to 0.05.
+            max_backoff (float, optional): The maximum delay before a retry in seconds. Defaults to 2.0.
+            timeout (float, optional): The seconds after which a request without a result times out. Defaults to 30.0.
+            poll (int, optional): The milliseconds to wait for results at a time. Defaults to 10.
+            transient (Collection[int], optional): The reason codes worth retrying. Defaults to TRANSIENT.
+        """
+        self._instance = instance
+        self.window = window
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.timeout = timeout
+        self.poll = poll
+        self.transient = transient
+        self.stats = WriteStats()
+        self._reference = 0
+        self._in_flight = {}
+        self._retries = []
+        self._results = deque()
+
+    def _send(self, operation: Operation, attempts: int) -> None:
+        """
+        Sends an attempt of an operation.
+        Every attempt gets a new reference, so late results of expired attempts are ignored.
+
+        Args:
+            operation (Operation): The operation.
+            attempts (int): The number of this attempt.
+        """
+        self._reference += 1
+        reference = self._reference
+        sent_at = perf_counter()
+        rc = send_operation(operation, reference)
+        self.stats.sent += 1
+
+        if rc:
+            self._finish(operation, attempts, rc, sent_at)
+            return
+
+        self._in_flight[reference] = (operation, attempts, sent_at)
+        self.stats.in_flight = len(self._in_flight)
+        self.stats.peak_in_flight = max(self.stats.peak_in_flight, self.stats.in_flight)
+
+    def _finish(self, operation: Operation, attempts: int, rc: int, sent_at: float, event: Event = None) -> None:
+        """
+        Retries a transient failure or records the result of an operation.
+
+        Args:
+            operation (Operation): The operation.
+            attempts (int): The number of the attempt.
+            rc (int): The reason code of the attempt.
+            sent_at (float): When the attempt was sent.
+            event (Event, optional): The object result event. Defaults to None.
+        """
+        now = perf_counter()
+        self.stats.in_flight = len(self._in_flight)
+
+        if rc in self.transient and attempts <= self.retries:
+            delay = min(self.max_backoff, self.backoff * 2 ** (attempts - 1))
+            self._reference += 1
+            heappush(self._retries, (now + delay, self._reference, operation, attempts + 1))
+            self.stats.retried += 1
+            return
+
+        result = ObjectResult(operation, rc, attempts, now - sent_at)
+
+        if event is not None:
+            result.number = event.object_number
+            result.id = event.object_id
+            result.cell_x = event.cell_x
+            result.cell_z = event.cell_z
+
+        if rc:
+            self.stats.failed += 1
+        else:
+            self.stats.succeeded += 1
+
+        self.stats.latency += result.latency
+        self._results.append(result)
+
+    def _on_result(self, event: Event) -> None:
+        """
+        Correlates an object result with its request by callback reference.
+
+        Args:
+            event (Event): The object result event.
+        """
+        request = self._in_flight.pop(event.object_callback_reference, None)
+
+        if request is not None:
+            operation, attempts, sent_at = request
+            self._finish(operation, attempts, event.rc, sent_at, event)
+
+    def _expire(self, now: float) -> None:
+        """
+        Times out the requests that have been in flight for too long.
+        Requests are kept in the order they were sent, so only the oldest are checked.
+
+        Args:
+            now (float): The current time.
+        """
+        while self._in_flight:
+            reference = next(iter(self._in_flight))
+            operation, attempts, sent_at = self._in_flight[reference]
+
+            if now - sent_at < self.timeout:
+                break
+
+            del self._in_flight[reference]
+            self._finish(operation, attempts, RC_TIMEOUT, sent_at)
+
+    def _wait_time(self, now: float) -> int:
+        """
+        Gets how long to wait for results.
+
+        Args:
+            now (float): The current time.
+
+        Returns:
+            int: The milliseconds to wait.
+        """
+        if self._in_flight or not self._retries:
+            return self.poll
+
+        return max(0, int((self._retries[0][0] - now) * 1000))
+
+    def write(self, operations: Iterable[Operation]) -> Iterator[ObjectResult]:
+        """
+        Writes the operations, yielding each result as it arrives.
+        Results may arrive in a different order than the operations.
+
+        Args:
+            operations (Iterable[Operation]): The objects to create, change or delete.
+
+        Yields:
+            Iterator[ObjectResult]: The result of each operation.
+        """
+        source = iter(operations)
+        exhausted = False
+        self.stats = WriteStats()
+
+        aw_instance_set(self._instance._instance)
+        self._instance.bus.subscribe(CallBackEnum.AW_CALLBACK_OBJECT_RESULT, self._on_result)
+
+        try:
+            while True:
+                now = perf_counter()
+                aw_instance_set(self._instance._instance)
+
+                while len(self._in_flight) < self.window:
+                    if self._retries and self._retries[0][0] <= now:
+                        _, _, operation, attempts = heappop(self._retries)
+                        self._send(operation, attempts)
+                    elif not exhausted:
+                        operation = next(source, None)
+
+                        if operation is None:
+                            exhausted = True
+                            continue
+
+                        self.stats.submitted += 1
+                        self._send(operation, 1)
+                    else:
+                        break
+
+                while self._results:
+                    yield self._results.popleft()
+
+                if exhausted and not self._in_flight and not self._retries:
+                    break
+
+                aw_wait(self._wait_time(now))
+                self._expire(perf_counter())
+
+                while self._results:
+                    yield self._results.popleft()
+        finally:
+            self._instance.bus.unsubscribe(CallBackEnum.AW_CALLBACK_OBJECT_RESULT, self._on_result)
+            self._in_flight.clear()
+            self._retries.clear()
+            self._results.clear()
+            self.stats.in_flight = 0
+            self.stats.finished = perf_counter()
@@ -0,0 +1,470 @@
+# Copyright (c) 2021-2022 Johnathan P. Irvin
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+from heapq import nsmallest
+from time import monotonic
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ..data import CellObjectData
+from ..events import Event
+from ..query.objects import ObjectQuery
+from ..sdk import (AttributeEnum, EventEnum, aw_cell_next, aw_instance_set,
+                   aw_int, aw_int_set, aw_wait)
+from ..sdk.errors import EndOfIterationError
+
+# Coordinates are in centimeters, and a cell is ten meters wide.
+CELL_SIZE = 1000
+
+Cell = Tuple[int, int]
+
+
+def cell_of(coordinate: int) -> int:
+    """
+    Gets the cell of a coordinate.
+
+    Args:
+        coordinate (int): The coordinate in centimeters.
+
+    Returns:
+        int: The cell.
+    """
+    return coordinate // CELL_SIZE
+
+
+class WorldObjectCache:
+    def __init__(self, instance: "Instance", max_age: float = None, clock: Callable[[], float] = monotonic) -> None:
+        """
+        A copy of the objects of the world an instance is in, indexed by cell.
+        It is loaded by one scan of every cell, and kept current by the object
+        add and delete events, and the cell contents other queries receive,
+        so nearby objects are found without asking the server.
+
+        The cache is stale before its first scan, while stopped, and once
+        max_age seconds have passed since its last scan. A query of a stale
+        cache counts as a miss and scans again first, and any other as a hit.
+
+        Args:
+            instance (Instance): The instance, which must have entered a world.
+            max_age (float, optional): The seconds a scan stays fresh. Defaults to None, forever.
+            clock (Callable[[], float], optional): The clock ages are measured with. Defaults to monotonic.
+        """
+        self._instance = instance
+        self.max_age = max_age
+        self._clock = clock
+        self.objects: Dict[int, CellObjectData] = {}
+        self.cells: Dict[Cell, Dict[int, CellObjectData]] = {}
+        self.sequences: Dict[Cell, int] = {}
+        self._object_cells: Dict[int, Cell] = {}
+        self.scanned_at: Optional[float] = None
+        self.updated_at: Optional[float] = None
+        self.hits = 0
+        self.misses = 0
+        self.applied = 0
+        self._subscriptions = []
+        self._cell: Optional[Cell] = None
+
+    def __enter__(self) -> "WorldObjectCache":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+    @property
+    def listening(self) -> bool:
+        """
+        Whether the cache is applying events.
+
+        Returns:
+            bool: True if started, False otherwise.
+        """
+        return bool(self._subscriptions)
+
+    @property
+    def age(self) -> Optional[float]:
+        """
+        The seconds since the last scan.
+
+        Returns:
+            Optional[float]: The age, or None before the first scan.
+        """
+        return self._clock() - self.scanned_at if self.scanned_at is not None else None
+
+    @property
+    def stale(self) -> bool:
+        """
+        Whether the cache may have missed changes to the world.
+
+        Returns:
+            bool: True if stale, False otherwise.
+        """
+        if self.scanned_at is None or not self.listening:
+            return True
+
+        return self.max_age is not None and self.age > self.max_age
+
+    def start(self, scan: bool = True) -> "WorldObjectCache":
+        """
+        Starts applying events, and scans every cell.
+
+        Args:
+            scan (bool, optional): Whether to scan now. Defaults to True.
+
+        Returns:
+            WorldObjectCache: The cache.
+        """
+        if not self.listening:
+            bus = self._instance.bus
+            self._subscriptions = [
+                bus.on(EventEnum.AW_EVENT_CELL_BEGIN, self.on_cell_begin),
+                bus.on(EventEnum.AW_EVENT_CELL_OBJECT, self.on_cell_object),
+                bus.on(EventEnum.AW_EVENT_CELL_END, self.on_cell_end),
+                bus.on(EventEnum.AW_EVENT_OBJECT_ADD, self.on_object_add),
+                bus.on(EventEnum.AW_EVENT_OBJECT_DELETE, self.on_object_delete),
+            ]
+
+        if scan:
+            self.scan()
+
+        return self
+
+    def stop(self) -> None:
+        """
+        Stops applying events, leaving the cache stale.
+        """
+        for subscription in self._subscriptions:
+            subscription.unsubscribe()
+
+        self._subscriptions = []
+        self._cell = None
+
+    def scan(self) -> None:
+        """
+        Replaces the cache with the contents of every cell.
+        """
+        self.clear()
+        instance = self._instance._instance
+
+        aw_instance_set(instance)
+        aw_int_set(AttributeEnum.AW_CELL_ITERATOR, 0)
+
+        while True:
+            aw_instance_set(instance)
+            try:
+                aw_cell_next(combine=True)
+            except EndOfIterationError:
+                break
+            aw_wait(1)
+
+            aw_instance_set(instance)
+            if aw_int(AttributeEnum.AW_CELL_ITERATOR) == -1:
+                break
+
+        self.touch()
+
+    def clear(self) -> None:
+        """
+        Forgets every object.
+        """
+        self.objects.clear()
+        self.cells.clear()
+        self._object_cells.clear()
+        self.sequences.clear()
+        self.scanned_at = None
+
+    def touch(self) -> None:
+        """
+        Marks the cache as fresh, once it has been brought up to date another
+        way than a scan, such as by a SectorSync.
+        """
+        self.scanned_at = self._clock()
+
+    def replace_cell(self, cell: Cell, sequence: int, objects: Iterable[CellObjectData] = ()) -> None:
+        """
+        Replaces the contents of a cell.
+
+        Args:
+            cell (Cell): The cell.
+            sequence (int): The sequence of the cell.
+            objects (Iterable[CellObjectData], optional): The objects in the cell. Defaults to ().
+        """
+        for number in list(self.cells.get(cell, ())):
+            self._remove(number)
+
+        for found in objects:
+            self._add(cell, found)
+
+        self.sequences[cell] = sequence
+
+    def _add(self, cell: Cell, found: CellObjectData) -> None:
+        old = self.objects.get(found.number)
+
+        if old is not None:
+            self._remove(old.number)
+
+        self.objects[found.number] = found
+        self.cells.setdefault(cell, {})[found.number] = found
+        # Objects are filed under the cell the SDK reported.
+        self._object_cells[found.number] = cell
+
+    def _remove(self, number: int) -> Optional[CellObjectData]:
+        found = self.objects.pop(number, None)
+
+        if found is None:
+            return None
+
+        cell = self._object_cells.pop(number)
+        objects = self.cells[cell]
+        del objects[number]
+        if not objects:
+            del self.cells[cell]
+
+        return found
+
+    def _applied(self) -> None:
+        self.applied += 1
+        self.updated_at = self._clock()
+
+    def on_cell_begin(self, event: Event) -> None:
+        """
+        Empties a cell whose contents are about to be sent.
+
+        Args:
+            event (Event): The cell begin event.
+        """
+        self._cell = event.cell_x, event.cell_z
+        self.replace_cell(self._cell, event.cell_sequence)
+        self._applied()
+
+    def on_cell_object(self, event: Event) -> None:
+        """
+        Adds an object of the cell being sent.
+
+        Args:
+            event (Event): The cell object event.
+        """
+        if self._cell is not None:
+            self._add(self._cell, ObjectQuery.object_data(event))
+
+    def on_cell_end(self, event: Event) -> None:
+        """
+        Ends the cell being sent.
+
+        Args:
+            event (Event): The cell end event.
+        """
+        self._cell = None
+
+    def on_object_add(self, event: Event) -> None:
+        """
+        Adds an object someone built.
+
+        Args:
+            event (Event): The object add event.
+        """
+        cell = event.cell_x, event.cell_z
+        self._add(cell, ObjectQuery.object_data(event))
+        self.sequences[cell] = event.cell_sequence
+        self._applied()
+
+    def on_object_delete(self, event: Event) -> None:
+        """
+        Removes an object someone deleted.
+
+        Args:
+            event (Event): The object delete event.
+        """
+        self._remove(event.object_number)
+        self.sequences[event.cell_x, event.cell_z] = event.cell_sequence
+        self._applied()
+
+    def _checked(self) -> None:
+        """
+        Counts a query, scanning first if the cache is stale.
+        """
+        if self.stale:
+            self.misses += 1
+            self.start()
+        else:
+            self.hits += 1
+
+    def _cells(self, low_x: int, low_z: int, high_x: int, high_z: int) -> Iterator[Dict[int, CellObjectData]]:
+        """
+        Gets the cells with objects in a range of cells.
+
+        Yields:
+            Iterator[Dict[int, CellObjectData]]: The objects of each cell.
+        """
+        cells = self.cells
+
+        # A sparse world has fewer cells than the range covers.
+        if (high_x - low_x + 1) * (high_z - low_z + 1) > len(cells):
+            for (x, z), objects in cells.items():
+                if low_x <= x <= high_x and low_z <= z <= high_z:
+                    yield objects
+            return
+
+        for x in range(low_x, high_x + 1):
+            for z in range(low_z, high_z + 1):
+                objects = cells.get((x, z))
+                if objects:
+                    yield objects
+
+    def box(self, min_x: int, min_z: int, max_x: int, max_z: int) -> List[CellObjectData]:
+        """
+        Finds the objects within a box.
+
+        Args:
+            min_x (int): The lowest x coordinate.
+            min_z (int): The lowest z coordinate.
+            max_x (int): The highest x coordinate.
+            max_z (int): The highest z coordinate.
+
+        Returns:
+            List[CellObjectData]: The objects.
+        """
+        self._checked()
+
+        return [
+            found
+            for objects in self._cells(cell_of(min_x), cell_of(min_z), cell_of(max_x), cell_of(max_z))
+            for found in objects.values()
+            if min_x <= found.x <= max_x and min_z <= found.z <= max_z
+        ]
+
+    def within(self, x: int, z: int, radius: int) -> List[CellObjectData]:
+        """
+        Finds the objects within a distance, nearest first.
+
+        Args:
+            x (int): The x coordinate.
+            z (int): The z coordinate.
+            radius (int): The distance in centimeters.
+
+        Returns:
+            List[CellObjectData]: The objects.
+        """
+        self._checked()
+        limit = radius * radius
+        found = []
+
+        for objects in self._cells(cell_of(x - radius), cell_of(z - radius), cell_of(x + radius), cell_of(z + radius)):
+            for candidate in objects.values():
+                distance = (candidate.x - x) ** 2 + (candidate.z - z) ** 2
+                if distance <= limit:
+                    found.append((distance, candidate.number, candidate))
+
+        return [candidate for _, _, candidate in sorted(found)]
+
+    def nearest(self, x: int, z: int, k: int = 1) -> List[CellObjectData]:
+        """
+        Finds the nearest objects, searching rings of cells outwards.
+
+        Args:
+            x (int): The x coordinate.
+            z (int): The z coordinate.
+            k (int, optional): The number of objects, none when below one. Defaults to 1.
+
+        Returns:
+            List[CellObjectData]: The objects, nearest first.
+        """
+        self._checked()
+
+        if k <= 0:
+            return []
+
+        center_x, center_z = cell_of(x), cell_of(z)
+        candidates = []
+        seen = 0
+        ring = 0
+
+        while seen < len(self.objects):
+            # Past the cells there are, comparing every object is cheaper.
+            if (2 * ring + 1) ** 2 > len(self.cells):
+                candidates = [
+                    ((candidate.x - x) ** 2 + (candidate.z - z) ** 2, candidate.number, candidate)
+                    for candidate in self.objects.values()
+                ]
+                break
+
+            for objects in self._ring(center_x, center_z, ring):
+                seen += len(objects)
+                for candidate in objects.values():
+                    candidates.append(((candidate.x - x) ** 2 + (candidate.z - z) ** 2, candidate.number, candidate))
+
+            # Cells past this ring are at least ring cells away.
+            if len(candidates) >= k:
+                candidates = nsmallest(k, candidates)
+                if candidates[-1][0] <= (ring * CELL_SIZE) ** 2:
+                    break
+
+            ring += 1
+
+        return [candidate for _, _, candidate in nsmallest(k, candidates)]
+
+    def _ring(self, center_x: int, center_z: int, ring: int) -> Iterator[Dict[int, CellObjectData]]:
+        """
+        Gets the cells with objects at a ring around a cell.
+
+        Yields:
+            Iterator[Dict[int, CellObjectData]]: The objects of each cell.
+        """
+        cells = self.cells
+
+        if ring == 0:
+            objects = cells.get((center_x, center_z))
+            if objects:
+                yield objects
+            return
+
+        for offset in range(-ring, ring + 1):
+            for cell in (
+                (center_x + offset, center_z - ring),
+                (center_x + offset, center_z + ring),
+            ):
+                objects = cells.get(cell)
+                if objects:
+                    yield objects
+
+        for offset in range(-ring + 1, ring):
+            for cell in (
+                (center_x - ring, center_z + offset),
+                (center_x + ring, center_z + offset),
+            ):
+                objects = cells.get(cell)
+                if objects:
+                    yield objects
+
+    def stats(self) -> dict:
+        """
+        Gets the size, freshness and hit rate of the cache.
+
+        Returns:
+            dict: The number of objects and cells, hits, misses and events
+                applied, the age of the last scan and whether it is stale.
+        """
+        return {
+            'objects': len(self.objects),
+            'cells': len(self.cells),
+            'hits': self.hits,
+            'misses': self.misses,
+            'applied': self.applied,
+            'age': self.age,
+            'stale': self.stale,
+        }
@@ -0,0 +1,264 @@
+# Copyright (c) 2021-2022 Johnathan P. Irvin
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import json
+import os
+from dataclasses import astuple, fields
+from typing import Dict, Iterator, List, Set, Tuple
+
+from ..data import CellObjectData
+from ..events import Event
+from ..sdk import (AttributeEnum, EventEnum, aw_bool, aw_instance_set,
+                   aw_query, aw_sector_from_cell, aw_wait)
+from .object_cache import WorldObjectCache
+
+# The version of the file format written by save().
+VERSION = 1
+# The fields of an object, in the order they are saved.
+OBJECT_FIELDS = [field.name for field in fields(CellObjectData)]
+
+Sector = Tuple[int, int]
+
+
+class SectorSync:
+    def __init__(self, cache: WorldObjectCache, path: str = None, max_rounds: int = 100) -> None:
+        """
+        Keeps a WorldObjectCache up to date with aw_query, which only sends the
+        cells of the sectors that changed since the sequences it is given.
+        The sequence of every sector queried is tracked, and saved to disk with
+        the cached objects, so a restart only fetches what changed meanwhile.
+
+        Only the cells received for a query advance a sector's sequence. Live
+        object events still update the cache, but a sector they touch is
+        fetched again by the next sync, so changes missed while offline are
+        never skipped.
+
+        Args:
+            cache (WorldObjectCache): The cache to keep up to date.
+            path (str, optional): The file the state is saved to and loaded from. Defaults to None.
+            max_rounds (int, optional): The most aw_query calls a zone takes to complete. Defaults to 100.
+        """
+        self.cache = cache
+        self.path = path
+        self.max_rounds = max_rounds
+        self.sequences: Dict[Sector, int] = {}
+        self.zones: Set[Sector] = set()
+        self.queries = 0
+        self.cells = 0
+
+    def __enter__(self) -> "SectorSync":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+    def start(self, refresh: bool = True) -> "SectorSync":
+        """
+        Loads the saved state, if any, and starts the cache without a scan.
+
+        Args:
+            refresh (bool, optional): Whether to fetch what changed in the saved zones. Defaults to True.
+
+        Returns:
+            SectorSync: The sync.
+        """
+        if self.path is not None and os.path.exists(self.path):
+            self.load()
+
+        self.cache.start(scan=False)
+
+        if refresh and self.zones:
+            self.refresh()
+
+        return self
+
+    def stop(self) -> None:
+        """
+        Stops the cache, saving the state if there is a path.
+        """
+        self.cache.stop()
+
+        if self.path is not None:
+            self.save()
+
+    def on_cell_begin(self, event: Event) -> None:
+        """
+        Advances the sequence of the sector of a cell received for a query.
+
+        Args:
+            event (Event): The cell begin event.
+        """
+        self.cells += 1
+        sector = aw_sector_from_cell(event.cell_x), aw_sector_from_cell(event.cell_z)
+
+        if event.cell_sequence > self.sequences.get(sector, 0):
+            self.sequences[sector] = event.cell_sequence
+
+    def zone(self, x_sector: int, z_sector: int) -> List[List[int]]:
+        """
+        Gets the sequences of the three by three sectors around a sector.
+
+        Args:
+            x_sector (int): The sector at the center.
+            z_sector (int): The sector at the center.
+
+        Returns:
+            List[List[int]]: The sequences, by x then z offset.
+        """
+        return [
+            [self.sequences.get((x_sector + x, z_sector + z), 0) for z in (-1, 0, 1)]
+            for x in (-1, 0, 1)
+        ]
+
+    def sync(self, x_sector: int, z_sector: int) -> int:
+        """
+        Fetches the changed cells of the three by three sectors around a sector.
+
+        Args:
+            x_sector (int): The sector at the center.
+            z_sector (int): The sector at the center.
+
+        Raises:
+            Exception: If the query did not complete in max_rounds calls.
+
+        Returns:
+            int: The number of cells received.
+        """
+        instance = self.cache._instance
+        received = self.cells
+        subscription = instance.bus.on(EventEnum.AW_EVENT_CELL_BEGIN, self.on_cell_begin)
+
+        try:
+            for _ in range(self.max_rounds):
+                aw_instance_set(instance._instance)
+                aw_query(x_sector, z_sector, self.zone(x_sector, z_sector))
+                self.queries += 1
+                aw_wait(1)
+
+                # An incomplete query is asked again with the sequences received so far.
+                aw_instance_set(instance._instance)
+                if aw_bool(AttributeEnum.AW_QUERY_COMPLETE):
+                    break
+            else:
+                raise Exception(f"The query of sector {x_sector}, {z_sector} did not complete.")
+        finally:
+            subscription.unsubscribe()
+
+        self.zones.add((x_sector, z_sector))
+
+        return self.cells - received
+
+    def sync_area(self, min_x_sector: int, min_z_sector: int, max_x_sector: int, max_z_sector: int) -> int:
+        """
+        Fetches the changed cells of a rectangle of sectors, one zone of three
+        by three sectors at a time.
+
+        Args:
+            min_x_sector (int): The lowest x sector.
+            min_z_sector (int): The lowest z sector.
+            max_x_sector (int): The highest x sector.
+            max_z_sector (int): The highest z sector.
+
+        Returns:
+            int: The number of cells received.
+        """
+        received = sum(
+            self.sync(x_sector, z_sector)
+            for x_sector in range(min_x_sector + 1, max_x_sector + 2, 3)
+            for z_sector in range(min_z_sector + 1, max_z_sector + 2, 3)
+        )
+        self.cache.touch()
+
+        return received
+
+    def refresh(self) -> int:
+        """
+        Fetches the changed cells of every zone synced before.
+
+        Returns:
+            int: The number of cells received.
+        """
+        received = sum(self.sync(*zone) for zone in sorted(self.zones))
+        self.cache.touch()
+
+        return received
+
+    def _cells(self) -> Iterator[list]:
+        cache = self.cache
+
+        for cell, sequence in cache.sequences.items():
+            yield [*cell, sequence, [astuple(found) for found in cache.cells.get(cell, {}).values()]]
+
+    def save(self, path: str = None) -> None:
+        """
+        Saves the sequences, zones and cached objects, replacing the file at once.
+
+        Args:
+            path (str, optional): The file. Defaults to the path of the sync.
+        """
+        path = path or self.path
+        temporary = f"{path}.tmp"
+
+        with open(temporary, 'w') as file:
+            json.dump({
+                'version': VERSION,
+                'fields': OBJECT_FIELDS,
+                'sequences': [[*sector, sequence] for sector, sequence in self.sequences.items()],
+                'zones': sorted(self.zones),
+                'cells': list(self._cells()),
+            }, file, separators=(',', ':'))
+
+        os.replace(temporary, path)
+
+    def load(self, path: str = None) -> None:
+        """
+        Loads saved sequences, zones and objects into the sync and its cache.
+
+        Args:
+            path (str, optional): The file. Defaults to the path of the sync.
+
+        Raises:
+            ValueError: If the file is of another version or object layout.
+        """
+        with open(path or self.path) as file:
+            state = json.load(file)
+
+        if state.get('version') != VERSION or state.get('fields') != OBJECT_FIELDS:
+            raise ValueError(f"Unsupported sector sync file: {path or self.path}")
+
+        self.sequences = {(x, z): sequence for x, z, sequence in state['sequences']}
+        self.zones = {tuple(zone) for zone in state['zones']}
+
+        for x, z, sequence, objects in state['cells']:
+            self.cache.replace_cell((x, z), sequence, [CellObjectData(*values) for values in objects])
+
+    def stats(self) -> dict:
+        """
+        Gets how much the sync has fetched.
+
+        Returns:
+            dict: The sectors and zones tracked, the queries made and the cells received.
+        """
+        return {
+            'sectors': len(self.sequences),
+            'zones': len(self.zones),
+            'queries': self.queries,
+            'cells': self.cells,
+        }
@@ -24,6 +24,7 @@ from .bot_menu_data import BotMenuData
 from .camera_set_data import CameraSetData
 from .cav_change_data import CavChangeData
 from .cav_delete_data import CavDeleteData
+from .cell_data import CellData
 from .cell_iterator_data import CellIteratorData
 from .cell_object_data import CellObjectData
 from .citizen_data import CitizenData
@@ -58,6 +59,7 @@ __all__ = [
     "CavChangeData",
     "CavDeleteData",
     "CameraSetData",
+    "CellData",
     "CellIteratorData",
     "CellObjectData",
     "CitizenData",
@@ -18,7 +18,9 @@
 # LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
 # WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+from array import array
 from dataclasses import dataclass
+from typing import Union
 
 
 @dataclass
@@ -28,5 +30,5 @@ class TerrainNodeData:
     node_x: int
     node_z: int
     node_size: int
-    heights: list[int]
-    textures: list[int]
+    heights: Union[array, list[int]]
+    textures: Union[array, list[int]]
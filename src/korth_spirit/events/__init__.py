@@ -19,9 +19,17 @@
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
 # WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 from .bus import EventBus
-from .event import Event
+from .dispatcher import ThreadedDispatcher
+from .event import DynamicEvent, Event
+from .router import ROUTER, Router
+from .subscription import Subscription
 
 __all__ = [
+    'DynamicEvent',
     'EventBus',
-    'Event'
+    'Event',
+    'ROUTER',
+    'Router',
+    'Subscription',
+    'ThreadedDispatcher',
 ]
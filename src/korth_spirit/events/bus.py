@@ -18,70 +18,160 @@
 # LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
 # WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
-from typing import Union
+from time import perf_counter, perf_counter_ns
+from typing import TYPE_CHECKING, Any, Dict, Optional, Union
 
 from korth_spirit.sdk import CallBackEnum, EventEnum
 
-from .event import Event
+from .coalesce import Coalescer
+from .event import DynamicEvent, Event
+from .event_types import EVENT_CLASSES
+from .metrics import BusMetrics
+from .router import ROUTER
+from .subscription import Subscribers, Subscription, filterable
 from .translations import TRANSLATIONS
 
+if TYPE_CHECKING:
+    from .dispatcher import ThreadedDispatcher
+
 EventType = Union[EventEnum, CallBackEnum]
 class EventBus:
     def _hook_aw_event(self, event: EventType) -> None:
         """
-        Republish AW events to the bus.
+        Republish AW events to the bus, once it is bound to an instance.
 
         Args:
             event (EventType): The event to publish and hook.
         """
-        from korth_spirit.sdk import AW_CALLBACK, aw_callback_set, aw_event_set
+        if self._instance is not None:
+            ROUTER.hook(self._instance, event)
+
+    def _release(self, subscribers: Subscribers) -> None:
+        """
+        Stops republishing an AW event once its last subscription is removed.
+        A set callback makes the matching SDK call asynchronous, and a set
+        event handler costs a dispatch per event, so neither outlives its subscribers.
 
-        @AW_CALLBACK
-        def mini_pub() -> None:
-            self.publish(event)
+        Args:
+            subscribers (Subscribers): The emptied subscriptions of the event.
+        """
+        if self._subscribers.get(subscribers.event) is not subscribers:
+            return
 
-        self._refs[event] = mini_pub
+        del self._subscribers[subscribers.event]
 
-        if type(event) is EventEnum:
-            aw_event_set(event, mini_pub)
-        elif type(event) is CallBackEnum:
-            aw_callback_set(event, mini_pub)
+        if self._instance is not None:
+            ROUTER.release(self._instance, subscribers.event)
 
-    def __init__(self):
-        self._refs = {}
+    def __init__(self, dispatcher: "ThreadedDispatcher" = None):
+        """
+        Delivers SDK and user events to their subscribers.
+
+        Args:
+            dispatcher (ThreadedDispatcher, optional): Runs the subscribers off the
+                SDK callback. Defaults to None, calling them within it.
+        """
+        self._instance = None
         self._subscribers = {}
+        self.dispatcher = dispatcher
+        self.published = 0
+        self._coalescers: Dict[EventType, Coalescer] = {}
+        self._metrics: Optional[BusMetrics] = None
+
+    def bind(self, instance: Any) -> "EventBus":
+        """
+        Receive the AW events of an instance.
+
+        Args:
+            instance (Any): The instance handle.
+
+        Returns:
+            EventBus: The event bus.
+        """
+        self._instance = instance
+        ROUTER.register(instance, self)
+
+        for event in self._subscribers:
+            ROUTER.hook(instance, event)
+
+        return self
+
+    def unbind(self) -> "EventBus":
+        """
+        Stop receiving the AW events of the instance.
+        The handlers are left set, as they go away with the destroyed instance.
+
+        Returns:
+            EventBus: The event bus.
+        """
+        if self._instance is not None:
+            ROUTER.unregister(self._instance)
+            self._instance = None
+
+        return self
+
+    def on(self, event: EventType, subscriber: callable, where: Dict[str, Any] = None) -> Subscription:
+        """
+        Subscribe to an event, getting a handle to the subscription.
+
+        Args:
+            event (EventType): The event to subscribe to.
+            subscriber (callable): The subscriber to the event.
+            where (Dict[str, Any], optional): The field values an event must have
+                to be delivered, such as {'chat_session': 42}. Defaults to None.
+
+        Raises:
+            ValueError: If the event has no such field.
 
-    def subscribe(self, event: EventType, subscriber: callable) -> "EventBus":
+        Returns:
+            Subscription: The subscription, whose unsubscribe() removes it.
+        """
+        subscription = Subscription(event, subscriber, where)
+        subscribers = self._subscribers.get(event)
+
+        if subscribers is None:
+            subscribers = self._subscribers[event] = Subscribers(self, event)
+            self._hook_aw_event(event)
+
+        return subscribers.add(subscription)
+
+    def subscribe(self, event: EventType, subscriber: callable, where: Dict[str, Any] = None) -> "EventBus":
         """
         Subscribe to an event.
 
         Args:
             event (EventType): The event to subscribe to.
             subscriber (callable): The subscriber to the event.
+            where (Dict[str, Any], optional): The field values an event must have
+                to be delivered, such as {'chat_session': 42}. Defaults to None.
+
+        Raises:
+            ValueError: If the event has no such field.
 
         Returns:
             EventBus: The event bus.
         """
-        if event not in self._subscribers:
-            self._subscribers[event] = []
-            self._hook_aw_event(event)
-        self._subscribers[event].append(subscriber)
+        self.on(event, subscriber, where)
 
         return self
 
-    def unsubscribe(self, event: EventType, subscriber: callable) -> "EventBus":
+    def unsubscribe(self, event: EventType, subscriber: callable, where: Dict[str, Any] = None) -> "EventBus":
         """
         Unsubscribe from an event.
 
         Args:
             event (EventType): The event to unsubscribe from.
             subscriber (callable): The subscriber to the event.
+            where (Dict[str, Any], optional): The filter it was subscribed with. Defaults to None.
 
         Returns:
             EventBus: The event bus.
         """
-        if event in self._subscribers:
-            self._subscribers[event].remove(subscriber)
+        subscribers = self._subscribers.get(event)
+        subscription = subscribers and subscribers.find(subscriber, where)
+
+        if subscription is not None:
+            subscription.unsubscribe()
 
         return self
 
@@ -89,25 +179,187 @@ class EventBus:
         """
         Unsubscribe from all events.
 
+        Returns:
+            EventBus: The event bus.
+        """
+        for subscribers in list(self._subscribers.values()):
+            for subscription in [*subscribers.unfiltered, *(
+                subscription
+                for index in subscribers.indexes.values()
+                for bucket in index.values()
+                for subscription in bucket
+            )]:
+                subscription._subscribers = None
+
+            self._release(subscribers)
+
+        return self
+
+    def coalesce(self, event: EventType, key: str = 'avatar_session', tick: float = 0.0) -> "EventBus":
+        """
+        Keeps only the latest event per key, delivering them when the bus is
+        flushed, which the main loop does after every aw_wait. Coalesced events
+        are delivered after the events published before the flush.
+
         Args:
-            event (EventType): The event to unsubscribe from.
+            event (EventType): The event to coalesce, such as AW_EVENT_AVATAR_CHANGE.
+            key (str, optional): The field events are keyed by. Defaults to 'avatar_session'.
+            tick (float, optional): The least seconds between deliveries. Defaults to 0.0,
+                delivering on every flush.
+
+        Raises:
+            ValueError: If the event has no such field.
 
         Returns:
             EventBus: The event bus.
         """
-        for ref in self._refs:
-            from korth_spirit.sdk import aw_callback_set, aw_event_set
+        if key not in filterable(event):
+            raise ValueError(f"{event} cannot be coalesced by {key}")
 
-            if type(ref) is EventEnum:
-                aw_event_set(ref, None)
-            elif type(ref) is CallBackEnum:
-                aw_callback_set(ref, None)
+        self.uncoalesce(event)
+        self._coalescers[event] = Coalescer(key, tick)
 
-        self._refs = {}
-        self._subscribers = {}
+        return self
+
+    def uncoalesce(self, event: EventType) -> "EventBus":
+        """
+        Stops coalescing an event, delivering its pending events.
+
+        Args:
+            event (EventType): The event.
+
+        Returns:
+            EventBus: The event bus.
+        """
+        coalescer = self._coalescers.pop(event, None)
+
+        if coalescer is not None:
+            self._deliver_batch(event, coalescer.take(perf_counter(), force=True))
 
         return self
 
+    def flush(self, force: bool = False) -> int:
+        """
+        Delivers the coalesced events whose tick has passed.
+
+        Args:
+            force (bool, optional): Whether to deliver them before their tick has passed. Defaults to False.
+
+        Returns:
+            int: The number of events delivered.
+        """
+        if not self._coalescers:
+            return 0
+
+        now = perf_counter()
+        delivered = 0
+
+        for event, coalescer in list(self._coalescers.items()):
+            batch = coalescer.take(now, force)
+
+            if batch:
+                delivered += self._deliver_batch(event, batch)
+
+        return delivered
+
+    def coalesced(self) -> Dict[EventType, dict]:
+        """
+        Gets the counters of each coalesced event.
+
+        Returns:
+            Dict[EventType, dict]: The events received, delivered, collapsed and pending.
+        """
+        return {event: coalescer.stats() for event, coalescer in self._coalescers.items()}
+
+    def instrument(self, enabled: bool = True) -> "EventBus":
+        """
+        Starts or stops measuring the bus. Starting again resets the measurements.
+        Translation is the time taken to create each event, and to snapshot it
+        when it is coalesced. Handlers are timed when
+        called by the bus, not when they run on a dispatcher's threads.
+
+        Args:
+            enabled (bool, optional): Whether to measure. Defaults to True.
+
+        Returns:
+            EventBus: The event bus.
+        """
+        self._metrics = BusMetrics() if enabled else None
+
+        return self
+
+    def stats(self) -> dict:
+        """
+        Gets a snapshot of the measurements.
+
+        Returns:
+            dict: Whether the bus is instrumented and the events published. While it is,
+                also the seconds measured, each event type's count, rate, translation and
+                dispatch latencies, and each handler's latencies.
+        """
+        stats = {'instrumented': self._metrics is not None, 'published': self.published}
+
+        if self._metrics is not None:
+            stats.update(self._metrics.stats())
+
+        return stats
+
+    def _deliver_batch(self, event: EventType, batch: list) -> int:
+        """
+        Delivers snapshotted events to their current subscribers.
+
+        Args:
+            event (EventType): The event type.
+            batch (list): The events with their arguments.
+
+        Returns:
+            int: The number of events delivered.
+        """
+        subscribers = self._subscribers.get(event)
+
+        if not subscribers:
+            return 0
+
+        for wrapped_event, args, kwargs in batch:
+            matching = subscribers.matching(wrapped_event)
+
+            if self.dispatcher is not None:
+                self.dispatcher.submit(self._instance, wrapped_event, matching, args, kwargs)
+            elif self._metrics is not None:
+                self._metrics.call(event, matching, wrapped_event, args, kwargs)
+            else:
+                for subscriber in matching:
+                    subscriber(wrapped_event, *args, **kwargs)
+
+        return len(batch)
+
+    def _deliver(self, subscribers: Subscribers, event: Event, args: tuple, kwargs: dict) -> None:
+        """
+        Calls the matching subscribers, or queues the snapshotted event for them
+        when there is a dispatcher. The event is closed once the callback ends.
+
+        Args:
+            subscribers (Subscribers): The subscriptions to the event.
+            event (Event): The event.
+            args (tuple): The arguments to pass to the subscribers.
+            kwargs (dict): The keyword arguments to pass to the subscribers.
+        """
+        try:
+            matching = subscribers.matching(event)
+
+            if self.dispatcher is not None:
+                event.snapshot()
+            elif self._metrics is not None:
+                self._metrics.call(event.event_type, matching, event, args, kwargs)
+            else:
+                for subscriber in matching:
+                    subscriber(event, *args, **kwargs)
+        finally:
+            event.close()
+
+        if self.dispatcher is not None:
+            self.dispatcher.submit(self._instance, event, matching, args, kwargs)
+
     def publish(self, event: EventType, *args, **kwargs) -> "EventBus":
         """
         Publish an event.
@@ -120,10 +372,73 @@ class EventBus:
         Returns:
             EventBus: The event bus.
         """
-        translations = TRANSLATIONS.get(event, {})
-        wrapped_event = Event(event, translations)
-        if event in self._subscribers:
-            for subscriber in self._subscribers[event]:
-                subscriber(wrapped_event, *args, **kwargs)
-        
+        self.published += 1
+        subscribers = self._subscribers.get(event)
+        metrics = self._metrics
+
+        if metrics is not None:
+            metrics.published[event] += 1
+            started = perf_counter_ns()
+
+        if not subscribers:
+            return self
+
+        event_class = EVENT_CLASSES.get(event)
+        wrapped_event = (
+            event_class() if event_class is not None
+            else DynamicEvent(event, TRANSLATIONS.get(event, ()))
+        )
+        coalescer = self._coalescers.get(event) if self._coalescers else None
+
+        if coalescer is not None:
+            try:
+                coalescer.add(wrapped_event.snapshot(), args, kwargs)
+            finally:
+                wrapped_event.close()
+
+            if metrics is not None:
+                metrics.translated(event, perf_counter_ns() - started)
+        else:
+            if metrics is not None:
+                metrics.translated(event, perf_counter_ns() - started)
+
+            self._deliver(subscribers, wrapped_event, args, kwargs)
+
+        return self
+
+    def publish_result(self, event: CallBackEnum, rc: int) -> "EventBus":
+        """
+        Publish the result of an asynchronous SDK call.
+        The reason code is available to subscribers as event.rc.
+
+        Args:
+            event (CallBackEnum): The callback to publish.
+            rc (int): The reason code of the call.
+
+        Returns:
+            EventBus: The event bus.
+        """
+        self.published += 1
+        subscribers = self._subscribers.get(event)
+        metrics = self._metrics
+
+        if metrics is not None:
+            metrics.published[event] += 1
+            started = perf_counter_ns()
+
+        if not subscribers:
+            return self
+
+        event_class = EVENT_CLASSES.get(event)
+        wrapped_event = (
+            event_class() if event_class is not None
+            else DynamicEvent(event, TRANSLATIONS.get(event, ()))
+        )
+        wrapped_event.rc = rc
+
+        if metrics is not None:
+            metrics.translated(event, perf_counter_ns() - started)
+
+        self._deliver(subscribers, wrapped_event, (), {})
+
         return self
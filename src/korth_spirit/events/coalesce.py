@@ -0,0 +1,97 @@
+# Copyright (c) 2021-2022 Johnathan P. Irvin
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+from time import perf_counter
+from typing import Any, Dict, List, Tuple
+
+
+class Coalescer:
+    __slots__ = ('key', 'tick', 'pending', 'flushed_at', 'received', 'delivered', 'collapsed')
+
+    def __init__(self, key: str = 'avatar_session', tick: float = 0.0) -> None:
+        """
+        Keeps the latest event per key until the bus is flushed, so frequent
+        events such as avatar changes reach handlers once per tick.
+
+        Args:
+            key (str, optional): The field events are keyed by. Defaults to 'avatar_session'.
+            tick (float, optional): The least seconds between deliveries. Defaults to 0.0,
+                delivering on every flush.
+        """
+        self.key = key
+        self.tick = tick
+        self.pending: Dict[Any, Tuple[Any, tuple, dict]] = {}
+        self.flushed_at = perf_counter()
+        self.received = 0
+        self.delivered = 0
+        self.collapsed = 0
+
+    def add(self, event: Any, args: tuple, kwargs: dict) -> None:
+        """
+        Keeps a snapshotted event, replacing the pending one with the same key.
+
+        Args:
+            event (Any): The event.
+            args (tuple): The arguments to pass to the subscribers.
+            kwargs (dict): The keyword arguments to pass to the subscribers.
+        """
+        key = getattr(event, self.key)
+        self.received += 1
+
+        if key in self.pending:
+            self.collapsed += 1
+
+        # A replaced event keeps its key's place in delivery order.
+        self.pending[key] = event, args, kwargs
+
+    def take(self, now: float, force: bool = False) -> List[Tuple[Any, tuple, dict]]:
+        """
+        Takes the pending events, once the tick has passed.
+
+        Args:
+            now (float): The current perf_counter() time.
+            force (bool, optional): Whether to take them before the tick has passed. Defaults to False.
+
+        Returns:
+            List[Tuple[Any, tuple, dict]]: The events with their arguments, oldest key first.
+        """
+        if not self.pending or (not force and now - self.flushed_at < self.tick):
+            return []
+
+        batch = list(self.pending.values())
+        self.pending.clear()
+        self.flushed_at = now
+        self.delivered += len(batch)
+
+        return batch
+
+    def stats(self) -> dict:
+        """
+        Gets the counters.
+
+        Returns:
+            dict: The events received, delivered, collapsed into a later one, and pending.
+        """
+        return {
+            'received': self.received,
+            'delivered': self.delivered,
+            'collapsed': self.collapsed,
+            'pending': len(self.pending),
+        }
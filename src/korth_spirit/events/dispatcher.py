@@ -0,0 +1,426 @@
+# Copyright (c) 2021-2022 Johnathan P. Irvin
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import threading
+from collections import deque
+from time import perf_counter, sleep
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+from korth_spirit.sdk import CONTEXT, SDK
+from korth_spirit.sdk.errors import AwError
+
+# Attribute sets only stage values for the next call, so workers send them along with it.
+ATTRIBUTE_SETTERS = frozenset({'aw_int_set', 'aw_string_set', 'aw_bool_set', 'aw_float_set', 'aw_data_set'})
+
+
+def by_event_type(event: Any) -> Hashable:
+    """
+    Orders the events of each type.
+
+    Args:
+        event (Any): The event.
+
+    Returns:
+        Hashable: The event type.
+    """
+    return event.event_type
+
+
+class ThreadedDispatcher:
+    def __init__(
+        self,
+        workers: int = 4,
+        key: Callable[[Any], Hashable] = by_event_type,
+        max_queue: Optional[int] = 10000,
+        batch: int = 32,
+        on_error: Callable[[Any, BaseException], None] = None,
+    ) -> None:
+        """
+        Runs subscribers on a thread pool instead of inside the SDK callback,
+        so slow handlers don't stall aw_wait. Events are snapshotted before
+        they are queued, and events with the same key are handled in order.
+
+        While it runs, SDK calls made from the workers are marshalled back to
+        the SDK thread, the thread that started the dispatcher, which runs them
+        when it next calls aw_wait. Attribute sets are sent along with the call
+        that uses them, so each call sees its own attributes, and those left
+        when a subscriber returns are sent then. On a worker, aw_wait only
+        waits while the SDK thread delivers events.
+
+        Each marshalled call is run on its own, so attributes read after a call
+        may have been changed by other calls or callbacks in between. Handlers
+        that read the results of a call should make both through run().
+
+        Args:
+            workers (int, optional): The number of threads. Defaults to 4.
+            key (Callable[[Any], Hashable], optional): The ordering key of an event,
+                such as its session. Defaults to by_event_type.
+            max_queue (Optional[int], optional): The queued events after which new ones
+                are dropped, or None for no limit. Defaults to 10000.
+            batch (int, optional): The events handled for a key before the thread is
+                handed to another key. Defaults to 32.
+            on_error (Callable[[Any, BaseException], None], optional): Called with the event
+                and error when a subscriber raises. Defaults to printing the traceback.
+        """
+        self.workers = workers
+        self.key = key
+        self.max_queue = max_queue
+        self.batch = batch
+        self.on_error = on_error or _print_error
+
+        self._lock = threading.Lock()
+        self._lanes: Dict[Hashable, deque] = {}
+        self._calls = deque()
+        self._local = threading.local()
+        self._sdk_thread = threading.get_ident()
+        self._executor = None
+
+        self.queued = 0
+        self.running = 0
+        self.submitted = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.errors = 0
+        self.marshalled = 0
+        self.lag_max = 0.0
+        self._lag_total = 0.0
+
+    @property
+    def started(self) -> bool:
+        """
+        Whether the workers have been started.
+
+        Returns:
+            bool: True once an event was queued, until closed.
+        """
+        return self._executor is not None
+
+    def start(self) -> "ThreadedDispatcher":
+        """
+        Starts the workers and marshalling of their SDK calls.
+
+        Returns:
+            ThreadedDispatcher: The dispatcher.
+        """
+        if self._executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            self._sdk_thread = threading.get_ident()
+            self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix='korth-spirit-events')
+            SDK.wrap(self._marshal)
+            CONTEXT.redirect(self._select)
+
+        return self
+
+    def submit(self, instance: Any, event: Any, subscribers: List[Callable], args: tuple = (), kwargs: dict = None) -> bool:
+        """
+        Queues a snapshotted event for its subscribers.
+
+        Args:
+            instance (Any): The instance the event was received by.
+            event (Any): The snapshotted event.
+            subscribers (List[Callable]): The subscribers to call.
+            args (tuple, optional): Extra arguments for the subscribers. Defaults to ().
+            kwargs (dict, optional): Extra keyword arguments for the subscribers. Defaults to None.
+
+        Returns:
+            bool: False if the event was dropped because the queue is full.
+        """
+        self.start()
+        key = self.key(event)
+        item = (perf_counter(), instance, event, subscribers, args, kwargs or {})
+
+        with self._lock:
+            if self.max_queue is not None and self.queued >= self.max_queue:
+                self.dropped += 1
+                return False
+
+            self.queued += 1
+            self.submitted += 1
+            lane = self._lanes.get(key)
+
+            if lane is not None:
+                lane.append(item)
+                return True
+
+            self._lanes[key] = deque([item])
+
+        self._executor.submit(self._drain, key)
+
+        return True
+
+    def _drain(self, key: Hashable) -> None:
+        """
+        Handles the queued events of a key, in order. A key has a lane while
+        a worker owns it, so its events are never handled concurrently.
+
+        Args:
+            key (Hashable): The key.
+        """
+        for _ in range(self.batch):
+            with self._lock:
+                lane = self._lanes[key]
+
+                if not lane:
+                    del self._lanes[key]
+                    return
+
+                queued_at, instance, event, subscribers, args, kwargs = lane.popleft()
+                self.queued -= 1
+                self.running += 1
+                lag = perf_counter() - queued_at
+                self._lag_total += lag
+                self.lag_max = max(self.lag_max, lag)
+
+            self._local.instance = instance
+            try:
+                for subscriber in subscribers:
+                    try:
+                        try:
+                            subscriber(event, *args, **kwargs)
+                        finally:
+                            self._flush()
+                    except Exception as error:
+                        with self._lock:
+                            self.errors += 1
+                        self.on_error(event, error)
+            finally:
+                self._local.pending = None
+                with self._lock:
+                    self.running -= 1
+                    self.delivered += 1
+
+        # Hand the thread to the other keys, and continue later.
+        self._executor.submit(self._drain, key)
+
+    def _select(self, instance: Any) -> None:
+        """
+        Selects an instance on the SDK thread, and only records it on workers,
+        as their calls are run on the SDK thread with the instance they recorded.
+
+        Args:
+            instance (Any): The instance handle.
+        """
+        if threading.get_ident() == self._sdk_thread:
+            type(CONTEXT).select(CONTEXT, instance)
+        else:
+            self._local.instance = instance
+
+    def _marshal(self, name: str, function: Callable) -> Callable:
+        """
+        Wraps an SDK function to run on the SDK thread.
+
+        Args:
+            name (str): The function name.
+            function (Callable): The function.
+
+        Returns:
+            Callable: The function to call in its place.
+        """
+        if name == 'aw_wait':
+            def wait(*args: Any) -> Any:
+                if threading.get_ident() != self._sdk_thread:
+                    self._flush()
+                    sleep(args[0] / 1000 if args else 0)
+                    return 0
+
+                self.run_pending()
+                try:
+                    return function(*args)
+                finally:
+                    self.run_pending()
+
+            return wait
+
+        deferred = name in ATTRIBUTE_SETTERS
+
+        def call(*args: Any) -> Any:
+            if threading.get_ident() == self._sdk_thread:
+                return function(*args)
+
+            local = self._local
+            pending = getattr(local, 'pending', None) or []
+            pending.append((function, args))
+
+            if deferred:
+                local.pending = pending
+                return 0
+
+            local.pending = None
+            return self._call(getattr(local, 'instance', None), pending)
+
+        return call
+
+    def _flush(self) -> None:
+        """
+        Sends the attribute sets a worker has left to the SDK thread.
+
+        Raises:
+            AwError: If an attribute could not be set.
+        """
+        local = self._local
+        pending, local.pending = getattr(local, 'pending', None), None
+
+        if pending:
+            rc = self._call(getattr(local, 'instance', None), pending)
+
+            if rc:
+                raise AwError.from_rc(rc, "Failed to set attribute")
+
+    def run(self, function: Callable, *args: Any, **kwargs: Any) -> Any:
+        """
+        Runs a function on the SDK thread as one marshalled call, so the SDK
+        calls it makes, and the attributes it reads, are not interleaved with
+        others. Runs it directly on the SDK thread, or when not started.
+
+        Args:
+            function (Callable): The function, such as aw_object_add.
+            *args (Any): Its arguments.
+            **kwargs (Any): Its keyword arguments.
+
+        Returns:
+            Any: The result of the function.
+        """
+        if self._executor is None or threading.get_ident() == self._sdk_thread:
+            return function(*args, **kwargs)
+
+        local = self._local
+        pending = getattr(local, 'pending', None) or []
+        local.pending = None
+        pending.append((lambda: function(*args, **kwargs), ()))
+
+        return self._call(getattr(local, 'instance', None), pending)
+
+    def _call(self, instance: Any, calls: list) -> Any:
+        """
+        Queues calls for the SDK thread and waits for their result.
+
+        Args:
+            instance (Any): The instance to run them on.
+            calls (list): The functions and arguments, the last one giving the result.
+
+        Returns:
+            Any: The result of the last call.
+        """
+        from concurrent.futures import Future
+
+        future = Future()
+        self._calls.append((instance, calls, future))
+
+        return future.result()
+
+    def run_pending(self) -> int:
+        """
+        Runs the SDK calls marshalled from the workers. Called by aw_wait on the SDK thread.
+
+        Returns:
+            int: The number of calls run.
+        """
+        ran = 0
+
+        while self._calls:
+            instance, calls, future = self._calls.popleft()
+
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            try:
+                if instance is not None:
+                    type(CONTEXT).select(CONTEXT, instance)
+
+                for function, args in calls[:-1]:
+                    rc = function(*args)
+
+                    if rc:
+                        raise AwError.from_rc(rc, "Failed to set attribute")
+
+                function, args = calls[-1]
+                future.set_result(function(*args))
+            except BaseException as error:
+                future.set_exception(error)
+
+            ran += 1
+
+        self.marshalled += ran
+        return ran
+
+    def stats(self) -> dict:
+        """
+        Gets the queue statistics.
+
+        Returns:
+            dict: The queued, running, delivered and dropped events, handler errors,
+                marshalled SDK calls, and the average and maximum lag in seconds.
+        """
+        with self._lock:
+            return {
+                'queued': self.queued,
+                'running': self.running,
+                'keys': len(self._lanes),
+                'submitted': self.submitted,
+                'delivered': self.delivered,
+                'dropped': self.dropped,
+                'errors': self.errors,
+                'marshalled': self.marshalled,
+                'lag_avg': self._lag_total / self.delivered if self.delivered else 0.0,
+                'lag_max': self.lag_max,
+            }
+
+    def close(self, wait: bool = True, poll: float = 0.001) -> None:
+        """
+        Stops the workers, and marshalling with them. Must be called on the SDK
+        thread, which runs the workers' SDK calls while waiting for them.
+
+        Args:
+            wait (bool, optional): Whether to handle the queued events, or drop them
+                and only wait for the running ones. Defaults to True.
+            poll (float, optional): The seconds between checks for marshalled calls. Defaults to 0.001.
+        """
+        if self._executor is None:
+            return
+
+        if not wait:
+            with self._lock:
+                self.dropped += self.queued
+                self.queued = 0
+                for lane in self._lanes.values():
+                    lane.clear()
+
+        while self._lanes or self._calls:
+            self.run_pending()
+            sleep(poll)
+
+        self._executor.shutdown()
+        self._executor = None
+        CONTEXT.redirect(None)
+        SDK.unwrap(self._marshal)
+
+
+def _print_error(event: Any, error: BaseException) -> None:
+    """
+    Prints the error of a subscriber.
+
+    Args:
+        event (Any): The event it was handling.
+        error (BaseException): The error.
+    """
+    import traceback
+
+    traceback.print_exception(type(error), error, error.__traceback__)
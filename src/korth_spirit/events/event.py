@@ -18,40 +18,165 @@
 # LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
 # WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
-from typing import Dict, List, Tuple, Type
+from typing import Any, Callable, Dict, List, Tuple, Type
 
 from korth_spirit.sdk import AttributeEnum, EventEnum
 
+# Field readers of each translation list, keyed by its id.
+_FIELDS: Dict[int, Tuple[list, Dict[str, Callable[[], Any]]]] = {}
+
+def _fields(event_data: List[Tuple[Type, AttributeEnum]]) -> Dict[str, Callable[[], Any]]:
+    """
+    Gets the field names and readers of a translation list, computed once per list.
+
+    Args:
+        event_data (List[Tuple[Type, AttributeEnum]]): The data associated with the event.
+
+    Raises:
+        Exception: If an attribute type is not found.
+
+    Returns:
+        Dict[str, Callable[[], Any]]: The reader of each field.
+    """
+    entry = _FIELDS.get(id(event_data))
+
+    if entry is not None and entry[0] is event_data:
+        return entry[1]
+
+    from korth_spirit.sdk.accessors import READERS, build_reader
+
+    fields = {}
+    for data_type, attribute in event_data:
+        reader = READERS[attribute.value] or build_reader(attribute, data_type)
+
+        if reader is None:
+            raise Exception(f"Unknown type for attribute: {attribute}")
+
+        fields[attribute.name.removeprefix('AW_').lower()] = reader
+
+    _FIELDS[id(event_data)] = (event_data, fields)
+
+    return fields
+
+
+# The generated event class of each event type, filled by events.event_types.
+EVENT_CLASSES: Dict[Any, Type["Event"]] = {}
+
 
 class Event:
-    def __init__(self, event_type: EventEnum, event_data: List[Tuple[Type, AttributeEnum]]) -> None:
+    __slots__ = ('_active', 'rc')
+
+    event_type = None
+    translations = ()
+    _readers = None
+
+    def __new__(cls, event_type: EventEnum = None, event_data: List[Tuple[Type, AttributeEnum]] = None) -> "Event":
+        """
+        Creates the generated class of the event type, or a DynamicEvent
+        for event types and data without one.
+        """
+        if cls is Event:
+            generated = EVENT_CLASSES.get(event_type)
+
+            if generated is not None and (event_data is None or event_data is generated.translations):
+                cls = generated
+            else:
+                cls = DynamicEvent
+
+        return object.__new__(cls)
+
+    def __init__(self, event_type: EventEnum = None, event_data: List[Tuple[Type, AttributeEnum]] = None) -> None:
         """
         Class for Active Worlds events, which are published to the bus and simplified for Python.
+        Attributes are read from the SDK on first access and remembered. The SDK only
+        holds them while the callback runs, so call snapshot() to keep an event longer.
 
         Args:
             event_type (EventEnum): The type of event received from the Active Worlds SDK.
             event_data (List[Tuple[Type, AttributeEnum]]): The data associated with the event.
         """
-        self.event_type = event_type
-        self._translate(event_data)
+        self._active = True
+
+    @classmethod
+    def fields(cls) -> Dict[str, Callable[[], Any]]:
+        """
+        Gets the reader of each field, built on first use.
+
+        Returns:
+            Dict[str, Callable[[], Any]]: The reader of each field.
+        """
+        if cls._readers is None:
+            cls._readers = _fields(cls.translations)
 
-    def _translate(self, event_data: List[Tuple[Type, AttributeEnum]]) -> None:
+        return cls._readers
+
+    def __getattr__(self, name: str) -> Any:
         """
-        Translates the event data to this object.
-        This is a private method.
+        Reads an attribute that has not been read yet.
 
         Args:
-            event_data (List[Tuple[Type, AttributeEnum]]): The data associated with the event.
+            name (str): The attribute name.
+
+        Raises:
+            AttributeError: If the event has no such attribute.
+            Exception: If the callback of the event has ended.
+
+        Returns:
+            Any: The attribute value.
+        """
+        readers = self._readers or self.fields()
+        reader = readers.get(name)
+
+        if reader is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        if not self._active:
+            raise Exception(f"Event attribute {name} read after its callback, use snapshot() to keep it")
+
+        value = reader()
+        setattr(self, name, value)
+
+        return value
+
+    def __dir__(self) -> List[str]:
+        return sorted({*super().__dir__(), *(self._readers or self.fields())})
+
+    def snapshot(self) -> "Event":
+        """
+        Reads every attribute, so the event can be kept after its callback.
+
+        Returns:
+            Event: The event.
+        """
+        readers = self._readers or self.fields()
+
+        if not self._active:
+            # Raises for the attributes that were never read.
+            for name in readers:
+                getattr(self, name)
+
+            return self
+
+        for name, reader in readers.items():
+            setattr(self, name, reader())
+
+        return self
+
+    def close(self) -> None:
+        """
+        Marks the callback of the event as ended.
         """
-        from korth_spirit.sdk.get_data import get_data
+        self._active = False
 
-        for data_type, attribute in event_data:
-            name = (
-                str(attribute)
-                .removeprefix('AttributeEnum.')
-                .removeprefix('AW_')
-                .lower()
-            )
-            data = get_data(attribute, data_type)
 
-            setattr(self, name, data)
+class DynamicEvent(Event):
+    def __init__(self, event_type: EventEnum = None, event_data: List[Tuple[Type, AttributeEnum]] = ()) -> None:
+        """
+        An event without a generated class, whose fields come from its data.
+
+        Args:
+            event_type (EventEnum): The type of event received from the Active Worlds SDK.
+            event_data (List[Tuple[Type, AttributeEnum]]): The data associated with the event.
+        """
+        self.event_type = event_type
+        self._readers = _fields(event_data or ())
+        self._active = True
@@ -0,0 +1,1555 @@
+# Copyright (c) 2021-2022 Johnathan P. Irvin
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# Generated by korth_spirit.events.generate from TRANSLATIONS, do not edit.
+from korth_spirit.sdk import CallBackEnum, EventEnum
+
+from .event import EVENT_CLASSES, Event
+from .translations import TRANSLATIONS
+
+
+class AvatarAddEvent(Event):
+    __slots__ = (
+        'avatar_session',
+        'avatar_name',
+        'avatar_x',
+        'avatar_y',
+        'avatar_z',
+        'avatar_yaw',
+        'avatar_type',
+        'avatar_gesture',
+        'avatar_version',
+        'avatar_citizen',
+        'avatar_privilege',
+        'avatar_pitch',
+        'avatar_state',
+        'plugin_string',
+    )
+    event_type = EventEnum.AW_EVENT_AVATAR_ADD
+    translations = TRANSLATIONS[EventEnum.AW_EVENT_AVATAR_ADD]
+    avatar_session: int
+    avatar_name: str
+    avatar_x: int
+    avatar_y: int
+    avatar_z: int
+    avatar_yaw: int
+    avatar_type: int
+    avatar_gesture: int
+    avatar_version: int
+    avatar_citizen: int
+    avatar_privilege: int
+    avatar_pitch: int
+    avatar_state: int
+    plugin_string: str
+
+
+class AvatarChangeEvent(Event):
+    __slots__ = (
+        'avatar_session',
+        'avatar_name',
+        'avatar_x',
+        'avatar_y',
+        'avatar_z',
+        'avatar_yaw',
+        'avatar_type',
+        'avatar_gesture',
+        'avatar_pitch',
+        'avatar_state',
+        'avatar_flags',
+        'avatar_lock',
+        'plugin_string',
+    )
+    event_type = EventEnum.AW_EVENT_AVATAR_CHANGE
+    translations = TRANSLATIONS[EventEnum.AW_EVENT_AVATAR_CHANGE]
+    avatar_session: int
+    avatar_name: str
+    avatar_x: int
+    avatar_y: int
+    avatar_z: int
+    avatar_yaw: int
+    avatar_type: int
+    avatar_gesture: int
+    avatar_pitch: int
+    avatar_state: int
+    avatar_flags: int
+    avatar_lock: bool
+    plugin_string: str
+
+
+class AvatarDeleteEvent(Event):
+    __slots__ = (
+        'avatar_session',
+        'avatar_name',
+    )
+    event_type = EventEnum.AW_EVENT_AVATAR_DELETE
+    translations = TRANSLATIONS[EventEnum.AW_EVENT_AVATAR_DELETE]
+    avatar_session: int
+    avatar_name: str
+
+
+class CellBeginEvent(Event):
+    __slots__ = (
+        'cell_x',
+        'cell_z',
+        'cell_sequence',
+        'cell_size',
+    )
+    event_type = EventEnum.AW_EVENT_CELL_BEGIN
+    translations = TRANSLATIONS[EventEnum.AW_EVENT_CELL_BEGIN]
+    cell_x: int
+    cell_z: int
+    cell_sequence: int
+    cell_size: int
+
+
+class CellObjectEvent(Event):
+    __slots__ = (
+        'object_type',
+        'object_id',
+        'object_number',
+        'object_owner',
+        'object_build_timestamp',
+        'object_x',
+        'object_y',
+        'object_z',
+        'object_yaw',
+        'object_tilt',
+        'object_roll',
+        'object_model',
+        'object_description',
+        'object_action',
+        'object_data',
+    )
+    event_type = EventEnum.AW_EVENT_CELL_OBJECT
+    translations = TRANSLATIONS[EventEnum.AW_EVENT_CELL_OBJECT]
+    object_type: int
+    object_id: int
+    object_number: int
+    object_owner: int
+    object_build_timestamp: int
+    object_x: int
+    object_y: int
+    object_z: int
+    object_yaw: int
+    object_tilt: int
+    object_roll: int
+    object_model: str
+    object_description: str
+    object_action: str
+    object_data: bytes
+
+
+class CellEndEvent(Event):
+    __slots__ = ()
+    event_type = EventEnum.AW_EVENT_CELL_END
+    translations = TRANSLATIONS[EventEnum.AW_EVENT_CELL_END]
+
+
+class ChatEvent(Event):
+    __slots__ = (
+        'avatar_name',
+        'chat_message',
+        'chat_type',
+        'chat_citizen',
+        'chat_session',
+    )
+    event_type = EventEnum.AW_EVENT_CHAT
+    translations = TRANSLATIONS[EventEnum.AW_EVENT_CHAT]
+    avatar_name: str
+    chat_message: str
+    chat_type: int
+    chat_citizen: int
+    chat_session: int
+
+
+class ObjectAddEvent(Event):
+    __slots__ = (
+        'object_session',
+        'cell_sequence',
+        'cell_x',
+        'cell_z',
+        'object_type',
+        'object_id',
+        'object_number',
+        'object_owner',
+        'object_build_timestamp',
+        'object_x',
+        'object_y',
+        'object_z',
+        'object_yaw',
+        'object_tilt',
+        'object_roll',
+        'object_model',
+        'object_description',
+        'object_action',
+        'object_data',
+    )
+    event_type = EventEnum.AW_EVENT_OBJECT_ADD
+    translations = TRANSLATIONS[EventEnum.AW_EVENT_OBJECT_ADD]
+    object_session: int
+    cell_sequence: int
+    cell_x: int
+    cell_z: int
+    object_type: int
+    object_id: int
+    object_number: int
+    object_owner: int
+    object_build_timestamp: int
+    object_x: int
+    object_y: int
+    object_z: int
+    object_yaw: int
+    object_tilt: int
+    object_roll: int
+    object_model: str
+    object_description: str
+    object_action: str
+    object_data: bytes
+
+
+class ObjectDeleteEvent(Event):
+    __slots__ = (
+        'object_session',
+        'object_id',
+        'object_number',
+        'cell_x',
+        'cell_z',
+        'cell_sequence',
+    )
+    event_type = EventEnum.AW_EVENT_OBJECT_DELETE
+    translations = TRANSLATIONS[EventEnum.AW_EVENT_OBJECT_DELETE]
+    object_session: int
+    object_id: int
+    object_number: int
+    cell_x: int
+    cell_z: int
+    cell_sequence: int
+
+
+class UniverseAttributesEvent(Event):
+    __slots__ = (
+        'universe_allow_tourists',
+        'universe_annual_charge',
+        'universe_browser_beta',
+        'universe_browser_minimum',
+        'universe_browser_release',
+        'universe_build_number',
+        'universe_citizen_changes_allowed',
+        'universe_monthly_charge',
+        'universe_register_method',
+        'universe_registration_required',
+        'universe_search_url',
+        'universe_time',
+        'universe_welcome_message',
+        'universe_world_beta',
+        'universe_world_minimum',
+        'universe_world_release',
+        'universe_world_start',
+        'universe_user_list_enabled',
+        'universe_notepad_url',
+        'universe_cav_path',
+        'universe_cav_path2',
+    )
+    event_type = EventEnum.AW_EVENT_UNIVERSE_ATTRIBUTES
+    translations = TRANSLATIONS[EventEnum.AW_EVENT_UNIVERSE_ATTRIBUTES]
+    universe_allow_tourists: bool
+    universe_annual_charge: str
+    universe_browser_beta: int
+    universe_browser_minimum: int
+    universe_browser_release: int
+    universe_build_number: int
+    universe_citizen_changes_allowed: bool
+    universe_monthly_charge: str
+    universe_register_method: int
+    universe_registration_required: bool
+    universe_search_url: str
+    universe_time: int
+    universe_welcome_message: str
+    universe_world_beta: int
+    universe_world_minimum: int
+    universe_world_release: int
+    universe_world_start: str
+    universe_user_list_enabled: bool
+    universe_notepad_url: str
+    universe_cav_path: str
+    universe_cav_path2: str
+
+
+class UniverseDisconnectEvent(Event):
+    __slots__ = (
+        'disconnect_reason',
+    )
+    event_type = EventEnum.AW_EVENT_UNIVERSE_DISCONNECT
+    translations = TRANSLATIONS[EventEnum.AW_EVENT_UNIVERSE_DISCONNECT]
+    disconnect_reason: int
+
+
+class WorldAttributesEvent(Event):
+    __slots__ = (
+        'attrib_sender_session',
+    )
+    event_type = EventEnum.AW_EVENT_WORLD_ATTRIBUTES
+    translations = TRANSLATIONS[EventEnum.AW_EVENT_WORLD_ATTRIBUTES]
+    attrib_sender_session: int
+
+
+class WorldInfoEvent(Event):
+    __slots__ = (
+        'worldlist_name',
+        'worldlist_users',
+        'worldlist_status',
+        'worldlist_rating',
+    )
+    event_type = EventEnum.AW_EVENT_WORLD_INFO
+    translations = TRANSLATIONS[EventEnum.AW_EVENT_WORLD_INFO]
+    worldlist_name: str
+    worldlist_users: int
+    worldlist_status: int
+    worldlist_rating: int
+
+
+class WorldDisconnectEvent(Event):
+    __slots__ = (
+        'disconnect_reason',
+    )
+    event_type = EventEnum.AW_EVENT_WORLD_DISCONNECT
+    translations = TRANSLATIONS[EventEnum.AW_EVENT_WORLD_DISCONNECT]
+    disconnect_reason: int
+
+
+class SendFileEvent(Event):
+    __slots__ = ()
+    event_type = EventEnum.AW_EVENT_SEND_FILE
+    translations = TRANSLATIONS[EventEnum.AW_EVENT_SEND_FILE]
+
+
+class ContactStateEvent(Event):
+    __slots__ = ()
+    event_type = EventEnum.AW_EVENT_CONTACT_STATE
+    translations = TRANSLATIONS[EventEnum.AW_EVENT_CONTACT_STATE]
+
+
+class TelegramEvent(Event):
+    __slots__ = ()
+    event_type = EventEnum.AW_EVENT_TELEGRAM
+    translations = TRANSLATIONS[EventEnum.AW_EVENT_TELEGRAM]
+
+
+class JoinEvent(Event):
+    __slots__ = ()
+    event_type = EventEnum.AW_EVENT_JOIN
+    translations = TRANSLATIONS[EventEnum.AW_EVENT_JOIN]
+
+
+class ObjectClickEvent(Event):
+    __slots__ = (
+        'avatar_session',
+        'avatar_name',
+        'cell_x',
+        'cell_z',
+        'object_id',
+        'object_number',
+        'object_type',
+        'object_sync',
+        'object_x',
+        'object_y',
+        'object_z',
+        'object_yaw',
+        'object_tilt',
+        'object_roll',
+        'object_build_timestamp',
+        'object_owner',
+        'object_model',
+        'object_description',
+        'object_action',
+        'object_data',
+    )
+    event_type = EventEnum.AW_EVENT_OBJECT_CLICK
+    translations = TRANSLATIONS[EventEnum.AW_EVENT_OBJECT_CLICK]
+    avatar_session: int
+    avatar_name: str
+    cell_x: int
+    cell_z: int
+    object_id: int
+    object_number: int
+    object_type: int
+    object_sync: int
+    object_x: int
+    object_y: int
+    object_z: int
+    object_yaw: int
+    object_tilt: int
+    object_roll: int
+    object_build_timestamp: int
+    object_owner: int
+    object_model: str
+    object_description: str
+    object_action: str
+    object_data: bytes
+
+
+class ObjectSelectEvent(Event):
+    __slots__ = (
+        'avatar_session',
+        'avatar_name',
+        'cell_x',
+        'cell_z',
+        'object_id',
+        'object_number',
+    )
+    event_type = EventEnum.AW_EVENT_OBJECT_SELECT
+    translations = TRANSLATIONS[EventEnum.AW_EVENT_OBJECT_SELECT]
+    avatar_session: int
+    avatar_name: str
+    cell_x: int
+    cell_z: int
+    object_id: int
+    object_number: int
+
+
+class AvatarClickEvent(Event):
+    __slots__ = (
+        'avatar_session',
+        'avatar_name',
+        'clicked_session',
+        'clicked_name',
+    )
+    event_type = EventEnum.AW_EVENT_AVATAR_CLICK
+    translations = TRANSLATIONS[EventEnum.AW_EVENT_AVATAR_CLICK]
+    avatar_session: int
+    avatar_name: str
+    clicked_session: int
+    clicked_name: str
+
+
+class UrlEvent(Event):
+    __slots__ = (
+        'avatar_session',
+        'avatar_name',
+        'url_name',
+        'url_post',
+        'url_target',
+        'url_target_3d',
+    )
+    event_type = EventEnum.AW_EVENT_URL
+    translations = TRANSLATIONS[EventEnum.AW_EVENT_URL]
+    avatar_session: int
+    avatar_name: str
+    url_name: str
+    url_post: str
+    url_target: str
+    url_target_3d: bool
+
+
+class UrlClickEvent(Event):
+    __slots__ = (
+        'avatar_name',
+        'avatar_session',
+        'url_name',
+    )
+    event_type = EventEnum.AW_EVENT_URL_CLICK
+    translations = TRANSLATIONS[EventEnum.AW_EVENT_URL_CLICK]
+    avatar_name: str
+    avatar_session: int
+    url_name: str
+
+
+class TeleportEvent(Event):
+    __slots__ = (
+        'teleport_world',
+        'teleport_x',
+        'teleport_y',
+        'teleport_z',
+        'teleport_yaw',
+        'teleport_warp',
+    )
+    event_type = EventEnum.AW_EVENT_TELEPORT
+    translations = TRANSLATIONS[EventEnum.AW_EVENT_TELEPORT]
+    teleport_world: str
+    teleport_x: int
+    teleport_y: int
+    teleport_z: int
+    teleport_yaw: int
+    teleport_warp: bool
+
+
+class AdminWorldInfoEvent(Event):
+    __slots__ = (
+        'server_id',
+        'server_instance',
+        'server_caretakers',
+        'server_enabled',
+        'server_expiration',
+        'server_max_users',
+        'server_name',
+        'server_objects',
+        'server_password',
+        'server_registry',
+        'server_size',
+        'server_start_rc',
+        'server_state',
+        'server_terrain_nodes',
+        'server_users',
+    )
+    event_type = EventEnum.AW_EVENT_ADMIN_WORLD_INFO
+    translations = TRANSLATIONS[EventEnum.AW_EVENT_ADMIN_WORLD_INFO]
+    server_id: int
+    server_instance: int
+    server_caretakers: str
+    server_enabled: bool
+    server_expiration: int
+    server_max_users: int
+    server_name: str
+    server_objects: int
+    server_password: str
+    server_registry: str
+    server_size: int
+    server_start_rc: int
+    server_state: int
+    server_terrain_nodes: int
+    server_users: int
+
+
+class AdminWorldDeleteEvent(Event):
+    __slots__ = (
+        'server_id',
+    )
+    event_type = EventEnum.AW_EVENT_ADMIN_WORLD_DELETE
+    translations = TRANSLATIONS[EventEnum.AW_EVENT_ADMIN_WORLD_DELETE]
+    server_id: int
+
+
+class TerrainBeginEvent(Event):
+    __slots__ = (
+        'terrain_page_x',
+        'terrain_page_z',
+    )
+    event_type = EventEnum.AW_EVENT_TERRAIN_BEGIN
+    translations = TRANSLATIONS[EventEnum.AW_EVENT_TERRAIN_BEGIN]
+    terrain_page_x: int
+    terrain_page_z: int
+
+
+class TerrainDataEvent(Event):
+    __slots__ = (
+        'terrain_page_x',
+        'terrain_page_z',
+        'terrain_node_x',
+        'terrain_node_z',
+        'terrain_node_size',
+        'terrain_node_textures',
+        'terrain_node_heights',
+    )
+    event_type = EventEnum.AW_EVENT_TERRAIN_DATA
+    translations = TRANSLATIONS[EventEnum.AW_EVENT_TERRAIN_DATA]
+    terrain_page_x: int
+    terrain_page_z: int
+    terrain_node_x: int
+    terrain_node_z: int
+    terrain_node_size: int
+    terrain_node_textures: bytes
+    terrain_node_heights: bytes
+
+
+class TerrainEndEvent(Event):
+    __slots__ = (
+        'terrain_complete',
+        'terrain_sequence',
+    )
+    event_type = EventEnum.AW_EVENT_TERRAIN_END
+    translations = TRANSLATIONS[EventEnum.AW_EVENT_TERRAIN_END]
+    terrain_complete: bool
+    terrain_sequence: int
+
+
+class ConsoleMessageEvent(Event):
+    __slots__ = (
+        'console_red',
+        'console_green',
+        'console_blue',
+        'console_message',
+        'console_bold',
+        'console_italics',
+    )
+    event_type = EventEnum.AW_EVENT_CONSOLE_MESSAGE
+    translations = TRANSLATIONS[EventEnum.AW_EVENT_CONSOLE_MESSAGE]
+    console_red: int
+    console_green: int
+    console_blue: int
+    console_message: str
+    console_bold: bool
+    console_italics: bool
+
+
+class TerrainChangedEvent(Event):
+    __slots__ = (
+        'terrain_page_x',
+        'terrain_page_z',
+    )
+    event_type = EventEnum.AW_EVENT_TERRAIN_CHANGED
+    translations = TRANSLATIONS[EventEnum.AW_EVENT_TERRAIN_CHANGED]
+    terrain_page_x: int
+    terrain_page_z: int
+
+
+class BotgramEvent(Event):
+    __slots__ = (
+        'botgram_from_name',
+        'botgram_from',
+        'botgram_text',
+    )
+    event_type = EventEnum.AW_EVENT_BOTGRAM
+    translations = TRANSLATIONS[EventEnum.AW_EVENT_BOTGRAM]
+    botgram_from_name: str
+    botgram_from: int
+    botgram_text: str
+
+
+class ToolbarClickEvent(Event):
+    __slots__ = (
+        'toolbar_session',
+        'toolbar_id',
+    )
+    event_type = EventEnum.AW_EVENT_TOOLBAR_CLICK
+    translations = TRANSLATIONS[EventEnum.AW_EVENT_TOOLBAR_CLICK]
+    toolbar_session: int
+    toolbar_id: int
+
+
+class UserInfoEvent(Event):
+    __slots__ = (
+        'userlist_id',
+        'userlist_name',
+        'userlist_world',
+        'userlist_citizen',
+        'userlist_state',
+        'userlist_email',
+        'userlist_privilege',
+        'userlist_address',
+    )
+    event_type = EventEnum.AW_EVENT_USER_INFO
+    translations = TRANSLATIONS[EventEnum.AW_EVENT_USER_INFO]
+    userlist_id: int
+    userlist_name: str
+    userlist_world: str
+    userlist_citizen: int
+    userlist_state: int
+    userlist_email: str
+    userlist_privilege: int
+    userlist_address: int
+
+
+class NoiseEvent(Event):
+    __slots__ = (
+        'sound_name',
+    )
+    event_type = EventEnum.AW_EVENT_NOISE
+    translations = TRANSLATIONS[EventEnum.AW_EVENT_NOISE]
+    sound_name: str
+
+
+class CameraEvent(Event):
+    __slots__ = ()
+    event_type = EventEnum.AW_EVENT_CAMERA
+    translations = TRANSLATIONS[EventEnum.AW_EVENT_CAMERA]
+
+
+class BotmenuEvent(Event):
+    __slots__ = (
+        'botmenu_from_name',
+        'botmenu_from_session',
+        'botmenu_question',
+        'botmenu_answer',
+    )
+    event_type = EventEnum.AW_EVENT_BOTMENU
+    translations = TRANSLATIONS[EventEnum.AW_EVENT_BOTMENU]
+    botmenu_from_name: str
+    botmenu_from_session: int
+    botmenu_question: str
+    botmenu_answer: str
+
+
+class ObjectBumpEvent(Event):
+    __slots__ = (
+        'avatar_session',
+        'avatar_name',
+        'object_type',
+        'object_sync',
+        'object_x',
+        'object_y',
+        'object_z',
+        'object_yaw',
+        'object_tilt',
+        'object_roll',
+        'object_build_timestamp',
+        'object_owner',
+        'object_model',
+        'object_description',
+        'object_action',
+        'object_data',
+    )
+    event_type = EventEnum.AW_EVENT_OBJECT_BUMP
+    translations = TRANSLATIONS[EventEnum.AW_EVENT_OBJECT_BUMP]
+    avatar_session: int
+    avatar_name: str
+    object_type: int
+    object_sync: int
+    object_x: int
+    object_y: int
+    object_z: int
+    object_yaw: int
+    object_tilt: int
+    object_roll: int
+    object_build_timestamp: int
+    object_owner: int
+    object_model: str
+    object_description: str
+    object_action: str
+    object_data: bytes
+
+
+class EntityAddEvent(Event):
+    __slots__ = (
+        'entity_type',
+        'entity_id',
+        'entity_state',
+        'entity_flags',
+        'entity_x',
+        'entity_y',
+        'entity_z',
+        'entity_yaw',
+        'entity_pitch',
+        'entity_roll',
+        'entity_owner_session',
+        'entity_model_num',
+        'entity_owner_citizen',
+    )
+    event_type = EventEnum.AW_EVENT_ENTITY_ADD
+    translations = TRANSLATIONS[EventEnum.AW_EVENT_ENTITY_ADD]
+    entity_type: int
+    entity_id: int
+    entity_state: int
+    entity_flags: int
+    entity_x: int
+    entity_y: int
+    entity_z: int
+    entity_yaw: int
+    entity_pitch: int
+    entity_roll: int
+    entity_owner_session: int
+    entity_model_num: int
+    entity_owner_citizen: int
+
+
+class EntityChangeEvent(Event):
+    __slots__ = (
+        'entity_type',
+        'entity_id',
+        'entity_state',
+        'entity_flags',
+        'entity_x',
+        'entity_y',
+        'entity_z',
+        'entity_yaw',
+        'entity_pitch',
+        'entity_roll',
+        'entity_owner_session',
+        'entity_model_num',
+    )
+    event_type = EventEnum.AW_EVENT_ENTITY_CHANGE
+    translations = TRANSLATIONS[EventEnum.AW_EVENT_ENTITY_CHANGE]
+    entity_type: int
+    entity_id: int
+    entity_state: int
+    entity_flags: int
+    entity_x: int
+    entity_y: int
+    entity_z: int
+    entity_yaw: int
+    entity_pitch: int
+    entity_roll: int
+    entity_owner_session: int
+    entity_model_num: int
+
+
+class EntityDeleteEvent(Event):
+    __slots__ = (
+        'entity_type',
+        'entity_id',
+    )
+    event_type = EventEnum.AW_EVENT_ENTITY_DELETE
+    translations = TRANSLATIONS[EventEnum.AW_EVENT_ENTITY_DELETE]
+    entity_type: int
+    entity_id: int
+
+
+class EntityRiderAddEvent(Event):
+    __slots__ = (
+        'entity_type',
+        'entity_id',
+        'avatar_session',
+    )
+    event_type = EventEnum.AW_EVENT_ENTITY_RIDER_ADD
+    translations = TRANSLATIONS[EventEnum.AW_EVENT_ENTITY_RIDER_ADD]
+    entity_type: int
+    entity_id: int
+    avatar_session: int
+
+
+class EntityRiderDeleteEvent(Event):
+    __slots__ = (
+        'entity_type',
+        'entity_id',
+        'avatar_session',
+    )
+    event_type = EventEnum.AW_EVENT_ENTITY_RIDER_DELETE
+    translations = TRANSLATIONS[EventEnum.AW_EVENT_ENTITY_RIDER_DELETE]
+    entity_type: int
+    entity_id: int
+    avatar_session: int
+
+
+class EntityRiderChangeEvent(Event):
+    __slots__ = (
+        'entity_type',
+        'entity_id',
+        'avatar_session',
+    )
+    event_type = EventEnum.AW_EVENT_ENTITY_RIDER_CHANGE
+    translations = TRANSLATIONS[EventEnum.AW_EVENT_ENTITY_RIDER_CHANGE]
+    entity_type: int
+    entity_id: int
+    avatar_session: int
+
+
+class AvatarReloadEvent(Event):
+    __slots__ = (
+        'avatar_citizen',
+        'avatar_session',
+    )
+    event_type = EventEnum.AW_EVENT_AVATAR_RELOAD
+    translations = TRANSLATIONS[EventEnum.AW_EVENT_AVATAR_RELOAD]
+    avatar_citizen: int
+    avatar_session: int
+
+
+class EntityLinksEvent(Event):
+    __slots__ = (
+        'entity_type',
+        'entity_id',
+    )
+    event_type = EventEnum.AW_EVENT_ENTITY_LINKS
+    translations = TRANSLATIONS[EventEnum.AW_EVENT_ENTITY_LINKS]
+    entity_type: int
+    entity_id: int
+
+
+class HudClickEvent(Event):
+    __slots__ = (
+        'hud_element_session',
+        'hud_element_id',
+        'hud_element_click_x',
+        'hud_element_click_y',
+    )
+    event_type = EventEnum.AW_EVENT_HUD_CLICK
+    translations = TRANSLATIONS[EventEnum.AW_EVENT_HUD_CLICK]
+    hud_element_session: int
+    hud_element_id: int
+    hud_element_click_x: int
+    hud_element_click_y: int
+
+
+class HudCreateEvent(Event):
+    __slots__ = ()
+    event_type = EventEnum.AW_EVENT_HUD_CREATE
+    translations = TRANSLATIONS[EventEnum.AW_EVENT_HUD_CREATE]
+
+
+class HudDestroyEvent(Event):
+    __slots__ = ()
+    event_type = EventEnum.AW_EVENT_HUD_DESTROY
+    translations = TRANSLATIONS[EventEnum.AW_EVENT_HUD_DESTROY]
+
+
+class HudClearEvent(Event):
+    __slots__ = ()
+    event_type = EventEnum.AW_EVENT_HUD_CLEAR
+    translations = TRANSLATIONS[EventEnum.AW_EVENT_HUD_CLEAR]
+
+
+class CavDefinitionChangeEvent(Event):
+    __slots__ = (
+        'cav_citizen',
+        'cav_session',
+    )
+    event_type = EventEnum.AW_EVENT_CAV_DEFINITION_CHANGE
+    translations = TRANSLATIONS[EventEnum.AW_EVENT_CAV_DEFINITION_CHANGE]
+    cav_citizen: int
+    cav_session: int
+
+
+class WorldCavDefinitionChangeEvent(Event):
+    __slots__ = (
+        'cav_citizen',
+        'cav_session',
+    )
+    event_type = EventEnum.AW_EVENT_WORLD_CAV_DEFINITION_CHANGE
+    translations = TRANSLATIONS[EventEnum.AW_EVENT_WORLD_CAV_DEFINITION_CHANGE]
+    cav_citizen: int
+    cav_session: int
+
+
+class LaserBeamEvent(Event):
+    __slots__ = (
+        'laser_beam_source_type',
+    )
+    event_type = EventEnum.AW_EVENT_LASER_BEAM
+    translations = TRANSLATIONS[EventEnum.AW_EVENT_LASER_BEAM]
+    laser_beam_source_type: int
+
+
+class CreateCallback(Event):
+    __slots__ = ()
+    event_type = CallBackEnum.AW_CALLBACK_CREATE
+    translations = TRANSLATIONS[CallBackEnum.AW_CALLBACK_CREATE]
+
+
+class LoginCallback(Event):
+    __slots__ = (
+        'citizen_beta',
+        'citizen_cav_enabled',
+        'citizen_name',
+        'citizen_number',
+        'citizen_pav_enabled',
+        'citizen_time_left',
+        'login_privilege_name',
+    )
+    event_type = CallBackEnum.AW_CALLBACK_LOGIN
+    translations = TRANSLATIONS[CallBackEnum.AW_CALLBACK_LOGIN]
+    citizen_beta: bool
+    citizen_cav_enabled: bool
+    citizen_name: str
+    citizen_number: int
+    citizen_pav_enabled: bool
+    citizen_time_left: int
+    login_privilege_name: str
+
+
+class EnterCallback(Event):
+    __slots__ = (
+        'world_name',
+    )
+    event_type = CallBackEnum.AW_CALLBACK_ENTER
+    translations = TRANSLATIONS[CallBackEnum.AW_CALLBACK_ENTER]
+    world_name: str
+
+
+class ObjectResultCallback(Event):
+    __slots__ = (
+        'object_number',
+        'object_id',
+        'object_callback_reference',
+        'cell_x',
+        'cell_z',
+    )
+    event_type = CallBackEnum.AW_CALLBACK_OBJECT_RESULT
+    translations = TRANSLATIONS[CallBackEnum.AW_CALLBACK_OBJECT_RESULT]
+    object_number: int
+    object_id: int
+    object_callback_reference: int
+    cell_x: int
+    cell_z: int
+
+
+class LicenseAttributesCallback(Event):
+    __slots__ = (
+        'license_password',
+        'license_users',
+        'license_range',
+        'license_email',
+        'license_comment',
+        'license_creation_time',
+        'license_expiration_time',
+        'license_last_start',
+        'license_last_address',
+        'license_hidden',
+        'license_allow_tourists',
+        'license_voip',
+        'license_plugins',
+    )
+    event_type = CallBackEnum.AW_CALLBACK_LICENSE_ATTRIBUTES
+    translations = TRANSLATIONS[CallBackEnum.AW_CALLBACK_LICENSE_ATTRIBUTES]
+    license_password: str
+    license_users: int
+    license_range: int
+    license_email: str
+    license_comment: str
+    license_creation_time: int
+    license_expiration_time: int
+    license_last_start: int
+    license_last_address: int
+    license_hidden: bool
+    license_allow_tourists: bool
+    license_voip: bool
+    license_plugins: bool
+
+
+class LicenseResultCallback(Event):
+    __slots__ = ()
+    event_type = CallBackEnum.AW_CALLBACK_LICENSE_RESULT
+    translations = TRANSLATIONS[CallBackEnum.AW_CALLBACK_LICENSE_RESULT]
+
+
+class CitizenAttributesCallback(Event):
+    __slots__ = (
+        'citizen_number',
+        'citizen_name',
+        'citizen_password',
+        'citizen_email',
+        'citizen_enabled',
+        'citizen_beta',
+        'citizen_trial',
+        'citizen_cav_enabled',
+        'citizen_pav_enabled',
+        'citizen_bot_limit',
+        'citizen_comment',
+        'citizen_expiration_time',
+        'citizen_immigration_time',
+        'citizen_last_login',
+        'citizen_privilege_password',
+        'citizen_privacy',
+        'citizen_total_time',
+        'citizen_url',
+    )
+    event_type = CallBackEnum.AW_CALLBACK_CITIZEN_ATTRIBUTES
+    translations = TRANSLATIONS[CallBackEnum.AW_CALLBACK_CITIZEN_ATTRIBUTES]
+    citizen_number: int
+    citizen_name: str
+    citizen_password: str
+    citizen_email: str
+    citizen_enabled: bool
+    citizen_beta: bool
+    citizen_trial: bool
+    citizen_cav_enabled: bool
+    citizen_pav_enabled: bool
+    citizen_bot_limit: int
+    citizen_comment: str
+    citizen_expiration_time: int
+    citizen_immigration_time: int
+    citizen_last_login: int
+    citizen_privilege_password: str
+    citizen_privacy: int
+    citizen_total_time: int
+    citizen_url: str
+
+
+class CitizenResultCallback(Event):
+    __slots__ = (
+        'citizen_number',
+    )
+    event_type = CallBackEnum.AW_CALLBACK_CITIZEN_RESULT
+    translations = TRANSLATIONS[CallBackEnum.AW_CALLBACK_CITIZEN_RESULT]
+    citizen_number: int
+
+
+class QueryCallback(Event):
+    __slots__ = (
+        'query_complete',
+    )
+    event_type = CallBackEnum.AW_CALLBACK_QUERY
+    translations = TRANSLATIONS[CallBackEnum.AW_CALLBACK_QUERY]
+    query_complete: bool
+
+
+class WorldListCallback(Event):
+    __slots__ = (
+        'worldlist_more',
+    )
+    event_type = CallBackEnum.AW_CALLBACK_WORLD_LIST
+    translations = TRANSLATIONS[CallBackEnum.AW_CALLBACK_WORLD_LIST]
+    worldlist_more: bool
+
+
+class UniverseEjectionCallback(Event):
+    __slots__ = (
+        'ejection_address',
+        'ejection_creation_time',
+        'ejection_expiration_time',
+        'ejection_comment',
+    )
+    event_type = CallBackEnum.AW_CALLBACK_UNIVERSE_EJECTION
+    translations = TRANSLATIONS[CallBackEnum.AW_CALLBACK_UNIVERSE_EJECTION]
+    ejection_address: int
+    ejection_creation_time: int
+    ejection_expiration_time: int
+    ejection_comment: str
+
+
+class UniverseEjectionResultCallback(Event):
+    __slots__ = ()
+    event_type = CallBackEnum.AW_CALLBACK_UNIVERSE_EJECTION_RESULT
+    translations = TRANSLATIONS[CallBackEnum.AW_CALLBACK_UNIVERSE_EJECTION_RESULT]
+
+
+class AddressCallback(Event):
+    __slots__ = (
+        'avatar_session',
+        'avatar_address',
+    )
+    event_type = CallBackEnum.AW_CALLBACK_ADDRESS
+    translations = TRANSLATIONS[CallBackEnum.AW_CALLBACK_ADDRESS]
+    avatar_session: int
+    avatar_address: int
+
+
+class WorldEjectionCallback(Event):
+    __slots__ = (
+        'ejection_type',
+        'ejection_address',
+        'ejection_creation_time',
+        'ejection_expiration_time',
+        'ejection_comment',
+    )
+    event_type = CallBackEnum.AW_CALLBACK_WORLD_EJECTION
+    translations = TRANSLATIONS[CallBackEnum.AW_CALLBACK_WORLD_EJECTION]
+    ejection_type: int
+    ejection_address: int
+    ejection_creation_time: int
+    ejection_expiration_time: int
+    ejection_comment: str
+
+
+class WorldEjectionResultCallback(Event):
+    __slots__ = ()
+    event_type = CallBackEnum.AW_CALLBACK_WORLD_EJECTION_RESULT
+    translations = TRANSLATIONS[CallBackEnum.AW_CALLBACK_WORLD_EJECTION_RESULT]
+
+
+class AdminWorldListCallback(Event):
+    __slots__ = (
+        'server_id',
+    )
+    event_type = CallBackEnum.AW_CALLBACK_ADMIN_WORLD_LIST
+    translations = TRANSLATIONS[CallBackEnum.AW_CALLBACK_ADMIN_WORLD_LIST]
+    server_id: int
+
+
+class AdminWorldResultCallback(Event):
+    __slots__ = (
+        'server_id',
+        'server_instance',
+        'server_name',
+    )
+    event_type = CallBackEnum.AW_CALLBACK_ADMIN_WORLD_RESULT
+    translations = TRANSLATIONS[CallBackEnum.AW_CALLBACK_ADMIN_WORLD_RESULT]
+    server_id: int
+    server_instance: int
+    server_name: str
+
+
+class DeleteAllObjectsResultCallback(Event):
+    __slots__ = ()
+    event_type = CallBackEnum.AW_CALLBACK_DELETE_ALL_OBJECTS_RESULT
+    translations = TRANSLATIONS[CallBackEnum.AW_CALLBACK_DELETE_ALL_OBJECTS_RESULT]
+
+
+class CellResultCallback(Event):
+    __slots__ = (
+        'cell_iterator',
+    )
+    event_type = CallBackEnum.AW_CALLBACK_CELL_RESULT
+    translations = TRANSLATIONS[CallBackEnum.AW_CALLBACK_CELL_RESULT]
+    cell_iterator: int
+
+
+class ReloadRegistryCallback(Event):
+    __slots__ = ()
+    event_type = CallBackEnum.AW_CALLBACK_RELOAD_REGISTRY
+    translations = TRANSLATIONS[CallBackEnum.AW_CALLBACK_RELOAD_REGISTRY]
+
+
+class AttributesResetResultCallback(Event):
+    __slots__ = ()
+    event_type = CallBackEnum.AW_CALLBACK_ATTRIBUTES_RESET_RESULT
+    translations = TRANSLATIONS[CallBackEnum.AW_CALLBACK_ATTRIBUTES_RESET_RESULT]
+
+
+class AdminCallback(Event):
+    __slots__ = (
+        'server_build',
+        'world_build_number',
+    )
+    event_type = CallBackEnum.AW_CALLBACK_ADMIN
+    translations = TRANSLATIONS[CallBackEnum.AW_CALLBACK_ADMIN]
+    server_build: int
+    world_build_number: int
+
+
+class TerrainSetResultCallback(Event):
+    __slots__ = (
+        'terrain_x',
+        'terrain_z',
+    )
+    event_type = CallBackEnum.AW_CALLBACK_TERRAIN_SET_RESULT
+    translations = TRANSLATIONS[CallBackEnum.AW_CALLBACK_TERRAIN_SET_RESULT]
+    terrain_x: int
+    terrain_z: int
+
+
+class TerrainNextResultCallback(Event):
+    __slots__ = (
+        'terrain_complete',
+    )
+    event_type = CallBackEnum.AW_CALLBACK_TERRAIN_NEXT_RESULT
+    translations = TRANSLATIONS[CallBackEnum.AW_CALLBACK_TERRAIN_NEXT_RESULT]
+    terrain_complete: bool
+
+
+class TerrainDeleteAllResultCallback(Event):
+    __slots__ = ()
+    event_type = CallBackEnum.AW_CALLBACK_TERRAIN_DELETE_ALL_RESULT
+    translations = TRANSLATIONS[CallBackEnum.AW_CALLBACK_TERRAIN_DELETE_ALL_RESULT]
+
+
+class TerrainLoadNodeResultCallback(Event):
+    __slots__ = ()
+    event_type = CallBackEnum.AW_CALLBACK_TERRAIN_LOAD_NODE_RESULT
+    translations = TRANSLATIONS[CallBackEnum.AW_CALLBACK_TERRAIN_LOAD_NODE_RESULT]
+
+
+class BotgramResultCallback(Event):
+    __slots__ = ()
+    event_type = CallBackEnum.AW_CALLBACK_BOTGRAM_RESULT
+    translations = TRANSLATIONS[CallBackEnum.AW_CALLBACK_BOTGRAM_RESULT]
+
+
+class UserListCallback(Event):
+    __slots__ = (
+        'userlist_more',
+    )
+    event_type = CallBackEnum.AW_CALLBACK_USER_LIST
+    translations = TRANSLATIONS[CallBackEnum.AW_CALLBACK_USER_LIST]
+    userlist_more: bool
+
+
+class BotmenuResultCallback(Event):
+    __slots__ = ()
+    event_type = CallBackEnum.AW_CALLBACK_BOTMENU_RESULT
+    translations = TRANSLATIONS[CallBackEnum.AW_CALLBACK_BOTMENU_RESULT]
+
+
+class CavCallback(Event):
+    __slots__ = (
+        'cav_citizen',
+        'cav_session',
+        'cav_definition',
+    )
+    event_type = CallBackEnum.AW_CALLBACK_CAV
+    translations = TRANSLATIONS[CallBackEnum.AW_CALLBACK_CAV]
+    cav_citizen: int
+    cav_session: int
+    cav_definition: bytes
+
+
+class CavResultCallback(Event):
+    __slots__ = (
+        'cav_citizen',
+        'cav_session',
+    )
+    event_type = CallBackEnum.AW_CALLBACK_CAV_RESULT
+    translations = TRANSLATIONS[CallBackEnum.AW_CALLBACK_CAV_RESULT]
+    cav_citizen: int
+    cav_session: int
+
+
+class WorldInstanceCallback(Event):
+    __slots__ = (
+        'avatar_citizen',
+        'avatar_world_instance',
+    )
+    event_type = CallBackEnum.AW_CALLBACK_WORLD_INSTANCE
+    translations = TRANSLATIONS[CallBackEnum.AW_CALLBACK_WORLD_INSTANCE]
+    avatar_citizen: int
+    avatar_world_instance: int
+
+
+class HudResultCallback(Event):
+    __slots__ = (
+        'hud_element_session',
+        'hud_element_id',
+    )
+    event_type = CallBackEnum.AW_CALLBACK_HUD_RESULT
+    translations = TRANSLATIONS[CallBackEnum.AW_CALLBACK_HUD_RESULT]
+    hud_element_session: int
+    hud_element_id: int
+
+
+class AvatarLocationCallback(Event):
+    __slots__ = ()
+    event_type = CallBackEnum.AW_CALLBACK_AVATAR_LOCATION
+    translations = TRANSLATIONS[CallBackEnum.AW_CALLBACK_AVATAR_LOCATION]
+
+
+class ObjectQueryCallback(Event):
+    __slots__ = (
+        'object_type',
+        'object_id',
+        'object_number',
+        'object_owner',
+        'object_build_timestamp',
+        'object_x',
+        'object_y',
+        'object_z',
+        'object_yaw',
+        'object_tilt',
+        'object_roll',
+        'object_model',
+        'object_description',
+        'object_action',
+        'object_data',
+    )
+    event_type = CallBackEnum.AW_CALLBACK_OBJECT_QUERY
+    translations = TRANSLATIONS[CallBackEnum.AW_CALLBACK_OBJECT_QUERY]
+    object_type: int
+    object_id: int
+    object_number: int
+    object_owner: int
+    object_build_timestamp: int
+    object_x: int
+    object_y: int
+    object_z: int
+    object_yaw: int
+    object_tilt: int
+    object_roll: int
+    object_model: str
+    object_description: str
+    object_action: str
+    object_data: bytes
+
+
+class WorldCavResultCallback(Event):
+    __slots__ = (
+        'cav_citizen',
+        'cav_session',
+    )
+    event_type = CallBackEnum.AW_CALLBACK_WORLD_CAV_RESULT
+    translations = TRANSLATIONS[CallBackEnum.AW_CALLBACK_WORLD_CAV_RESULT]
+    cav_citizen: int
+    cav_session: int
+
+
+class WorldCavCallback(Event):
+    __slots__ = (
+        'cav_citizen',
+        'cav_session',
+        'cav_definition',
+    )
+    event_type = CallBackEnum.AW_CALLBACK_WORLD_CAV
+    translations = TRANSLATIONS[CallBackEnum.AW_CALLBACK_WORLD_CAV]
+    cav_citizen: int
+    cav_session: int
+    cav_definition: bytes
+
+
+EVENT_CLASSES.update({
+    EventEnum.AW_EVENT_AVATAR_ADD: AvatarAddEvent,
+    EventEnum.AW_EVENT_AVATAR_CHANGE: AvatarChangeEvent,
+    EventEnum.AW_EVENT_AVATAR_DELETE: AvatarDeleteEvent,
+    EventEnum.AW_EVENT_CELL_BEGIN: CellBeginEvent,
+    EventEnum.AW_EVENT_CELL_OBJECT: CellObjectEvent,
+    EventEnum.AW_EVENT_CELL_END: CellEndEvent,
+    EventEnum.AW_EVENT_CHAT: ChatEvent,
+    EventEnum.AW_EVENT_OBJECT_ADD: ObjectAddEvent,
+    EventEnum.AW_EVENT_OBJECT_DELETE: ObjectDeleteEvent,
+    EventEnum.AW_EVENT_UNIVERSE_ATTRIBUTES: UniverseAttributesEvent,
+    EventEnum.AW_EVENT_UNIVERSE_DISCONNECT: UniverseDisconnectEvent,
+    EventEnum.AW_EVENT_WORLD_ATTRIBUTES: WorldAttributesEvent,
+    EventEnum.AW_EVENT_WORLD_INFO: WorldInfoEvent,
+    EventEnum.AW_EVENT_WORLD_DISCONNECT: WorldDisconnectEvent,
+    EventEnum.AW_EVENT_SEND_FILE: SendFileEvent,
+    EventEnum.AW_EVENT_CONTACT_STATE: ContactStateEvent,
+    EventEnum.AW_EVENT_TELEGRAM: TelegramEvent,
+    EventEnum.AW_EVENT_JOIN: JoinEvent,
+    EventEnum.AW_EVENT_OBJECT_CLICK: ObjectClickEvent,
+    EventEnum.AW_EVENT_OBJECT_SELECT: ObjectSelectEvent,
+    EventEnum.AW_EVENT_AVATAR_CLICK: AvatarClickEvent,
+    EventEnum.AW_EVENT_URL: UrlEvent,
+    EventEnum.AW_EVENT_URL_CLICK: UrlClickEvent,
+    EventEnum.AW_EVENT_TELEPORT: TeleportEvent,
+    EventEnum.AW_EVENT_ADMIN_WORLD_INFO: AdminWorldInfoEvent,
+    EventEnum.AW_EVENT_ADMIN_WORLD_DELETE: AdminWorldDeleteEvent,
+    EventEnum.AW_EVENT_TERRAIN_BEGIN: TerrainBeginEvent,
+    EventEnum.AW_EVENT_TERRAIN_DATA: TerrainDataEvent,
+    EventEnum.AW_EVENT_TERRAIN_END: TerrainEndEvent,
+    EventEnum.AW_EVENT_CONSOLE_MESSAGE: ConsoleMessageEvent,
+    EventEnum.AW_EVENT_TERRAIN_CHANGED: TerrainChangedEvent,
+    EventEnum.AW_EVENT_BOTGRAM: BotgramEvent,
+    EventEnum.AW_EVENT_TOOLBAR_CLICK: ToolbarClickEvent,
+    EventEnum.AW_EVENT_USER_INFO: UserInfoEvent,
+    EventEnum.AW_EVENT_NOISE: NoiseEvent,
+    EventEnum.AW_EVENT_CAMERA: CameraEvent,
+    EventEnum.AW_EVENT_BOTMENU: BotmenuEvent,
+    EventEnum.AW_EVENT_OBJECT_BUMP: ObjectBumpEvent,
+    EventEnum.AW_EVENT_ENTITY_ADD: EntityAddEvent,
+    EventEnum.AW_EVENT_ENTITY_CHANGE: EntityChangeEvent,
+    EventEnum.AW_EVENT_ENTITY_DELETE: EntityDeleteEvent,
+    EventEnum.AW_EVENT_ENTITY_RIDER_ADD: EntityRiderAddEvent,
+    EventEnum.AW_EVENT_ENTITY_RIDER_DELETE: EntityRiderDeleteEvent,
+    EventEnum.AW_EVENT_ENTITY_RIDER_CHANGE: EntityRiderChangeEvent,
+    EventEnum.AW_EVENT_AVATAR_RELOAD: AvatarReloadEvent,
+    EventEnum.AW_EVENT_ENTITY_LINKS: EntityLinksEvent,
+    EventEnum.AW_EVENT_HUD_CLICK: HudClickEvent,
+    EventEnum.AW_EVENT_HUD_CREATE: HudCreateEvent,
+    EventEnum.AW_EVENT_HUD_DESTROY: HudDestroyEvent,
+    EventEnum.AW_EVENT_HUD_CLEAR: HudClearEvent,
+    EventEnum.AW_EVENT_CAV_DEFINITION_CHANGE: CavDefinitionChangeEvent,
+    EventEnum.AW_EVENT_WORLD_CAV_DEFINITION_CHANGE: WorldCavDefinitionChangeEvent,
+    EventEnum.AW_EVENT_LASER_BEAM: LaserBeamEvent,
+    CallBackEnum.AW_CALLBACK_CREATE: CreateCallback,
+    CallBackEnum.AW_CALLBACK_LOGIN: LoginCallback,
+    CallBackEnum.AW_CALLBACK_ENTER: EnterCallback,
+    CallBackEnum.AW_CALLBACK_OBJECT_RESULT: ObjectResultCallback,
+    CallBackEnum.AW_CALLBACK_LICENSE_ATTRIBUTES: LicenseAttributesCallback,
+    CallBackEnum.AW_CALLBACK_LICENSE_RESULT: LicenseResultCallback,
+    CallBackEnum.AW_CALLBACK_CITIZEN_ATTRIBUTES: CitizenAttributesCallback,
+    CallBackEnum.AW_CALLBACK_CITIZEN_RESULT: CitizenResultCallback,
+    CallBackEnum.AW_CALLBACK_QUERY: QueryCallback,
+    CallBackEnum.AW_CALLBACK_WORLD_LIST: WorldListCallback,
+    CallBackEnum.AW_CALLBACK_UNIVERSE_EJECTION: UniverseEjectionCallback,
+    CallBackEnum.AW_CALLBACK_UNIVERSE_EJECTION_RESULT: UniverseEjectionResultCallback,
+    CallBackEnum.AW_CALLBACK_ADDRESS: AddressCallback,
+    CallBackEnum.AW_CALLBACK_WORLD_EJECTION: WorldEjectionCallback,
+    CallBackEnum.AW_CALLBACK_WORLD_EJECTION_RESULT: WorldEjectionResultCallback,
+    CallBackEnum.AW_CALLBACK_ADMIN_WORLD_LIST: AdminWorldListCallback,
+    CallBackEnum.AW_CALLBACK_ADMIN_WORLD_RESULT: AdminWorldResultCallback,
+    CallBackEnum.AW_CALLBACK_DELETE_ALL_OBJECTS_RESULT: DeleteAllObjectsResultCallback,
+    CallBackEnum.AW_CALLBACK_CELL_RESULT: CellResultCallback,
+    CallBackEnum.AW_CALLBACK_RELOAD_REGISTRY: ReloadRegistryCallback,
+    CallBackEnum.AW_CALLBACK_ATTRIBUTES_RESET_RESULT: AttributesResetResultCallback,
+    CallBackEnum.AW_CALLBACK_ADMIN: AdminCallback,
+    CallBackEnum.AW_CALLBACK_TERRAIN_SET_RESULT: TerrainSetResultCallback,
+    CallBackEnum.AW_CALLBACK_TERRAIN_NEXT_RESULT: TerrainNextResultCallback,
+    CallBackEnum.AW_CALLBACK_TERRAIN_DELETE_ALL_RESULT: TerrainDeleteAllResultCallback,
+    CallBackEnum.AW_CALLBACK_TERRAIN_LOAD_NODE_RESULT: TerrainLoadNodeResultCallback,
+    CallBackEnum.AW_CALLBACK_BOTGRAM_RESULT: BotgramResultCallback,
+    CallBackEnum.AW_CALLBACK_USER_LIST: UserListCallback,
+    CallBackEnum.AW_CALLBACK_BOTMENU_RESULT: BotmenuResultCallback,
+    CallBackEnum.AW_CALLBACK_CAV: CavCallback,
+    CallBackEnum.AW_CALLBACK_CAV_RESULT: CavResultCallback,
+    CallBackEnum.AW_CALLBACK_WORLD_INSTANCE: WorldInstanceCallback,
+    CallBackEnum.AW_CALLBACK_HUD_RESULT: HudResultCallback,
+    CallBackEnum.AW_CALLBACK_AVATAR_LOCATION: AvatarLocationCallback,
+    CallBackEnum.AW_CALLBACK_OBJECT_QUERY: ObjectQueryCallback,
+    CallBackEnum.AW_CALLBACK_WORLD_CAV_RESULT: WorldCavResultCallback,
+    CallBackEnum.AW_CALLBACK_WORLD_CAV: WorldCavCallback,
+})
+
+__all__ = [
+    'AvatarAddEvent',
+    'AvatarChangeEvent',
+    'AvatarDeleteEvent',
+    'CellBeginEvent',
+    'CellObjectEvent',
+    'CellEndEvent',
+    'ChatEvent',
+    'ObjectAddEvent',
+    'ObjectDeleteEvent',
+    'UniverseAttributesEvent',
+    'UniverseDisconnectEvent',
+    'WorldAttributesEvent',
+    'WorldInfoEvent',
+    'WorldDisconnectEvent',
+    'SendFileEvent',
+    'ContactStateEvent',
+    'TelegramEvent',
+    'JoinEvent',
+    'ObjectClickEvent',
+    'ObjectSelectEvent',
+    'AvatarClickEvent',
+    'UrlEvent',
+    'UrlClickEvent',
+    'TeleportEvent',
+    'AdminWorldInfoEvent',
+    'AdminWorldDeleteEvent',
+    'TerrainBeginEvent',
+    'TerrainDataEvent',
+    'TerrainEndEvent',
+    'ConsoleMessageEvent',
+    'TerrainChangedEvent',
+    'BotgramEvent',
+    'ToolbarClickEvent',
+    'UserInfoEvent',
+    'NoiseEvent',
+    'CameraEvent',
+    'BotmenuEvent',
+    'ObjectBumpEvent',
+    'EntityAddEvent',
+    'EntityChangeEvent',
+    'EntityDeleteEvent',
+    'EntityRiderAddEvent',
+    'EntityRiderDeleteEvent',
+    'EntityRiderChangeEvent',
+    'AvatarReloadEvent',
+    'EntityLinksEvent',
+    'HudClickEvent',
+    'HudCreateEvent',
+    'HudDestroyEvent',
+    'HudClearEvent',
+    'CavDefinitionChangeEvent',
+    'WorldCavDefinitionChangeEvent',
+    'LaserBeamEvent',
+    'CreateCallback',
+    'LoginCallback',
+    'EnterCallback',
+    'ObjectResultCallback',
+    'LicenseAttributesCallback',
+    'LicenseResultCallback',
+    'CitizenAttributesCallback',
+    'CitizenResultCallback',
+    'QueryCallback',
+    'WorldListCallback',
+    'UniverseEjectionCallback',
+    'UniverseEjectionResultCallback',
+    'AddressCallback',
+    'WorldEjectionCallback',
+    'WorldEjectionResultCallback',
+    'AdminWorldListCallback',
+    'AdminWorldResultCallback',
+    'DeleteAllObjectsResultCallback',
+    'CellResultCallback',
+    'ReloadRegistryCallback',
+    'AttributesResetResultCallback',
+    'AdminCallback',
+    'TerrainSetResultCallback',
+    'TerrainNextResultCallback',
+    'TerrainDeleteAllResultCallback',
+    'TerrainLoadNodeResultCallback',
+    'BotgramResultCallback',
+    'UserListCallback',
+    'BotmenuResultCallback',
+    'CavCallback',
+    'CavResultCallback',
+    'WorldInstanceCallback',
+    'HudResultCallback',
+    'AvatarLocationCallback',
+    'ObjectQueryCallback',
+    'WorldCavResultCallback',
+    'WorldCavCallback',
+]
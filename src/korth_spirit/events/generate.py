@@ -0,0 +1,134 @@
+# Copyright (c) 2021-2022 Johnathan P. Irvin
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+Generates events/event_types.py, a slotted Event class per translated event type.
+Run after changing TRANSLATIONS:
+
+    python -m korth_spirit.events.generate
+"""
+import os
+from typing import Dict
+
+from korth_spirit.sdk import CallBackEnum, EventEnum
+
+from .translations import TRANSLATIONS
+
+TARGET = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'event_types.py')
+
+def class_name(event: object) -> str:
+    """
+    Gets the class name of an event type, e.g. AvatarAddEvent or ObjectResultCallback.
+
+    Args:
+        event (object): The EventEnum or CallBackEnum member.
+
+    Returns:
+        str: The class name.
+    """
+    prefix, suffix = ('AW_EVENT_', 'Event') if type(event) is EventEnum else ('AW_CALLBACK_', 'Callback')
+    words = event.name.removeprefix(prefix).split('_')
+
+    return ''.join(word.capitalize() for word in words) + suffix
+
+def field_types(event: object) -> Dict[str, str]:
+    """
+    Gets the field names and type names of an event type, in translation order.
+    Attributes with a known type use it over the translated type.
+
+    Args:
+        event (object): The EventEnum or CallBackEnum member.
+
+    Returns:
+        Dict[str, str]: The type name of each field.
+    """
+    from korth_spirit.sdk.enums import ATTRIBUTE_TYPES
+
+    fields = {}
+    for data_type, attribute in TRANSLATIONS[event]:
+        aw_type = ATTRIBUTE_TYPES.get(attribute) or data_type
+
+        if type(aw_type) is tuple:
+            aw_type = aw_type[0]
+
+        fields.setdefault(attribute.name.removeprefix('AW_').lower(), aw_type.__name__)
+
+    return fields
+
+def render() -> str:
+    """
+    Renders the event_types module.
+
+    Returns:
+        str: The module source.
+    """
+    with open(__file__) as source:
+        header = ''.join(source.readlines()[:20])
+
+    lines = [
+        header.rstrip('\n'),
+        '# Generated by korth_spirit.events.generate from TRANSLATIONS, do not edit.',
+        'from korth_spirit.sdk import CallBackEnum, EventEnum',
+        '',
+        'from .event import EVENT_CLASSES, Event',
+        'from .translations import TRANSLATIONS',
+        '',
+    ]
+    events = [
+        event for event in [*EventEnum, *CallBackEnum]
+        if event in TRANSLATIONS
+    ]
+
+    for event in events:
+        enum = type(event).__name__
+        fields = field_types(event)
+        lines += ['', f'class {class_name(event)}(Event):']
+
+        if fields:
+            lines.append('    __slots__ = (')
+            lines += [f"        '{name}'," for name in fields]
+            lines.append('    )')
+        else:
+            lines.append('    __slots__ = ()')
+
+        lines += [
+            f'    event_type = {enum}.{event.name}',
+            f'    translations = TRANSLATIONS[{enum}.{event.name}]',
+        ]
+        lines += [f'    {name}: {aw_type}' for name, aw_type in fields.items()]
+        lines.append('')
+
+    lines += ['', 'EVENT_CLASSES.update({']
+    lines += [f'    {type(event).__name__}.{event.name}: {class_name(event)},' for event in events]
+    lines += ['})', '', '__all__ = [']
+    lines += [f"    '{class_name(event)}'," for event in events]
+    lines += [']', '']
+
+    return '\n'.join(lines)
+
+def main() -> None:
+    source = render()
+
+    with open(TARGET, 'w') as target:
+        target.write(source)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,223 @@
+# Copyright (c) 2021-2022 Johnathan P. Irvin
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+from collections import Counter
+from time import perf_counter, perf_counter_ns
+from typing import Any, Callable, Dict, List
+
+# Sub-buckets per power of two, so a bucket spans at most a quarter of its value.
+_SUB_BITS = 2
+_BUCKETS = (65 - _SUB_BITS) << _SUB_BITS
+
+
+def bucket_of(nanoseconds: int) -> int:
+    """
+    Gets the histogram bucket of a duration.
+
+    Args:
+        nanoseconds (int): The duration.
+
+    Returns:
+        int: The bucket index.
+    """
+    bits = nanoseconds.bit_length()
+
+    if bits <= _SUB_BITS + 1:
+        return nanoseconds
+
+    return (bits - _SUB_BITS) << _SUB_BITS | (nanoseconds >> (bits - _SUB_BITS - 1)) & ((1 << _SUB_BITS) - 1)
+
+def bucket_limit(index: int) -> int:
+    """
+    Gets the largest duration of a histogram bucket.
+
+    Args:
+        index (int): The bucket index.
+
+    Returns:
+        int: The duration in nanoseconds.
+    """
+    if index < 2 << _SUB_BITS:
+        return index
+
+    shift = (index >> _SUB_BITS) - 1
+    return ((1 << _SUB_BITS | index & ((1 << _SUB_BITS) - 1)) + 1 << shift) - 1
+
+
+class Histogram:
+    __slots__ = ('counts', 'count', 'total', 'max')
+
+    def __init__(self) -> None:
+        """
+        A latency histogram with fixed logarithmic buckets, recorded without allocating.
+        """
+        self.counts = [0] * _BUCKETS
+        self.clear()
+
+    def clear(self) -> None:
+        """
+        Forgets the recorded durations.
+        """
+        self.counts[:] = [0] * _BUCKETS
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def record(self, nanoseconds: int) -> None:
+        """
+        Records a duration.
+
+        Args:
+            nanoseconds (int): The duration.
+        """
+        self.counts[bucket_of(nanoseconds)] += 1
+        self.count += 1
+        self.total += nanoseconds
+        if nanoseconds > self.max:
+            self.max = nanoseconds
+
+    def percentile(self, percent: float) -> float:
+        """
+        Gets the duration a percentage of the recordings did not exceed,
+        rounded up to the end of its bucket.
+
+        Args:
+            percent (float): The percentage, such as 99.
+
+        Returns:
+            float: The duration in seconds.
+        """
+        if not self.count:
+            return 0.0
+
+        remaining = self.count * percent / 100
+        for index, count in enumerate(self.counts):
+            remaining -= count
+            if remaining <= 0 and count:
+                return min(bucket_limit(index), self.max) / 1e9
+
+        return self.max / 1e9
+
+    def summary(self) -> dict:
+        """
+        Gets the count and the mean, median, 99th percentile and maximum durations.
+
+        Returns:
+            dict: The summary, with durations in seconds.
+        """
+        return {
+            'count': self.count,
+            'mean': self.total / self.count / 1e9 if self.count else 0.0,
+            'p50': self.percentile(50),
+            'p99': self.percentile(99),
+            'max': self.max / 1e9,
+        }
+
+
+class BusMetrics:
+    def __init__(self) -> None:
+        """
+        The counters and histograms of an instrumented bus.
+        """
+        self.started = perf_counter()
+        self.published = Counter()
+        self.translation: Dict[Any, Histogram] = {}
+        self.dispatch: Dict[Any, Histogram] = {}
+        self.handlers: Dict[Callable, Histogram] = {}
+
+    def translated(self, event: Any, nanoseconds: int) -> None:
+        """
+        Records the time taken to create an event.
+
+        Args:
+            event (Any): The event type.
+            nanoseconds (int): The duration.
+        """
+        histogram = self.translation.get(event)
+
+        if histogram is None:
+            histogram = self.translation[event] = Histogram()
+
+        histogram.record(nanoseconds)
+
+    def call(self, event_type: Any, subscribers: List[Callable], event: Any, args: tuple, kwargs: dict) -> None:
+        """
+        Calls subscribers, timing each one and the whole dispatch.
+
+        Args:
+            event_type (Any): The event type.
+            subscribers (List[Callable]): The subscribers.
+            event (Any): The event.
+            args (tuple): The arguments to pass to the subscribers.
+            kwargs (dict): The keyword arguments to pass to the subscribers.
+        """
+        handlers = self.handlers
+        start = perf_counter_ns()
+
+        for subscriber in subscribers:
+            called = perf_counter_ns()
+            try:
+                subscriber(event, *args, **kwargs)
+            finally:
+                histogram = handlers.get(subscriber)
+                if histogram is None:
+                    histogram = handlers[subscriber] = Histogram()
+                histogram.record(perf_counter_ns() - called)
+
+        histogram = self.dispatch.get(event_type)
+        if histogram is None:
+            histogram = self.dispatch[event_type] = Histogram()
+        histogram.record(perf_counter_ns() - start)
+
+    def stats(self) -> dict:
+        """
+        Gets a snapshot of the metrics.
+
+        Returns:
+            dict: The seconds instrumented, then per event type its count, rate per second,
+                translation and dispatch latencies, and per handler its latencies.
+        """
+        seconds = perf_counter() - self.started
+        events = {}
+
+        for event, count in self.published.items():
+            translation = self.translation.get(event)
+            dispatch = self.dispatch.get(event)
+            events[getattr(event, 'name', str(event))] = {
+                'count': count,
+                'rate': count / seconds if seconds else 0.0,
+                'translation': (translation or Histogram()).summary(),
+                'dispatch': (dispatch or Histogram()).summary(),
+            }
+
+        handlers = {}
+        for handler, histogram in self.handlers.items():
+            name = getattr(handler, '__qualname__', None) or repr(handler)
+            unique, number = name, 1
+            while unique in handlers:
+                number += 1
+                unique = f"{name} ({number})"
+            handlers[unique] = histogram.summary()
+
+        return {
+            'seconds': seconds,
+            'events': events,
+            'handlers': handlers,
+        }
@@ -0,0 +1,157 @@
+# Copyright (c) 2021-2022 Johnathan P. Irvin
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+from typing import Any, Dict, Union
+
+from korth_spirit.sdk import CallBackEnum, EventEnum
+from korth_spirit.sdk.context import instance_key
+
+EventType = Union[EventEnum, CallBackEnum]
+
+
+class Router:
+    def __init__(self) -> None:
+        """
+        Routes SDK events and callbacks to the bus of the instance that received them.
+        Handlers are set per instance, but every instance shares one handler per
+        event type: the SDK makes the receiving instance current before calling
+        it, so the handler finds the bus with a single lookup.
+        Handlers are kept once created, as one may still be running when cleared.
+        """
+        self._buses: Dict[int, "EventBus"] = {}
+        self._handlers: Dict[EventType, Any] = {}
+
+    def _handler(self, event: EventType) -> Any:
+        """
+        Gets the shared handler of an event type, creating it on first use.
+
+        Args:
+            event (EventType): The event or callback.
+
+        Returns:
+            Any: The ctypes handler.
+        """
+        from korth_spirit.sdk import AW_CALLBACK, AW_RESULT_CALLBACK, CONTEXT, SDK
+
+        if event in self._handlers:
+            return self._handlers[event]
+
+        buses = self._buses
+
+        if type(event) is CallBackEnum:
+            @AW_RESULT_CALLBACK
+            def handler(rc: int) -> None:
+                instance = SDK.aw_instance()
+                CONTEXT.entered(instance)
+                bus = buses.get(instance)
+                if bus is not None:
+                    bus.publish_result(event, rc)
+        else:
+            @AW_CALLBACK
+            def handler() -> None:
+                instance = SDK.aw_instance()
+                CONTEXT.entered(instance)
+                bus = buses.get(instance)
+                if bus is not None:
+                    bus.publish(event)
+
+        self._handlers[event] = handler
+
+        return handler
+
+    def _set(self, instance: Any, event: EventType, handler: Any) -> None:
+        """
+        Sets the handler of an event for an instance.
+
+        Args:
+            instance (Any): The instance handle.
+            event (EventType): The event or callback.
+            handler (Any): The handler, or None to clear it.
+        """
+        from korth_spirit.sdk import (aw_instance_callback_set,
+                                      aw_instance_event_set, aw_instance_set)
+
+        aw_instance_set(instance)
+
+        if type(event) is EventEnum:
+            aw_instance_event_set(event, handler)
+        elif type(event) is CallBackEnum:
+            aw_instance_callback_set(event, handler)
+
+    def register(self, instance: Any, bus: "EventBus") -> None:
+        """
+        Routes the events of an instance to a bus.
+
+        Args:
+            instance (Any): The instance handle.
+            bus (EventBus): The bus.
+        """
+        self._buses[instance_key(instance)] = bus
+
+    def unregister(self, instance: Any) -> None:
+        """
+        Stops routing the events of an instance.
+
+        Args:
+            instance (Any): The instance handle.
+        """
+        self._buses.pop(instance_key(instance), None)
+
+    def hook(self, instance: Any, event: EventType) -> None:
+        """
+        Sets the shared handler of an event for an instance.
+
+        Args:
+            instance (Any): The instance handle.
+            event (EventType): The event or callback.
+        """
+        self._set(instance, event, self._handler(event))
+
+    def release(self, instance: Any, event: EventType) -> None:
+        """
+        Clears the handler of an event for an instance.
+
+        Args:
+            instance (Any): The instance handle.
+            event (EventType): The event or callback.
+        """
+        self._set(instance, event, None)
+
+    @property
+    def handlers(self) -> int:
+        """
+        The number of handlers created, which is bounded by the number of event types.
+
+        Returns:
+            int: The number of handlers.
+        """
+        return len(self._handlers)
+
+    @property
+    def instances(self) -> int:
+        """
+        The number of routed instances.
+
+        Returns:
+            int: The number of instances.
+        """
+        return len(self._buses)
+
+ROUTER = Router()
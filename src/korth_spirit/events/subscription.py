@@ -0,0 +1,204 @@
+# Copyright (c) 2021-2022 Johnathan P. Irvin
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+from typing import Any, Callable, Dict, List, Tuple
+
+from .translations import TRANSLATIONS
+
+# Fields of an event that can be filtered on, keyed by event type.
+_FILTERABLE: Dict[Any, frozenset] = {}
+
+def filterable(event: Any) -> frozenset:
+    """
+    Gets the names of the fields a subscription to an event can filter on.
+
+    Args:
+        event (Any): The event type.
+
+    Returns:
+        frozenset: The field names.
+    """
+    names = _FILTERABLE.get(event)
+
+    if names is None:
+        names = _FILTERABLE[event] = frozenset(
+            ['rc', *(attribute.name.removeprefix('AW_').lower() for _, attribute in TRANSLATIONS.get(event, ()))]
+        )
+
+    return names
+
+
+class Subscription:
+    __slots__ = ('event', 'subscriber', 'where', 'fields', 'key', '_subscribers')
+
+    def __init__(self, event: Any, subscriber: Callable, where: Dict[str, Any] = None) -> None:
+        """
+        A handle to a subscription, which removes it in constant time.
+
+        Args:
+            event (Any): The event subscribed to.
+            subscriber (Callable): The subscriber to the event.
+            where (Dict[str, Any], optional): The field values the event must have. Defaults to None.
+
+        Raises:
+            ValueError: If the event has no such field.
+        """
+        where = dict(where or {})
+        unknown = where.keys() - filterable(event)
+
+        if unknown:
+            raise ValueError(f"{event} cannot be filtered on {', '.join(sorted(unknown))}")
+
+        self.event = event
+        self.subscriber = subscriber
+        self.where = where
+        self.fields = tuple(sorted(where))
+        self.key = tuple(where[field] for field in self.fields)
+        self._subscribers = None
+
+    @property
+    def active(self) -> bool:
+        """
+        Whether the subscription still receives events.
+
+        Returns:
+            bool: True until it is unsubscribed.
+        """
+        return self._subscribers is not None
+
+    def unsubscribe(self) -> None:
+        """
+        Removes the subscription, releasing the AW event once it was the last one.
+        """
+        if self._subscribers is not None:
+            self._subscribers.remove(self)
+
+
+class Subscribers:
+    __slots__ = ('bus', 'event', 'unfiltered', 'indexes', 'count')
+
+    def __init__(self, bus: Any, event: Any) -> None:
+        """
+        The subscriptions to one event of a bus.
+        Filtered subscriptions are indexed by the fields they filter on,
+        then by the values of those fields.
+
+        Args:
+            bus (Any): The bus subscribed to.
+            event (Any): The event subscribed to.
+        """
+        self.bus = bus
+        self.event = event
+        self.unfiltered: Dict[Subscription, Callable] = {}
+        self.indexes: Dict[Tuple[str, ...], Dict[tuple, Dict[Subscription, Callable]]] = {}
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def add(self, subscription: Subscription) -> Subscription:
+        """
+        Adds a subscription.
+
+        Args:
+            subscription (Subscription): The subscription.
+
+        Returns:
+            Subscription: The subscription.
+        """
+        if subscription.fields:
+            index = self.indexes.setdefault(subscription.fields, {})
+            index.setdefault(subscription.key, {})[subscription] = subscription.subscriber
+        else:
+            self.unfiltered[subscription] = subscription.subscriber
+
+        subscription._subscribers = self
+        self.count += 1
+
+        return subscription
+
+    def remove(self, subscription: Subscription) -> None:
+        """
+        Removes a subscription, and empty index entries with it.
+
+        Args:
+            subscription (Subscription): The subscription.
+        """
+        if subscription.fields:
+            index = self.indexes[subscription.fields]
+            bucket = index[subscription.key]
+            del bucket[subscription]
+
+            if not bucket:
+                del index[subscription.key]
+            if not index:
+                del self.indexes[subscription.fields]
+        else:
+            del self.unfiltered[subscription]
+
+        subscription._subscribers = None
+        self.count -= 1
+
+        if not self.count:
+            self.bus._release(self)
+
+    def find(self, subscriber: Callable, where: Dict[str, Any] = None) -> Subscription:
+        """
+        Finds the latest subscription of a subscriber with the given filter.
+
+        Args:
+            subscriber (Callable): The subscriber.
+            where (Dict[str, Any], optional): The filter of the subscription. Defaults to None.
+
+        Returns:
+            Subscription: The subscription, or None.
+        """
+        if where:
+            fields = tuple(sorted(where))
+            bucket = self.indexes.get(fields, {}).get(tuple(where[field] for field in fields), {})
+        else:
+            bucket = self.unfiltered
+
+        for subscription in reversed(bucket):
+            if subscription.subscriber == subscriber:
+                return subscription
+
+        return None
+
+    def matching(self, event: Any) -> List[Callable]:
+        """
+        Gets the subscribers an event is delivered to, unfiltered ones first.
+        Only the fields that are filtered on are read from the event.
+
+        Args:
+            event (Any): The published event.
+
+        Returns:
+            List[Callable]: The subscribers.
+        """
+        subscribers = [*self.unfiltered.values()]
+
+        for fields, index in self.indexes.items():
+            bucket = index.get(tuple([getattr(event, field) for field in fields]))
+
+            if bucket:
+                subscribers.extend(bucket.values())
+
+        return subscribers
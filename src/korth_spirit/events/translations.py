@@ -315,6 +315,8 @@ TRANSLATIONS = {
         (int, AttributeEnum.AW_TERRAIN_PAGE_Z),
     ],
     EventEnum.AW_EVENT_TERRAIN_DATA: [
+        (int, AttributeEnum.AW_TERRAIN_PAGE_X),
+        (int, AttributeEnum.AW_TERRAIN_PAGE_Z),
         (int, AttributeEnum.AW_TERRAIN_NODE_X),
         (int, AttributeEnum.AW_TERRAIN_NODE_Z),
         (int, AttributeEnum.AW_TERRAIN_NODE_SIZE),
@@ -18,11 +18,47 @@
 # LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
 # WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+from importlib import import_module
+
 from .configurable_instance import ConfigurableInstance
 from .instance import Instance
 
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .async_instance import AsyncInstance
+
+# AsyncInstance imports asyncio, which is slow to import.
+_LAZY_ATTRIBUTES = {
+    'AsyncInstance': '.async_instance',
+}
+
+def __getattr__(name: str) -> object:
+    """
+    Imports public attributes on first access (PEP 562).
+
+    Args:
+        name (str): The attribute name.
+
+    Raises:
+        AttributeError: If the attribute does not exist.
+
+    Returns:
+        object: The attribute.
+    """
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    globals()[name] = value
+
+    return value
+
+def __dir__() -> list:
+    return sorted([*globals(), *_LAZY_ATTRIBUTES])
+
 
 __all__ = [
+    "AsyncInstance",
     "ConfigurableInstance",
     "Instance", 
 ]
@@ -0,0 +1,281 @@
+# Copyright (c) 2021-2022 Johnathan P. Irvin
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import asyncio
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable
+
+from ..data import CellIteratorData
+from ..events import Event
+from ..query import ObjectQuery, QueryEnum, TerrainQuery, WorldAttributeQuery
+from ..sdk import (CallBackEnum, EventEnum, aw_cell_next, aw_instance_set,
+                   aw_terrain_next, aw_terrain_query)
+from ..sdk.errors import AwError, EndOfIterationError
+from .instance import Instance
+from .pump import PUMP
+
+# The callbacks reporting the calls made in callback mode.
+RESULT_CALLBACKS = (
+    CallBackEnum.AW_CALLBACK_LOGIN,
+    CallBackEnum.AW_CALLBACK_ENTER,
+    CallBackEnum.AW_CALLBACK_CELL_RESULT,
+    CallBackEnum.AW_CALLBACK_TERRAIN_NEXT_RESULT,
+)
+
+
+@dataclass
+class AsyncInstance(Instance):
+    async def __aenter__(self) -> "AsyncInstance":
+        self.__enter__()
+        self._results = {callback: deque() for callback in RESULT_CALLBACKS}
+
+        for callback in RESULT_CALLBACKS:
+            self.bus.subscribe(callback, self._on_result)
+
+        PUMP.attach(self)
+
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        PUMP.detach(self)
+
+        for callback in RESULT_CALLBACKS:
+            self.bus.unsubscribe(callback, self._on_result)
+
+        self.__exit__(exc_type, exc_val, exc_tb)
+
+    def _on_result(self, event: Event) -> None:
+        """
+        Resolves the oldest call awaiting the callback, as the SDK reports
+        the calls of an instance in order. The result of a call whose
+        caller stopped waiting is dropped.
+
+        Args:
+            event (Event): The callback event.
+        """
+        waiting = self._results[event.event_type]
+
+        if not waiting:
+            return
+
+        future, message = waiting.popleft()
+
+        if future.done():
+            return
+        if event.rc:
+            future.set_exception(AwError.from_rc(event.rc, message))
+        else:
+            future.set_result(event.snapshot())
+
+    async def _call(self, callback: CallBackEnum, send: Callable[[], Any], message: str) -> Event:
+        """
+        Makes an SDK call in callback mode and waits for its result.
+
+        Args:
+            callback (CallBackEnum): The callback reporting the result.
+            send (Callable[[], Any]): Makes the call.
+            message (str): What failed, for the error.
+
+        Raises:
+            AwError: If the call failed.
+
+        Returns:
+            Event: The callback event.
+        """
+        future = asyncio.get_running_loop().create_future()
+        waiting = self._results[callback]
+
+        with PUMP.waiting(future):
+            waiting.append((future, message))
+            try:
+                aw_instance_set(self._instance)
+                send()
+            except BaseException:
+                # No callback comes for a call that failed at once.
+                waiting.remove((future, message))
+                raise
+
+            return await future
+
+    async def login(self, citizen_number: int, password: str) -> "AsyncInstance":
+        """
+        Login to the universe, completing when the server answers.
+
+        Raises:
+            AwError: If the login failed.
+
+        Returns:
+            AsyncInstance: The instance.
+        """
+        await self._call(
+            CallBackEnum.AW_CALLBACK_LOGIN,
+            lambda: Instance.login(self, citizen_number, password),
+            "Failed to login"
+        )
+
+        return self
+
+    async def enter(self, world: str) -> "AsyncInstance":
+        """
+        Enter the specified world, completing when the server answers.
+
+        Args:
+            world (str): The name of the world.
+
+        Raises:
+            AwError: If the world could not be entered.
+
+        Returns:
+            AsyncInstance: The instance.
+        """
+        await self._call(
+            CallBackEnum.AW_CALLBACK_ENTER,
+            lambda: Instance.enter(self, world),
+            "Failed to enter world"
+        )
+
+        return self
+
+    async def _query_objects(self, **kwargs) -> AsyncIterator[Any]:
+        """
+        Queries the objects of a cell, or of all cells in batches.
+
+        Args:
+            x (int): The x coordinate of the cell.
+            z (int): The z coordinate of the cell.
+
+        Yields:
+            AsyncIterator[CellObjectData]: The objects found.
+        """
+        x, z = kwargs.get('x'), kwargs.get('z')
+        specific = x is not None and z is not None
+        query = ObjectQuery(self)
+        query.data = []
+        self.bus.subscribe(EventEnum.AW_EVENT_CELL_OBJECT, query.on_receive_object)
+
+        try:
+            done = False
+            while not done:
+                try:
+                    event = await self._call(
+                        CallBackEnum.AW_CALLBACK_CELL_RESULT,
+                        lambda: aw_cell_next(
+                            combine=not specific,
+                            iterator=CellIteratorData(x=x, z=z) if specific else None
+                        ),
+                        "Failed to get the next cell"
+                    )
+                    done = specific or event.cell_iterator == -1
+                except EndOfIterationError:
+                    done = True
+
+                batch, query.data = query.data, []
+                for found in batch:
+                    yield found
+        finally:
+            self.bus.unsubscribe(EventEnum.AW_EVENT_CELL_OBJECT, query.on_receive_object)
+
+    async def _query_terrain(self, **kwargs) -> AsyncIterator[Any]:
+        """
+        Queries the terrain of a page, or all terrain in batches.
+
+        Args:
+            x (int): The x coordinate of the page.
+            z (int): The z coordinate of the page.
+
+        Yields:
+            AsyncIterator[TerrainNodeData]: The terrain nodes found.
+        """
+        x, z = kwargs.get('x'), kwargs.get('z')
+        query = TerrainQuery(self)
+        query.data = []
+        self.bus.subscribe(EventEnum.AW_EVENT_TERRAIN_DATA, query.on_receive_terrain)
+
+        try:
+            done = False
+            while not done:
+                if x is not None and z is not None:
+                    # Page queries have no callback, so poll for completion.
+                    with PUMP.waiting():
+                        aw_instance_set(self._instance)
+                        done = aw_terrain_query(x, z, 0)
+                        await asyncio.sleep(PUMP.min_interval)
+                else:
+                    event = await self._call(
+                        CallBackEnum.AW_CALLBACK_TERRAIN_NEXT_RESULT,
+                        aw_terrain_next,
+                        "Failed to get next terrain"
+                    )
+                    done = bool(event.terrain_complete)
+
+                batch, query.data = query.data, []
+                for node in batch:
+                    yield node
+        finally:
+            self.bus.unsubscribe(EventEnum.AW_EVENT_TERRAIN_DATA, query.on_receive_terrain)
+
+    async def _query_world(self, **kwargs) -> AsyncIterator[Any]:
+        """
+        Queries world attributes, which are available without a round trip.
+
+        Args:
+            attribute (Union[str, WorldAttributeEnum]): The attribute to query.
+
+        Yields:
+            AsyncIterator[AttributeData]: The attributes.
+        """
+        result = WorldAttributeQuery(self).query(**kwargs)
+
+        if 'attribute' in kwargs:
+            yield result
+            return
+
+        for attribute in result:
+            yield attribute
+
+    def query(self, query_type: QueryEnum = QueryEnum.OBJECT, **kwargs) -> AsyncIterator[Any]:
+        """
+        Make a query from the instance, yielding results as they arrive.
+
+        Args:
+            query_type (QueryEnum, optional): The query type. Defaults to QueryEnum.OBJECT.
+            **kwargs: The query arguments.
+
+        Raises:
+            ValueError: If the query type is invalid.
+
+        Returns:
+            AsyncIterator[Any]: The query results.
+        """
+        if query_type == QueryEnum.OBJECT:
+            return self._query_objects(**kwargs)
+        elif query_type == QueryEnum.TERRAIN:
+            return self._query_terrain(**kwargs)
+        elif query_type == QueryEnum.WORLD:
+            return self._query_world(**kwargs)
+
+        raise ValueError("Invalid query type.")
+
+    async def main_loop(self) -> None:
+        """
+        Run until cancelled, while the pump delivers events to the bus.
+        """
+        await asyncio.get_running_loop().create_future()
@@ -19,29 +19,47 @@
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
 # WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 from dataclasses import dataclass, field
-from typing import Any, List
+from typing import Any, Iterable, Iterator, List
 
+from ..bulk import ObjectResult, ObjectWriter
+from ..bulk.object_writer import Operation
 from ..data import LoginData, StateChangeData
 from ..events import EventBus
 from ..query import QueryEnum, QueryFactory
-from ..sdk import (aw_create, aw_destroy, aw_enter, aw_instance_set, aw_login,
-                   aw_say, aw_state_change, aw_wait, aw_whisper)
+from ..sdk import (CONTEXT, aw_create, aw_destroy, aw_enter, aw_instance_set,
+                   aw_login, aw_say, aw_state_change, aw_wait, aw_whisper)
+from ..sdk.context import instance_key
 
 
 @dataclass
 class Instance:
     name: str
+    domain: str = "auth.activeworlds.com"
+    port: int = 6670
     bus: EventBus = field(init=False, repr=False, default_factory=EventBus)
 
     def __enter__(self) -> "Instance":
-        self._instance = aw_create()
+        self._instance = aw_create(self.domain, self.port)
+        self.bus.bind(self._instance)
 
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
-        aw_instance_set(self._instance)
+        if self.bus.dispatcher is not None:
+            self.bus.dispatcher.close()
+        self.bus.unbind()
         aw_destroy(self._instance)
 
+    @property
+    def switches(self) -> int:
+        """
+        The number of times the SDK switched to this instance.
+
+        Returns:
+            int: The number of switches.
+        """
+        return CONTEXT.counts[instance_key(self._instance)]
+
     def login(self, citizen_number: int, password: str) -> "Instance":
         """
         Login to the universe.
@@ -133,12 +151,26 @@ class Instance:
 
         return QueryFactory(self, query_type)(**kwargs)
 
+    def write_objects(self, operations: Iterable[Operation], **kwargs) -> Iterator[ObjectResult]:
+        """
+        Create, change or delete objects in bulk, with many requests in flight at once.
+
+        Args:
+            operations (Iterable[Operation]): The objects to create, change or delete.
+            **kwargs: The ObjectWriter options, such as window and retries.
+
+        Returns:
+            Iterator[ObjectResult]: The result of each operation, as it arrives.
+        """
+        return ObjectWriter(self, **kwargs).write(operations)
+
     def main_loop(self, timer: int = 100) -> None:
         """
-        Run the main loop.
+        Run the main loop, delivering coalesced events after every wait.
 
         Args:
             timer (int, optional): The timer interval in milliseconds. Defaults to 100.
         """
         while True:
             aw_wait(timer)
+            self.bus.flush()
@@ -0,0 +1,160 @@
+# Copyright (c) 2021-2022 Johnathan P. Irvin
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import asyncio
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from ..sdk import aw_wait
+
+
+class Pump:
+    def __init__(self, min_interval: float = 0.001, max_interval: float = 0.05) -> None:
+        """
+        Pumps SDK events from an asyncio event loop with aw_wait(0),
+        flushing the coalesced events of the attached instances after each.
+        The interval shrinks to min_interval while events arrive or calls are
+        awaiting their callback, and doubles up to max_interval while idle.
+
+        Args:
+            min_interval (float, optional): The shortest interval in seconds. Defaults to 0.001.
+            max_interval (float, optional): The longest interval in seconds. Defaults to 0.05.
+        """
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval = min_interval
+        self.pumps = 0
+        self._instances = []
+        self._waiting = 0
+        self._futures = set()
+        self._task: Optional[asyncio.Task] = None
+        self._error: Optional[Exception] = None
+
+    def _start(self) -> None:
+        """
+        Starts the pump task if instances are attached and it is not running.
+        """
+        if self._instances and (self._task is None or self._task.done()):
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def _raise_error(self) -> None:
+        """
+        Raises the error pumping stopped on, if no call was waiting for it.
+
+        Raises:
+            Exception: The error that stopped the pump.
+        """
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def attach(self, instance: "Instance") -> None:
+        """
+        Starts pumping for an instance, starting the pump task if needed.
+
+        Args:
+            instance (Instance): The instance.
+
+        Raises:
+            Exception: The error that stopped the pump, before attaching the instance.
+        """
+        self._raise_error()
+        self._instances.append(instance)
+        self._start()
+
+    def detach(self, instance: "Instance") -> None:
+        """
+        Stops pumping for an instance, stopping the pump task after the last one.
+
+        Args:
+            instance (Instance): The instance.
+        """
+        self._instances.remove(instance)
+
+        if not self._instances and self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    @contextmanager
+    def waiting(self, future: asyncio.Future = None) -> Iterator[None]:
+        """
+        Keeps the pump at its shortest interval while a call awaits its result.
+        If pumping fails, the error is raised from the future, or from the
+        next call to wait when none was waiting.
+
+        Args:
+            future (asyncio.Future, optional): The future resolved by the callback. Defaults to None.
+
+        Raises:
+            Exception: The error that stopped the pump, which is restarted.
+        """
+        self._start()
+        self._raise_error()
+        self._waiting += 1
+        self.interval = self.min_interval
+
+        if future is not None:
+            self._futures.add(future)
+
+        try:
+            yield
+        finally:
+            self._waiting -= 1
+            self._futures.discard(future)
+
+    def _activity(self) -> int:
+        """
+        Gets the number of events published to the attached instances.
+
+        Returns:
+            int: The number of events.
+        """
+        return sum(instance.bus.published for instance in self._instances)
+
+    async def _run(self) -> None:
+        """
+        Runs the pump until it is cancelled or pumping fails.
+        """
+        while True:
+            before = self._activity()
+
+            try:
+                aw_wait(0)
+            except Exception as e:
+                waiting = [future for future in self._futures if not future.done()]
+                for future in waiting:
+                    future.set_exception(e)
+                if not waiting:
+                    self._error = e
+                return
+
+            self.pumps += 1
+
+            for instance in self._instances:
+                instance.bus.flush()
+
+            if self._waiting or self._activity() != before:
+                self.interval = self.min_interval
+            else:
+                self.interval = min(self.interval * 2, self.max_interval)
+
+            await asyncio.sleep(self.interval)
+
+PUMP = Pump()
@@ -18,7 +18,7 @@
 # LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
 # WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
-from .objects import ObjectQuery
+from .objects import ObjectQuery, QueryProgress
 from .query import Query
 from .query_enum import QueryEnum
 from .query_factory import QueryFactory
@@ -31,6 +31,7 @@ __all__ = [
     "Query",
     "QueryEnum",
     "QueryFactory",
+    "QueryProgress",
     "TerrainQuery",
     "WorldAttributeQuery",
     "WorldAttributeEnum",
@@ -18,11 +18,21 @@
 # LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
 # WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
-from typing import Iterable
+from dataclasses import dataclass
+from typing import Callable, Iterable, Iterator, List, Union
 
-from ..data import CellIteratorData, CellObjectData
+from ..data import CellData, CellIteratorData, CellObjectData
 from ..events import Event
-from ..sdk import EventEnum, aw_cell_next, aw_wait
+from ..sdk import (AttributeEnum, EventEnum, aw_cell_next, aw_instance_set,
+                   aw_int, aw_int_set, aw_wait)
+from ..sdk.errors import EndOfIterationError
+
+
+@dataclass(frozen=True)
+class QueryProgress:
+    cells: int
+    objects: int
+    iterator: int
 
 
 class ObjectQuery:
@@ -35,6 +45,35 @@ class ObjectQuery:
         """        
         self._instance = instance
 
+    @staticmethod
+    def object_data(event: Event) -> CellObjectData:
+        """
+        Converts a cell object event.
+
+        Args:
+            event (Event): The cell object event.
+
+        Returns:
+            CellObjectData: The object.
+        """
+        return CellObjectData(
+            type = event.object_type,
+            id = event.object_id,
+            number = event.object_number,
+            owner = event.object_owner,
+            build_timestamp = event.object_build_timestamp,
+            x = event.object_x,
+            y = event.object_y,
+            z = event.object_z,
+            yaw = event.object_yaw,
+            tilt = event.object_tilt,
+            roll = event.object_roll,
+            model = event.object_model,
+            description = event.object_description,
+            action = event.object_action,
+            # data = event.object_data,
+        )
+
     def on_receive_object(self, event: Event) -> None:
         """
         This is the callback that is called when an object is found in a cell.
@@ -42,25 +81,7 @@ class ObjectQuery:
         Args:
             event (Event): The event that was triggered.
         """        
-        self.data.append(
-            CellObjectData(
-                type = event.object_type,
-                id = event.object_type,
-                number = event.object_number,
-                owner = event.object_owner,
-                build_timestamp = event.object_build_timestamp,
-                x = event.object_x,
-                y = event.object_y,
-                z = event.object_z,
-                yaw = event.object_yaw,
-                tilt = event.object_tilt,
-                roll = event.object_roll,
-                model = event.object_model,
-                description = event.object_description,
-                action = event.object_action,
-                # data = event.object_data,
-            )
-        )
+        self.data.append(self.object_data(event))
 
     def query_specific(self, **kwargs) -> Iterable[CellObjectData]:
         """
@@ -111,20 +132,83 @@ class ObjectQuery:
 
         try:
             while True:
+                # Waiting lets handlers switch instances.
+                aw_instance_set(self._instance._instance)
                 aw_cell_next(
                     combine=True,
                 )
                 aw_wait(1)
-        except Exception as e:
-            if 'Error code: 74' not in str(e):
-                raise e
+        except EndOfIterationError:
+            pass
+        finally:
+            self._instance.bus.unsubscribe(
+                EventEnum.AW_EVENT_CELL_OBJECT,
+                self.on_receive_object
+            )
 
-        self._instance.bus.unsubscribe(
-            EventEnum.AW_EVENT_CELL_OBJECT,
-            self.on_receive_object
-        )
         return self.data
 
+    def stream(self, cells: bool = False, progress: Callable[[QueryProgress], None] = None) -> Iterator[Union[CellObjectData, CellData]]:
+        """
+        Runs the query on all cells, yielding what each aw_cell_next returns
+        before asking for more, so only one batch of cells is held at a time.
+        Closing the generator early, such as by breaking out of a loop over
+        it, ends the query and unsubscribes it.
+
+        Args:
+            cells (bool, optional): Whether to yield a CellData per cell instead of each object. Defaults to False.
+            progress (Callable[[QueryProgress], None], optional): Called after each batch of cells. Defaults to None.
+
+        Yields:
+            Iterator[Union[CellObjectData, CellData]]: The objects, or the cells with their objects.
+        """
+        found: List[CellData] = []
+
+        def on_cell(event: Event) -> None:
+            found.append(CellData(event.cell_x, event.cell_z, event.cell_sequence))
+
+        def on_object(event: Event) -> None:
+            found[-1].objects.append(self.object_data(event))
+
+        bus = self._instance.bus
+        subscriptions = [
+            bus.on(EventEnum.AW_EVENT_CELL_BEGIN, on_cell),
+            bus.on(EventEnum.AW_EVENT_CELL_OBJECT, on_object),
+        ]
+        done = QueryProgress(0, 0, 0)
+
+        try:
+            # Restarts the iterator of a previous scan.
+            aw_instance_set(self._instance._instance)
+            aw_int_set(AttributeEnum.AW_CELL_ITERATOR, 0)
+
+            while done.iterator != -1:
+                aw_instance_set(self._instance._instance)
+                try:
+                    aw_cell_next(combine=True)
+                except EndOfIterationError:
+                    break
+                aw_wait(1)
+
+                aw_instance_set(self._instance._instance)
+                batch, found[:] = found[:], []
+                done = QueryProgress(
+                    done.cells + len(batch),
+                    done.objects + sum(len(cell.objects) for cell in batch),
+                    aw_int(AttributeEnum.AW_CELL_ITERATOR),
+                )
+                if progress is not None:
+                    progress(done)
+
+                for cell in batch:
+                    if cells:
+                        yield cell
+                    else:
+                        yield from cell.objects
+        finally:
+            for subscription in subscriptions:
+                subscription.unsubscribe()
+
     def query(self, **kwargs) -> Iterable[CellObjectData]:
         """
         Runs the query on a specific cell or all cells.
@@ -132,10 +216,22 @@ class ObjectQuery:
         Args:
             x (int): The x coordinate of the cell.
             z (int): The z coordinate of the cell.
+            stream (bool): Whether to stream all cells, see stream().
+            cells (bool): Whether a stream yields cells instead of objects.
+            progress (Callable[[QueryProgress], None]): Called as a stream progresses.
+
+        Raises:
+            ValueError: If a stream is asked of a specific cell.
 
         Returns:
             List[CellObjectData]: The list of objects found in the 3x3 sector.
         """
+        if kwargs.get('stream'):
+            if kwargs.get('x') != None or kwargs.get('z') != None:
+                raise ValueError("Streamed queries are of all cells.")
+
+            return self.stream(kwargs.get('cells', False), kwargs.get('progress'))
+
         if kwargs.get('x') != None and kwargs.get('z') != None:
             return self.query_specific(**kwargs)
         
@@ -22,7 +22,8 @@ from typing import Iterable
 
 from ..data import TerrainNodeData
 from ..events import Event
-from ..sdk import EventEnum, aw_terrain_next, aw_terrain_query, aw_wait
+from ..sdk import (EventEnum, aw_instance_set, aw_terrain_next,
+                   aw_terrain_query, aw_wait)
 
 
 class TerrainQuery:
@@ -34,7 +35,6 @@ class TerrainQuery:
             instance (Instance): The instance to run the query on.
         """        
         self._instance = instance
-        self._sequence = None
 
     def on_receive_terrain(self, event: Event) -> None:
         """
@@ -45,6 +45,8 @@ class TerrainQuery:
         """
         self.data.append(
             TerrainNodeData(
+                page_x=event.terrain_page_x,
+                page_z=event.terrain_page_z,
                 node_x=event.terrain_node_x,
                 node_z=event.terrain_node_z,
                 node_size=event.terrain_node_size,
@@ -60,11 +62,13 @@ class TerrainQuery:
         Args:
             x (int): The x coordinate to query.
             z (int): The z coordinate to query.
+            sequence (int): The sequence the page is known at, to only get it if it changed since. Defaults to 0, the whole page.
 
         Returns:
             Iterable[TerrainNodeData]: The result of the query.
         """
         x, z = kwargs.get("x"), kwargs.get("z")
+        sequence = kwargs.get("sequence", 0)
 
         self.data = []
         self._instance.bus.subscribe(
@@ -72,10 +76,12 @@ class TerrainQuery:
             self.on_receive_terrain
         )
 
+        aw_instance_set(self._instance._instance)
         while not aw_terrain_query(
-            x, z, self._sequence
+            x, z, sequence
         ):
             aw_wait(1)
+            aw_instance_set(self._instance._instance)
 
         self._instance.bus.unsubscribe(
             EventEnum.AW_EVENT_TERRAIN_DATA,
@@ -96,8 +102,10 @@ class TerrainQuery:
             self.on_receive_terrain
         )
 
+        aw_instance_set(self._instance._instance)
         while not aw_terrain_next():
             aw_wait(1)
+            aw_instance_set(self._instance._instance)
 
         self._instance.bus.unsubscribe(
             EventEnum.AW_EVENT_TERRAIN_DATA,
@@ -22,8 +22,6 @@ from typing import Iterable
 
 from ..data import AttributeData
 from ..sdk import AttributeEnum
-from ..sdk.enums import ATTRIBUTE_TYPES
-from ..sdk.get_data import get_data
 from .world_attribute_enum import WorldAttributeEnum
 
 
@@ -47,6 +45,9 @@ class WorldAttributeQuery:
         Returns:
             Iterable[AttributeData]: The queried attribute.
         """
+        from ..sdk.enums import ATTRIBUTE_TYPES
+        from ..sdk.get_data import get_data
+
         attribute = kwargs.get('attribute')
 
         if isinstance(attribute, str):
@@ -66,6 +67,9 @@ class WorldAttributeQuery:
         Returns:
             Iterable[AttributeData]: The queried attributes.
         """
+        from ..sdk.enums import ATTRIBUTE_TYPES
+        from ..sdk.get_data import get_data
+
         for attribute in WorldAttributeEnum:
             attribute = AttributeEnum(attribute.value)
             yield AttributeData(
@@ -0,0 +1,315 @@
+# Copyright (c) 2021-2022 Johnathan P. Irvin
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+The binary event log. A log is a sequence of segments, each starting with a
+header, so recordings can be appended to an existing log. Within a segment:
+
+- every record starts with a tag byte;
+- integers are zigzag varints, and avatar coordinates are deltas from the
+  previous value for the same avatar session;
+- strings are numbered the first time they are seen, and referred to by number;
+- data is the typecode of a typed array, or 0 for bytes, then its length in
+  bytes and its bytes;
+- timestamps are microseconds since the previous record, from a monotonic clock.
+"""
+import struct
+from array import array
+from functools import cache
+from typing import Any, BinaryIO, Dict, Iterator, List, NamedTuple, Tuple
+
+from korth_spirit.sdk import AttributeEnum, CallBackEnum, EventEnum
+
+MAGIC = b'KSEV'
+VERSION = 2
+
+TAG_STRING = 0
+TAG_EVENT = 1
+TAG_SEGMENT = 2
+
+# Longer strings are written inline instead of numbered.
+MAX_NUMBERED = 255
+
+# Fields delta encoded against the previous value for the same avatar session.
+COORDINATES = frozenset([
+    AttributeEnum.AW_AVATAR_X,
+    AttributeEnum.AW_AVATAR_Y,
+    AttributeEnum.AW_AVATAR_Z,
+    AttributeEnum.AW_AVATAR_YAW,
+    AttributeEnum.AW_AVATAR_PITCH,
+])
+
+FLOAT = struct.Struct('<f')
+
+
+class Field(NamedTuple):
+    name: str
+    attribute: AttributeEnum
+    kind: type
+    delta: bool
+
+
+class Record(NamedTuple):
+    time: float
+    event: Any
+    values: Dict[str, Any]
+
+
+@cache
+def plan(event: Any) -> Tuple[Field, ...]:
+    """
+    Gets the fields written for an event type, in translation order.
+
+    Args:
+        event (Any): The event type.
+
+    Returns:
+        Tuple[Field, ...]: The fields.
+    """
+    from korth_spirit.events.translations import TRANSLATIONS
+    from korth_spirit.sdk.enums import ATTRIBUTE_TYPES
+
+    fields = []
+    for data_type, attribute in TRANSLATIONS.get(event, ()):
+        # Attributes with a known type are read as it, as events.generate does.
+        kind = ATTRIBUTE_TYPES.get(attribute) or data_type
+        fields.append(Field(
+            attribute.name.removeprefix('AW_').lower(),
+            attribute,
+            kind[0] if type(kind) is tuple else kind,
+            # The session must be read first to find the previous value.
+            attribute in COORDINATES and any(
+                field.attribute is AttributeEnum.AW_AVATAR_SESSION for field in fields
+            ),
+        ))
+
+    return tuple(fields)
+
+def event_code(event: Any) -> int:
+    """
+    Encodes an event type, keeping events and callbacks apart.
+
+    Args:
+        event (Any): The event type.
+
+    Returns:
+        int: The code.
+    """
+    return event.value << 1 | (type(event) is CallBackEnum)
+
+def event_type(code: int) -> Any:
+    """
+    Decodes an event type.
+
+    Args:
+        code (int): The code.
+
+    Returns:
+        Any: The event type.
+    """
+    return (CallBackEnum if code & 1 else EventEnum)(code >> 1)
+
+def _varint(out: bytearray, value: int) -> None:
+    while value > 0x7F:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+def _zigzag(out: bytearray, value: int) -> None:
+    _varint(out, value << 1 if value >= 0 else ~value << 1 | 1)
+
+
+class LogWriter:
+    def __init__(self, file: BinaryIO) -> None:
+        """
+        Writes events to a log, starting a new segment.
+
+        Args:
+            file (BinaryIO): The file, opened for appending.
+        """
+        self._file = file
+        self._strings: Dict[str, int] = {}
+        self._last: Dict[Tuple[Any, AttributeEnum], int] = {}
+        self._time = None
+        self.written = 0
+        self.size = 0
+
+        out = bytearray([TAG_SEGMENT])
+        out += MAGIC
+        out.append(VERSION)
+        self._write(out)
+
+    def _write(self, out: bytearray) -> None:
+        self._file.write(out)
+        self.size += len(out)
+
+    def _string(self, out: bytearray, strings: bytearray, value: str) -> None:
+        number = self._strings.get(value)
+
+        if number is None:
+            encoded = value.encode('utf-8')
+
+            if len(encoded) > MAX_NUMBERED:
+                out.append(0)
+                _varint(out, len(encoded))
+                out += encoded
+                return
+
+            number = self._strings[value] = len(self._strings) + 1
+            strings.append(TAG_STRING)
+            _varint(strings, len(encoded))
+            strings += encoded
+
+        _varint(out, number)
+
+    def write(self, event: Any, values: Dict[str, Any], time_ns: int) -> None:
+        """
+        Writes an event.
+
+        Args:
+            event (Any): The event type.
+            values (Dict[str, Any]): The value of each field, and rc for callbacks.
+            time_ns (int): The monotonic time it was received, in nanoseconds.
+        """
+        strings = bytearray()
+        out = bytearray([TAG_EVENT])
+        _varint(out, event_code(event))
+        _varint(out, 0 if self._time is None else max(time_ns - self._time, 0) // 1000)
+        self._time = time_ns if self._time is None else max(time_ns, self._time)
+        session = values.get('avatar_session')
+
+        for field in plan(event):
+            value = values[field.name]
+
+            if field.kind is int:
+                if field.delta:
+                    key = session, field.attribute
+                    last = self._last.get(key, 0)
+                    self._last[key] = value
+                    value -= last
+                _zigzag(out, value)
+            elif field.kind is str:
+                self._string(out, strings, value)
+            elif field.kind is bool:
+                out.append(1 if value else 0)
+            elif field.kind is float:
+                out += FLOAT.pack(value)
+            else:
+                # Typed arrays, such as terrain heights, keep their typecode.
+                out.append(ord(value.typecode) if type(value) is array else 0)
+                data = memoryview(value).cast('B')
+                _varint(out, data.nbytes)
+                out += data
+
+        if type(event) is CallBackEnum:
+            _zigzag(out, values.get('rc') or 0)
+
+        self._write(strings + out)
+        self.written += 1
+
+
+def read_log(data: bytes) -> Iterator[Record]:
+    """
+    Reads the events of a log. Times are in seconds since the start of
+    the first segment, and later segments continue from the previous one.
+
+    Args:
+        data (bytes): The log.
+
+    Raises:
+        ValueError: If the log is corrupt or from an unknown version.
+
+    Yields:
+        Iterator[Record]: The events.
+    """
+    view = memoryview(data)
+    position = 0
+    strings: List[str] = []
+    last: Dict[Tuple[Any, AttributeEnum], int] = {}
+    clock = 0
+
+    def varint() -> int:
+        nonlocal position
+        value = shift = 0
+        while True:
+            byte = data[position]
+            position += 1
+            value |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return value
+            shift += 7
+
+    def zigzag() -> int:
+        value = varint()
+        return ~(value >> 1) if value & 1 else value >> 1
+
+    def raw(length: int) -> bytes:
+        nonlocal position
+        position += length
+        if position > len(data):
+            raise ValueError("Truncated event log")
+        return bytes(view[position - length:position])
+
+    try:
+        while position < len(data):
+            tag = data[position]
+            position += 1
+
+            if tag == TAG_SEGMENT:
+                if raw(len(MAGIC)) != MAGIC or raw(1)[0] != VERSION:
+                    raise ValueError("Not an event log, or an unknown version")
+                strings.clear()
+                last.clear()
+            elif tag == TAG_STRING:
+                strings.append(raw(varint()).decode('utf-8'))
+            elif tag == TAG_EVENT:
+                event = event_type(varint())
+                clock += varint()
+                values = {}
+
+                for field in plan(event):
+                    if field.kind is int:
+                        value = zigzag()
+                        if field.delta:
+                            key = values.get('avatar_session'), field.attribute
+                            value += last.get(key, 0)
+                            last[key] = value
+                    elif field.kind is str:
+                        number = varint()
+                        value = strings[number - 1] if number else raw(varint()).decode('utf-8')
+                    elif field.kind is bool:
+                        value = bool(raw(1)[0])
+                    elif field.kind is float:
+                        value = FLOAT.unpack(raw(FLOAT.size))[0]
+                    else:
+                        typecode = raw(1)[0]
+                        value = raw(varint())
+                        if typecode:
+                            value = array(chr(typecode), value)
+                    values[field.name] = value
+
+                if type(event) is CallBackEnum:
+                    values['rc'] = zigzag()
+
+                yield Record(clock / 1e6, event, values)
+            else:
+                raise ValueError(f"Unknown record {tag} at offset {position - 1}")
+    except IndexError:
+        raise ValueError("Truncated event log") from None
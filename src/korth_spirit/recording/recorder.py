@@ -0,0 +1,129 @@
+# Copyright (c) 2021-2022 Johnathan P. Irvin
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+from threading import Lock
+from time import monotonic_ns
+from typing import Any, Callable, Iterable
+
+from korth_spirit.sdk import CallBackEnum, EventEnum
+
+from .log import LogWriter, plan
+
+
+class EventRecorder:
+    def __init__(
+        self,
+        bus: Any,
+        path: str,
+        events: Iterable[Any] = None,
+        clock: Callable[[], int] = monotonic_ns,
+    ) -> None:
+        """
+        Records the events of a bus to a binary log, appending to it if it exists.
+        Callbacks are not recorded unless listed, since subscribing to one makes
+        its SDK call asynchronous.
+
+        Args:
+            bus (Any): The event bus.
+            path (str): The log file.
+            events (Iterable[Any], optional): The events to record. Defaults to every EventEnum.
+            clock (Callable[[], int], optional): The monotonic clock, in nanoseconds. Defaults to monotonic_ns.
+        """
+        self.bus = bus
+        self.path = path
+        self.events = list(EventEnum if events is None else events)
+        self.clock = clock
+        self._file = None
+        self._writer = None
+        self._subscriptions = []
+        self._lock = Lock()
+
+    @property
+    def recorded(self) -> int:
+        """
+        The events recorded since the recorder started.
+
+        Returns:
+            int: The number of events.
+        """
+        return self._writer.written if self._writer else 0
+
+    @property
+    def size(self) -> int:
+        """
+        The bytes written since the recorder started.
+
+        Returns:
+            int: The number of bytes.
+        """
+        return self._writer.size if self._writer else 0
+
+    def start(self) -> "EventRecorder":
+        """
+        Starts recording.
+
+        Returns:
+            EventRecorder: The recorder.
+        """
+        if self._file is None:
+            self._file = open(self.path, 'ab')
+            self._writer = LogWriter(self._file)
+            self._subscriptions = [self.bus.on(event, self._record) for event in self.events]
+
+        return self
+
+    def stop(self) -> "EventRecorder":
+        """
+        Stops recording and closes the log.
+
+        Returns:
+            EventRecorder: The recorder.
+        """
+        for subscription in self._subscriptions:
+            subscription.unsubscribe()
+        self._subscriptions = []
+
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+        return self
+
+    def _record(self, event: Any, *args, **kwargs) -> None:
+        """
+        Writes an event with every field read. Writes are serialized for
+        buses that dispatch on a thread pool.
+
+        Args:
+            event (Any): The event.
+        """
+        values = {field.name: getattr(event, field.name) for field in plan(event.event_type)}
+
+        if type(event.event_type) is CallBackEnum:
+            values['rc'] = event.rc
+
+        with self._lock:
+            self._writer.write(event.event_type, values, self.clock())
+
+    def __enter__(self) -> "EventRecorder":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
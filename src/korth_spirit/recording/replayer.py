@@ -0,0 +1,133 @@
+# Copyright (c) 2021-2022 Johnathan P. Irvin
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+from ctypes import addressof, create_string_buffer
+from time import perf_counter, sleep
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Tuple
+
+from korth_spirit.sdk import SDK, CallBackEnum
+
+from .log import Record, plan, read_log
+
+
+def replay_library() -> SimpleNamespace:
+    """
+    Creates a stand-in SDK library whose attribute getters read from its values,
+    which the replayer sets to those of each event in turn.
+
+    Returns:
+        SimpleNamespace: The library.
+    """
+    library = SimpleNamespace(values={}, buffers={})
+
+    def aw_data(attribute: int, length: Any) -> int:
+        data = bytes(memoryview(library.values[attribute]).cast('B'))
+        length._obj.value = len(data)
+        if not data:
+            return 0
+        buffer = library.buffers[attribute] = create_string_buffer(data, len(data))
+        return addressof(buffer)
+
+    library.aw_int = lambda attribute: library.values[attribute]
+    library.aw_string = lambda attribute: library.values[attribute]
+    library.aw_bool = lambda attribute: library.values[attribute]
+    library.aw_float = lambda attribute: library.values[attribute]
+    library.aw_data = aw_data
+
+    return library
+
+
+class EventReplayer:
+    def __init__(self, path: str) -> None:
+        """
+        Replays a recorded log into an event bus, without the SDK. The log is
+        decoded up front, so replaying at maximum speed measures the bus and
+        its handlers only.
+
+        Args:
+            path (str): The log file.
+
+        Raises:
+            ValueError: If the file is not a valid log.
+        """
+        with open(path, 'rb') as file:
+            self.records: List[Record] = list(read_log(file.read()))
+
+        self._attributes: List[Tuple[Any, Optional[int], Dict[int, Any]]] = []
+        for record in self.records:
+            attributes = {}
+            for field in plan(record.event):
+                value = record.values[field.name]
+                attributes[field.attribute.value] = value.encode('utf-8') if field.kind is str else value
+            self._attributes.append((record.event, record.values.get('rc'), attributes))
+
+    @property
+    def duration(self) -> float:
+        """
+        The recorded time span.
+
+        Returns:
+            float: The seconds between the first and last event.
+        """
+        return self.records[-1].time - self.records[0].time if self.records else 0.0
+
+    def replay(self, bus: Any, speed: Optional[float] = 1.0) -> dict:
+        """
+        Publishes the recorded events, with the recorded timing scaled by speed.
+        The SDK library is replaced while replaying, and restored afterwards.
+
+        Args:
+            bus (Any): The event bus.
+            speed (Optional[float], optional): The speed, such as 1 for real time
+                or 10 for ten times faster, or None for as fast as possible. Defaults to 1.0.
+
+        Returns:
+            dict: The events published, the seconds taken and the events per second.
+        """
+        library = replay_library()
+        previous = SDK._library
+        SDK.use(library)
+        start = perf_counter()
+        origin = self.records[0].time if self.records else 0.0
+
+        try:
+            for record, (event, rc, attributes) in zip(self.records, self._attributes):
+                if speed:
+                    delay = (record.time - origin) / speed - (perf_counter() - start)
+                    if delay > 0:
+                        sleep(delay)
+
+                library.values = attributes
+
+                if type(event) is CallBackEnum:
+                    bus.publish_result(event, rc)
+                else:
+                    bus.publish(event)
+        finally:
+            elapsed = perf_counter() - start
+            SDK._forget()
+            SDK._library = previous
+
+        return {
+            'events': len(self.records),
+            'seconds': elapsed,
+            'rate': len(self.records) / elapsed if elapsed else 0.0,
+        }
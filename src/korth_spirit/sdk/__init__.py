@@ -20,18 +20,21 @@
 # WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 import socket
 import typing
-from ctypes import (CDLL, CFUNCTYPE, POINTER, byref, c_char, c_char_p, c_float,
-                    c_int, c_uint, c_ulong, c_void_p)
-from dataclasses import fields
+from array import array
+from ctypes import (CFUNCTYPE, Array, byref, c_char, c_int, c_uint, c_ulong,
+                    c_void_p, memmove, sizeof, string_at)
 from typing import List, Tuple, Union
 
 from .. import data
 from .enums import AttributeEnum, CallBackEnum, EventEnum, RightsEnum
+from .errors import AwError
+from .context import InstanceContext
+from .library import AW_BUILD, SDK_FILE, Library
 
-SDK_FILE = './aw64.dll'
-SDK = CDLL(SDK_FILE)
-AW_BUILD = 134 # AW 7.0
+SDK = Library(SDK_FILE, AW_BUILD)
+CONTEXT = InstanceContext(SDK)
 AW_CALLBACK = CFUNCTYPE(None)
+AW_RESULT_CALLBACK = CFUNCTYPE(None, c_int)
 
 def aw_int_set(attribute: AttributeEnum, value: int) -> None:
     """
@@ -42,12 +45,12 @@ def aw_int_set(attribute: AttributeEnum, value: int) -> None:
         value (int): The attribute value.
 
     Raises:
-        Exception: If the attribute could not be set.
+        AwError: If the attribute could not be set.
     """
     rc = SDK.aw_int_set(attribute.value, value)
 
     if rc:
-        raise Exception(f"Failed to set initialization attribute: {rc}")
+        raise AwError.from_rc(rc, "Failed to set initialization attribute")
 
 def aw_string_set(attribute: AttributeEnum, value: str) -> None:
     """
@@ -58,12 +61,12 @@ def aw_string_set(attribute: AttributeEnum, value: str) -> None:
         value (str): The attribute value.
 
     Raises:
-        Exception: If the attribute could not be set.
+        AwError: If the attribute could not be set.
     """
     rc = SDK.aw_string_set(attribute.value, value.encode('utf-8'))
 
     if rc:
-        raise Exception(f"Failed to set initialization attribute: {rc}")
+        raise AwError.from_rc(rc, "Failed to set initialization attribute")
 
 def aw_address(session_id: int) -> data.AddressData:
     """
@@ -78,7 +81,7 @@ def aw_address(session_id: int) -> data.AddressData:
     rc = SDK.aw_address(session_id)
 
     if rc != 0:
-        raise Exception(f'Failed to get the IP address of the session. Error code: {rc}')
+        raise AwError.from_rc(rc, 'Failed to get the IP address of the session')
 
     return data.AddressData(
         aw_int(AttributeEnum.AW_AVATAR_SESSION.value),
@@ -96,7 +99,7 @@ def aw_avatar_click(session_id: int) -> None:
     rc = SDK.aw_avatar_click(session_id)
 
     if rc != 0:
-        raise Exception(f'Failed to click the avatar. Error code: {rc}')
+        raise AwError.from_rc(rc, 'Failed to click the avatar')
 
 def aw_avatar_location(
     citizen: typing.Optional[int] = None,
@@ -114,16 +117,16 @@ def aw_avatar_location(
         name (typing.Optional[str], optional): The name of the avatar. Defaults to None.
 
     Raises:
-        Exception: If the location could not be queried.
+        AwError: If the location could not be queried.
     """
     rc = SDK.aw_avatar_location(
-        citizen,
-        session,
+        citizen or 0,
+        session or 0,
         name.encode('utf-8') if name else None
     )
 
     if rc:
-        raise Exception(f"Failed to query avatar location: {rc}")
+        raise AwError.from_rc(rc, "Failed to query avatar location")
 
 def aw_avatar_reload(citizen: int = 0, session: int = 0) -> None:
     """
@@ -140,7 +143,7 @@ def aw_avatar_reload(citizen: int = 0, session: int = 0) -> None:
     rc = SDK.aw_avatar_reload(citizen, session)
 
     if rc != 0:
-        raise Exception(f'Failed to reload the avatar. Error code: {rc}')
+        raise AwError.from_rc(rc, 'Failed to reload the avatar')
 
 def aw_avatar_set(session_id: int) -> None:
     """
@@ -152,7 +155,7 @@ def aw_avatar_set(session_id: int) -> None:
     rc = SDK.aw_avatar_set(session_id)
 
     if rc != 0:
-        raise Exception(f'Failed to set the avatar. Error code: {rc}')
+        raise AwError.from_rc(rc, 'Failed to set the avatar')
 
 def aw_bool(attribute: AttributeEnum) -> bool:
     """
@@ -175,12 +178,12 @@ def aw_bool_set(attribute: AttributeEnum, value: bool) -> None:
         value (bool): The attribute value.
 
     Raises:
-        Exception: If the attribute could not be set.
+        AwError: If the attribute could not be set.
     """
     rc = SDK.aw_bool_set(attribute.value, value)
 
     if rc:
-        raise Exception(f"Failed to set initialization attribute: {rc}")
+        raise AwError.from_rc(rc, "Failed to set initialization attribute")
 
 def aw_botgram_send(text: str, citizen: int) -> None:
     """
@@ -196,14 +199,14 @@ def aw_botgram_send(text: str, citizen: int) -> None:
     rc = SDK.aw_botgram_send()
 
     if rc != 0:
-        raise Exception(f'Failed to send the botgram. Error code: {rc}')
+        raise AwError.from_rc(rc, 'Failed to send the botgram')
 
 def aw_botmenu_send(bot_menu: data.BotMenuData) -> None:
     """
     Builds and sends a botmenu to the defined session.
 
     Raises:
-        Exception: If the botmenu could not be sent.
+        AwError: If the botmenu could not be sent.
 
     Args:
         bot_menu (data.BotMenuData): The botmenu data.
@@ -215,7 +218,7 @@ def aw_botmenu_send(bot_menu: data.BotMenuData) -> None:
     rc = SDK.aw_botmenu_send()
     
     if rc != 0:
-        raise Exception(f'Failed to send the botmenu. Error code: {rc}')
+        raise AwError.from_rc(rc, 'Failed to send the botmenu')
 
 def aw_callback(callback: CallBackEnum) -> c_void_p:
     """
@@ -235,12 +238,12 @@ def aw_callback_set(callback: CallBackEnum, handler: AW_CALLBACK) -> None:
 
     Args:
         callback (CallBackEnum): The callback to set.
-        handler (AW_CALLBACK): The callback handler.
+        handler (AW_RESULT_CALLBACK): The callback handler, which receives the reason code.
     """
     rc = SDK.aw_callback_set(callback.value, handler)
 
     if rc != 0:
-        raise Exception(f'Failed to set the callback. Error code: {rc}')
+        raise AwError.from_rc(rc, 'Failed to set the callback')
 
 def aw_camera_set(session_id: int, camera_set: data.CameraSetData) -> None:
     """
@@ -251,20 +254,15 @@ def aw_camera_set(session_id: int, camera_set: data.CameraSetData) -> None:
         camera_set (data.CameraSetData): The camera data.
     
     Raises:
-        Exception: If the camera could not be set.
+        AwError: If the camera could not be set.
     """
-    from .write_data import write_data
-    for field in fields(camera_set):
-        value = getattr(camera_set, field.name, None)
-        attr = getattr(AttributeEnum, f'AW_CAMERA_{field.name.upper()}')
+    from .marshalling import write_fields
 
-        if value is not None:
-            write_data(attr, value)
-    
+    write_fields(camera_set, 'AW_CAMERA_', skip_none=True)
     rc = SDK.aw_camera_set(session_id)
 
     if rc != 0:
-        raise Exception(f'Failed to set the camera. Error code: {rc}')
+        raise AwError.from_rc(rc, 'Failed to set the camera')
 
 def aw_cav_change(cav_change: data.CavChangeData) -> None:
     """
@@ -274,7 +272,7 @@ def aw_cav_change(cav_change: data.CavChangeData) -> None:
         cav_change (data.CavChangeData): The CAV change data.
 
     Raises:
-        Exception: If the CAV could not be changed.
+        AwError: If the CAV could not be changed.
     """
     aw_int_set(AttributeEnum.AW_CAV_CITIZEN, cav_change.citizen)
     aw_int_set(AttributeEnum.AW_CAV_SESSION, cav_change.session)
@@ -283,7 +281,7 @@ def aw_cav_change(cav_change: data.CavChangeData) -> None:
     rc = SDK.aw_cav_change()
 
     if rc != 0:
-        raise Exception(f'Failed to change the CAV. Error code: {rc}')
+        raise AwError.from_rc(rc, 'Failed to change the CAV')
     
 def aw_cav_delete(cav_delete: data.CavDeleteData) -> None:
     """
@@ -293,7 +291,7 @@ def aw_cav_delete(cav_delete: data.CavDeleteData) -> None:
         cav_delete (data.CavDeleteData): The CAV delete data.
 
     Raises:
-        Exception: If the CAV could not be deleted.
+        AwError: If the CAV could not be deleted.
     """
     aw_int_set(AttributeEnum.AW_CAV_CITIZEN, cav_delete.citizen)
     aw_int_set(AttributeEnum.AW_CAV_SESSION, cav_delete.session)
@@ -301,7 +299,7 @@ def aw_cav_delete(cav_delete: data.CavDeleteData) -> None:
     rc = SDK.aw_cav_delete()
 
     if rc != 0:
-        raise Exception(f'Failed to delete the CAV. Error code: {rc}')
+        raise AwError.from_rc(rc, 'Failed to delete the CAV')
 
 def aw_cav_request(citizen: int, session: int) -> None:
     """
@@ -312,12 +310,12 @@ def aw_cav_request(citizen: int, session: int) -> None:
         session (int): The session ID to query the CAV of.
 
     Raises:
-        Exception: If the CAV could not be requested.
+        AwError: If the CAV could not be requested.
     """    
     rc = SDK.aw_cav_request(citizen, session)
 
     if rc != 0:
-        raise Exception(f'Failed to request the CAV. Error code: {rc}')
+        raise AwError.from_rc(rc, 'Failed to request the CAV')
 
 def aw_cell_next(combine: bool = False, iterator: data.CellIteratorData = None) -> None:
     """
@@ -330,7 +328,7 @@ def aw_cell_next(combine: bool = False, iterator: data.CellIteratorData = None)
         iterator (data.CellIteratorData, optional):  The cell iterator. Defaults to None.
 
     Raises:
-        Exception: If the cell could not be queried.
+        AwError: If the cell could not be queried.
     """    
     if iterator:
         aw_int_set(AttributeEnum.AW_CELL_ITERATOR, iterator.iterator)
@@ -339,7 +337,7 @@ def aw_cell_next(combine: bool = False, iterator: data.CellIteratorData = None)
     rc = SDK.aw_cell_next()
 
     if rc != 0:
-        raise Exception(f'Failed to get the next cell. Error code: {rc}')
+        raise AwError.from_rc(rc, 'Failed to get the next cell')
 
 def aw_check_right(citizen: int, right: str) -> bool:
     """
@@ -363,10 +361,7 @@ def aw_check_right(citizen: int, right: str) -> bool:
     Returns:
         bool: True if the citizen has the right, False otherwise.
     """ 
-    SDK.aw_check_right.argtypes = [c_int, c_char_p]
-    SDK.aw_check_right.restype = c_int
-
-    return bool(SDK.aw_check_right(citizen, right))
+    return bool(SDK.aw_check_right(citizen, right.encode('utf-8')))
 
 def aw_check_right_all(right: str) -> bool:
     """
@@ -384,10 +379,7 @@ def aw_check_right_all(right: str) -> bool:
     Returns:
         bool: True if all citizens have the right, False otherwise.
     """
-    SDK.aw_check_right_all.argtypes = [c_char_p]
-    SDK.aw_check_right_all.restype = c_int
-
-    rc = SDK.aw_check_right_all(right)
+    rc = SDK.aw_check_right_all(right.encode('utf-8'))
 
     return bool(rc)
 
@@ -399,21 +391,15 @@ def aw_citizen_add(citizen: data.CitizenData) -> None:
         citizen (CitizenAddData): The citizen data.
 
     Raises:
-        Exception: If the citizen could not be added.
+        AwError: If the citizen could not be added.
     """
-    from .write_data import write_data
-
-    for field in fields(citizen):
-        value = getattr(citizen, field.name, None)
-        attr = getattr(AttributeEnum, f'AW_CITIZEN_{field.name.upper()}')
+    from .marshalling import write_fields
 
-        if value is not None:
-            write_data(attr, value)
-    
+    write_fields(citizen, 'AW_CITIZEN_', skip_none=True)
     rc = SDK.aw_citizen_add()
 
     if rc != 0:
-        raise Exception(f'Failed to add the citizen. Error code: {rc}')
+        raise AwError.from_rc(rc, 'Failed to add the citizen')
 
 def aw_citizen_attributes_by_name(name: str) -> None:
     """
@@ -423,15 +409,12 @@ def aw_citizen_attributes_by_name(name: str) -> None:
         name (str): The citizen name to get the attributes of.
 
     Raises:
-        Exception: If the attributes could not be requested.
+        AwError: If the attributes could not be requested.
     """
-    SDK.aw_citizen_attributes_by_name.argtypes = [c_char_p]
-    SDK.aw_citizen_attributes_by_name.restype = c_int
-
-    rc = SDK.aw_citizen_attributes_by_name(name)
+    rc = SDK.aw_citizen_attributes_by_name(name.encode('utf-8'))
 
     if rc != 0:
-        raise Exception(f'Failed to get the attributes of the citizen. Error code: {rc}')
+        raise AwError.from_rc(rc, 'Failed to get the attributes of the citizen')
 
 def aw_citizen_attributes_by_number(citizen: int) -> None:
     """
@@ -441,15 +424,12 @@ def aw_citizen_attributes_by_number(citizen: int) -> None:
         citizen (int): The citizen number to get the attributes of.
 
     Raises
-        Exception: If the attributes could not be requested.
+        AwError: If the attributes could not be requested.
     """
-    SDK.aw_citizen_attributes_by_number.argtypes = [c_int]
-    SDK.aw_citizen_attributes_by_number.restype = c_int
-
     rc = SDK.aw_citizen_attributes_by_number(citizen)
 
     if rc != 0:
-        raise Exception(f'Failed to get the attributes of the citizen. Error code: {rc}')
+        raise AwError.from_rc(rc, 'Failed to get the attributes of the citizen')
 
 def aw_citizen_change(citizen: data.CitizenData) -> None:
     """
@@ -459,19 +439,15 @@ def aw_citizen_change(citizen: data.CitizenData) -> None:
         citizen (data.CitizenData): The citizen data.
 
     Raises:
-        Exception: If the citizen could not be changed.
+        AwError: If the citizen could not be changed.
     """
-    from .write_data import write_data
+    from .marshalling import write_fields
 
-    for field in fields(citizen):
-        value = getattr(citizen, field.name, None)
-        attr = getattr(AttributeEnum, f'AW_CITIZEN_{field.name.upper()}')
-        write_data(attr, value)
-    
+    write_fields(citizen, 'AW_CITIZEN_')
     rc = SDK.aw_citizen_change()
 
     if rc != 0:
-        raise Exception(f'Failed to change the citizen. Error code: {rc}')    
+        raise AwError.from_rc(rc, 'Failed to change the citizen')    
 
 def aw_citizen_delete(citizen: int) -> None:
     """
@@ -481,15 +457,12 @@ def aw_citizen_delete(citizen: int) -> None:
         citizen (int): The citizen number to delete.
 
     Raises:
-        Exception: If the citizen could not be deleted.
+        AwError: If the citizen could not be deleted.
     """
-    SDK.aw_citizen_delete.argtypes = [c_int]
-    SDK.aw_citizen_delete.restype = c_int
-
     rc = SDK.aw_citizen_delete(citizen)
 
     if rc != 0:
-        raise Exception(f'Failed to delete the citizen. Error code: {rc}')
+        raise AwError.from_rc(rc, 'Failed to delete the citizen')
 
 def aw_citizen_next(citizen: typing.Optional[int] = None) -> data.CitizenData:
     """
@@ -499,12 +472,12 @@ def aw_citizen_next(citizen: typing.Optional[int] = None) -> data.CitizenData:
         citizen (typing.Optional[int], optional): The citizen number to start the query. Defaults to None.
 
     Raises:
-        Exception: If the citizen could not be queried.
+        AwError: If the citizen could not be queried.
 
     Returns:
         CitizenData: The citizen data.
     """    
-    from .get_data import get_data
+    from .marshalling import read_fields
 
     if citizen:
         aw_int_set(AttributeEnum.AW_CITIZEN_NUMBER, citizen)
@@ -512,16 +485,9 @@ def aw_citizen_next(citizen: typing.Optional[int] = None) -> data.CitizenData:
     rc = SDK.aw_citizen_next()
 
     if rc != 0:
-        raise Exception(f'Failed to get the next citizen. Error code: {rc}')
+        raise AwError.from_rc(rc, 'Failed to get the next citizen')
     
-    citizen = data.CitizenData()
-
-    for field in fields(citizen):
-        attr = getattr(AttributeEnum, f'AW_CITIZEN_{field.name.upper()}')
-        value = get_data(attr)
-        setattr(citizen, field.name, value)
-
-    return citizen
+    return read_fields(data.CitizenData, 'AW_CITIZEN_')
 
 def aw_citizen_previous(citizen: typing.Optional[int] = None) -> data.CitizenData:
     """
@@ -531,12 +497,12 @@ def aw_citizen_previous(citizen: typing.Optional[int] = None) -> data.CitizenDat
         citizen (typing.Optional[int], optional): The citizen number to start the query. Defaults to None.
 
     Raises:
-        Exception: If the citizen could not be queried.
+        AwError: If the citizen could not be queried.
 
     Returns:
         CitizenData: The citizen data.
     """    
-    from .get_data import get_data
+    from .marshalling import read_fields
 
     if citizen:
         aw_int_set(AttributeEnum.AW_CITIZEN_NUMBER, citizen)
@@ -544,16 +510,9 @@ def aw_citizen_previous(citizen: typing.Optional[int] = None) -> data.CitizenDat
     rc = SDK.aw_citizen_previous()
 
     if rc != 0:
-        raise Exception(f'Failed to get the previous citizen. Error code: {rc}')
+        raise AwError.from_rc(rc, 'Failed to get the previous citizen')
     
-    citizen = data.CitizenData()
-
-    for field in fields(citizen):
-        attr = getattr(AttributeEnum, f'AW_CITIZEN_{field.name.upper()}')
-        value = get_data(attr)
-        setattr(citizen, field.name, value)
-
-    return citizen
+    return read_fields(data.CitizenData, 'AW_CITIZEN_')
 
 def aw_console_message(session_id: int, console_message: data.ConsoleMessageData) -> None:
     """
@@ -564,19 +523,15 @@ def aw_console_message(session_id: int, console_message: data.ConsoleMessageData
         console_message (data.ConsoleMessageData): The message data.
 
     Raises:
-        Exception: If the message could not be sent.
+        AwError: If the message could not be sent.
     """
-    from .write_data import write_data
+    from .marshalling import write_fields
 
-    for field in fields(console_message):
-        value = getattr(console_message, field.name, None)
-        attr = getattr(AttributeEnum, f'AW_CONSOLE_{field.name.upper()}')
-        write_data(attr, value)
-    
+    write_fields(console_message, 'AW_CONSOLE_')
     rc = SDK.aw_console_message(session_id)
 
     if rc != 0:
-        raise Exception(f'Failed to send the message. Error code: {rc}')
+        raise AwError.from_rc(rc, 'Failed to send the message')
 
 def aw_create(
     domain: str = "auth.activeworlds.com",
@@ -608,92 +563,101 @@ def aw_create_resolved(address: bytes, port: int) -> c_void_p:
         port (int): The universe port.
 
     Raises:
-        Exception: If the bot instance could not be created.
+        AwError: If the bot instance could not be created.
 
     Returns:
         c_void_p: The bot instance.
     """
     instance = c_void_p()
     address = c_ulong(int.from_bytes(address, byteorder='little')) # Little Endian, not network byte order
-    SDK.aw_create_resolved.argtypes = [c_ulong, c_int, POINTER(c_void_p)]
     rc = SDK.aw_create_resolved(address, port, instance)
 
     if rc:
-        raise Exception(f"Failed to create bot instance: {rc}")
+        raise AwError.from_rc(rc, "Failed to create bot instance")
 
+    CONTEXT.entered(instance)
     return instance
 
-def aw_data(attribute: AttributeEnum, ret_type = c_char) -> Union[bytes, list[bytes]]:
+def aw_data(attribute: AttributeEnum, ret_type = c_char) -> Union[bytes, array]:
     """
-    Gets a data attribute.
+    Gets a data attribute. The SDK buffer is copied once, as bytes for
+    c_char or as a typed array for other simple types.
+    Arrays support the buffer protocol, e.g. numpy.frombuffer without a copy.
 
     Args:
         attribute (AttributeEnum): The attribute name.
-        ret_type (c_char, optional): The return type. Defaults to c_char.
+        ret_type (c_char, optional): The element type in c. Defaults to c_char.
 
     Raises:
         Exception: If the attribute could not be retrieved.
 
     Returns:
-        Union[bytes, list[bytes]]: The attribute value.
+        Union[bytes, array]: The attribute value.
     """
-    SDK.aw_data.restype = POINTER(ret_type)
-    SDK.aw_data.argtypes = [c_int, POINTER(c_uint)]
     data_length = c_uint()
-
     data_p = SDK.aw_data(attribute.value, byref(data_length))
+    length = data_length.value if data_p else 0
 
-    if data_length.value <= 1:
-        return data_p
-        
-    return [data_p[i] for i in range(data_length.value)]
+    if ret_type is c_char:
+        return string_at(data_p, length) if length else b''
 
-def aw_data_set(attribute: AttributeEnum, value: bytes, ret_type = c_char) -> None:
+    values = array(ret_type._type_, [0]) * (length // sizeof(ret_type))
+    if values:
+        memmove(values.buffer_info()[0], data_p, len(values) * values.itemsize)
+
+    return values
+
+def aw_data_set(attribute: AttributeEnum, value: Union[bytes, array, list], ret_type = c_char) -> None:
     """
-    Sets a data attribute.
+    Sets a data attribute. The length passed to the SDK is in bytes.
 
     Args:
         attribute (AttributeEnum): The attribute name.
-        value (bytes): The attribute value.
+        value (Union[bytes, array, list]): The attribute value.
         ret_type (c_char, optional): The data type in c. Defaults to c_char.
 
     Raises:
-        Exception: If the attribute could not be set.
+        AwError: If the attribute could not be set.
     """
-    SDK.aw_data_set.restype = c_int
-    SDK.aw_data_set.argtypes = [c_int, POINTER(ret_type), c_uint]
-
-    length = len(value) if value else 0
     if type(value) is list:
-        value = (ret_type * length)(*value)
+        value = (ret_type * len(value))(*value)
+    elif isinstance(value, array):
+        value = value.tobytes()
+
+    length = sizeof(value) if isinstance(value, Array) else len(value) if value else 0
 
     rc = SDK.aw_data_set(attribute.value, value, length)
 
     if rc:
-        raise Exception(f"Failed to set data attribute: {rc}")
+        raise AwError.from_rc(rc, "Failed to set data attribute")
 
 def aw_delete_all_objects() -> None:
     """
     Deletes all objects.
 
     Raises:
-        Exception: If the objects could not be deleted.
+        AwError: If the objects could not be deleted.
     """    
-    SDK.aw_delete_all_objects.restype = c_int
-    SDK.aw_delete_all_objects.argtypes = []
-
     if rc := SDK.aw_delete_all_objects():
-        raise Exception(f"Failed to delete all objects: {rc}")
+        raise AwError.from_rc(rc, "Failed to delete all objects")
 
 def aw_destroy(instance: c_void_p) -> None:
     """
-    Destroys a bot instance.
+    Destroys a bot instance. The SDK destroys the current instance,
+    so the instance is set first.
 
     Args:
         instance (c_void_p): The bot instance.
+
+    Raises:
+        AwError: If the bot instance could not be destroyed.
     """
-    if rc := SDK.aw_destroy(instance):
-        raise Exception(f"Failed to destroy bot instance: {rc}")
+    aw_instance_set(instance)
+    rc = SDK.aw_destroy()
+    CONTEXT.invalidate()
+
+    if rc:
+        raise AwError.from_rc(rc, "Failed to destroy bot instance")
 
 def aw_enter(world: str) -> None:
     """
@@ -703,12 +667,12 @@ def aw_enter(world: str) -> None:
         name (str): The name of the world.
 
     Raises:
-        Exception: If the world could not be entered.
+        AwError: If the world could not be entered.
     """
     rc = SDK.aw_enter(world.encode('utf-8'))
 
     if rc:
-        raise Exception(f"Failed to enter universe: {rc}")
+        raise AwError.from_rc(rc, "Failed to enter universe")
 
 def aw_event(event: EventEnum) -> c_void_p:
     """
@@ -734,24 +698,24 @@ def aw_event_set(event: EventEnum, handler: AW_CALLBACK) -> None:
         handler (AW_CALLBACK): The event handler.
 
     Raises:
-        Exception: If the event handler could not be set.
+        AwError: If the event handler could not be set.
     """
     rc = SDK.aw_event_set(event.value, handler)
 
     if rc:
-        raise Exception(f"Failed to set event handler: {rc}, {event}")
+        raise AwError.from_rc(rc, "Failed to set event handler", event)
 
 def aw_exit() -> None:
     """
     Exits the world.
 
     Raises:
-        Exception: If the world could not be exited.
+        AwError: If the world could not be exited.
     """
     rc = SDK.aw_exit()
 
     if rc:
-        raise Exception(f"Failed to exit world: {rc}")
+        raise AwError.from_rc(rc, "Failed to exit world")
 
 def aw_float(attribute: AttributeEnum) -> float:
     """
@@ -777,15 +741,12 @@ def aw_float_set(attribute: AttributeEnum, value: float) -> None:
         value (float): The attribute value.
 
     Raises:
-        Exception: If the attribute could not be set.
+        AwError: If the attribute could not be set.
     """
-    SDK.aw_flaot_set.restype = c_int
-    SDK.aw_float_set.argtypes = [c_int, c_float]
-
     rc = SDK.aw_float_set(attribute.value, value)
 
     if rc:
-        raise Exception(f"Failed to set initialization attribute: {rc}")
+        raise AwError.from_rc(rc, "Failed to set initialization attribute")
 
 def aw_has_world_right(citizen: int, right: RightsEnum) -> bool:
     """
@@ -820,12 +781,12 @@ def aw_hud_clear(session: int) -> None:
         session (int): The session number.
 
     Raises:
-        Exception: If the HUD could not be cleared.
+        AwError: If the HUD could not be cleared.
     """    
     rc = SDK.aw_hud_clear(session)
 
     if rc:
-        raise Exception(f"Failed to clear HUD: {rc}")
+        raise AwError.from_rc(rc, "Failed to clear HUD")
 
 def aw_hud_click(hud_click: data.HudClickData) -> None:
     """
@@ -835,7 +796,7 @@ def aw_hud_click(hud_click: data.HudClickData) -> None:
         hud_click (data.HudClickData): The HUD click data.
 
     Raises:
-        Exception: If the HUD click could not be simulated.
+        AwError: If the HUD click could not be simulated.
     """
     aw_int_set(AttributeEnum.AW_HUD_ELEMENT_ID, hud_click.id)
     aw_int_set(AttributeEnum.AW_HUD_CLICK_X, hud_click.x)
@@ -845,7 +806,7 @@ def aw_hud_click(hud_click: data.HudClickData) -> None:
     rc = SDK.aw_hud_click()
 
     if rc:
-        raise Exception(f"Failed to simulate HUD click: {rc}")
+        raise AwError.from_rc(rc, "Failed to simulate HUD click")
 
 def aw_hud_create(hud: data.HudData) -> None:
     """
@@ -855,20 +816,15 @@ def aw_hud_create(hud: data.HudData) -> None:
         hud (data.HudData): The HUD data.
 
     Raises:
-        Exception: If the HUD element could not be created.
+        AwError: If the HUD element could not be created.
     """
-    from .write_data import write_data
-
-    for field in fields(hud):
-        write_data(
-            AttributeEnum(f"AW_HUD_ELEMENT_{field.upper()}"),
-            getattr(hud, field.name)
-        )
+    from .marshalling import write_fields
 
+    write_fields(hud, 'AW_HUD_ELEMENT_')
     rc = SDK.aw_hud_create()
 
     if rc:
-        raise Exception(f"Failed to create HUD element: {rc}")
+        raise AwError.from_rc(rc, "Failed to create HUD element")
 
 def aw_hud_destroy(session: int, id: int) -> None:
     """
@@ -881,7 +837,7 @@ def aw_hud_destroy(session: int, id: int) -> None:
     rc = SDK.aw_hud_destroy(session, id)
 
     if rc:
-        raise Exception(f"Failed to destroy HUD element: {rc}")
+        raise AwError.from_rc(rc, "Failed to destroy HUD element")
 
 def aw_init(build: int) -> None:
     """
@@ -894,7 +850,7 @@ def aw_init(build: int) -> None:
         int: The result of the initialization.
 
     Raises:
-        Exception: If the initialization fails.
+        AwError: If the initialization fails.
 
     See:
         http://wiki.activeworlds.com/index.php?title=SDK_Reason_Codes
@@ -902,7 +858,7 @@ def aw_init(build: int) -> None:
     rc = SDK.aw_init(build)
 
     if rc:
-        raise Exception(f"Failed to initialize SDK: {rc}")
+        raise AwError.from_rc(rc, "Failed to initialize SDK")
 
 def aw_instance() -> c_void_p:
     """
@@ -925,12 +881,12 @@ def aw_instance_callback_set(callback: CallBackEnum, handler: c_void_p) -> None:
         handler (c_void_p): The callback handler.
 
     Raises:
-        Exception: If the callback could not be set.
+        AwError: If the callback could not be set.
     """
     rc = SDK.aw_instance_callback_set(callback.value, handler)
 
     if rc:
-        raise Exception(f"Failed to set instance callback: {rc}")
+        raise AwError.from_rc(rc, "Failed to set instance callback")
 
 def aw_instance_event_set(event: EventEnum, handler: c_void_p) -> None:
     """
@@ -941,27 +897,24 @@ def aw_instance_event_set(event: EventEnum, handler: c_void_p) -> None:
         handler (c_void_p): The event handler.
 
     Raises:
-        Exception: If the event could not be set.
+        AwError: If the event could not be set.
     """    
     rc = SDK.aw_instance_event_set(event.value, handler)
 
     if rc:
-        raise Exception(f"Failed to set instance event: {rc}")
+        raise AwError.from_rc(rc, "Failed to set instance event")
 
 def aw_instance_set(instance: c_void_p) -> None:
     """
-    Sets the bot instance.
+    Sets the bot instance. Nothing is called if it is already current.
 
     Args:
         instance (c_void_p): The bot instance.
 
     Raises:
-        Exception: If the instance could not be set.
+        AwError: If the instance could not be set.
     """
-    rc = SDK.aw_instance_set(instance)
-
-    if rc:
-        raise Exception(f"Failed to set instance: {rc}")
+    CONTEXT.select(instance)
 
 def aw_int(attribute: AttributeEnum) -> int:
     """
@@ -985,18 +938,13 @@ def aw_laser_beam(laser_beam: data.LaserBeamData) -> None:
     Args:
         laser_beam (data.LaserBeamData): The laser beam data.
     """
-    from .write_data import write_data
-
-    for field in fields(laser_beam):
-        write_data(
-            AttributeEnum(f"AW_LASER_BEAM_{field.upper()}"),
-            getattr(laser_beam, field.name)
-        )
+    from .marshalling import write_fields
 
+    write_fields(laser_beam, 'AW_LASER_BEAM_')
     rc = SDK.aw_laser_beam()
 
     if rc:
-        raise Exception(f"Failed to create laser beam: {rc}")
+        raise AwError.from_rc(rc, "Failed to create laser beam")
 
 def aw_license_add(license_create: data.LicenseCreateData) -> None:
     """
@@ -1006,20 +954,16 @@ def aw_license_add(license_create: data.LicenseCreateData) -> None:
         license_create (data.LicenseData): The license data.
 
     Raises:
-        Exception: If the license could not be added.
+        AwError: If the license could not be added.
     """    
-    from .write_data import write_data
+    from .marshalling import write_fields
 
-    for field in fields(license_create):
-        write_data(
-            AttributeEnum(f"AW_LICENSE_{field.upper()}"),
-            getattr(license_create, field.name)
-        )
+    write_fields(license_create, 'AW_LICENSE_')
 
     rc = SDK.aw_license_add()
 
     if rc:
-        raise Exception(f"Failed to add license: {rc}")
+        raise AwError.from_rc(rc, "Failed to add license")
 
 def aw_license_attributes(name: str) -> data.LicenseData:
     """
@@ -1029,27 +973,19 @@ def aw_license_attributes(name: str) -> data.LicenseData:
         name (str): The license name.
 
     Raises:
-        Exception: If the license attributes could not be retrieved.
+        AwError: If the license attributes could not be retrieved.
 
     Returns:
         LicenseData: The license attributes.
     """
-    from .get_data import get_data
+    from .marshalling import read_fields
 
-    rc = SDK.aw_license_attributes(name)
+    rc = SDK.aw_license_attributes(name.encode('utf-8'))
 
     if rc:
-        raise Exception(f"Failed to get license attributes: {rc}")
-
-    license_data = data.LicenseData()
-    for field in fields(license_data):
-        setattr(
-            license_data,
-            field.name,
-            get_data(AttributeEnum(f"AW_LICENSE_{field.upper()}"))
-        )
+        raise AwError.from_rc(rc, "Failed to get license attributes")
 
-    return license_data
+    return read_fields(data.LicenseData, 'AW_LICENSE_')
 
 def aw_license_change(license_change: data.LicenseChangeData) -> None:
     """
@@ -1059,20 +995,16 @@ def aw_license_change(license_change: data.LicenseChangeData) -> None:
         data (data.LicenseChangeData): The license data.
 
     Raises:
-        Exception: If the license could not be changed.
+        AwError: If the license could not be changed.
     """    
-    from .write_data import write_data
+    from .marshalling import write_fields
 
-    for field in fields(license_change):
-        write_data(
-            AttributeEnum(f"AW_LICENSE_{field.upper()}"),
-            getattr(license_change, field.name)
-        )
+    write_fields(license_change, 'AW_LICENSE_')
     
     rc = SDK.aw_license_change()
     
     if rc:
-        raise Exception(f"Failed to change license: {rc}")
+        raise AwError.from_rc(rc, "Failed to change license")
 
 def aw_license_delete(name: str) -> None:
     """
@@ -1081,64 +1013,48 @@ def aw_license_delete(name: str) -> None:
     Args:
         name (str): The license name.
     """
-    rc = SDK.aw_license_delete(name)
+    rc = SDK.aw_license_delete(name.encode('utf-8'))
 
     if rc:
-        raise Exception(f"Failed to delete license: {rc}")
+        raise AwError.from_rc(rc, "Failed to delete license")
 
 def aw_license_next() -> data.LicenseData:
     """
     Gets the next world license.
 
     Raises:
-        Exception: If the license could not be retrieved.
+        AwError: If the license could not be retrieved.
 
     Returns:
         LicenseData: The license data.
     """
-    from .get_data import get_data
+    from .marshalling import read_fields
 
     rc = SDK.aw_license_next()
 
     if rc:
-        raise Exception(f"Failed to get next license: {rc}")
-
-    license_data = data.LicenseData()
-    for field in fields(license_data):
-        setattr(
-            license_data,
-            field.name,
-            get_data(AttributeEnum(f"AW_LICENSE_{field.upper()}"))
-        )
-    
-    return license_data
+        raise AwError.from_rc(rc, "Failed to get next license")
+
+    return read_fields(data.LicenseData, 'AW_LICENSE_')
 
 def aw_license_previous() -> data.LicenseData:
     """
     Gets the previous world license.
 
     Raises:
-        Exception: If the license could not be retrieved.
+        AwError: If the license could not be retrieved.
 
     Returns:
         LicenseData: The license data.
     """
-    from .get_data import get_data
+    from .marshalling import read_fields
 
     rc = SDK.aw_license_previous()
 
     if rc:
-        raise Exception(f"Failed to get previous license: {rc}")
-
-    license_data = data.LicenseData()
-    for field in fields(license_data):
-        setattr(
-            license_data,
-            field.name,
-            get_data(AttributeEnum(f"AW_LICENSE_{field.upper()}"))
-        )
+        raise AwError.from_rc(rc, "Failed to get previous license")
 
-    return license_data
+    return read_fields(data.LicenseData, 'AW_LICENSE_')
 
 def aw_login(instance: c_void_p, login: data.LoginData) -> None:
     """
@@ -1149,7 +1065,7 @@ def aw_login(instance: c_void_p, login: data.LoginData) -> None:
         login (data.LoginData): The login data.
 
     Raises:
-        Exception: If the login failed.
+        AwError: If the login failed.
     """
     aw_instance_set(instance)
 
@@ -1161,7 +1077,7 @@ def aw_login(instance: c_void_p, login: data.LoginData) -> None:
     rc = SDK.aw_login()
 
     if rc:
-        raise Exception(f"Failed to login: {rc}")
+        raise AwError.from_rc(rc, "Failed to login")
 
 def aw_mover_links(id: int) -> None:
     """
@@ -1171,12 +1087,12 @@ def aw_mover_links(id: int) -> None:
         id (int): The mover ID.
 
     Raises:
-        Exception: If the mover links could not be retrieved.
+        AwError: If the mover links could not be retrieved.
     """    
     rc = SDK.aw_mover_links(id)
 
     if rc:
-        raise Exception(f"Failed to get mover links: {rc}")
+        raise AwError.from_rc(rc, "Failed to get mover links")
 
 def aw_mover_rider_add(id: int, session: int, dist: int, angle: int, y_delta: int, yaw_delta: int, pitch_delta: int) -> None:
     """
@@ -1192,13 +1108,13 @@ def aw_mover_rider_add(id: int, session: int, dist: int, angle: int, y_delta: in
         pitch_delta (int): Pitch of the rider, relative to the pitch of the mover object.
 
     Raises:
-        Exception: If the mover rider could not be added.
+        AwError: If the mover rider could not be added.
     """
     rc = SDK.aw_mover_rider_add(id, session, dist, angle, y_delta, yaw_delta, pitch_delta)
 
     if rc:
-        raise Exception(f"Failed to add mover rider: {rc}")
-    rc = SDK.aw_destroy(instance)
+        raise AwError.from_rc(rc, "Failed to add mover rider")
+
 def aw_mover_rider_change(id: int, session: int, dist: int, angle: int, y_delta: int, yaw_delta: int, pitch_delta: int) -> None:
     """
     Changes a mover rider. Triggers the mover rider change event.
@@ -1213,12 +1129,12 @@ def aw_mover_rider_change(id: int, session: int, dist: int, angle: int, y_delta:
         pitch_delta (int): Pitch of the rider, relative to the pitch of the mover object.
 
     Raises:
-        Exception: If the mover rider could not be changed.
+        AwError: If the mover rider could not be changed.
     """
     rc = SDK.aw_mover_rider_change(id, session, dist, angle, y_delta, yaw_delta, pitch_delta)
 
     if rc:
-        raise Exception(f"Failed to change mover rider: {rc}")
+        raise AwError.from_rc(rc, "Failed to change mover rider")
 
 def aw_mover_rider_delete(id: int, session: int) -> None:
     """
@@ -1229,12 +1145,12 @@ def aw_mover_rider_delete(id: int, session: int) -> None:
         session (int): The session ID.
 
     Raises:
-        Exception: If the mover rider could not be deleted.
+        AwError: If the mover rider could not be deleted.
     """
     rc = SDK.aw_mover_rider_delete(id, session)
 
     if rc:
-        raise Exception(f"Failed to delete mover rider: {rc}")
+        raise AwError.from_rc(rc, "Failed to delete mover rider")
 
 def aw_mover_set_position(id: int, x: int, y: int, z: int, yaw: int, pitch: int, roll: int) -> None:
     """
@@ -1250,12 +1166,12 @@ def aw_mover_set_position(id: int, x: int, y: int, z: int, yaw: int, pitch: int,
         roll (int): Roll.
 
     Raises:
-        Exception: If the mover position could not be set.
+        AwError: If the mover position could not be set.
     """
     rc = SDK.aw_mover_set_position(id, x, y, z, yaw, pitch, roll)
 
     if rc:
-        raise Exception(f"Failed to set mover position: {rc}")
+        raise AwError.from_rc(rc, "Failed to set mover position")
 
 def aw_mover_set_state(id: int, state: int, model_num: int) -> None:
     """
@@ -1267,12 +1183,12 @@ def aw_mover_set_state(id: int, state: int, model_num: int) -> None:
         model_num (int): The model number.
     
     Raises:
-        Exception: If the mover state could not be set.
+        AwError: If the mover state could not be set.
     """
     rc = SDK.aw_mover_set_state(id, state, model_num)
 
     if rc:
-        raise Exception(f"Failed to set mover state: {rc}")
+        raise AwError.from_rc(rc, "Failed to set mover state")
 
 def aw_noise(session_id: int, sound_file: str) -> None:
     """
@@ -1283,13 +1199,13 @@ def aw_noise(session_id: int, sound_file: str) -> None:
         sound_file (str): Absolute url or relative path to the sound file.
 
     Raises:
-        Exception: If the noise could not be played.
+        AwError: If the noise could not be played.
     """    
     aw_string_set(AttributeEnum.AW_SOUND_NAME, sound_file)
     rc = SDK.aw_noise(session_id)
 
     if rc:
-        raise Exception(f"Failed to play noise: {rc}")
+        raise AwError.from_rc(rc, "Failed to play noise")
 
 def aw_object_add(object_create: data.ObjectCreateData) -> data.ObjectCreatedData:
     """
@@ -1301,31 +1217,15 @@ def aw_object_add(object_create: data.ObjectCreateData) -> data.ObjectCreatedDat
     Returns:
         ObjectCreatedData: The created object data.
     """
-    from .get_data import get_data
-    from .write_data import write_data
-
-    for field in fields(object_create):
-        value = getattr(object_create, field.name, None)
-        attr = getattr(AttributeEnum, f'AW_OBJECT_{field.name.upper()}')
-        write_data(attr, value)
+    from .marshalling import read_fields, write_fields
 
+    write_fields(object_create, 'AW_OBJECT_')
     rc = SDK.aw_object_add()
 
     if rc:
-        raise Exception(f"Failed to create object: {rc}")
-
-    ret = data.ObjectCreatedData()
-    for field in fields(ret):
-        prepend = 'AW_OBJECT_'
-        if 'CELL' in field.name.upper():
-            prepend = 'AW_'
-        attr = getattr(AttributeEnum, f'{prepend}{field.name.upper()}')
-        object_create = get_data(attr)
-
-        if object_create:
-            setattr(ret, field.name, object_create)
+        raise AwError.from_rc(rc, "Failed to create object")
 
-    return ret
+    return read_fields(data.ObjectCreatedData, 'AW_OBJECT_', skip_empty=True)
 
 def aw_object_bump(object_bump: data.ObjectBumpData) -> Tuple[int, int]:
     """
@@ -1335,23 +1235,19 @@ def aw_object_bump(object_bump: data.ObjectBumpData) -> Tuple[int, int]:
         object_bump (data.ObjectBumpData): The object data.
 
     Raises:
-        Exception: If the object could not be bumped.
+        AwError: If the object could not be bumped.
 
     Returns:
         Tuple[int, int]: Object sync, and session ID.
     """    
     from .get_data import get_data
-    from .write_data import write_data
+    from .marshalling import write_fields
 
-    for field in fields(object_bump):
-        value = getattr(object_bump, field.name, None)
-        attr = getattr(AttributeEnum, f'AW_OBJECT_{field.name.upper()}')
-        write_data(attr, value)
-    
+    write_fields(object_bump, 'AW_OBJECT_')
     rc = SDK.aw_object_bump()
 
     if rc:
-        raise Exception(f"Failed to bump object: {rc}")
+        raise AwError.from_rc(rc, "Failed to bump object")
 
     return get_data(AttributeEnum.AW_OBJECT_SYNC), get_data(AttributeEnum.AW_OBJECT_SESSION_TO)
 
@@ -1363,20 +1259,16 @@ def aw_object_change(object_change: data.ObjectChangeData) -> None:
         object_change (data.ObjectChangeData): The object data.
 
     Raises:
-        Exception: If the object could not be changed.
-        Exception: If the change data has an unsupported type.
+        AwError: If the object could not be changed.
+        AwError: If the change data has an unsupported type.
     """
-    from .write_data import write_data
-
-    for field in fields(object_change):
-        value = getattr(object_change, field.name, None)
-        attr = getattr(AttributeEnum, f'AW_OBJECT_{field.name.upper()}')
-        write_data(attr, value)
+    from .marshalling import write_fields
 
+    write_fields(object_change, 'AW_OBJECT_')
     rc = SDK.aw_object_change()
 
     if rc:
-        raise Exception(f"Failed to change object: {rc}")
+        raise AwError.from_rc(rc, "Failed to change object")
 
 def aw_object_click(object_click: data.ObjectClickData) -> data.ObjectClickedData:
     """
@@ -1388,31 +1280,15 @@ def aw_object_click(object_click: data.ObjectClickData) -> data.ObjectClickedDat
     Returns:
         data.ObjectClickedData: The clicked object data.
     """    
-    from .get_data import get_data
-    from .write_data import write_data
-
-    for field in fields(object_click):
-        value = getattr(object_click, field.name, None)
-        attr = getattr(AttributeEnum, f'AW_OBJECT_{field.name.upper()}')
-        write_data(attr, value)
+    from .marshalling import read_fields, write_fields
 
+    write_fields(object_click, 'AW_OBJECT_')
     rc = SDK.aw_object_click()
 
     if rc:
-        raise Exception(f"Failed to click object: {rc}")
-
-    ret = data.ObjectClickedData()
-    for field in fields(ret):
-        prepend = 'AW_OBJECT_'
-        if 'CELL' in field.name.upper():
-            prepend = 'AW_'
-        attr = getattr(AttributeEnum, f'{prepend}{field.name.upper()}')
-        object_click = get_data(attr)
-
-        if object_click:
-            setattr(ret, field.name, object_click)
+        raise AwError.from_rc(rc, "Failed to click object")
 
-    return ret
+    return read_fields(data.ObjectClickedData, 'AW_OBJECT_', skip_empty=True)
 
 def aw_object_delete(object_delete: data.ObjectDeleteData) -> None:
     """
@@ -1422,20 +1298,15 @@ def aw_object_delete(object_delete: data.ObjectDeleteData) -> None:
         object_delete (data.ObjectDeleteData): The object data.
 
     Raises:
-        Exception: If the object could not be deleted.
+        AwError: If the object could not be deleted.
     """
-    from .write_data import write_data
-
-    for field in fields(object_delete):
-        value = getattr(object_delete, field.name, None)
-        attr = getattr(AttributeEnum, f'AW_OBJECT_{field.name.upper()}')
-        if value:
-            write_data(attr, value)
+    from .marshalling import write_fields
 
+    write_fields(object_delete, 'AW_OBJECT_', skip_none=True)
     rc = SDK.aw_object_delete()
 
     if rc:
-        raise Exception(f"Failed to delete object: {rc}")
+        raise AwError.from_rc(rc, "Failed to delete object")
 
 def aw_object_load(object_load: data.ObjectLoadData) -> data.ObjectLoadedData:
     """
@@ -1445,40 +1316,20 @@ def aw_object_load(object_load: data.ObjectLoadData) -> data.ObjectLoadedData:
         object_load (data.ObjectLoadData): The object data.
 
     Raises:
-        Exception: If the object could not be loaded.
+        AwError: If the object could not be loaded.
 
     Returns:
         data.ObjectLoadedData: The loaded object data.
     """
-    from .get_data import get_data
-    from .write_data import write_data
-
-    for field in fields(object_load):
-        value = getattr(object_load, field.name, None)
-        if 'cell' not in field.name.lower():
-            attr = getattr(AttributeEnum, f'AW_OBJECT_{field.name.upper()}')
-            write_data(attr, value)
-        else:
-            attr = getattr(AttributeEnum, f'AW_{field.name.upper()}')
-            write_data(attr, value)
+    from .marshalling import read_fields, write_fields
 
+    write_fields(object_load, 'AW_OBJECT_')
     rc = SDK.aw_object_load()
     
     if rc:
-        raise Exception(f"Failed to load object: {rc}")
-
-    ret = data.ObjectLoadedData()
-    for field in fields(ret):
-        prepend = 'AW_OBJECT_'
-        if 'CELL' in field.name.upper():
-            prepend = 'AW_'
-        attr = getattr(AttributeEnum, f'{prepend}{field.name.upper()}')
-        object_load = get_data(attr)
+        raise AwError.from_rc(rc, "Failed to load object")
 
-        if object_load:
-            setattr(ret, field.name, object_load)
-
-    return ret
+    return read_fields(data.ObjectLoadedData, 'AW_OBJECT_', skip_empty=True)
 
 def aw_object_query(object_query: Union[data.ObjectQueryData, int]) -> data.ObjectQueriedData:
     """
@@ -1490,31 +1341,20 @@ def aw_object_query(object_query: Union[data.ObjectQueryData, int]) -> data.Obje
     Returns:
         data.ObjectQueriedData: The queried object data.
     """    
-    from .get_data import get_data
+    from .marshalling import read_fields, write_fields
     from .write_data import write_data
 
     if isinstance(object_query, int):
         write_data(AttributeEnum.AW_OBJECT_ID, object_query)
     else:
-        for field in fields(object_query):
-            value = getattr(object_query, field.name, None)
-            attr = getattr(AttributeEnum, f'AW_OBJECT_{field.name.upper()}')
-            write_data(attr, value)
+        write_fields(object_query, 'AW_OBJECT_')
     
     rc = SDK.aw_object_query()
 
     if rc:
-        raise Exception(f"Failed to query object: {rc}")
+        raise AwError.from_rc(rc, "Failed to query object")
 
-    ret = data.ObjectQueriedData()
-    for field in fields(ret):
-        attr = getattr(AttributeEnum, f'AW_OBJECT_{field.name.upper()}')
-        object_query = get_data(attr)
-
-        if object_query:
-            setattr(ret, field.name, object_query)
-
-    return ret
+    return read_fields(data.ObjectQueriedData, 'AW_OBJECT_', skip_empty=True)
 
 def aw_object_select(*args: typing.Any) -> typing.Any:
     return SDK.aw_object_select(*args)
@@ -1529,7 +1369,7 @@ def aw_query(x_sector: int, z_sector: int, sequence3_x_3: List[List[int]]) -> No
         sequence3_x_3 (List[List[int]]): The sequence of 3 x 3 cells.
 
     Raises:
-        Exception: If the query failed.
+        AwError: If the query failed.
         Exception: If the sequence is invalid.
     """
     if len(sequence3_x_3) != 3:
@@ -1540,12 +1380,10 @@ def aw_query(x_sector: int, z_sector: int, sequence3_x_3: List[List[int]]) -> No
             raise Exception("The sequence must be 3 x 3.")
     
     sequence = (c_int * 9)(*[x for row in sequence3_x_3 for x in row])
-    SDK.aw_query.argtypes = [c_int, c_int, (c_int * 9)]
-    SDK.aw_query.restype = c_int
     rc = SDK.aw_query(x_sector, z_sector, sequence)
 
     if rc:
-        raise Exception(f"Failed to query: {rc}")
+        raise AwError.from_rc(rc, "Failed to query")
 
 def aw_say(message: str) -> None:
     """
@@ -1555,12 +1393,12 @@ def aw_say(message: str) -> None:
         message (str): The message to send.
 
     Raises:
-        Exception: If the message could not be sent.
+        AwError: If the message could not be sent.
     """
     rc = SDK.aw_say(message.encode('utf-8'))
 
     if rc:
-        raise Exception(f"Failed to send message: {rc}")
+        raise AwError.from_rc(rc, "Failed to send message")
 
 def aw_sector_from_cell(cell: int) -> int:
     """
@@ -1569,9 +1407,6 @@ def aw_sector_from_cell(cell: int) -> int:
     Args:
         cell (int): The cell.
     """
-    SDK.aw_sector_from_cell.argtypes = [c_int]
-    SDK.aw_sector_from_cell.restype = c_int
-    
     return SDK.aw_sector_from_cell(cell)
 
 def aw_server_admin(domain: str, port: int, password: str, instance: c_void_p) -> Tuple[int, int]:
@@ -1585,18 +1420,15 @@ def aw_server_admin(domain: str, port: int, password: str, instance: c_void_p) -
         instance (c_void_p): The instance.
 
     Raises:
-        Exception: If the connection failed.
+        AwError: If the connection failed.
 
     Returns:
         Tuple[int, int]: Server build, build number.
     """
-    SDK.aw_server_admin.argtypes = [c_char_p, c_int, c_char_p, c_void_p]
-    SDK.aw_server_admin.restype = c_int
-
     rc = SDK.aw_server_admin(domain.encode('utf-8'), port, password.encode('utf-8'), instance)
 
     if rc:
-        raise Exception(f"Failed to connect: {rc}")
+        raise AwError.from_rc(rc, "Failed to connect")
 
 def aw_server_world_add(server: data.ServerData) -> data.ServerReturnData:
     """
@@ -1608,28 +1440,15 @@ def aw_server_world_add(server: data.ServerData) -> data.ServerReturnData:
     Returns:
         ServerReturnData: The created world data.
     """
-    from .get_data import get_data
-    from .write_data import write_data
-
-    for field in fields(server):
-        value = getattr(server, field.name, None)
-        attr = getattr(AttributeEnum, f'AW_SERVER_{field.name.upper()}')
-        write_data(attr, value)
+    from .marshalling import read_fields, write_fields
 
+    write_fields(server, 'AW_SERVER_')
     rc = SDK.aw_server_world_add()
 
     if rc:
-        raise Exception(f"Failed to create world: {rc}")
-
-    ret = data.ServerReturnData()
-    for field in fields(ret):
-        attr = getattr(AttributeEnum, f'AW_SERVER_{field.name.upper()}')
-        attr_data = get_data(attr)
-
-        if attr_data:
-            setattr(ret, field.name, attr_data)
+        raise AwError.from_rc(rc, "Failed to create world")
 
-    return ret
+    return read_fields(data.ServerReturnData, 'AW_SERVER_', skip_empty=True)
 
 def aw_server_world_change(server: data.ServerData) -> data.ServerReturnData:
     """
@@ -1641,28 +1460,15 @@ def aw_server_world_change(server: data.ServerData) -> data.ServerReturnData:
     Returns:
         ServerReturnData: The changed world data.
     """
-    from .get_data import get_data
-    from .write_data import write_data
-
-    for field in fields(server):
-        value = getattr(server, field.name, None)
-        attr = getattr(AttributeEnum, f'AW_SERVER_{field.name.upper()}')
-        write_data(attr, value)
+    from .marshalling import read_fields, write_fields
 
+    write_fields(server, 'AW_SERVER_')
     rc = SDK.aw_server_world_change()
 
     if rc:
-        raise Exception(f"Failed to create world: {rc}")
+        raise AwError.from_rc(rc, "Failed to create world")
 
-    ret = data.ServerReturnData()
-    for field in fields(ret):
-        attr = getattr(AttributeEnum, f'AW_SERVER_{field.name.upper()}')
-        attr_data = get_data(attr)
-
-        if attr_data:
-            setattr(ret, field.name, attr_data)
-
-    return ret
+    return read_fields(data.ServerReturnData, 'AW_SERVER_', skip_empty=True)
 
 def aw_server_world_delete(id: int) -> data.ServerReturnData:
     """
@@ -1674,22 +1480,14 @@ def aw_server_world_delete(id: int) -> data.ServerReturnData:
     Returns:
         ServerReturnData: The deleted world data.
     """
-    from .get_data import get_data
+    from .marshalling import read_fields
 
     rc = SDK.aw_server_world_delete(id)
 
     if rc:
-        raise Exception(f"Failed to delete world: {rc}")
+        raise AwError.from_rc(rc, "Failed to delete world")
 
-    ret = data.ServerReturnData()
-    for field in fields(ret):
-        attr = getattr(AttributeEnum, f'AW_SERVER_{field.name.upper()}')
-        attr_data = get_data(attr)
-
-        if attr_data:
-            setattr(ret, field.name, attr_data)
-
-    return ret
+    return read_fields(data.ServerReturnData, 'AW_SERVER_', skip_empty=True)
 
 def aw_server_world_instance_add(*args: typing.Any) -> typing.Any:
     return SDK.aw_server_world_instance_add(*args)
@@ -1724,20 +1522,17 @@ def aw_state_change(instance: c_void_p, state_change: data.StateChangeData) -> N
         state_change (data.StateChangeData): The state change data.
 
     Raises:
-        Exception: If the state change failed.
+        AwError: If the state change failed.
     """
+    from .marshalling import write_fields
+
     aw_instance_set(instance)
-    
-    for field in fields(state_change):
-        value = getattr(state_change, field.name, None)
-        attr = getattr(AttributeEnum, f'AW_MY_{field.name.upper()}')
-        if value:
-            aw_int_set(attr, value)
+    write_fields(state_change, 'AW_MY_', skip_none=True)
 
     rc = SDK.aw_state_change()
 
     if rc:
-        raise Exception(f"Failed to check state change: {rc}")
+        raise AwError.from_rc(rc, "Failed to check state change")
 
 def aw_string(attribute: AttributeEnum) -> str:
     """
@@ -1752,7 +1547,6 @@ def aw_string(attribute: AttributeEnum) -> str:
     Returns:
         str: The attribute value.
     """
-    SDK.aw_string.restype = c_char_p
     return SDK.aw_string(attribute.value).decode('utf-8')
 
 def aw_string_from_unicode(*args: typing.Any) -> typing.Any:
@@ -1778,12 +1572,12 @@ def aw_terrain_delete_all() -> None:
     Resets all terrain data.
 
     Raises:
-        Exception: If the terrain data could not be reset.
+        AwError: If the terrain data could not be reset.
     """
     rc = SDK.aw_terrain_delete_all()
 
     if rc:
-        raise Exception(f"Failed to delete all terrain: {rc}")
+        raise AwError.from_rc(rc, "Failed to delete all terrain")
 
 def aw_terrain_load_node(node: data.TerrainNodeData) -> None:
     """
@@ -1793,8 +1587,9 @@ def aw_terrain_load_node(node: data.TerrainNodeData) -> None:
         node (TerrainNodeData): The terrain node data.
 
     Raises:
-        Exception: If the terrain node could not be loaded.
+        AwError: If the terrain node could not be loaded.
     """
+    from .marshalling import write_fields
     from .write_data import write_data
 
     aw_int_set(
@@ -1802,27 +1597,20 @@ def aw_terrain_load_node(node: data.TerrainNodeData) -> None:
         2
     )
 
-    for field in fields(node):
-        value = getattr(node, field.name, None)
-        if field.name.lower() == 'heights' or field.name.lower() == 'textures':
-            field.name = f'node_{field.name}'
-        attr = getattr(AttributeEnum, f'AW_TERRAIN_{field.name.upper()}')
-        if value:
-            write_data(attr, value)
-
+    write_fields(node, 'AW_TERRAIN_', skip_none=True)
     write_data(AttributeEnum.AW_TERRAIN_NODE_HEIGHT_COUNT, len(node.heights))
     write_data(AttributeEnum.AW_TERRAIN_NODE_TEXTURE_COUNT, len(node.textures))
     rc = SDK.aw_terrain_load_node()
 
     if rc:
-        raise Exception(f"Failed to load terrain node: {rc}")
+        raise AwError.from_rc(rc, "Failed to load terrain node")
 
 def aw_terrain_next() -> bool:
     """
     Gets the next terrain node.
 
     Raises:
-        Exception: If an error occured.
+        AwError: If an error occured.
 
     Returns:
         bool: True if completed, False if not.
@@ -1832,36 +1620,32 @@ def aw_terrain_next() -> bool:
         2
     )
 
-    SDK.aw_terrain_next.restype = c_int
     rc = SDK.aw_terrain_next()
 
     if rc:
-        raise Exception(f"Failed to get next terrain: {rc}")
+        raise AwError.from_rc(rc, "Failed to get next terrain")
 
     return aw_bool(AttributeEnum.AW_TERRAIN_COMPLETE)
 
-def aw_terrain_query(page_x: int, page_z: int, sequence: int) -> bool:
+def aw_terrain_query(page_x: int, page_z: int, sequence: typing.Optional[int] = None) -> bool:
     """
     Queries the terrain for the specified page.
 
     Args:
         page_x (int): The page's X coordinate.
         page_z (int): The page's Z coordinate.
-        sequence (int): The sequence number.
+        sequence (typing.Optional[int], optional): The sequence number. Defaults to None, queried as 0.
 
     Raises:
-        Exception: If the terrain query failed.
+        AwError: If the terrain query failed.
 
     Returns:
         bool: True if the terrain query has completed, False otherwise.
     """
-    SDK.aw_terrain_query.argtypes = [c_int, c_int, c_ulong]
-    SDK.aw_terrain_query.restype = c_int
-    
-    rc = SDK.aw_terrain_query(page_x, page_z, sequence)
+    rc = SDK.aw_terrain_query(page_x, page_z, sequence or 0)
 
     if rc:
-        raise Exception(f"Failed to query terrain: {rc}")
+        raise AwError.from_rc(rc, "Failed to query terrain")
 
     return aw_bool(AttributeEnum.AW_TERRAIN_COMPLETE)
 
@@ -1912,12 +1696,12 @@ def aw_url_click(url: str) -> None:
         url (str): The url to click.
 
     Raises:
-        Exception: If the url click failed.
+        AwError: If the url click failed.
     """
-    rc = SDK.aw_url_click(url)
+    rc = SDK.aw_url_click(url.encode('utf-8'))
 
     if rc:
-        raise Exception(f"Failed to click url: {rc}")
+        raise AwError.from_rc(rc, "Failed to click url")
 
 def aw_url_send(session_id: int, url: str, target: str, post: bool = False, target_3d: bool = False)-> None:
     """
@@ -1931,15 +1715,15 @@ def aw_url_send(session_id: int, url: str, target: str, post: bool = False, targ
         target_3d (bool): True if the target is a 3D frame, False otherwise.
 
     Raises:
-        Exception: If the url send failed.
+        AwError: If the url send failed.
     """
     aw_bool_set(AttributeEnum.AW_URL_POST, post)
     aw_bool_set(AttributeEnum.AW_URL_TARGET_3D, target_3d)
     
-    rc = SDK.aw_url_send(session_id, url, target)
+    rc = SDK.aw_url_send(session_id, url.encode('utf-8'), target.encode('utf-8'))
 
     if rc:
-        raise Exception(f"Failed to send url: {rc}")
+        raise AwError.from_rc(rc, "Failed to send url")
 
 def aw_user_data(*args: typing.Any) -> typing.Any:
     return SDK.aw_user_data(*args)
@@ -1959,12 +1743,14 @@ def aw_wait(milliseconds: int = -1) -> None:
         milliseconds (int, optional): The amount of time to wait in milliseconds. Defaults to -1.
 
     Raises:
-        Exception: If the wait failed.
+        AwError: If the wait failed.
     """    
     rc = SDK.aw_wait(milliseconds)
+    # Handlers run with their own instance current.
+    CONTEXT.invalidate()
 
     if rc:
-        raise Exception(f"Failed to wait: {rc}")
+        raise AwError.from_rc(rc, "Failed to wait")
 
 def aw_whisper(session_id: int, message: str) -> None:
     """
@@ -1977,7 +1763,7 @@ def aw_whisper(session_id: int, message: str) -> None:
     rc = SDK.aw_whisper(session_id, message.encode('utf-8'))
 
     if rc:
-        raise Exception(f"Failed to send whisper: {rc}")
+        raise AwError.from_rc(rc, "Failed to send whisper")
 
 def aw_world_attribute_get(attribute: int) -> Union[bool, str]:
     """
@@ -1987,19 +1773,17 @@ def aw_world_attribute_get(attribute: int) -> Union[bool, str]:
         attribute (int): The attribute to get. These attributes aren't documented.
 
     Raises:
-        Exception: If the attribute could not be retrieved.
+        AwError: If the attribute could not be retrieved.
 
     Returns:
         Union[bool, str]: Read Only, The attribute value.
     """    
-    SDK.aw_world_attribute_get.argtypes = [c_int, POINTER(c_int), c_char_p]
-
     read_only = c_int()
     value = c_char_p()
     rc = SDK.aw_world_attribute_get(attribute, read_only, value.encode('utf-8'))
 
     if rc:
-        raise Exception(f"Failed to get world attribute: {rc}")
+        raise AwError.from_rc(rc, "Failed to get world attribute")
 
     return bool(read_only), value.decode('utf-8')
 
@@ -2014,7 +1798,7 @@ def aw_world_attribute_set(attribute: int, value: str) -> None:
     rc = SDK.aw_world_attribute_set(attribute, value.encode('utf-8'))
 
     if rc:
-        raise Exception(f"Failed to set world attribute: {rc}")
+        raise AwError.from_rc(rc, "Failed to set world attribute")
 
 def aw_world_attributes_change(*args: typing.Any) -> typing.Any:
     return SDK.aw_world_attributes_change(*args)
@@ -0,0 +1,109 @@
+# Copyright (c) 2021-2022 Johnathan P. Irvin
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+from typing import Any, Callable, List, Optional, Type, Union
+
+from . import SDK, aw_data, aw_data_set
+from .enums import ATTRIBUTE_TYPES, AttributeEnum
+from .errors import AwError
+
+Reader = Callable[[], Any]
+Writer = Callable[[Any], None]
+
+def _check(rc: int) -> None:
+    """
+    Raises if an attribute could not be set.
+
+    Args:
+        rc (int): The SDK reason code.
+
+    Raises:
+        AwError: If the reason code is not zero.
+    """
+    if rc:
+        raise AwError.from_rc(rc, "Failed to set initialization attribute")
+
+def build_reader(attribute: AttributeEnum, aw_type: Union[Type, tuple]) -> Optional[Reader]:
+    """
+    Builds a reader bound to a single attribute.
+
+    Args:
+        attribute (AttributeEnum): The attribute to read.
+        aw_type (Union[Type, tuple]): The type of the attribute, with extra aw_data arguments for bytes.
+
+    Returns:
+        Optional[Reader]: The reader, or None if the type is unknown.
+    """
+    index = attribute.value
+    args = ()
+    if type(aw_type) is tuple:
+        aw_type, *args = aw_type
+
+    if aw_type is int:
+        return lambda: SDK.aw_int(index)
+    if aw_type is str:
+        return lambda: SDK.aw_string(index).decode('utf-8')
+    if aw_type is bool:
+        return lambda: bool(SDK.aw_bool(index))
+    if aw_type is float:
+        return lambda: SDK.aw_float(index)
+    if aw_type is bytes:
+        return lambda: aw_data(attribute, *args)
+
+    return None
+
+def build_writer(attribute: AttributeEnum, aw_type: Union[Type, tuple]) -> Optional[Writer]:
+    """
+    Builds a writer bound to a single attribute.
+    None is written as zero, or as a null string.
+
+    Args:
+        attribute (AttributeEnum): The attribute to write.
+        aw_type (Union[Type, tuple]): The type of the attribute, with extra aw_data_set arguments for bytes.
+
+    Returns:
+        Optional[Writer]: The writer, or None if the type is unknown.
+    """
+    index = attribute.value
+    args = ()
+    if type(aw_type) is tuple:
+        aw_type, *args = aw_type
+
+    if aw_type is int:
+        return lambda value: _check(SDK.aw_int_set(index, value or 0))
+    if aw_type is str:
+        return lambda value: _check(SDK.aw_string_set(index, None if value is None else value.encode('utf-8')))
+    if aw_type is bool:
+        return lambda value: _check(SDK.aw_bool_set(index, bool(value)))
+    if aw_type is float:
+        return lambda value: _check(SDK.aw_float_set(index, value or 0.0))
+    if aw_type is bytes:
+        return lambda value: aw_data_set(attribute, value, *args)
+
+    return None
+
+# Dense tables indexed by the attribute's integer value.
+READERS: List[Optional[Reader]] = [None] * len(AttributeEnum)
+WRITERS: List[Optional[Writer]] = [None] * len(AttributeEnum)
+
+for _attribute in AttributeEnum:
+    _aw_type = ATTRIBUTE_TYPES.get(_attribute)
+    READERS[_attribute.value] = build_reader(_attribute, _aw_type)
+    WRITERS[_attribute.value] = build_writer(_attribute, _aw_type)
@@ -0,0 +1,150 @@
+# Copyright (c) 2021-2022 Johnathan P. Irvin
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+from collections import Counter
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional
+
+from .errors import AwError
+
+
+def instance_key(instance: Any) -> Optional[int]:
+    """
+    Gets the address of an instance handle, which is either a c_void_p or an int.
+
+    Args:
+        instance (Any): The instance handle.
+
+    Returns:
+        Optional[int]: The address, or None for no instance.
+    """
+    return getattr(instance, 'value', instance)
+
+
+class InstanceContext:
+    def __init__(self, library: Any) -> None:
+        """
+        Tracks the current SDK instance, so switching to the instance that is
+        already current costs nothing. The SDK also changes the current
+        instance itself: when creating one, and before calling a handler.
+
+        Args:
+            library (Any): The SDK library.
+        """
+        self._library = library
+        self.current: Optional[int] = None
+        self.known = False
+        self.switches = 0
+        self.skipped = 0
+        self.counts = Counter()
+
+    def select(self, instance: Any) -> None:
+        """
+        Makes an instance current, unless it already is.
+
+        Args:
+            instance (Any): The instance handle.
+
+        Raises:
+            AwError: If the instance could not be set.
+        """
+        key = instance_key(instance)
+
+        if self.known and key == self.current:
+            self.skipped += 1
+            return
+
+        rc = self._library.aw_instance_set(instance)
+
+        if rc:
+            self.known = False
+            raise AwError.from_rc(rc, "Failed to set instance")
+
+        self.current = key
+        self.known = True
+        self.switches += 1
+        self.counts[key] += 1
+
+    def redirect(self, select: Optional[Callable[[Any], None]]) -> None:
+        """
+        Routes select() through another function, such as one that only records
+        the instance on threads that must not switch it. None restores select().
+
+        Args:
+            select (Optional[Callable[[Any], None]]): The function, or None.
+        """
+        if select is None:
+            self.__dict__.pop('select', None)
+        else:
+            self.select = select
+
+    def entered(self, instance: Any) -> None:
+        """
+        Records that the SDK made an instance current.
+
+        Args:
+            instance (Any): The instance handle.
+        """
+        self.current = instance_key(instance)
+        self.known = True
+
+    def invalidate(self) -> None:
+        """
+        Forgets the current instance, after the SDK may have changed it.
+        """
+        self.known = False
+
+    @contextmanager
+    def using(self, instance: Any) -> Iterator[None]:
+        """
+        Makes an instance current for a block, then restores the previous one.
+
+        Args:
+            instance (Any): The instance handle.
+        """
+        previous = self.current if self.known else None
+        self.select(instance)
+
+        try:
+            yield
+        finally:
+            if previous is not None:
+                self.select(previous)
+
+    def stats(self) -> dict:
+        """
+        Gets the switch counts.
+
+        Returns:
+            dict: The switches made, the switches skipped and the switches to each instance.
+        """
+        return {
+            'switches': self.switches,
+            'skipped': self.skipped,
+            'instances': dict(self.counts),
+        }
+
+    def reset(self) -> None:
+        """
+        Resets the switch counts.
+        """
+        self.switches = 0
+        self.skipped = 0
+        self.counts.clear()
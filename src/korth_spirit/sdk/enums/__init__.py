@@ -18,11 +18,46 @@
 # LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
 # WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
-from .attribute import AttributeEnum
-from .attribute_types import ATTRIBUTE_TYPES
-from .callback import CallBackEnum
-from .event import EventEnum
-from .rights import RightsEnum
+from importlib import import_module
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .attribute import AttributeEnum
+    from .attribute_types import ATTRIBUTE_TYPES
+    from .callback import CallBackEnum
+    from .event import EventEnum
+    from .rights import RightsEnum
+
+_LAZY_ATTRIBUTES = {
+    'AttributeEnum': '.attribute',
+    'ATTRIBUTE_TYPES': '.attribute_types',
+    'CallBackEnum': '.callback',
+    'EventEnum': '.event',
+    'RightsEnum': '.rights',
+}
+
+def __getattr__(name: str) -> object:
+    """
+    Imports the enumerations on first access (PEP 562).
+
+    Args:
+        name (str): The attribute name.
+
+    Raises:
+        AttributeError: If the attribute does not exist.
+
+    Returns:
+        object: The attribute.
+    """
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    globals()[name] = value
+
+    return value
+
+def __dir__() -> list:
+    return sorted([*globals(), *_LAZY_ATTRIBUTES])
 
 __all__ = [
     'AttributeEnum',
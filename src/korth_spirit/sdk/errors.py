@@ -0,0 +1,98 @@
+# Copyright (c) 2021-2022 Johnathan P. Irvin
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+from typing import Any, Dict, Type
+
+# Reason codes with a dedicated error type.
+RC_SUCCESS = 0
+RC_END_OF_ITERATION = 74
+RC_NO_SUCH_OBJECT = 302
+RC_NOT_AVAILABLE = 444
+RC_TIMEOUT = 448
+
+
+class AwError(Exception):
+    """
+    An error reported by the SDK, carrying its reason code.
+    The message is only formatted when the error is displayed.
+    """
+    def __init__(self, rc: int, message: str = "SDK call failed", *details: Any) -> None:
+        """
+        Initializes the error.
+
+        Args:
+            rc (int): The SDK reason code.
+            message (str, optional): What failed. Defaults to "SDK call failed".
+            details (Any): Extra values shown after the reason code.
+        """
+        super().__init__(rc, message, *details)
+        self.rc = rc
+        self.message = message
+        self.details = details
+
+    def __str__(self) -> str:
+        """
+        Formats the error.
+
+        Returns:
+            str: The message followed by the reason code.
+        """
+        return ", ".join(
+            [f"{self.message}: {self.rc}", *map(str, self.details)]
+        )
+
+    @classmethod
+    def from_rc(cls, rc: int, message: str = "SDK call failed", *details: Any) -> "AwError":
+        """
+        Creates the most specific error for a reason code.
+
+        Args:
+            rc (int): The SDK reason code.
+            message (str, optional): What failed. Defaults to "SDK call failed".
+            details (Any): Extra values shown after the reason code.
+
+        Returns:
+            AwError: The error.
+        """
+        return ERRORS.get(rc, cls)(rc, message, *details)
+
+
+class EndOfIterationError(AwError):
+    """Raised when an iteration (cells, citizens, licenses, ...) has no more results."""
+
+
+class NoSuchObjectError(AwError):
+    """Raised when the requested object does not exist."""
+
+
+class NotAvailableError(AwError):
+    """Raised when the requested feature or data is not available."""
+
+
+class TimedOutError(AwError):
+    """Raised when the SDK timed out waiting for the server."""
+
+
+ERRORS: Dict[int, Type[AwError]] = {
+    RC_END_OF_ITERATION: EndOfIterationError,
+    RC_NO_SUCH_OBJECT: NoSuchObjectError,
+    RC_NOT_AVAILABLE: NotAvailableError,
+    RC_TIMEOUT: TimedOutError,
+}
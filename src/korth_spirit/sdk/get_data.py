@@ -20,37 +20,33 @@
 # WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 from typing import Type, Union
 
-from . import aw_bool, aw_data, aw_float, aw_int, aw_string
-from .enums import ATTRIBUTE_TYPES, AttributeEnum
+from .accessors import READERS, build_reader
+from .enums import AttributeEnum
 
 
 def get_data(attribute: Union[int, AttributeEnum], aw_type: Type = None) -> Union[int, float, bool, str, bytes, list[bytes]]:
     """
-    Gets a data attribute.
+    Gets a data attribute through its precompiled reader.
 
     Args:
         attribute (Union[int, AttributeEnum]): The attribute to get.
-        aw_type (Type): The type of the attribute. Defaults to None.
+        aw_type (Type): The type to read attributes without a known type as. Defaults to None.
 
     Raises:
-        Exception: If the attribute could not be retrieved.
         Exception: If the attribute type is not found.
 
     Returns:
         Union[int, float, bool, str, bytes]: The attribute value.
     """
-    aw_type = ATTRIBUTE_TYPES[attribute]
-    
-    args = []
-    if type(aw_type) == tuple:
-        aw_type, *args = aw_type
-
-    switcher = {
-        int: aw_int,
-        str: aw_string,
-        bool: aw_bool,
-        float: aw_float,
-        bytes: aw_data
-    }
-
-    return switcher[aw_type](attribute, *args)
+    if type(attribute) is not int:
+        attribute = attribute._value_
+
+    reader = READERS[attribute]
+
+    if reader is None:
+        reader = build_reader(AttributeEnum(attribute), aw_type)
+
+        if reader is None:
+            raise Exception(f"Unknown type for attribute: {AttributeEnum(attribute)}")
+
+    return reader()
@@ -0,0 +1,209 @@
+# Copyright (c) 2021-2022 Johnathan P. Irvin
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import os
+from atexit import register
+from ctypes import CDLL
+from typing import Any, Callable
+
+from .errors import AwError
+from .signatures import bind_signatures
+
+SDK_FILE = os.environ.get('AW_SDK_FILE', './aw64.dll')
+SDK_BACKEND = os.environ.get('AW_SDK_BACKEND', 'native')
+AW_BUILD = 134 # AW 7.0
+BACKENDS = ('native', 'simulator')
+
+class Library:
+    def __init__(self, path: str = SDK_FILE, build: int = AW_BUILD, backend: str = SDK_BACKEND) -> None:
+        """
+        Defers loading and initializing the SDK until the first SDK call.
+        Functions are cached on the instance once resolved so later lookups
+        are plain attribute access.
+
+        Args:
+            path (str, optional): The path to the SDK library. Defaults to SDK_FILE.
+            build (int, optional): The build number passed to aw_init. Defaults to AW_BUILD.
+            backend (str, optional): 'native' for the SDK library, or 'simulator' for
+                the in-process world simulator. Defaults to SDK_BACKEND.
+        """
+        self._path = path
+        self._build = build
+        self._backend = backend
+        self._initialize = True
+        self._library = None
+        self._wrappers = []
+
+    @property
+    def loaded(self) -> bool:
+        """
+        Whether the SDK library has been loaded.
+
+        Returns:
+            bool: True if loaded, False otherwise.
+        """
+        return self._library is not None
+
+    def configure(self, path: str = None, build: int = None, initialize: bool = None, backend: str = None) -> "Library":
+        """
+        Configures how the SDK will be loaded.
+
+        Args:
+            path (str, optional): The path to the SDK library. Defaults to None.
+            build (int, optional): The build number passed to aw_init. Defaults to None.
+            initialize (bool, optional): Whether to call aw_init on load. Defaults to None.
+            backend (str, optional): 'native' or 'simulator'. Defaults to None.
+
+        Raises:
+            Exception: If the SDK has already been loaded.
+            ValueError: If the backend is unknown.
+
+        Returns:
+            Library: The library.
+        """
+        if self.loaded:
+            raise Exception("The SDK has already been loaded.")
+
+        if path is not None:
+            self._path = path
+        if build is not None:
+            self._build = build
+        if initialize is not None:
+            self._initialize = initialize
+        if backend is not None:
+            if backend not in BACKENDS:
+                raise ValueError(f"Unknown SDK backend: {backend}")
+            self._backend = backend
+
+        return self
+
+    def _forget(self) -> None:
+        """
+        Drops the resolved functions, so they are resolved again on next use.
+        """
+        for name in [name for name in vars(self) if name.startswith('aw_')]:
+            delattr(self, name)
+
+    def wrap(self, wrapper: Callable[[str, Callable], Callable]) -> "Library":
+        """
+        Wraps every SDK function, such as to time or marshal its calls.
+        Wrappers are applied in the order they were added, and cost nothing
+        once removed.
+
+        Args:
+            wrapper (Callable[[str, Callable], Callable]): Takes the name and
+                function, and returns the function to call in its place.
+
+        Returns:
+            Library: The library.
+        """
+        self._wrappers.append(wrapper)
+        self._forget()
+
+        return self
+
+    def unwrap(self, wrapper: Callable[[str, Callable], Callable]) -> "Library":
+        """
+        Removes a wrapper added with wrap().
+
+        Args:
+            wrapper (Callable[[str, Callable], Callable]): The wrapper.
+
+        Returns:
+            Library: The library.
+        """
+        if wrapper in self._wrappers:
+            self._wrappers.remove(wrapper)
+            self._forget()
+
+        return self
+
+    def use(self, library: Any) -> "Library":
+        """
+        Uses an already loaded library, such as a stub, in place of the SDK.
+        Its signatures are bound but aw_init is not called.
+
+        Args:
+            library (Any): An object exposing the aw_* functions.
+
+        Returns:
+            Library: The library.
+        """
+        self._forget()
+        self._library = bind_signatures(library)
+
+        return self
+
+    def load(self) -> CDLL:
+        """
+        Loads the SDK library, binds its signatures and initializes it.
+        The SDK is terminated when the interpreter exits.
+        With the simulator backend, a new Simulator stands in for the library.
+
+        Raises:
+            AwError: If the SDK could not be initialized.
+
+        Returns:
+            CDLL: The loaded library.
+        """
+        if self._library is not None:
+            return self._library
+
+        if self._backend == 'simulator':
+            from .simulator import Simulator
+            library = bind_signatures(Simulator())
+        else:
+            library = bind_signatures(CDLL(self._path))
+
+        if self._initialize:
+            rc = library.aw_init(self._build)
+
+            if rc:
+                raise AwError.from_rc(rc, "Failed to initialize SDK")
+
+            register(library.aw_term)
+
+        self._library = library
+        return library
+
+    def __getattr__(self, name: str) -> Any:
+        """
+        Resolves an SDK function, loading the library on first use.
+
+        Args:
+            name (str): The function name.
+
+        Raises:
+            AttributeError: If the name is not an SDK function.
+
+        Returns:
+            Any: The SDK function.
+        """
+        if not name.startswith('aw_'):
+            raise AttributeError(name)
+
+        function = getattr(self.load(), name)
+
+        for wrapper in self._wrappers:
+            function = wrapper(name, function)
+
+        setattr(self, name, function)
+
+        return function
@@ -0,0 +1,158 @@
+# Copyright (c) 2021-2022 Johnathan P. Irvin
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+from dataclasses import MISSING, fields
+from functools import cache
+from typing import Any, Optional, Tuple, Type, Union, get_args, get_origin
+
+from .accessors import READERS, WRITERS, Reader, Writer, build_reader, build_writer
+from .enums import AttributeEnum
+
+Plan = Tuple[Tuple[str, AttributeEnum, Reader, Writer, bool], ...]
+
+# Fields whose attribute can not be derived from their name.
+ALIASES = {
+    'immigraation_time': AttributeEnum.AW_CITIZEN_IMMIGRATION_TIME,
+    'heights': AttributeEnum.AW_TERRAIN_NODE_HEIGHTS,
+    'textures': AttributeEnum.AW_TERRAIN_NODE_TEXTURES,
+}
+
+def _resolve(name: str, prefix: str) -> AttributeEnum:
+    """
+    Resolves the attribute of a field, trying the prefixed name first,
+    then the bare name (e.g. cell_x is AW_CELL_X), then the aliases.
+
+    Args:
+        name (str): The field name.
+        prefix (str): The attribute prefix, e.g. 'AW_OBJECT_'.
+
+    Raises:
+        Exception: If no attribute matches the field.
+
+    Returns:
+        AttributeEnum: The attribute.
+    """
+    members = AttributeEnum.__members__
+
+    for candidate in (f'{prefix}{name.upper()}', f'AW_{name.upper()}'):
+        if candidate in members:
+            return members[candidate]
+
+    if name in ALIASES:
+        return ALIASES[name]
+
+    raise Exception(f"No attribute for field: {name}")
+
+def _field_type(annotation: Any) -> Optional[Type]:
+    """
+    Gets the simple type of a field annotation, unwrapping Optional.
+
+    Args:
+        annotation (Any): The field annotation.
+
+    Returns:
+        Optional[Type]: The type, or None if it is not a single simple type.
+    """
+    if get_origin(annotation) is Union:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        annotation = args[0] if len(args) == 1 else None
+
+    return annotation if annotation in (int, str, bool, float, bytes) else None
+
+@cache
+def compile_plan(data_class: Type, prefix: str) -> Plan:
+    """
+    Compiles the fields of a data class into (field, attribute, reader, writer,
+    optional) steps, where optional means the field has a default. Plans are cached, so the name resolution only happens once.
+    Attributes without a known type are read and written as the field type.
+
+    Args:
+        data_class (Type): The data class.
+        prefix (str): The attribute prefix, e.g. 'AW_OBJECT_'.
+
+    Returns:
+        Plan: The compiled plan.
+    """
+    plan = []
+
+    for field in fields(data_class):
+        attribute = _resolve(field.name, prefix)
+        reader = READERS[attribute.value]
+        writer = WRITERS[attribute.value]
+
+        if reader is None or writer is None:
+            aw_type = _field_type(field.type)
+            reader = reader or build_reader(attribute, aw_type)
+            writer = writer or build_writer(attribute, aw_type)
+
+        optional = field.default is not MISSING or field.default_factory is not MISSING
+        plan.append((field.name, attribute, reader, writer, optional))
+
+    return tuple(plan)
+
+def write_fields(instance: Any, prefix: str, skip_none: bool = False) -> None:
+    """
+    Writes the fields of a data class instance to their attributes.
+
+    Args:
+        instance (Any): The data class instance.
+        prefix (str): The attribute prefix, e.g. 'AW_OBJECT_'.
+        skip_none (bool, optional): Whether to leave attributes of None fields untouched. Defaults to False.
+
+    Raises:
+        Exception: If a field has no known attribute type.
+    """
+    for name, attribute, _, writer, _ in compile_plan(type(instance), prefix):
+        value = getattr(instance, name)
+
+        if value is None and skip_none:
+            continue
+        if writer is None:
+            raise Exception(f"Unknown type for attribute: {attribute}")
+
+        writer(value)
+
+def read_fields(data_class: Type, prefix: str, skip_empty: bool = False) -> Any:
+    """
+    Reads the attributes of a data class into a new instance.
+
+    Args:
+        data_class (Type): The data class.
+        prefix (str): The attribute prefix, e.g. 'AW_OBJECT_'.
+        skip_empty (bool, optional): Whether to leave optional fields at their default when the attribute is falsy. Defaults to False.
+
+    Raises:
+        Exception: If a field has no known attribute type.
+
+    Returns:
+        Any: The data class instance.
+    """
+    values = {}
+
+    for name, attribute, reader, _, optional in compile_plan(data_class, prefix):
+        if reader is None:
+            raise Exception(f"Unknown type for attribute: {attribute}")
+
+        value = reader()
+
+        if value or not (skip_empty and optional):
+            values[name] = value
+
+    return data_class(**values)
@@ -0,0 +1,255 @@
+# Copyright (c) 2021-2022 Johnathan P. Irvin
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+from collections import Counter
+from time import perf_counter, perf_counter_ns
+from typing import Any, Callable, Dict, List
+
+from korth_spirit.events.metrics import Histogram
+
+# Functions returning a value rather than a reason code.
+RETURNS_VALUE = frozenset([
+    'aw_bool',
+    'aw_callback',
+    'aw_data',
+    'aw_event',
+    'aw_float',
+    'aw_instance',
+    'aw_int',
+    'aw_sector_from_cell',
+    'aw_string',
+    'aw_string_from_unicode',
+    'aw_string_to_unicode',
+    'aw_term',
+    'aw_tick',
+    'aw_user_data',
+    'aw_user_data_set',
+])
+
+# Bus methods timed as handlers, with the SDK calls they make excluded.
+BUS_METHODS = ('publish', 'publish_result', 'flush')
+
+
+class CallStats:
+    __slots__ = ('latency', 'rcs')
+
+    def __init__(self, rcs: bool) -> None:
+        self.latency = Histogram()
+        self.rcs = Counter() if rcs else None
+
+
+class Profiler:
+    def __init__(self, library: Any = None) -> None:
+        """
+        Times every SDK function and splits the main loop's time between
+        aw_wait, the other SDK calls, and the bus and its handlers. SDK calls
+        made by handlers within aw_wait count as SDK calls, not as waiting.
+        Only the thread calling aw_wait should make SDK calls while profiling.
+
+        Nothing is wrapped until it is started, and nothing remains once stopped.
+
+        Args:
+            library (Any, optional): The SDK library. Defaults to korth_spirit.sdk.SDK.
+        """
+        if library is None:
+            from korth_spirit.sdk import SDK as library
+
+        self.library = library
+        self.active = False
+        self._originals: Dict[str, Callable] = {}
+        self.calls: Dict[str, CallStats] = {}
+        self.totals = {'wait': 0, 'sdk': 0, 'handlers': 0}
+        self.iterations = Histogram()
+        self.started = perf_counter()
+        self._stack: List[int] = [0]
+        self._iteration = None
+
+    def reset(self) -> "Profiler":
+        """
+        Clears the measurements, in place as the wrapped functions hold them.
+
+        Returns:
+            Profiler: The profiler.
+        """
+        for stats in self.calls.values():
+            stats.latency.clear()
+            if stats.rcs is not None:
+                stats.rcs.clear()
+
+        for category in self.totals:
+            self.totals[category] = 0
+
+        self.iterations.clear()
+        self.started = perf_counter()
+        self._iteration = None
+
+        return self
+
+    def _measure(self, category: str, stats: CallStats, function: Callable) -> Callable:
+        """
+        Wraps a function to time it, crediting its time without nested calls to a category.
+
+        Args:
+            category (str): The category.
+            stats (CallStats): The statistics of the function.
+            function (Callable): The function.
+
+        Returns:
+            Callable: The wrapped function.
+        """
+        stack = self._stack
+        totals = self.totals
+        rcs = stats.rcs
+        latency = stats.latency
+
+        def measured(*args: Any, **kwargs: Any) -> Any:
+            stack.append(0)
+            start = perf_counter_ns()
+            try:
+                result = function(*args, **kwargs)
+            finally:
+                elapsed = perf_counter_ns() - start
+                nested = stack.pop()
+                stack[-1] += elapsed
+                totals[category] += elapsed - nested
+                latency.record(elapsed)
+
+            if rcs is not None:
+                rcs[result] += 1
+
+            return result
+
+        return measured
+
+    def _wrap(self, name: str, function: Callable) -> Callable:
+        """
+        Wraps an SDK function as it is resolved by the library.
+
+        Args:
+            name (str): The function name.
+            function (Callable): The function.
+
+        Returns:
+            Callable: The wrapped function.
+        """
+        stats = self.calls.get(name)
+
+        if stats is None:
+            stats = self.calls[name] = CallStats(name not in RETURNS_VALUE)
+
+        if name != 'aw_wait':
+            return self._measure('sdk', stats, function)
+
+        measured = self._measure('wait', stats, function)
+
+        def wait(*args: Any) -> Any:
+            # A main loop iteration runs from one top level wait to the next.
+            if len(self._stack) == 1:
+                now = perf_counter_ns()
+                if self._iteration is not None:
+                    self.iterations.record(now - self._iteration)
+                self._iteration = now
+
+            return measured(*args)
+
+        return wait
+
+    def start(self) -> "Profiler":
+        """
+        Starts profiling.
+
+        Returns:
+            Profiler: The profiler.
+        """
+        if self.active:
+            return self
+
+        from korth_spirit.events import EventBus
+
+        for name in BUS_METHODS:
+            function = self._originals[name] = EventBus.__dict__[name]
+            stats = self.calls.get(f"EventBus.{name}")
+            if stats is None:
+                stats = self.calls[f"EventBus.{name}"] = CallStats(False)
+            setattr(EventBus, name, self._measure('handlers', stats, function))
+
+        self.library.wrap(self._wrap)
+        self.active = True
+
+        return self
+
+    def stop(self) -> "Profiler":
+        """
+        Stops profiling, keeping the measurements.
+
+        Returns:
+            Profiler: The profiler.
+        """
+        if not self.active:
+            return self
+
+        from korth_spirit.events import EventBus
+
+        self.library.unwrap(self._wrap)
+        for name, function in self._originals.items():
+            setattr(EventBus, name, function)
+        self._originals.clear()
+        self.active = False
+
+        return self
+
+    def stats(self) -> dict:
+        """
+        Gets a snapshot of the measurements.
+
+        Returns:
+            dict: Per function its count, total, mean and percentile seconds and reason
+                codes, and for the main loop the iterations, their latencies, and the
+                seconds spent waiting, in other SDK calls, in handlers and elsewhere.
+        """
+        calls = {}
+
+        for name, stats in sorted(self.calls.items(), key=lambda item: -item[1].latency.total):
+            if not stats.latency.count:
+                continue
+            calls[name] = {
+                **stats.latency.summary(),
+                'total': stats.latency.total / 1e9,
+            }
+            if stats.rcs is not None:
+                calls[name]['rcs'] = dict(stats.rcs)
+
+        measured = sum(self.totals.values())
+
+        return {
+            'seconds': perf_counter() - self.started,
+            'calls': calls,
+            'main_loop': {
+                'iterations': self.iterations.summary(),
+                **{category: total / 1e9 for category, total in self.totals.items()},
+                'other': max(self.iterations.total - measured, 0) / 1e9,
+            },
+        }
+
+    def __enter__(self) -> "Profiler":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
@@ -0,0 +1,190 @@
+# Copyright (c) 2021-2022 Johnathan P. Irvin
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+from ctypes import (CDLL, POINTER, c_char_p, c_float, c_int, c_uint, c_ulong,
+                    c_void_p, c_wchar_p)
+
+# Handlers and callbacks are passed as c_void_p so that both AW_CALLBACK
+# instances and None (to clear a handler) are accepted.
+SIGNATURES = {
+    'aw_address': (c_int, (c_int,)),
+    'aw_avatar_click': (c_int, (c_int,)),
+    'aw_avatar_location': (c_int, (c_int, c_int, c_char_p)),
+    'aw_avatar_reload': (c_int, (c_int, c_int)),
+    'aw_avatar_set': (c_int, (c_int,)),
+    'aw_bool': (c_int, (c_int,)),
+    'aw_bool_set': (c_int, (c_int, c_int)),
+    'aw_botgram_send': (c_int, ()),
+    'aw_botmenu_send': (c_int, ()),
+    'aw_callback': (c_void_p, (c_int,)),
+    'aw_callback_set': (c_int, (c_int, c_void_p)),
+    'aw_camera_set': (c_int, (c_int,)),
+    'aw_cav_change': (c_int, ()),
+    'aw_cav_delete': (c_int, ()),
+    'aw_cav_request': (c_int, (c_int, c_int)),
+    'aw_cell_next': (c_int, ()),
+    'aw_check_right': (c_int, (c_int, c_char_p)),
+    'aw_check_right_all': (c_int, (c_char_p,)),
+    'aw_citizen_add': (c_int, ()),
+    'aw_citizen_attributes_by_name': (c_int, (c_char_p,)),
+    'aw_citizen_attributes_by_number': (c_int, (c_int,)),
+    'aw_citizen_change': (c_int, ()),
+    'aw_citizen_delete': (c_int, (c_int,)),
+    'aw_citizen_next': (c_int, ()),
+    'aw_citizen_previous': (c_int, ()),
+    'aw_console_message': (c_int, (c_int,)),
+    'aw_create_resolved': (c_int, (c_ulong, c_int, POINTER(c_void_p))),
+    'aw_data': (c_void_p, (c_int, POINTER(c_uint))),
+    'aw_data_set': (c_int, (c_int, c_void_p, c_uint)),
+    'aw_delete_all_objects': (c_int, ()),
+    'aw_destroy': (c_int, ()),
+    'aw_enter': (c_int, (c_char_p,)),
+    'aw_event': (c_void_p, (c_int,)),
+    'aw_event_set': (c_int, (c_int, c_void_p)),
+    'aw_exit': (c_int, ()),
+    'aw_float': (c_float, (c_int,)),
+    'aw_float_set': (c_int, (c_int, c_float)),
+    'aw_has_world_right': (c_int, (c_int, c_int)),
+    'aw_has_world_right_all': (c_int, (c_int,)),
+    'aw_hud_clear': (c_int, (c_int,)),
+    'aw_hud_click': (c_int, ()),
+    'aw_hud_create': (c_int, ()),
+    'aw_hud_destroy': (c_int, (c_int, c_int)),
+    'aw_init': (c_int, (c_int,)),
+    'aw_instance': (c_void_p, ()),
+    'aw_instance_callback_set': (c_int, (c_int, c_void_p)),
+    'aw_instance_event_set': (c_int, (c_int, c_void_p)),
+    'aw_instance_set': (c_int, (c_void_p,)),
+    'aw_int': (c_int, (c_int,)),
+    'aw_int_set': (c_int, (c_int, c_int)),
+    'aw_laser_beam': (c_int, ()),
+    'aw_license_add': (c_int, ()),
+    'aw_license_attributes': (c_int, (c_char_p,)),
+    'aw_license_change': (c_int, ()),
+    'aw_license_delete': (c_int, (c_char_p,)),
+    'aw_license_next': (c_int, ()),
+    'aw_license_previous': (c_int, ()),
+    'aw_login': (c_int, ()),
+    'aw_mover_links': (c_int, (c_int,)),
+    'aw_mover_rider_add': (c_int, (c_int, c_int, c_int, c_int, c_int, c_int, c_int)),
+    'aw_mover_rider_change': (c_int, (c_int, c_int, c_int, c_int, c_int, c_int, c_int)),
+    'aw_mover_rider_delete': (c_int, (c_int, c_int)),
+    'aw_mover_set_position': (c_int, (c_int, c_int, c_int, c_int, c_int, c_int, c_int)),
+    'aw_mover_set_state': (c_int, (c_int, c_int, c_int)),
+    'aw_noise': (c_int, (c_int,)),
+    'aw_object_add': (c_int, ()),
+    'aw_object_bump': (c_int, ()),
+    'aw_object_change': (c_int, ()),
+    'aw_object_click': (c_int, ()),
+    'aw_object_delete': (c_int, ()),
+    'aw_object_load': (c_int, ()),
+    'aw_object_query': (c_int, ()),
+    'aw_object_select': (c_int, ()),
+    'aw_query': (c_int, (c_int, c_int, POINTER(c_int))),
+    'aw_say': (c_int, (c_char_p,)),
+    'aw_sector_from_cell': (c_int, (c_int,)),
+    'aw_server_admin': (c_int, (c_char_p, c_int, c_char_p, POINTER(c_void_p))),
+    'aw_server_world_add': (c_int, ()),
+    'aw_server_world_change': (c_int, ()),
+    'aw_server_world_delete': (c_int, (c_int,)),
+    'aw_server_world_instance_add': (c_int, (c_int, c_int)),
+    'aw_server_world_instance_delete': (c_int, (c_int, c_int)),
+    'aw_server_world_instance_set': (c_int, (c_int,)),
+    'aw_server_world_list': (c_int, ()),
+    'aw_server_world_set': (c_int, (c_int,)),
+    'aw_server_world_start': (c_int, (c_int,)),
+    'aw_server_world_stop': (c_int, (c_int,)),
+    'aw_session': (c_int, ()),
+    'aw_state_change': (c_int, ()),
+    'aw_string': (c_char_p, (c_int,)),
+    'aw_string_from_unicode': (c_char_p, (c_wchar_p,)),
+    'aw_string_set': (c_int, (c_int, c_char_p)),
+    'aw_string_set_MBCS_codepage': (c_int, (c_uint,)),
+    'aw_string_to_unicode': (c_wchar_p, (c_char_p,)),
+    'aw_teleport': (c_int, (c_int,)),
+    'aw_term': (None, ()),
+    'aw_terrain_delete_all': (c_int, ()),
+    'aw_terrain_load_node': (c_int, ()),
+    'aw_terrain_next': (c_int, ()),
+    'aw_terrain_query': (c_int, (c_int, c_int, c_ulong)),
+    'aw_terrain_set': (c_int, (c_int, c_int, c_int, c_int, POINTER(c_int))),
+    'aw_tick': (c_uint, ()),
+    'aw_toolbar_click': (c_int, ()),
+    'aw_traffic_count': (c_int, (POINTER(c_int), POINTER(c_int))),
+    'aw_universe_attributes_change': (c_int, ()),
+    'aw_universe_ejection_add': (c_int, ()),
+    'aw_universe_ejection_delete': (c_int, ()),
+    'aw_universe_ejection_lookup': (c_int, ()),
+    'aw_universe_ejection_next': (c_int, ()),
+    'aw_universe_ejection_previous': (c_int, ()),
+    'aw_unzip': (c_int, (c_void_p, POINTER(c_uint), c_void_p, c_uint)),
+    'aw_url_click': (c_int, (c_char_p,)),
+    'aw_url_send': (c_int, (c_int, c_char_p, c_char_p)),
+    'aw_user_data': (c_void_p, ()),
+    'aw_user_data_set': (None, (c_void_p,)),
+    'aw_user_list': (c_int, ()),
+    'aw_wait': (c_int, (c_int,)),
+    'aw_whisper': (c_int, (c_int, c_char_p)),
+    'aw_world_attribute_get': (c_int, (c_int, POINTER(c_int), c_char_p)),
+    'aw_world_attribute_set': (c_int, (c_int, c_char_p)),
+    'aw_world_attributes_change': (c_int, ()),
+    'aw_world_attributes_reset': (c_int, ()),
+    'aw_world_attributes_send': (c_int, (c_int,)),
+    'aw_world_cav_change': (c_int, ()),
+    'aw_world_cav_delete': (c_int, ()),
+    'aw_world_cav_request': (c_int, (c_int, c_int)),
+    'aw_world_eject': (c_int, ()),
+    'aw_world_ejection_add': (c_int, ()),
+    'aw_world_ejection_delete': (c_int, ()),
+    'aw_world_ejection_lookup': (c_int, ()),
+    'aw_world_ejection_next': (c_int, ()),
+    'aw_world_ejection_previous': (c_int, ()),
+    'aw_world_instance_get': (c_int, (c_int,)),
+    'aw_world_instance_set': (c_int, (c_int,)),
+    'aw_world_list': (c_int, ()),
+    'aw_world_reload_registry': (c_int, ()),
+    'aw_zip': (c_int, (c_void_p, POINTER(c_uint), c_void_p, c_uint)),
+}
+
+def bind_signatures(sdk: CDLL) -> CDLL:
+    """
+    Binds the argument and return types of every known SDK function once.
+    Symbols missing from the library are skipped, as are functions that
+    are not foreign functions, such as a simulator's methods.
+
+    Args:
+        sdk (CDLL): The loaded SDK library.
+
+    Returns:
+        CDLL: The same library with its functions typed.
+    """
+    for name, (restype, argtypes) in SIGNATURES.items():
+        try:
+            function = getattr(sdk, name)
+        except AttributeError:
+            continue
+
+        if not hasattr(type(function), 'argtypes'):
+            continue
+
+        function.restype = restype
+        function.argtypes = argtypes
+
+    return sdk
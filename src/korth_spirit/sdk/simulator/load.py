@@ -0,0 +1,173 @@
+# Copyright (c) 2021-2022 Johnathan P. Irvin
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import random
+from typing import Any, Callable, Iterable, List, Tuple
+
+from .world import CELL_SIZE, SimObject, World
+
+
+class ScriptedLoad:
+    def __init__(self, steps: Iterable[Tuple[int, Callable[[Any], None]]]) -> None:
+        """
+        Runs steps at set times on the simulated clock, each with the simulator.
+
+        Args:
+            steps (Iterable[Tuple[int, Callable[[Any], None]]]): The time in
+                milliseconds and the step to run then.
+        """
+        self.steps: List[Tuple[int, Callable[[Any], None]]] = sorted(steps, key=lambda step: step[0])
+        self.ran = 0
+
+    @property
+    def done(self) -> bool:
+        """
+        Whether every step has run.
+
+        Returns:
+            bool: True if done, False otherwise.
+        """
+        return self.ran == len(self.steps)
+
+    def tick(self, simulator: Any) -> None:
+        """
+        Runs the steps that are due.
+
+        Args:
+            simulator (Simulator): The simulator.
+        """
+        while self.ran < len(self.steps) and self.steps[self.ran][0] <= simulator.clock:
+            self.steps[self.ran][1](simulator)
+            self.ran += 1
+
+
+class RandomLoad:
+    def __init__(
+        self,
+        world: World,
+        avatars: int = 20,
+        moves: float = 10.0,
+        chats: float = 1.0,
+        churn: float = 0.1,
+        builds: float = 0.5,
+        radius: int = 16,
+        seed: int = 0,
+    ) -> None:
+        """
+        Keeps a crowd of avatars busy in a world. Rates are per avatar per
+        simulated second, so a longer aw_wait brings more events.
+
+        Args:
+            world (World): The world.
+            avatars (int, optional): The avatars kept in the world. Defaults to 20.
+            moves (float, optional): The rate of avatar moves. Defaults to 10.0.
+            chats (float, optional): The rate of chat messages. Defaults to 1.0.
+            churn (float, optional): The rate at which avatars leave and are replaced. Defaults to 0.1.
+            builds (float, optional): The rate of objects built or deleted. Defaults to 0.5.
+            radius (int, optional): The cells from the origin avatars stay within. Defaults to 16.
+            seed (int, optional): The random seed. Defaults to 0.
+        """
+        self.world = world
+        self.avatars = avatars
+        self.rates = {'moves': moves, 'chats': chats, 'churn': churn, 'builds': builds}
+        self.radius = radius * CELL_SIZE
+        self.random = random.Random(seed)
+        self.sessions: List[int] = []
+        self.built: List[int] = []
+        self._clock = None
+        self._owed = dict.fromkeys(self.rates, 0.0)
+        self._names = 0
+
+    def _count(self, kind: str, seconds: float) -> int:
+        """
+        Gets how many actions of a kind are due, carrying the fraction over.
+
+        Args:
+            kind (str): The kind of action.
+            seconds (float): The simulated time passed.
+
+        Returns:
+            int: The number of actions.
+        """
+        owed = self._owed[kind] + self.rates[kind] * len(self.sessions) * seconds
+        count = int(owed)
+        self._owed[kind] = owed - count
+
+        return count
+
+    def _coordinate(self) -> int:
+        return self.random.randint(-self.radius, self.radius)
+
+    def _join(self, simulator: Any) -> None:
+        self._names += 1
+        avatar = simulator.add_avatar(
+            self.world, f"Load {self._names}",
+            x=self._coordinate(), z=self._coordinate(),
+            citizen=self.random.randint(1, 1000),
+        )
+        self.sessions.append(avatar.session)
+
+    def tick(self, simulator: Any) -> None:
+        """
+        Acts for the simulated time passed since the last tick.
+
+        Args:
+            simulator (Simulator): The simulator.
+        """
+        rng = self.random
+        seconds = (simulator.clock - self._clock) / 1000 if self._clock is not None else 0.0
+        self._clock = simulator.clock
+
+        while len(self.sessions) < self.avatars:
+            self._join(simulator)
+
+        for _ in range(self._count('churn', seconds)):
+            session = self.sessions.pop(rng.randrange(len(self.sessions)))
+            simulator.remove_avatar(self.world, session)
+            self._join(simulator)
+
+        for _ in range(self._count('moves', seconds)):
+            session = rng.choice(self.sessions)
+            avatar = self.world.avatars[session]
+            simulator.move_avatar(
+                self.world, session,
+                x=max(-self.radius, min(self.radius, avatar.x + rng.randint(-200, 200))),
+                z=max(-self.radius, min(self.radius, avatar.z + rng.randint(-200, 200))),
+                yaw=rng.randrange(3600),
+            )
+
+        for _ in range(self._count('chats', seconds)):
+            simulator.chat(self.world, rng.choice(self.sessions), f"message {rng.randrange(10**6)}")
+
+        for _ in range(self._count('builds', seconds)):
+            session = rng.choice(self.sessions)
+
+            if self.built and rng.random() < 0.5:
+                simulator.demolish(self.world, self.built.pop(rng.randrange(len(self.built))), session=session)
+                continue
+
+            avatar = self.world.avatars[session]
+            obj = simulator.build(self.world, SimObject(
+                owner=avatar.citizen,
+                x=avatar.x, y=avatar.y, z=avatar.z,
+                yaw=rng.randrange(3600),
+                model=f"model{rng.randint(1, 50)}.rwx",
+            ), session)
+            self.built.append(obj.number)
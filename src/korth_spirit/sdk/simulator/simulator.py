@@ -0,0 +1,823 @@
+# Copyright (c) 2021-2022 Johnathan P. Irvin
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+from collections import Counter, deque
+from ctypes import addressof, create_string_buffer
+from typing import Any, Callable, Dict, List, Optional
+
+from ..enums import AttributeEnum, CallBackEnum, EventEnum
+from ..errors import (RC_END_OF_ITERATION, RC_NO_SUCH_OBJECT,
+                      RC_NOT_AVAILABLE, RC_SUCCESS)
+from .world import SimAvatar, SimObject, TerrainPage, World, sector_of
+
+A = AttributeEnum
+
+# The objects sent for one combined aw_cell_next.
+COMBINE_OBJECTS = 1000
+
+# Chat types, as the SDK reports them.
+CHAT_SAID = 0
+CHAT_WHISPER = 2
+
+OBJECT_FIELDS = {
+    'type': A.AW_OBJECT_TYPE,
+    'id': A.AW_OBJECT_ID,
+    'number': A.AW_OBJECT_NUMBER,
+    'owner': A.AW_OBJECT_OWNER,
+    'build_timestamp': A.AW_OBJECT_BUILD_TIMESTAMP,
+    'x': A.AW_OBJECT_X,
+    'y': A.AW_OBJECT_Y,
+    'z': A.AW_OBJECT_Z,
+    'yaw': A.AW_OBJECT_YAW,
+    'tilt': A.AW_OBJECT_TILT,
+    'roll': A.AW_OBJECT_ROLL,
+    'model': A.AW_OBJECT_MODEL,
+    'description': A.AW_OBJECT_DESCRIPTION,
+    'action': A.AW_OBJECT_ACTION,
+    'data': A.AW_OBJECT_DATA,
+}
+
+
+class SimInstance:
+    def __init__(self, handle: int) -> None:
+        """
+        The state of a simulated bot instance.
+
+        Args:
+            handle (int): The instance handle.
+        """
+        self.handle = handle
+        self.attributes: Dict[int, Any] = {}
+        self.events: Dict[int, Any] = {}
+        self.callbacks: Dict[int, Any] = {}
+        self.buffers: Dict[int, Any] = {}
+        self.citizen = 0
+        self.name = ''
+        self.world: Optional[World] = None
+        self.avatar: Optional[SimAvatar] = None
+        self.visible = False
+        self.cells: List[tuple] = []
+        self.terrain_pending = set()
+        self.terrain_pages: List[tuple] = []
+
+
+def _encode(value: Any) -> Any:
+    return value.encode('utf-8') if type(value) is str else value
+
+def avatar_values(avatar: SimAvatar) -> Dict[AttributeEnum, Any]:
+    """
+    Gets the attributes describing an avatar.
+
+    Args:
+        avatar (SimAvatar): The avatar.
+
+    Returns:
+        Dict[AttributeEnum, Any]: The attributes.
+    """
+    return {
+        A.AW_AVATAR_SESSION: avatar.session,
+        A.AW_AVATAR_NAME: avatar.name,
+        A.AW_AVATAR_X: avatar.x,
+        A.AW_AVATAR_Y: avatar.y,
+        A.AW_AVATAR_Z: avatar.z,
+        A.AW_AVATAR_YAW: avatar.yaw,
+        A.AW_AVATAR_PITCH: avatar.pitch,
+        A.AW_AVATAR_TYPE: avatar.type,
+        A.AW_AVATAR_GESTURE: avatar.gesture,
+        A.AW_AVATAR_STATE: avatar.state,
+        A.AW_AVATAR_CITIZEN: avatar.citizen,
+        A.AW_AVATAR_PRIVILEGE: avatar.privilege,
+    }
+
+def object_values(obj: SimObject) -> Dict[AttributeEnum, Any]:
+    """
+    Gets the attributes describing an object.
+
+    Args:
+        obj (SimObject): The object.
+
+    Returns:
+        Dict[AttributeEnum, Any]: The attributes.
+    """
+    return {attribute: getattr(obj, name) for name, attribute in OBJECT_FIELDS.items()}
+
+
+class Simulator:
+    def __init__(self, loads: List[Any] = (), max_events: int = 100000) -> None:
+        """
+        An in-process stand-in for the SDK library, to be installed with
+        SDK.use(Simulator()) or selected with AW_SDK_BACKEND=simulator.
+
+        It keeps an attribute store per instance, and delivers events and
+        callbacks to the handlers set for them when aw_wait is called. Worlds
+        hold objects, avatars and terrain, which bots query and change as they
+        would a real world. Each aw_wait advances the simulated clock by its
+        timeout and lets the loads act, without sleeping.
+
+        SDK functions the simulator does not implement succeed without effect,
+        and are counted in unsupported.
+
+        Args:
+            loads (List[Any], optional): Loads acting on the worlds, such as RandomLoad. Defaults to ().
+            max_events (int, optional): The most events delivered by one aw_wait. Defaults to 100000.
+        """
+        self.loads = list(loads)
+        self.max_events = max_events
+        self.worlds: Dict[str, World] = {}
+        self.instances: Dict[int, SimInstance] = {}
+        self.events: Dict[int, Any] = {}
+        self.callbacks: Dict[int, Any] = {}
+        self.current: Optional[SimInstance] = None
+        self.clock = 0
+        self.delivered = 0
+        self.calls = Counter()
+        self.unsupported = Counter()
+        self._queue = deque()
+        self._handles = 0
+        self._sessions = 0
+
+    def __getattr__(self, name: str) -> Callable:
+        """
+        Gets a function that succeeds without effect, for unimplemented SDK functions.
+
+        Args:
+            name (str): The function name.
+
+        Raises:
+            AttributeError: If the name is not an SDK function.
+
+        Returns:
+            Callable: The function.
+        """
+        if not name.startswith('aw_'):
+            raise AttributeError(name)
+
+        def unsupported(*args: Any) -> int:
+            self.unsupported[name] += 1
+            return RC_SUCCESS
+
+        return unsupported
+
+    # World state, for loads and tests.
+
+    def world(self, name: str) -> World:
+        """
+        Gets a world, creating it empty.
+
+        Args:
+            name (str): The world name.
+
+        Returns:
+            World: The world.
+        """
+        world = self.worlds.get(name)
+
+        if world is None:
+            world = self.worlds[name] = World(name)
+
+        return world
+
+    def add_avatar(self, world: World, name: str, x: int = 0, y: int = 0, z: int = 0, **kwargs: Any) -> SimAvatar:
+        """
+        Makes an avatar appear in a world.
+
+        Args:
+            world (World): The world.
+            name (str): The avatar name.
+            x (int, optional): The position. Defaults to 0.
+            y (int, optional): The position. Defaults to 0.
+            z (int, optional): The position. Defaults to 0.
+            **kwargs: The other SimAvatar fields.
+
+        Returns:
+            SimAvatar: The avatar.
+        """
+        self._sessions += 1
+        avatar = world.avatars[self._sessions] = SimAvatar(self._sessions, name, x=x, y=y, z=z, **kwargs)
+        self.broadcast(world, EventEnum.AW_EVENT_AVATAR_ADD, avatar_values(avatar), avatar.instance)
+
+        return avatar
+
+    def move_avatar(self, world: World, session: int, **changes: Any) -> None:
+        """
+        Moves or otherwise changes an avatar.
+
+        Args:
+            world (World): The world.
+            session (int): The avatar session.
+            **changes: The SimAvatar fields to change.
+        """
+        avatar = world.avatars[session]
+
+        for name, value in changes.items():
+            setattr(avatar, name, value)
+
+        self.broadcast(world, EventEnum.AW_EVENT_AVATAR_CHANGE, avatar_values(avatar), avatar.instance)
+
+    def remove_avatar(self, world: World, session: int) -> None:
+        """
+        Makes an avatar leave a world.
+
+        Args:
+            world (World): The world.
+            session (int): The avatar session.
+        """
+        avatar = world.avatars.pop(session, None)
+
+        if avatar is not None:
+            self.broadcast(world, EventEnum.AW_EVENT_AVATAR_DELETE, {
+                A.AW_AVATAR_SESSION: avatar.session,
+                A.AW_AVATAR_NAME: avatar.name,
+            }, avatar.instance)
+
+    def chat(self, world: World, session: int, message: str, to: int = None) -> None:
+        """
+        Makes an avatar say or whisper something.
+
+        Args:
+            world (World): The world.
+            session (int): The avatar session.
+            message (str): The message.
+            to (int, optional): The session whispered to. Defaults to None, saying it.
+        """
+        avatar = world.avatars[session]
+        values = {
+            A.AW_AVATAR_NAME: avatar.name,
+            A.AW_CHAT_MESSAGE: message,
+            A.AW_CHAT_TYPE: CHAT_SAID if to is None else CHAT_WHISPER,
+            A.AW_CHAT_CITIZEN: avatar.citizen,
+            A.AW_CHAT_SESSION: avatar.session,
+        }
+
+        if to is None:
+            self.broadcast(world, EventEnum.AW_EVENT_CHAT, values, avatar.instance)
+        else:
+            target = world.avatars.get(to)
+            if target is not None and target.instance in self.instances:
+                self.emit(self.instances[target.instance], EventEnum.AW_EVENT_CHAT, values)
+
+    def build(self, world: World, obj: SimObject, session: int = 0) -> SimObject:
+        """
+        Adds an object to a world, telling the bots in it.
+
+        Args:
+            world (World): The world.
+            obj (SimObject): The object.
+            session (int, optional): The session of the builder. Defaults to 0.
+
+        Returns:
+            SimObject: The numbered object.
+        """
+        world.add_object(obj)
+        self.broadcast(world, EventEnum.AW_EVENT_OBJECT_ADD, {
+            **object_values(obj),
+            A.AW_OBJECT_SESSION: session,
+            A.AW_CELL_X: obj.cell[0],
+            A.AW_CELL_Z: obj.cell[1],
+            A.AW_CELL_SEQUENCE: world.cell_sequences[obj.cell],
+        }, self._instance_of(world, session))
+
+        return obj
+
+    def demolish(self, world: World, number: int, x: int = None, z: int = None, session: int = 0) -> Optional[SimObject]:
+        """
+        Deletes an object from a world, telling the bots in it.
+
+        Args:
+            world (World): The world.
+            number (int): The object number.
+            x (int, optional): A coordinate in the object's cell. Defaults to None, any.
+            z (int, optional): A coordinate in the object's cell. Defaults to None, any.
+            session (int, optional): The session of the builder. Defaults to 0.
+
+        Returns:
+            Optional[SimObject]: The deleted object, or None if there was none.
+        """
+        obj = world.delete_object(number, x, z)
+
+        if obj is not None:
+            self.broadcast(world, EventEnum.AW_EVENT_OBJECT_DELETE, {
+                A.AW_OBJECT_SESSION: session,
+                A.AW_OBJECT_ID: obj.id,
+                A.AW_OBJECT_NUMBER: obj.number,
+                A.AW_CELL_X: obj.cell[0],
+                A.AW_CELL_Z: obj.cell[1],
+                A.AW_CELL_SEQUENCE: world.cell_sequences[obj.cell],
+            }, self._instance_of(world, session))
+
+        return obj
+
+    def _instance_of(self, world: World, session: int) -> Optional[int]:
+        avatar = world.avatars.get(session)
+        return avatar.instance if avatar is not None else None
+
+    # Event delivery.
+
+    def emit(self, instance: SimInstance, event: EventEnum, values: Dict[AttributeEnum, Any]) -> None:
+        """
+        Queues an event for an instance, delivered by its next aw_wait.
+
+        Args:
+            instance (SimInstance): The instance.
+            event (EventEnum): The event.
+            values (Dict[AttributeEnum, Any]): The attributes set while its handler runs.
+        """
+        self._queue.append((
+            instance, False, event.value,
+            {attribute.value: _encode(value) for attribute, value in values.items()},
+            None,
+        ))
+
+    def broadcast(self, world: World, event: EventEnum, values: Dict[AttributeEnum, Any], exclude: int = None) -> None:
+        """
+        Queues an event for every instance in a world.
+
+        Args:
+            world (World): The world.
+            event (EventEnum): The event.
+            values (Dict[AttributeEnum, Any]): The attributes set while its handler runs.
+            exclude (int, optional): The handle of an instance not to tell. Defaults to None.
+        """
+        for instance in self.instances.values():
+            if instance.world is world and instance.handle != exclude:
+                self.emit(instance, event, values)
+
+    def _result(self, instance: SimInstance, callback: CallBackEnum, rc: int, values: Dict[AttributeEnum, Any] = None) -> int:
+        """
+        Reports the result of a call, through its callback when one is set.
+
+        Args:
+            instance (SimInstance): The calling instance.
+            callback (CallBackEnum): The callback reporting the call.
+            rc (int): The reason code.
+            values (Dict[AttributeEnum, Any], optional): The attributes of the result. Defaults to None.
+
+        Returns:
+            int: The reason code to return, which is success when the callback reports it.
+        """
+        values = {attribute.value: _encode(value) for attribute, value in (values or {}).items()}
+
+        if callback.value not in instance.callbacks and callback.value not in self.callbacks:
+            instance.attributes.update(values)
+            return rc
+
+        self._queue.append((instance, True, callback.value, values, rc))
+        return RC_SUCCESS
+
+    def aw_wait(self, milliseconds: int) -> int:
+        self.calls['aw_wait'] += 1
+        self.clock += max(milliseconds, 0)
+
+        for load in self.loads:
+            load.tick(self)
+
+        queue = self._queue
+        delivered = 0
+
+        while queue and delivered < self.max_events:
+            instance, is_callback, code, values, rc = queue.popleft()
+
+            if self.instances.get(instance.handle) is not instance:
+                continue
+
+            self.current = instance
+            instance.attributes.update(values)
+            delivered += 1
+
+            if is_callback:
+                handler = instance.callbacks.get(code) or self.callbacks.get(code)
+                if handler is not None:
+                    handler(rc)
+            else:
+                handler = instance.events.get(code) or self.events.get(code)
+                if handler is not None:
+                    handler()
+
+        self.delivered += delivered
+        return RC_SUCCESS
+
+    # Instances and handlers.
+
+    def aw_init(self, build: int) -> int:
+        return RC_SUCCESS
+
+    def aw_term(self) -> None:
+        self.instances.clear()
+
+    def aw_create_resolved(self, address: Any, port: int, instance: Any) -> int:
+        self._handles += 1
+        self.current = self.instances[self._handles] = SimInstance(self._handles)
+        instance.value = self._handles
+
+        return RC_SUCCESS
+
+    def aw_destroy(self) -> int:
+        instance = self.current
+
+        if instance is None:
+            return RC_NOT_AVAILABLE
+
+        self._leave(instance)
+        del self.instances[instance.handle]
+        self.current = None
+
+        return RC_SUCCESS
+
+    def aw_instance(self) -> Optional[int]:
+        return self.current.handle if self.current is not None else None
+
+    def aw_instance_set(self, instance: Any) -> int:
+        instance = self.instances.get(getattr(instance, 'value', instance))
+
+        if instance is None:
+            return RC_NOT_AVAILABLE
+
+        self.current = instance
+        return RC_SUCCESS
+
+    def _set_handler(self, handlers: Dict[int, Any], code: int, handler: Any) -> int:
+        if handler is None:
+            handlers.pop(code, None)
+        else:
+            handlers[code] = handler
+
+        return RC_SUCCESS
+
+    def aw_event_set(self, event: int, handler: Any) -> int:
+        return self._set_handler(self.events, event, handler)
+
+    def aw_callback_set(self, callback: int, handler: Any) -> int:
+        return self._set_handler(self.callbacks, callback, handler)
+
+    def aw_instance_event_set(self, event: int, handler: Any) -> int:
+        return self._set_handler(self.current.events, event, handler)
+
+    def aw_instance_callback_set(self, callback: int, handler: Any) -> int:
+        return self._set_handler(self.current.callbacks, callback, handler)
+
+    def aw_event(self, event: int) -> Any:
+        return self.current.events.get(event) or self.events.get(event)
+
+    def aw_callback(self, callback: int) -> Any:
+        return self.current.callbacks.get(callback) or self.callbacks.get(callback)
+
+    # The attribute store.
+
+    def aw_int(self, attribute: int) -> int:
+        value = self.current.attributes.get(attribute, 0)
+        return int(value) if type(value) in (int, bool) else 0
+
+    def aw_int_set(self, attribute: int, value: int) -> int:
+        self.current.attributes[attribute] = int(value or 0)
+        return RC_SUCCESS
+
+    def aw_bool(self, attribute: int) -> int:
+        return self.aw_int(attribute)
+
+    def aw_bool_set(self, attribute: int, value: int) -> int:
+        return self.aw_int_set(attribute, value)
+
+    def aw_float(self, attribute: int) -> float:
+        value = self.current.attributes.get(attribute, 0.0)
+        return float(value) if type(value) in (int, float) else 0.0
+
+    def aw_float_set(self, attribute: int, value: float) -> int:
+        self.current.attributes[attribute] = float(value or 0.0)
+        return RC_SUCCESS
+
+    def aw_string(self, attribute: int) -> bytes:
+        value = self.current.attributes.get(attribute, b'')
+        return value if type(value) is bytes else b''
+
+    def aw_string_set(self, attribute: int, value: Optional[bytes]) -> int:
+        self.current.attributes[attribute] = value or b''
+        return RC_SUCCESS
+
+    def aw_data(self, attribute: int, length: Any) -> int:
+        value = self.current.attributes.get(attribute, b'')
+        data = bytes(value) if type(value) is not int else b''
+        length._obj.value = len(data)
+
+        if not data:
+            return 0
+
+        # Kept until the attribute is read again, as the SDK's buffer would be.
+        buffer = self.current.buffers[attribute] = create_string_buffer(data, len(data))
+        return addressof(buffer)
+
+    def aw_data_set(self, attribute: int, value: Any, length: int) -> int:
+        self.current.attributes[attribute] = bytes(value)[:length] if value else b''
+        return RC_SUCCESS
+
+    def _get(self, attribute: AttributeEnum) -> Any:
+        value = self.current.attributes.get(attribute.value)
+        return value.decode('utf-8') if type(value) is bytes else value
+
+    # Sessions.
+
+    def aw_login(self) -> int:
+        instance = self.current
+        instance.citizen = self._get(A.AW_LOGIN_OWNER) or 0
+        instance.name = self._get(A.AW_LOGIN_NAME) or ''
+
+        return self._result(instance, CallBackEnum.AW_CALLBACK_LOGIN, RC_SUCCESS, {
+            A.AW_CITIZEN_NUMBER: instance.citizen,
+            A.AW_CITIZEN_NAME: instance.name,
+        })
+
+    def aw_enter(self, world: bytes) -> int:
+        instance = self.current
+        self._leave(instance)
+        instance.world = self.world(world.decode('utf-8'))
+        self._sessions += 1
+        instance.avatar = SimAvatar(self._sessions, f"[{instance.name}]", citizen=instance.citizen, instance=instance.handle)
+        instance.visible = False
+
+        # Bots are only seen once they have changed state.
+        for avatar in instance.world.avatars.values():
+            if avatar.instance is None or self.instances[avatar.instance].visible:
+                self.emit(instance, EventEnum.AW_EVENT_AVATAR_ADD, avatar_values(avatar))
+
+        instance.world.avatars[instance.avatar.session] = instance.avatar
+
+        return self._result(instance, CallBackEnum.AW_CALLBACK_ENTER, RC_SUCCESS, {
+            A.AW_WORLD_NAME: instance.world.name,
+        })
+
+    def _leave(self, instance: SimInstance) -> None:
+        if instance.world is not None and instance.avatar is not None:
+            if instance.visible:
+                self.remove_avatar(instance.world, instance.avatar.session)
+            else:
+                instance.world.avatars.pop(instance.avatar.session, None)
+
+        instance.world = None
+        instance.avatar = None
+
+    def aw_exit(self) -> int:
+        self._leave(self.current)
+        return RC_SUCCESS
+
+    def aw_state_change(self) -> int:
+        instance = self.current
+
+        if instance.world is None:
+            return RC_NOT_AVAILABLE
+
+        avatar = instance.avatar
+        for name in ('x', 'y', 'z', 'yaw', 'pitch', 'type', 'gesture', 'state'):
+            value = self._get(getattr(A, f"AW_MY_{name.upper()}"))
+            if value is not None:
+                setattr(avatar, name, value)
+
+        event = EventEnum.AW_EVENT_AVATAR_CHANGE if instance.visible else EventEnum.AW_EVENT_AVATAR_ADD
+        instance.visible = True
+        self.broadcast(instance.world, event, avatar_values(avatar), instance.handle)
+
+        return RC_SUCCESS
+
+    def aw_say(self, message: bytes) -> int:
+        instance = self.current
+
+        if instance.world is None:
+            return RC_NOT_AVAILABLE
+
+        self.chat(instance.world, instance.avatar.session, message.decode('utf-8'))
+        return RC_SUCCESS
+
+    def aw_whisper(self, session: int, message: bytes) -> int:
+        instance = self.current
+
+        if instance.world is None:
+            return RC_NOT_AVAILABLE
+
+        self.chat(instance.world, instance.avatar.session, message.decode('utf-8'), to=session)
+        return RC_SUCCESS
+
+    # Objects and cells.
+
+    def _object_from_attributes(self) -> SimObject:
+        values = {name: self._get(attribute) for name, attribute in OBJECT_FIELDS.items()}
+        values['data'] = self.current.attributes.get(A.AW_OBJECT_DATA.value) or b''
+
+        # The world numbers new objects.
+        return SimObject(**{name: value for name, value in values.items() if value is not None and name not in ('number', 'id')})
+
+    def _object_result(self, instance: SimInstance, rc: int, obj: SimObject = None) -> int:
+        values = {A.AW_OBJECT_CALLBACK_REFERENCE: self._get(A.AW_OBJECT_CALLBACK_REFERENCE) or 0}
+
+        if obj is not None:
+            values.update({
+                A.AW_OBJECT_NUMBER: obj.number,
+                A.AW_OBJECT_ID: obj.id,
+                A.AW_CELL_X: obj.cell[0],
+                A.AW_CELL_Z: obj.cell[1],
+            })
+
+        return self._result(instance, CallBackEnum.AW_CALLBACK_OBJECT_RESULT, rc, values)
+
+    def aw_object_add(self) -> int:
+        instance = self.current
+
+        if instance.world is None:
+            return RC_NOT_AVAILABLE
+
+        obj = self._object_from_attributes()
+        obj.owner = obj.owner or instance.citizen
+        self.build(instance.world, obj, instance.avatar.session)
+
+        return self._object_result(instance, RC_SUCCESS, obj)
+
+    def aw_object_change(self) -> int:
+        instance = self.current
+
+        if instance.world is None:
+            return RC_NOT_AVAILABLE
+
+        old = self.demolish(
+            instance.world,
+            self._get(A.AW_OBJECT_OLD_NUMBER) or 0,
+            self._get(A.AW_OBJECT_OLD_X) or 0,
+            self._get(A.AW_OBJECT_OLD_Z) or 0,
+            instance.avatar.session,
+        )
+
+        if old is None:
+            return self._object_result(instance, RC_NO_SUCH_OBJECT)
+
+        obj = self._object_from_attributes()
+        obj.owner = obj.owner or old.owner
+        self.build(instance.world, obj, instance.avatar.session)
+
+        return self._object_result(instance, RC_SUCCESS, obj)
+
+    def aw_object_delete(self) -> int:
+        instance = self.current
+
+        if instance.world is None:
+            return RC_NOT_AVAILABLE
+
+        obj = self.demolish(
+            instance.world,
+            self._get(A.AW_OBJECT_NUMBER) or 0,
+            self._get(A.AW_OBJECT_X) or 0,
+            self._get(A.AW_OBJECT_Z) or 0,
+            instance.avatar.session,
+        )
+
+        return self._object_result(instance, RC_SUCCESS if obj else RC_NO_SUCH_OBJECT, obj)
+
+    def _send_cell(self, instance: SimInstance, cell: tuple) -> int:
+        """
+        Queues the events describing a cell and its objects.
+
+        Returns:
+            int: The number of objects.
+        """
+        world = instance.world
+        objects = world.cells.get(cell, {})
+        self.emit(instance, EventEnum.AW_EVENT_CELL_BEGIN, {
+            A.AW_CELL_X: cell[0],
+            A.AW_CELL_Z: cell[1],
+            A.AW_CELL_SEQUENCE: world.cell_sequences.get(cell, 0),
+            A.AW_CELL_SIZE: len(objects),
+        })
+        for obj in objects.values():
+            self.emit(instance, EventEnum.AW_EVENT_CELL_OBJECT, object_values(obj))
+        self.emit(instance, EventEnum.AW_EVENT_CELL_END, {})
+
+        return len(objects)
+
+    def aw_cell_next(self) -> int:
+        instance = self.current
+
+        if instance.world is None:
+            return RC_NOT_AVAILABLE
+
+        iterator = self._get(A.AW_CELL_ITERATOR) or 0
+        combine = self._get(A.AW_CELL_COMBINE)
+
+        if iterator < 0:
+            return RC_END_OF_ITERATION
+        if iterator == 0:
+            instance.cells = sorted(instance.world.cells)
+
+        sent = 0
+        while iterator < len(instance.cells):
+            sent += self._send_cell(instance, instance.cells[iterator])
+            iterator += 1
+            if not combine or sent >= COMBINE_OBJECTS:
+                break
+
+        iterator = iterator if iterator < len(instance.cells) else -1
+        instance.attributes[A.AW_CELL_ITERATOR.value] = iterator
+
+        return self._result(instance, CallBackEnum.AW_CALLBACK_CELL_RESULT, RC_SUCCESS, {
+            A.AW_CELL_ITERATOR: iterator,
+        })
+
+    def aw_sector_from_cell(self, cell: int) -> int:
+        return sector_of(cell)
+
+    def aw_query(self, x_sector: int, z_sector: int, sequence: Any) -> int:
+        instance = self.current
+
+        if instance.world is None:
+            return RC_NOT_AVAILABLE
+
+        world = instance.world
+        sequence = list(sequence) if sequence is not None else [0] * 9
+
+        for i, dx in enumerate((-1, 0, 1)):
+            for j, dz in enumerate((-1, 0, 1)):
+                sector = x_sector + dx, z_sector + dz
+                known = sequence[i * 3 + j]
+
+                if world.sector_sequences.get(sector, 0) <= known:
+                    continue
+
+                for cell in world.cells_in_sector(*sector):
+                    if world.cell_sequences[cell] > known:
+                        self._send_cell(instance, cell)
+
+        return self._result(instance, CallBackEnum.AW_CALLBACK_QUERY, RC_SUCCESS, {
+            A.AW_QUERY_COMPLETE: True,
+        })
+
+    # Terrain.
+
+    def _send_page(self, instance: SimInstance, page: TerrainPage, complete: bool = True) -> None:
+        self.emit(instance, EventEnum.AW_EVENT_TERRAIN_BEGIN, {
+            A.AW_TERRAIN_PAGE_X: page.x,
+            A.AW_TERRAIN_PAGE_Z: page.z,
+        })
+        for node in page.nodes:
+            self.emit(instance, EventEnum.AW_EVENT_TERRAIN_DATA, {
+                A.AW_TERRAIN_PAGE_X: page.x,
+                A.AW_TERRAIN_PAGE_Z: page.z,
+                A.AW_TERRAIN_NODE_X: node.x,
+                A.AW_TERRAIN_NODE_Z: node.z,
+                A.AW_TERRAIN_NODE_SIZE: node.size,
+                A.AW_TERRAIN_NODE_TEXTURES: node.textures,
+                A.AW_TERRAIN_NODE_HEIGHTS: node.heights,
+            })
+        self.emit(instance, EventEnum.AW_EVENT_TERRAIN_END, {
+            A.AW_TERRAIN_COMPLETE: complete,
+            A.AW_TERRAIN_SEQUENCE: page.sequence,
+        })
+
+    def aw_terrain_query(self, page_x: int, page_z: int, sequence: Optional[int]) -> int:
+        instance = self.current
+
+        if instance.world is None:
+            return RC_NOT_AVAILABLE
+
+        # The first call sends the page, and a later one reports it complete.
+        key = page_x, page_z
+        page = instance.world.pages.get(key)
+        complete = key in instance.terrain_pending or page is None or page.sequence <= (sequence or 0)
+
+        if complete:
+            instance.terrain_pending.discard(key)
+        else:
+            instance.terrain_pending.add(key)
+            self._send_page(instance, page)
+
+        instance.attributes[A.AW_TERRAIN_COMPLETE.value] = complete
+        return RC_SUCCESS
+
+    def aw_terrain_next(self) -> int:
+        instance = self.current
+
+        if instance.world is None:
+            return RC_NOT_AVAILABLE
+
+        if not instance.terrain_pages:
+            instance.terrain_pages = [None, *sorted(instance.world.pages, reverse=True)]
+
+        key = instance.terrain_pages.pop()
+        complete = key is None
+
+        if not complete:
+            self._send_page(instance, instance.world.pages[key], len(instance.terrain_pages) == 1)
+
+        return self._result(instance, CallBackEnum.AW_CALLBACK_TERRAIN_NEXT_RESULT, RC_SUCCESS, {
+            A.AW_TERRAIN_COMPLETE: complete,
+        })
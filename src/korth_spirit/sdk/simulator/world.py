@@ -0,0 +1,284 @@
+# Copyright (c) 2021-2022 Johnathan P. Irvin
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import random
+from array import array
+from dataclasses import dataclass, field
+from math import sin
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Coordinates are in centimeters, and a cell is ten meters wide.
+CELL_SIZE = 1000
+# A sector is eight cells wide, and a query covers three by three sectors.
+SECTOR_CELLS = 8
+# A terrain page is 128 cells wide.
+PAGE_CELLS = 128
+
+Cell = Tuple[int, int]
+
+
+def cell_of(coordinate: int) -> int:
+    """
+    Gets the cell of a coordinate.
+
+    Args:
+        coordinate (int): The coordinate in centimeters.
+
+    Returns:
+        int: The cell.
+    """
+    return coordinate // CELL_SIZE
+
+def sector_of(cell: int) -> int:
+    """
+    Gets the sector of a cell, as aw_sector_from_cell does.
+
+    Args:
+        cell (int): The cell.
+
+    Returns:
+        int: The sector.
+    """
+    return (cell + SECTOR_CELLS // 2) // SECTOR_CELLS
+
+
+@dataclass
+class SimObject:
+    number: int = 0
+    id: int = 0
+    owner: int = 0
+    build_timestamp: int = 0
+    type: int = 0
+    x: int = 0
+    y: int = 0
+    z: int = 0
+    yaw: int = 0
+    tilt: int = 0
+    roll: int = 0
+    model: str = ''
+    description: str = ''
+    action: str = ''
+    data: bytes = b''
+
+    @property
+    def cell(self) -> Cell:
+        return cell_of(self.x), cell_of(self.z)
+
+
+@dataclass
+class SimAvatar:
+    session: int
+    name: str
+    citizen: int = 0
+    privilege: int = 0
+    x: int = 0
+    y: int = 0
+    z: int = 0
+    yaw: int = 0
+    pitch: int = 0
+    type: int = 0
+    gesture: int = 0
+    state: int = 0
+    instance: Optional[int] = None
+
+
+@dataclass
+class TerrainNode:
+    x: int
+    z: int
+    size: int
+    heights: bytes
+    textures: bytes
+
+
+@dataclass
+class TerrainPage:
+    x: int
+    z: int
+    sequence: int = 0
+    nodes: List[TerrainNode] = field(default_factory=list)
+
+
+class World:
+    def __init__(self, name: str) -> None:
+        """
+        The state of a simulated world: its objects by cell, the avatars in it,
+        and its terrain pages. Every change to a cell bumps the world sequence,
+        which the cell and its sector remember.
+
+        Args:
+            name (str): The world name.
+        """
+        self.name = name
+        self.objects: Dict[int, SimObject] = {}
+        self.cells: Dict[Cell, Dict[int, SimObject]] = {}
+        self.cell_sequences: Dict[Cell, int] = {}
+        self.sector_sequences: Dict[Cell, int] = {}
+        self.avatars: Dict[int, SimAvatar] = {}
+        self.pages: Dict[Cell, TerrainPage] = {}
+        self.sequence = 0
+        self._numbers = 0
+
+    def touch(self, cell: Cell) -> int:
+        """
+        Records a change to a cell.
+
+        Args:
+            cell (Cell): The cell.
+
+        Returns:
+            int: The new sequence of the cell.
+        """
+        self.sequence += 1
+        self.cell_sequences[cell] = self.sequence
+        self.sector_sequences[sector_of(cell[0]), sector_of(cell[1])] = self.sequence
+
+        return self.sequence
+
+    def add_object(self, obj: SimObject) -> SimObject:
+        """
+        Adds an object, numbering it.
+
+        Args:
+            obj (SimObject): The object.
+
+        Returns:
+            SimObject: The object.
+        """
+        self._numbers += 1
+        obj.number = self._numbers
+        obj.id = obj.id or obj.number
+        self.objects[obj.number] = obj
+        self.cells.setdefault(obj.cell, {})[obj.number] = obj
+        self.touch(obj.cell)
+
+        return obj
+
+    def delete_object(self, number: int, x: int = None, z: int = None) -> Optional[SimObject]:
+        """
+        Deletes an object. As with the SDK, the coordinates must be in its cell.
+
+        Args:
+            number (int): The object number.
+            x (int, optional): A coordinate in the object's cell. Defaults to None, any.
+            z (int, optional): A coordinate in the object's cell. Defaults to None, any.
+
+        Returns:
+            Optional[SimObject]: The deleted object, or None if there was none.
+        """
+        obj = self.objects.get(number)
+
+        if obj is None or (x is not None and (cell_of(x), cell_of(z)) != obj.cell):
+            return None
+
+        del self.objects[number]
+        cell = self.cells[obj.cell]
+        del cell[number]
+        if not cell:
+            del self.cells[obj.cell]
+        self.touch(obj.cell)
+
+        return obj
+
+    def cells_in_sector(self, sector_x: int, sector_z: int) -> Iterator[Cell]:
+        """
+        Gets the cells of a sector that hold objects.
+
+        Args:
+            sector_x (int): The sector.
+            sector_z (int): The sector.
+
+        Yields:
+            Iterator[Cell]: The cells.
+        """
+        low_x = sector_x * SECTOR_CELLS - SECTOR_CELLS // 2
+        low_z = sector_z * SECTOR_CELLS - SECTOR_CELLS // 2
+
+        for x in range(low_x, low_x + SECTOR_CELLS):
+            for z in range(low_z, low_z + SECTOR_CELLS):
+                if (x, z) in self.cell_sequences:
+                    yield x, z
+
+    def populate(self, cells: int = 32, per_cell: int = 20, seed: int = 0) -> "World":
+        """
+        Fills a square of cells around the origin with objects.
+
+        Args:
+            cells (int, optional): The width of the square in cells. Defaults to 32.
+            per_cell (int, optional): The objects in each cell. Defaults to 20.
+            seed (int, optional): The random seed. Defaults to 0.
+
+        Returns:
+            World: The world.
+        """
+        rng = random.Random(seed)
+        low = -cells // 2
+
+        for cell_x in range(low, low + cells):
+            for cell_z in range(low, low + cells):
+                for _ in range(per_cell):
+                    self.add_object(SimObject(
+                        owner=rng.randint(1, 1000),
+                        build_timestamp=1600000000 + rng.randint(0, 10**8),
+                        x=cell_x * CELL_SIZE + rng.randrange(CELL_SIZE),
+                        y=rng.randint(-500, 500),
+                        z=cell_z * CELL_SIZE + rng.randrange(CELL_SIZE),
+                        yaw=rng.randrange(3600),
+                        model=f"model{rng.randint(1, 50)}.rwx",
+                        description=rng.choice(['', 'sign', 'tree', 'wall']),
+                        action=rng.choice(['', 'create solid off', 'create sign']),
+                    ))
+
+        return self
+
+    def generate_terrain(self, pages: int = 2, node_size: int = 32, seed: int = 0) -> "World":
+        """
+        Fills a square of terrain pages around the origin with rolling hills.
+
+        Args:
+            pages (int, optional): The width of the square in pages. Defaults to 2.
+            node_size (int, optional): The width of a node in cells. Defaults to 32.
+            seed (int, optional): Shifts the hills. Defaults to 0.
+
+        Returns:
+            World: The world.
+        """
+        low = -pages // 2
+
+        for page_x in range(low, low + pages):
+            for page_z in range(low, low + pages):
+                page = self.pages[page_x, page_z] = TerrainPage(page_x, page_z)
+
+                for node_x in range(0, PAGE_CELLS, node_size):
+                    for node_z in range(0, PAGE_CELLS, node_size):
+                        heights = array('i', (
+                            int(400 * sin((page_x * PAGE_CELLS + node_x + x + seed) / 17)
+                                + 300 * sin((page_z * PAGE_CELLS + node_z + z) / 23))
+                            for z in range(node_size) for x in range(node_size)
+                        ))
+                        page.nodes.append(TerrainNode(
+                            node_x, node_z, node_size,
+                            heights.tobytes(), bytes(2 * node_size * node_size),
+                        ))
+
+                self.sequence += 1
+                page.sequence = self.sequence
+
+        return self
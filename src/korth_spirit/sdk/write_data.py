@@ -18,35 +18,31 @@
 # LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
 # WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
-from typing import Union
+from typing import Type, Union
 
-from . import aw_bool_set, aw_data_set, aw_float_set, aw_int_set, aw_string_set
-from .enums import ATTRIBUTE_TYPES, AttributeEnum
+from .accessors import WRITERS, build_writer
+from .enums import AttributeEnum
 
 
-def write_data(attribute: AttributeEnum, value: Union[int, str, bool, float, bytes] = None) -> None:
+def write_data(attribute: AttributeEnum, value: Union[int, str, bool, float, bytes] = None, aw_type: Type = None) -> None:
     """
-    Sets an initialization attribute.
+    Sets an initialization attribute through its precompiled writer.
 
     Args:
         attribute (AttributeEnum): The attribute name.
         value (Union[int, str, bool, float, bytes]): The attribute value.
+        aw_type (Type): The type to write attributes without a known type as. Defaults to None.
 
     Raises:
         Exception: If the attribute could not be set.
+        Exception: If the attribute type is not found.
     """
-    aw_type = ATTRIBUTE_TYPES[attribute]
+    writer = WRITERS[attribute._value_]
 
-    args = []
-    if type(aw_type) == tuple:
-        aw_type, *args = aw_type
+    if writer is None:
+        writer = build_writer(attribute, aw_type)
 
-    switcher = {
-        int: aw_int_set,
-        str: aw_string_set,
-        bool: aw_bool_set,
-        float: aw_float_set,
-        bytes: aw_data_set
-    }
+        if writer is None:
+            raise Exception(f"Unknown type for attribute: {attribute}")
 
-    switcher[aw_type](attribute, value, *args)
+    writer(value)
@@ -0,0 +1,278 @@
+# Copyright (c) 2021-2022 Johnathan P. Irvin
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+from typing import Any, Dict, Iterable, Tuple
+
+try:
+    import numpy as np
+except ImportError as error:
+    raise ImportError("The heightmap needs numpy, install korth-spirit[terrain].") from error
+
+from ..data import TerrainNodeData
+
+# Coordinates are in centimeters, and a cell is ten meters wide.
+CELL_SIZE = 1000
+# A terrain page is 128 cells wide.
+PAGE_SHIFT = 7
+PAGE_CELLS = 1 << PAGE_SHIFT
+
+Page = Tuple[int, int]
+
+
+class Heightmap:
+    def __init__(self, capacity: int = 4) -> None:
+        """
+        Terrain heights and textures, one per cell corner, in pages of 128 by
+        128 cells. Only the pages nodes were added to take memory. Heights are
+        sampled bilinearly for whole arrays of points at once.
+
+        Args:
+            capacity (int, optional): The pages to make room for at first. Defaults to 4.
+        """
+        self.pages: Dict[Page, int] = {}
+        self.heights = np.zeros((capacity, PAGE_CELLS, PAGE_CELLS), dtype=np.int32)
+        self.textures = np.zeros((capacity, PAGE_CELLS, PAGE_CELLS), dtype=np.uint16)
+        self._index = np.full((0, 0), -1, dtype=np.int64)
+        self._origin = (0, 0)
+
+    @classmethod
+    def from_nodes(cls, nodes: Iterable[TerrainNodeData]) -> "Heightmap":
+        """
+        Creates a heightmap from the nodes of a terrain query.
+
+        Args:
+            nodes (Iterable[TerrainNodeData]): The nodes.
+
+        Returns:
+            Heightmap: The heightmap.
+        """
+        heightmap = cls()
+        heightmap.update(nodes)
+
+        return heightmap
+
+    def _slot(self, page: Page) -> int:
+        """
+        Gets the slot of a page, making room for it if it is new.
+
+        Args:
+            page (Page): The page.
+
+        Returns:
+            int: The index of the page in heights and textures.
+        """
+        slot = self.pages.get(page)
+
+        if slot is not None:
+            return slot
+
+        slot = self.pages[page] = len(self.pages)
+
+        if slot == len(self.heights):
+            self.heights = np.concatenate([self.heights, np.zeros_like(self.heights)])
+            self.textures = np.concatenate([self.textures, np.zeros_like(self.textures)])
+
+        self._reindex()
+
+        return slot
+
+    def _reindex(self) -> None:
+        """
+        Rebuilds the grid from page coordinates to slots, over the pages' bounds.
+        """
+        xs = [x for x, _ in self.pages]
+        zs = [z for _, z in self.pages]
+        self._origin = min(xs), min(zs)
+        self._index = np.full((max(zs) - min(zs) + 1, max(xs) - min(xs) + 1), -1, dtype=np.int64)
+
+        for (x, z), slot in self.pages.items():
+            self._index[z - self._origin[1], x - self._origin[0]] = slot
+
+    def add_node(self, node: TerrainNodeData) -> None:
+        """
+        Copies a terrain node into its page.
+
+        Args:
+            node (TerrainNodeData): The node.
+        """
+        slot = self._slot((node.page_x, node.page_z))
+        size = node.node_size
+        rows = slice(node.node_z, node.node_z + size)
+        columns = slice(node.node_x, node.node_x + size)
+
+        self.heights[slot, rows, columns] = np.asarray(node.heights, dtype=np.int32).reshape(size, size)
+        if len(node.textures):
+            self.textures[slot, rows, columns] = np.asarray(node.textures, dtype=np.uint16).reshape(size, size)
+
+    def add_page(self, x: int, z: int, heights: Any, textures: Any) -> None:
+        """
+        Copies a whole page, such as one mapped by a TerrainStore.
+
+        Args:
+            x (int): The page.
+            z (int): The page.
+            heights (Any): The int32 heights, row by row of z, as a buffer or sequence.
+            textures (Any): The uint16 textures, row by row of z, as a buffer or sequence.
+        """
+        slot = self._slot((x, z))
+        self.heights[slot] = np.frombuffer(heights, dtype='<i4').reshape(PAGE_CELLS, PAGE_CELLS)
+        self.textures[slot] = np.frombuffer(textures, dtype='<u2').reshape(PAGE_CELLS, PAGE_CELLS)
+
+    def update(self, nodes: Iterable[TerrainNodeData]) -> "Heightmap":
+        """
+        Copies terrain nodes into their pages.
+
+        Args:
+            nodes (Iterable[TerrainNodeData]): The nodes.
+
+        Returns:
+            Heightmap: The heightmap.
+        """
+        for node in nodes:
+            self.add_node(node)
+
+        return self
+
+    def _lookup(self, cell_x: np.ndarray, cell_z: np.ndarray, values: np.ndarray, missing: float) -> np.ndarray:
+        """
+        Gets the values at cell corners, from whichever page holds each.
+
+        Args:
+            cell_x (np.ndarray): The cells.
+            cell_z (np.ndarray): The cells.
+            values (np.ndarray): The heights or textures of the pages.
+            missing (float): The value of corners in pages not loaded.
+
+        Returns:
+            np.ndarray: The values.
+        """
+        # Pages are a power of two wide, so shifts and masks split cells into pages.
+        page_x = (cell_x >> PAGE_SHIFT) - self._origin[0]
+        page_z = (cell_z >> PAGE_SHIFT) - self._origin[1]
+        rows, columns = self._index.shape
+        inside = (page_x >= 0) & (page_x < columns) & (page_z >= 0) & (page_z < rows)
+
+        slot = self._index[np.clip(page_z, 0, rows - 1), np.clip(page_x, 0, columns - 1)]
+        loaded = inside & (slot >= 0)
+        mask = PAGE_CELLS - 1
+        flat = (np.maximum(slot, 0) << 2 * PAGE_SHIFT) | ((cell_z & mask) << PAGE_SHIFT) | (cell_x & mask)
+        found = values.reshape(-1).take(flat).astype(np.float64)
+
+        return found if loaded.all() else np.where(loaded, found, missing)
+
+    def sample(self, x: np.ndarray, z: np.ndarray, missing: float = np.nan) -> np.ndarray:
+        """
+        Gets the ground height under points, interpolating between the four
+        corners of the cell each is in.
+
+        Args:
+            x (np.ndarray): The x coordinates in centimeters.
+            z (np.ndarray): The z coordinates in centimeters.
+            missing (float, optional): The height where a corner is in a page
+                not loaded. Defaults to nan.
+
+        Returns:
+            np.ndarray: The heights in centimeters, shaped like the coordinates.
+        """
+        x = np.asarray(x, dtype=np.float64) / CELL_SIZE
+        z = np.asarray(z, dtype=np.float64) / CELL_SIZE
+        cell_x = np.floor(x).astype(np.int64)
+        cell_z = np.floor(z).astype(np.int64)
+        fraction_x = x - cell_x
+        fraction_z = z - cell_z
+
+        if not self.pages:
+            return np.full(x.shape, missing, dtype=np.float64)
+
+        corner = lambda dx, dz: self._lookup(cell_x + dx, cell_z + dz, self.heights, np.nan)
+        near = corner(0, 0) * (1 - fraction_x) + corner(1, 0) * fraction_x
+        far = corner(0, 1) * (1 - fraction_x) + corner(1, 1) * fraction_x
+        heights = near * (1 - fraction_z) + far * fraction_z
+
+        return heights if np.isnan(missing) else np.where(np.isnan(heights), missing, heights)
+
+    def sample_points(self, points: np.ndarray, missing: float = np.nan) -> np.ndarray:
+        """
+        Gets the ground height under an array of (x, z) points.
+
+        Args:
+            points (np.ndarray): The points, shaped (n, 2).
+            missing (float, optional): The height where a corner is in a page
+                not loaded. Defaults to nan.
+
+        Returns:
+            np.ndarray: The heights, shaped (n,).
+        """
+        points = np.asarray(points)
+
+        return self.sample(points[..., 0], points[..., 1], missing)
+
+    def texture(self, x: np.ndarray, z: np.ndarray) -> np.ndarray:
+        """
+        Gets the texture of the cells points are in.
+
+        Args:
+            x (np.ndarray): The x coordinates in centimeters.
+            z (np.ndarray): The z coordinates in centimeters.
+
+        Returns:
+            np.ndarray: The textures, or -1 where the page is not loaded.
+        """
+        cell_x = np.floor(np.asarray(x, dtype=np.float64) / CELL_SIZE).astype(np.int64)
+        cell_z = np.floor(np.asarray(z, dtype=np.float64) / CELL_SIZE).astype(np.int64)
+
+        if not self.pages:
+            return np.full(cell_x.shape, -1, dtype=np.int64)
+
+        return self._lookup(cell_x, cell_z, self.textures, -1).astype(np.int64)
+
+    def mosaic(self, fill: int = 0) -> Tuple[np.ndarray, np.ndarray, Tuple[int, int]]:
+        """
+        Assembles the loaded pages into one heightmap and texture map, over
+        the bounds of the pages.
+
+        Args:
+            fill (int, optional): The value of pages not loaded. Defaults to 0.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, Tuple[int, int]]: The heights and
+                textures, indexed by cell z then x, and the cell of their first corner.
+        """
+        rows, columns = self._index.shape
+        heights = np.full((rows * PAGE_CELLS, columns * PAGE_CELLS), fill, dtype=np.int32)
+        textures = np.full((rows * PAGE_CELLS, columns * PAGE_CELLS), fill, dtype=np.uint16)
+
+        for (x, z), slot in self.pages.items():
+            row = (z - self._origin[1]) * PAGE_CELLS
+            column = (x - self._origin[0]) * PAGE_CELLS
+            heights[row:row + PAGE_CELLS, column:column + PAGE_CELLS] = self.heights[slot]
+            textures[row:row + PAGE_CELLS, column:column + PAGE_CELLS] = self.textures[slot]
+
+        return heights, textures, (self._origin[0] * PAGE_CELLS, self._origin[1] * PAGE_CELLS)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        The memory the loaded pages take.
+
+        Returns:
+            int: The bytes.
+        """
+        return self.heights.nbytes + self.textures.nbytes
@@ -0,0 +1,412 @@
+# Copyright (c) 2021-2022 Johnathan P. Irvin
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+The terrain store keeps each terrain page in its own file, memory mapped:
+
+- a 64 byte header, with the magic, the version, the page coordinates and
+  the sequence of the page when it was last synced;
+- the heights, int32 per cell, row by row of z;
+- the textures, uint16 per cell, row by row of z.
+
+All values are little endian.
+"""
+import mmap
+import os
+import re
+import struct
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ..data import TerrainNodeData
+from ..events import Event
+from ..sdk import EventEnum, aw_instance_set, aw_terrain_query, aw_wait
+
+MAGIC = b'KSTP'
+VERSION = 1
+HEADER = struct.Struct('<4sIiiq')
+HEADER_SIZE = 64
+
+# A terrain page is 128 cells wide.
+PAGE_CELLS = 128
+HEIGHTS_SIZE = PAGE_CELLS * PAGE_CELLS * 4
+TEXTURES_SIZE = PAGE_CELLS * PAGE_CELLS * 2
+PAGE_SIZE = HEADER_SIZE + HEIGHTS_SIZE + TEXTURES_SIZE
+
+PAGE_FILE = re.compile(r'^(-?\d+)_(-?\d+)\.page$')
+
+Page = Tuple[int, int]
+
+
+class StoredPage:
+    __slots__ = ('x', 'z', '_file', '_map')
+
+    def __init__(self, path: str, x: int, z: int) -> None:
+        """
+        A memory mapped terrain page file, created empty if missing.
+
+        Args:
+            path (str): The file.
+            x (int): The page.
+            z (int): The page.
+
+        Raises:
+            ValueError: If the file is not a page of this version.
+        """
+        self.x = x
+        self.z = z
+        exists = os.path.exists(path)
+        self._file = open(path, 'r+b' if exists else 'w+b')
+
+        if not exists:
+            self._file.write(HEADER.pack(MAGIC, VERSION, x, z, 0).ljust(PAGE_SIZE, b'\0'))
+            self._file.flush()
+
+        self._map = mmap.mmap(self._file.fileno(), PAGE_SIZE)
+        magic, version, page_x, page_z, _ = HEADER.unpack_from(self._map)
+
+        if (magic, version, page_x, page_z) != (MAGIC, VERSION, x, z):
+            self.close()
+            raise ValueError(f"Not a terrain page {x}, {z} of version {VERSION}: {path}")
+
+    @property
+    def sequence(self) -> int:
+        """
+        The sequence of the page when it was last synced.
+
+        Returns:
+            int: The sequence, 0 if never synced.
+        """
+        return HEADER.unpack_from(self._map)[4]
+
+    @sequence.setter
+    def sequence(self, sequence: int) -> None:
+        HEADER.pack_into(self._map, 0, MAGIC, VERSION, self.x, self.z, sequence)
+
+    @property
+    def heights(self) -> memoryview:
+        """
+        The heights of the page, mapped rather than copied.
+
+        Returns:
+            memoryview: The int32 heights, row by row of z.
+        """
+        return memoryview(self._map)[HEADER_SIZE:HEADER_SIZE + HEIGHTS_SIZE].cast('i')
+
+    @property
+    def textures(self) -> memoryview:
+        """
+        The textures of the page, mapped rather than copied.
+
+        Returns:
+            memoryview: The uint16 textures, row by row of z.
+        """
+        return memoryview(self._map)[HEADER_SIZE + HEIGHTS_SIZE:PAGE_SIZE].cast('H')
+
+    def write_node(self, node: TerrainNodeData) -> None:
+        """
+        Copies a terrain node into the page.
+
+        Args:
+            node (TerrainNodeData): The node.
+        """
+        size = node.node_size
+        heights = memoryview(node.heights).cast('B') if not isinstance(node.heights, list) else None
+        textures = memoryview(node.textures).cast('B') if not isinstance(node.textures, list) else None
+
+        for row in range(size):
+            cell = (node.node_z + row) * PAGE_CELLS + node.node_x
+            start = HEADER_SIZE + cell * 4
+
+            if heights is None:
+                struct.pack_into(f'<{size}i', self._map, start, *node.heights[row * size:(row + 1) * size])
+            else:
+                self._map[start:start + size * 4] = heights[row * size * 4:(row + 1) * size * 4]
+
+            if not len(node.textures):
+                continue
+
+            start = HEADER_SIZE + HEIGHTS_SIZE + cell * 2
+
+            if textures is None:
+                struct.pack_into(f'<{size}H', self._map, start, *node.textures[row * size:(row + 1) * size])
+            else:
+                self._map[start:start + size * 2] = textures[row * size * 2:(row + 1) * size * 2]
+
+    def flush(self) -> None:
+        """
+        Writes changes to the file.
+        """
+        self._map.flush()
+
+    def close(self) -> None:
+        """
+        Unmaps and closes the file. Views of its heights and textures must be
+        released first.
+        """
+        self._map.close()
+        self._file.close()
+
+
+class TerrainStore:
+    def __init__(self, path: str) -> None:
+        """
+        Terrain pages kept on disk, one memory mapped file each, with the
+        sequence each page was synced at. A sync passes that sequence to
+        aw_terrain_query, so only pages that changed are downloaded again,
+        and a restarted bot maps its terrain rather than downloading it.
+
+        Args:
+            path (str): The directory of the page files, created if missing.
+        """
+        self.path = path
+        self._pages: Dict[Page, StoredPage] = {}
+        self.downloaded = 0
+        self.skipped = 0
+        os.makedirs(path, exist_ok=True)
+
+        self._known = set()
+        for name in os.listdir(path):
+            match = PAGE_FILE.match(name)
+            if match:
+                self._known.add((int(match.group(1)), int(match.group(2))))
+
+    def __enter__(self) -> "TerrainStore":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def __contains__(self, page: Page) -> bool:
+        return page in self._known
+
+    def __len__(self) -> int:
+        return len(self._known)
+
+    @property
+    def pages(self) -> List[Page]:
+        """
+        The pages in the store.
+
+        Returns:
+            List[Page]: The page coordinates.
+        """
+        return sorted(self._known)
+
+    def page(self, x: int, z: int, create: bool = False) -> Optional[StoredPage]:
+        """
+        Gets a page, mapping its file on first use.
+
+        Args:
+            x (int): The page.
+            z (int): The page.
+            create (bool, optional): Whether to create a missing page. Defaults to False.
+
+        Returns:
+            Optional[StoredPage]: The page, or None if it is missing.
+        """
+        page = self._pages.get((x, z))
+
+        if page is None and (create or (x, z) in self._known):
+            page = self._pages[x, z] = StoredPage(os.path.join(self.path, f"{x}_{z}.page"), x, z)
+            self._known.add((x, z))
+
+        return page
+
+    def sequence(self, x: int, z: int) -> int:
+        """
+        Gets the sequence a page was synced at.
+
+        Args:
+            x (int): The page.
+            z (int): The page.
+
+        Returns:
+            int: The sequence, 0 if never synced.
+        """
+        page = self.page(x, z)
+
+        return page.sequence if page is not None else 0
+
+    def heights(self, x: int, z: int) -> Optional[memoryview]:
+        """
+        Gets the heights of a page without copying them.
+        numpy.frombuffer(heights, numpy.int32) wraps them as an array.
+
+        Args:
+            x (int): The page.
+            z (int): The page.
+
+        Returns:
+            Optional[memoryview]: The int32 heights, row by row of z, or None if the page is missing.
+        """
+        page = self.page(x, z)
+
+        return page.heights if page is not None else None
+
+    def textures(self, x: int, z: int) -> Optional[memoryview]:
+        """
+        Gets the textures of a page without copying them.
+
+        Args:
+            x (int): The page.
+            z (int): The page.
+
+        Returns:
+            Optional[memoryview]: The uint16 textures, row by row of z, or None if the page is missing.
+        """
+        page = self.page(x, z)
+
+        return page.textures if page is not None else None
+
+    def write_nodes(self, nodes: Iterable[TerrainNodeData]) -> None:
+        """
+        Copies terrain nodes into their pages.
+
+        Args:
+            nodes (Iterable[TerrainNodeData]): The nodes.
+        """
+        for node in nodes:
+            self.page(node.page_x, node.page_z, create=True).write_node(node)
+
+    def sync(self, instance: "Instance", pages: Iterable[Page]) -> int:
+        """
+        Downloads the pages that changed since they were stored.
+
+        Args:
+            instance (Instance): The instance, which must have entered a world.
+            pages (Iterable[Page]): The pages to sync.
+
+        Returns:
+            int: The number of pages downloaded.
+        """
+        current: List[Optional[StoredPage]] = [None]
+        sequence: List[Optional[int]] = [None]
+
+        def on_begin(event: Event) -> None:
+            current[0] = self.page(event.terrain_page_x, event.terrain_page_z, create=True)
+
+        def on_data(event: Event) -> None:
+            self.page(event.terrain_page_x, event.terrain_page_z, create=True).write_node(TerrainNodeData(
+                page_x=event.terrain_page_x,
+                page_z=event.terrain_page_z,
+                node_x=event.terrain_node_x,
+                node_z=event.terrain_node_z,
+                node_size=event.terrain_node_size,
+                heights=event.terrain_node_heights,
+                textures=event.terrain_node_textures,
+            ))
+
+        def on_end(event: Event) -> None:
+            sequence[0] = event.terrain_sequence
+
+        bus = instance.bus
+        subscriptions = [
+            bus.on(EventEnum.AW_EVENT_TERRAIN_BEGIN, on_begin),
+            bus.on(EventEnum.AW_EVENT_TERRAIN_DATA, on_data),
+            bus.on(EventEnum.AW_EVENT_TERRAIN_END, on_end),
+        ]
+        downloaded = 0
+
+        try:
+            for x, z in pages:
+                current[0] = sequence[0] = None
+
+                aw_instance_set(instance._instance)
+                while not aw_terrain_query(x, z, self.sequence(x, z)):
+                    aw_wait(1)
+                    aw_instance_set(instance._instance)
+
+                # The sequence is only recorded once the whole page has arrived.
+                if current[0] is not None and sequence[0] is not None:
+                    current[0].sequence = sequence[0]
+                    downloaded += 1
+                else:
+                    self.skipped += 1
+        finally:
+            for subscription in subscriptions:
+                subscription.unsubscribe()
+
+        self.downloaded += downloaded
+        self.flush()
+
+        return downloaded
+
+    def refresh(self, instance: "Instance") -> int:
+        """
+        Downloads the stored pages that changed.
+
+        Args:
+            instance (Instance): The instance, which must have entered a world.
+
+        Returns:
+            int: The number of pages downloaded.
+        """
+        return self.sync(instance, self.pages)
+
+    def heightmap(self) -> "Heightmap":
+        """
+        Builds a Heightmap of the stored pages, which needs numpy.
+
+        Returns:
+            Heightmap: The heightmap.
+        """
+        from .heightmap import Heightmap
+
+        heightmap = Heightmap(capacity=max(len(self), 1))
+
+        for x, z in self.pages:
+            page = self.page(x, z)
+            heights, textures = page.heights, page.textures
+            heightmap.add_page(x, z, heights, textures)
+            heights.release()
+            textures.release()
+
+        return heightmap
+
+    def flush(self) -> None:
+        """
+        Writes changes to the page files.
+        """
+        for page in self._pages.values():
+            page.flush()
+
+    def close(self) -> None:
+        """
+        Unmaps every page, writing changes to the page files.
+        """
+        for page in self._pages.values():
+            page.flush()
+            page.close()
+
+        self._pages.clear()
+
+    def stats(self) -> dict:
+        """
+        Gets the size of the store and how much syncs downloaded.
+
+        Returns:
+            dict: The pages stored and mapped, and the pages downloaded and skipped.
+        """
+        return {
+            'pages': len(self._known),
+            'mapped': len(self._pages),
+            'downloaded': self.downloaded,
+            'skipped': self.skipped,
+        }
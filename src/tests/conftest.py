@@ -0,0 +1,55 @@
+# Copyright (c) 2021-2022 Johnathan P. Irvin
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+from types import SimpleNamespace
+
+import pytest
+from korth_spirit.sdk import CONTEXT, SDK
+from korth_spirit.sdk.simulator import Simulator
+
+
+@pytest.fixture
+def sdk():
+    """
+    Replaces the SDK library with a namespace, for tests to add aw_* functions to.
+    """
+    fake = SimpleNamespace()
+    SDK.use(fake)
+
+    yield fake
+
+    for name in [name for name in vars(SDK) if name.startswith('aw_')]:
+        delattr(SDK, name)
+    SDK._library = None
+
+
+@pytest.fixture
+def simulator(sdk):
+    """
+    Replaces the SDK library with a simulator of one populated world.
+    """
+    simulator = Simulator()
+    simulator.world('sim').populate(cells=8, per_cell=5).generate_terrain(pages=2)
+    SDK.use(simulator)
+    CONTEXT.invalidate()
+
+    yield simulator
+
+    CONTEXT.invalidate()
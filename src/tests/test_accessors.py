@@ -0,0 +1,90 @@
+# Copyright (c) 2021-2022 Johnathan P. Irvin
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+from ctypes import addressof, c_int32, create_string_buffer
+
+import pytest
+from korth_spirit.sdk import AttributeEnum, accessors
+from korth_spirit.sdk.get_data import get_data
+from korth_spirit.sdk.write_data import write_data
+
+
+def test_each_type_reaches_its_sdk_function(sdk):
+    """
+    Attributes are read and written through the aw_* function of their type.
+    """
+    values = {}
+    buffers = []
+
+    def aw_data(attribute, length):
+        buffers.append(create_string_buffer(values[attribute], len(values[attribute])))
+        length._obj.value = len(values[attribute])
+        return addressof(buffers[-1])
+
+    for name in ('int', 'string', 'bool', 'float'):
+        setattr(sdk, f'aw_{name}', lambda attribute, name=name: values[attribute][name])
+        setattr(sdk, f'aw_{name}_set', lambda attribute, value, name=name: values.__setitem__(attribute, {name: value}) or 0)
+    sdk.aw_data = aw_data
+    sdk.aw_data_set = lambda attribute, value, length: values.__setitem__(attribute, bytes(value)[:length]) or 0
+
+    cases = [
+        (AttributeEnum.AW_LOGIN_OWNER, 7, {'int': 7}),
+        (AttributeEnum.AW_LOGIN_NAME, 'Bob', {'string': b'Bob'}),
+        (AttributeEnum.AW_UNIVERSE_REGISTRATION_REQUIRED, True, {'bool': True}),
+        (AttributeEnum.AW_WORLD_LIGHT_X, 0.5, {'float': 0.5}),
+        (AttributeEnum.AW_OBJECT_DATA, b'data', b'data'),
+    ]
+    for attribute, value, stored in cases:
+        write_data(attribute, value)
+
+        assert values[attribute.value] == stored
+        assert get_data(attribute) == value
+        assert get_data(attribute.value) == value
+
+    write_data(AttributeEnum.AW_LOGIN_OWNER, None)
+    assert values[AttributeEnum.AW_LOGIN_OWNER.value] == {'int': 0}
+
+    write_data(AttributeEnum.AW_TERRAIN_NODE_HEIGHTS, [1, -2])
+    heights = get_data(AttributeEnum.AW_TERRAIN_NODE_HEIGHTS)
+    assert heights.typecode == c_int32._type_ and list(heights) == [1, -2]
+
+
+def test_given_type_is_used_for_attributes_without_one(sdk):
+    """
+    Attributes without a known type are read and written as the type passed.
+    """
+    attribute = AttributeEnum.AW_LOGIN_OWNER
+    reader, writer = accessors.READERS[attribute.value], accessors.WRITERS[attribute.value]
+    accessors.READERS[attribute.value] = accessors.WRITERS[attribute.value] = None
+    written = []
+    sdk.aw_string = lambda index: b'as text'
+    sdk.aw_string_set = lambda index, value: written.append((index, value)) or 0
+
+    try:
+        write_data(attribute, 'as text', str)
+        assert written == [(attribute.value, b'as text')]
+        assert get_data(attribute, str) == 'as text'
+
+        with pytest.raises(Exception, match='Unknown type'):
+            get_data(attribute)
+        with pytest.raises(Exception, match='Unknown type'):
+            write_data(attribute, 1)
+    finally:
+        accessors.READERS[attribute.value], accessors.WRITERS[attribute.value] = reader, writer
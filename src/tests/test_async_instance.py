@@ -0,0 +1,72 @@
+# Copyright (c) 2021-2022 Johnathan P. Irvin
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import asyncio
+from collections import Counter
+
+import pytest
+from korth_spirit.instance import AsyncInstance
+from korth_spirit.query import QueryEnum
+from korth_spirit.sdk import SDK
+from korth_spirit.sdk.errors import AwError
+
+
+def test_async_instance_logs_in_enters_and_queries(simulator):
+    """
+    Calls complete when their callback arrives, and queries yield what the world holds.
+    """
+    world = simulator.worlds['sim']
+    calls = Counter()
+
+    def count(name, function):
+        def call(*args):
+            calls[name] += 1
+            return function(*args)
+
+        return call
+
+    SDK.wrap(count)
+
+    async def run():
+        async with AsyncInstance('Bot', domain='127.0.0.1') as bot:
+            assert await bot.login(1, 'password') is bot
+
+            # Failing at once, outside a world, leaves no call awaiting the callback.
+            with pytest.raises(AwError):
+                [found async for found in bot.query(QueryEnum.OBJECT)]
+
+            assert await bot.enter('sim') is bot
+
+            objects = [found async for found in bot.query(QueryEnum.OBJECT)]
+            page = [node async for node in bot.query(QueryEnum.TERRAIN, x=0, z=0)]
+            terrain = [node async for node in bot.query(QueryEnum.TERRAIN)]
+
+            return objects, page, terrain
+
+    try:
+        objects, page, terrain = asyncio.run(run())
+    finally:
+        SDK.unwrap(count)
+
+    assert sorted(found.number for found in objects) == sorted(world.objects)
+    assert len(page) == 16 and len(page[0].heights) == 32 * 32
+    assert len(terrain) == 4 * 16
+    # Each result callback is installed and removed once, however many calls await it.
+    assert calls['aw_instance_callback_set'] == 8
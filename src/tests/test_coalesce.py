@@ -0,0 +1,49 @@
+# Copyright (c) 2021-2022 Johnathan P. Irvin
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+from korth_spirit.events import EventBus
+from korth_spirit.sdk import AttributeEnum, EventEnum
+
+
+def test_only_the_latest_event_per_session_is_delivered(sdk):
+    """
+    Coalesced avatar changes reach handlers once per flush, in the order their sessions first changed.
+    """
+    values = {}
+    sdk.aw_int = lambda attribute: values.get(AttributeEnum(attribute), 0)
+    sdk.aw_string = lambda attribute: b'Bob'
+    sdk.aw_bool = lambda attribute: 0
+    received = []
+
+    bus = EventBus().coalesce(EventEnum.AW_EVENT_AVATAR_CHANGE)
+    bus.subscribe(EventEnum.AW_EVENT_AVATAR_CHANGE, lambda e: received.append((e.avatar_session, e.avatar_x)))
+
+    for x in range(10):
+        for session in (1, 2):
+            values.update({AttributeEnum.AW_AVATAR_SESSION: session, AttributeEnum.AW_AVATAR_X: x})
+            bus.publish(EventEnum.AW_EVENT_AVATAR_CHANGE)
+
+    assert received == []
+    assert bus.flush() == 2
+    assert received == [(1, 9), (2, 9)]
+    assert bus.flush() == 0
+    assert bus.coalesced()[EventEnum.AW_EVENT_AVATAR_CHANGE] == {
+        'received': 20, 'delivered': 2, 'collapsed': 18, 'pending': 0,
+    }
@@ -0,0 +1,46 @@
+# Copyright (c) 2021-2022 Johnathan P. Irvin
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+from types import SimpleNamespace
+
+from korth_spirit.sdk.context import InstanceContext
+
+
+def test_redundant_switches_are_skipped():
+    """
+    Switching to the current instance does not call the SDK, and switches are counted.
+    """
+    calls = []
+    library = SimpleNamespace(aw_instance_set=lambda instance: calls.append(instance) or 0)
+    context = InstanceContext(library)
+
+    for instance in (1, 1, 2, 2, 2, 1):
+        context.select(instance)
+
+    assert calls == [1, 2, 1]
+    assert context.stats() == {'switches': 3, 'skipped': 3, 'instances': {1: 2, 2: 1}}
+
+    with context.using(2):
+        assert context.current == 2
+    assert context.current == 1
+
+    context.invalidate()
+    context.select(1)
+    assert calls == [1, 2, 1, 2, 1, 1]
@@ -0,0 +1,88 @@
+# Copyright (c) 2021-2022 Johnathan P. Irvin
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+from array import array
+from ctypes import addressof, c_int32, c_uint16, create_string_buffer
+
+import pytest
+from korth_spirit.sdk import AttributeEnum, aw_data, aw_data_set
+
+
+@pytest.fixture
+def data(sdk):
+    """
+    Stores data attributes as the SDK does, by pointer and length in bytes.
+    """
+    values, buffers = {}, []
+
+    def read(attribute, length):
+        value = values.get(attribute)
+
+        if value is None:
+            return None
+
+        buffers.append(create_string_buffer(value, len(value) or 1))
+        length._obj.value = len(value)
+        return addressof(buffers[-1])
+
+    def write(attribute, value, length):
+        values[attribute] = bytes(value)[:length] if value else b''
+        return 0
+
+    sdk.aw_data = read
+    sdk.aw_data_set = write
+
+    return values
+
+
+@pytest.mark.parametrize('value', [b'', b'x', b'data'])
+def test_data_is_returned_as_bytes_of_any_length(data, value):
+    """
+    Short and empty data come back as bytes, not as a pointer.
+    """
+    data[AttributeEnum.AW_OBJECT_DATA.value] = value
+
+    assert aw_data(AttributeEnum.AW_OBJECT_DATA) == value
+
+
+def test_missing_data_is_empty(data):
+    """
+    A null pointer is read as empty data.
+    """
+    assert aw_data(AttributeEnum.AW_OBJECT_DATA) == b''
+    assert aw_data(AttributeEnum.AW_TERRAIN_NODE_HEIGHTS, c_int32) == array('i')
+
+
+def test_terrain_data_is_typed_and_set_by_byte_length(data):
+    """
+    Heights and textures come back as typed arrays, and are set with their length in bytes.
+    """
+    heights, textures = AttributeEnum.AW_TERRAIN_NODE_HEIGHTS, AttributeEnum.AW_TERRAIN_NODE_TEXTURES
+
+    aw_data_set(heights, [1, -2, 3], c_int32)
+    aw_data_set(textures, array('H', [7, 65535]), c_uint16)
+
+    assert len(data[heights.value]) == 3 * 4
+    assert len(data[textures.value]) == 2 * 2
+    assert aw_data(heights, c_int32) == array('i', [1, -2, 3])
+    assert aw_data(textures, c_uint16) == array('H', [7, 65535])
+
+    aw_data_set(heights, array('i', [5]), c_int32)
+    assert aw_data(heights, c_int32) == array('i', [5])
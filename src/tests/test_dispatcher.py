@@ -0,0 +1,116 @@
+# Copyright (c) 2021-2022 Johnathan P. Irvin
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import threading
+import time
+
+from korth_spirit.events import EventBus, ThreadedDispatcher
+from korth_spirit.sdk import (CONTEXT, AttributeEnum, EventEnum, aw_int,
+                              aw_int_set, aw_say, aw_wait)
+
+
+def test_events_are_handled_in_order_per_key_off_the_sdk_thread(sdk):
+    """
+    Handlers run on workers in order per key, and their SDK calls run on the SDK thread.
+    """
+    sessions = iter([1, 2, 1, 2, 1, 2])
+    sdk.aw_int = lambda attribute: next(sessions)
+    names = iter(b'012345')
+    sdk.aw_string = lambda attribute: bytes([next(names)])
+    sdk.aw_instance_event_set = lambda event, handler: 0
+    sdk.aw_instance_set = lambda instance: 0
+    sdk.aw_wait = lambda milliseconds: time.sleep(0.001) or 0
+    said = []
+    sdk.aw_string_set = lambda attribute, value: 0
+    sdk.aw_say = lambda message: said.append((message, threading.get_ident(), CONTEXT.current)) or 0
+
+    dispatcher = ThreadedDispatcher(workers=2, key=lambda event: event.avatar_session)
+    bus = EventBus(dispatcher).bind(9)
+    handled = []
+
+    def handler(event):
+        time.sleep(0.01 if event.avatar_session == 1 else 0)
+        handled.append((event.avatar_session, event.avatar_name))
+        aw_say(f"bye {event.avatar_name}")
+
+    bus.subscribe(EventEnum.AW_EVENT_AVATAR_DELETE, handler)
+    for _ in range(6):
+        bus.publish(EventEnum.AW_EVENT_AVATAR_DELETE)
+
+    while dispatcher.stats()['delivered'] < 6:
+        aw_wait(1)
+    dispatcher.close()
+    bus.unbind()
+
+    assert [name for session, name in handled if session == 1] == ['0', '2', '4']
+    assert [name for session, name in handled if session == 2] == ['1', '3', '5']
+    assert {(thread, instance) for _, thread, instance in said} == {(threading.get_ident(), 9)}
+    assert dispatcher.stats()['marshalled'] == 6
+    assert not dispatcher.started
+
+
+def test_worker_sdk_calls_are_not_lost_or_moved(sdk):
+    """
+    Sets a handler ends on, and the hooks of its subscriptions, reach the SDK,
+    a worker's aw_wait does not take over the SDK thread, and run() batches calls.
+    """
+    main = threading.get_ident()
+    calls = []
+    record = lambda name: lambda *args: calls.append((name, args, threading.get_ident())) or 0
+    sdk.aw_int = lambda attribute: 7
+    sdk.aw_string = lambda attribute: b'Bob'
+    sdk.aw_instance_set = lambda instance: 0
+    sdk.aw_wait = lambda milliseconds: time.sleep(0.001) or 0
+    sdk.aw_int_set = record('aw_int_set')
+    sdk.aw_say = record('aw_say')
+
+    dispatcher = ThreadedDispatcher(workers=2)
+    bus = EventBus(dispatcher).bind(9)
+    sdk.aw_instance_event_set = record('aw_instance_event_set')
+    results = []
+
+    def read_after_call():
+        aw_say('hi')
+        return aw_int(AttributeEnum.AW_AVATAR_SESSION), threading.get_ident()
+
+    def handler(event):
+        aw_wait(1)
+        aw_say('bye')
+        results.append(dispatcher.run(read_after_call))
+        bus.subscribe(EventEnum.AW_EVENT_CHAT, lambda event: None)
+        aw_int_set(AttributeEnum.AW_CELL_ITERATOR, 3)
+
+    bus.subscribe(EventEnum.AW_EVENT_AVATAR_DELETE, handler)
+    calls.clear()
+    bus.publish(EventEnum.AW_EVENT_AVATAR_DELETE)
+
+    while dispatcher.stats()['delivered'] < 1:
+        aw_wait(1)
+    dispatcher.close()
+    bus.unbind()
+
+    assert [(name, thread) for name, _, thread in calls] == [
+        ('aw_say', main),
+        ('aw_say', main),
+        ('aw_instance_event_set', main),
+        ('aw_int_set', main),
+    ]
+    assert calls[-1][1] == (AttributeEnum.AW_CELL_ITERATOR.value, 3)
+    assert results == [(7, main)]
@@ -0,0 +1,73 @@
+# Copyright (c) 2021-2022 Johnathan P. Irvin
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+from korth_spirit.query import objects
+from korth_spirit.sdk.errors import (RC_END_OF_ITERATION, AwError,
+                                     EndOfIterationError, NoSuchObjectError)
+
+
+class FakeBus:
+    def __init__(self):
+        self.subscribed = 0
+
+    def subscribe(self, event, callback):
+        self.subscribed += 1
+
+    def unsubscribe(self, event, callback):
+        self.subscribed -= 1
+
+
+class FakeInstance:
+    def __init__(self):
+        self.bus = FakeBus()
+        self._instance = 1
+
+
+def test_error_types_follow_reason_codes():
+    """
+    Errors are created from reason codes and keep them as integers.
+    """
+    assert type(AwError.from_rc(RC_END_OF_ITERATION)) is EndOfIterationError
+    assert isinstance(AwError.from_rc(302), NoSuchObjectError)
+    assert type(AwError.from_rc(1)) is AwError
+
+    error = AwError.from_rc(1, "Failed to login")
+    assert error.rc == 1
+    assert str(error) == "Failed to login: 1"
+
+def test_query_all_ends_on_end_of_iteration(monkeypatch):
+    """
+    Querying all cells stops at the end of the iteration and unsubscribes.
+    """
+    calls = []
+
+    def cell_next(combine):
+        calls.append(combine)
+        if len(calls) == 3:
+            raise AwError.from_rc(RC_END_OF_ITERATION, "Failed to get the next cell")
+
+    monkeypatch.setattr(objects, 'aw_cell_next', cell_next)
+    monkeypatch.setattr(objects, 'aw_wait', lambda timeout: None)
+    monkeypatch.setattr(objects, 'aw_instance_set', lambda instance: None)
+    instance = FakeInstance()
+
+    assert objects.ObjectQuery(instance).query_all() == []
+    assert len(calls) == 3
+    assert instance.bus.subscribed == 0
@@ -0,0 +1,73 @@
+# Copyright (c) 2021-2022 Johnathan P. Irvin
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import pytest
+from korth_spirit.events import EventBus
+from korth_spirit.sdk import AttributeEnum, EventEnum
+
+
+def test_attributes_are_read_on_first_access(sdk):
+    """
+    Only the attributes a handler reads are fetched, once, and only during the callback.
+    """
+    reads = []
+    sdk.aw_int = lambda attribute: reads.append(AttributeEnum(attribute)) or 7
+    sdk.aw_string = lambda attribute: reads.append(AttributeEnum(attribute)) or b'Bob'
+    kept = []
+
+    def handler(event):
+        assert event.avatar_name == 'Bob'
+        assert event.avatar_name == 'Bob'
+        kept.append(event)
+
+    bus = EventBus().subscribe(EventEnum.AW_EVENT_AVATAR_ADD, handler)
+    bus.publish(EventEnum.AW_EVENT_AVATAR_ADD)
+
+    assert reads == [AttributeEnum.AW_AVATAR_NAME]
+    with pytest.raises(Exception):
+        kept[0].avatar_session
+
+def test_snapshot_keeps_every_attribute(sdk):
+    """
+    A snapshot can be read after the callback.
+    """
+    sdk.aw_int = lambda attribute: 7
+    sdk.aw_string = lambda attribute: b'Bob'
+    kept = []
+
+    bus = EventBus().subscribe(EventEnum.AW_EVENT_AVATAR_DELETE, lambda event: kept.append(event.snapshot()))
+    bus.publish(EventEnum.AW_EVENT_AVATAR_DELETE)
+
+    assert (kept[0].avatar_session, kept[0].avatar_name) == (7, 'Bob')
+
+def test_event_types_are_generated_and_slotted():
+    """
+    The generated event classes match TRANSLATIONS and carry no instance dict.
+    """
+    from korth_spirit.events import Event, generate
+    from korth_spirit.events.event_types import AvatarAddEvent
+
+    with open(generate.TARGET) as generated:
+        assert generated.read() == generate.render()
+
+    event = Event(EventEnum.AW_EVENT_AVATAR_ADD)
+    assert type(event) is AvatarAddEvent
+    assert not hasattr(event, '__dict__')
+    assert 'avatar_name' in AvatarAddEvent.__slots__
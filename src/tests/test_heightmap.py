@@ -0,0 +1,50 @@
+# Copyright (c) 2021-2022 Johnathan P. Irvin
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import pytest
+from korth_spirit.instance import Instance
+from korth_spirit.query import QueryEnum
+
+np = pytest.importorskip('numpy')
+
+
+def test_heightmap_samples_terrain_bilinearly(simulator):
+    """
+    Heights at cell corners match the terrain, and points between them are interpolated.
+    """
+    from korth_spirit.terrain import Heightmap
+
+    with Instance('Bot', domain='127.0.0.1') as bot:
+        bot.login(1, 'password').enter('sim')
+        heightmap = Heightmap.from_nodes(bot.query(QueryEnum.TERRAIN))
+
+    page = simulator.worlds['sim'].pages[-1, 0]
+    node = page.nodes[5]
+    expected = np.frombuffer(node.heights, dtype=np.int32).reshape(node.size, node.size)
+    cell_x, cell_z = -128 + node.x + 3, node.z + 7
+
+    corners = heightmap.sample([cell_x * 1000, (cell_x + 1) * 1000], [cell_z * 1000, cell_z * 1000])
+    middle = heightmap.sample_points([[cell_x * 1000 + 500, cell_z * 1000 + 500]])
+
+    assert len(heightmap.pages) == 4 and heightmap.nbytes == 4 * 128 * 128 * 6
+    assert corners.tolist() == [expected[7, 3], expected[7, 4]]
+    assert middle[0] == pytest.approx(expected[7:9, 3:5].mean())
+    assert np.isnan(heightmap.sample(10**7, 0))
+    assert heightmap.mosaic()[0].shape == (256, 256)
@@ -0,0 +1,87 @@
+# Copyright (c) 2021-2022 Johnathan P. Irvin
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import json
+import os
+import subprocess
+import sys
+
+SRC = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+IMPORT_BUDGET = 0.05 # seconds
+
+def run_isolated(code: str, tmp_path) -> dict:
+    """
+    Runs code in a fresh interpreter where no SDK library is present.
+
+    Args:
+        code (str): The code to run, which must print a JSON object.
+        tmp_path (Path): The working directory.
+
+    Returns:
+        dict: The decoded output.
+    """
+    env = dict(os.environ, PYTHONPATH=SRC)
+    env.pop('AW_SDK_FILE', None)
+    output = subprocess.run(
+        [sys.executable, '-c', code],
+        cwd=tmp_path,
+        env=env,
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+
+    return json.loads(output)
+
+def test_import_is_side_effect_free(tmp_path):
+    """
+    Importing the package must not load the SDK or its submodules.
+    """
+    result = run_isolated(
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        "import korth_spirit\n"
+        "elapsed = time.perf_counter() - start\n"
+        "print(json.dumps({'elapsed': elapsed, 'modules': [m for m in sys.modules if m.startswith('korth_spirit.')]}))",
+        tmp_path
+    )
+
+    assert result['modules'] == []
+    assert result['elapsed'] < IMPORT_BUDGET
+
+def test_sdk_loads_on_first_call(tmp_path):
+    """
+    The public API is importable without the SDK, which only loads when called.
+    """
+    result = run_isolated(
+        "import json, sys\n"
+        "from korth_spirit import EventEnum, Instance\n"
+        "from korth_spirit.sdk import SDK, aw_wait\n"
+        "loaded = SDK.loaded\n"
+        "try:\n"
+        "    aw_wait(0)\n"
+        "    error = None\n"
+        "except OSError as e:\n"
+        "    error = type(e).__name__\n"
+        "print(json.dumps({'loaded': loaded, 'error': error, 'types': 'korth_spirit.sdk.enums.attribute_types' in sys.modules}))",
+        tmp_path
+    )
+
+    assert result == {'loaded': False, 'error': 'OSError', 'types': False}
@@ -0,0 +1,61 @@
+# Copyright (c) 2021-2022 Johnathan P. Irvin
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+from korth_spirit.events import EventBus
+from korth_spirit.events.metrics import Histogram
+from korth_spirit.sdk import EventEnum
+
+
+def test_histogram_percentiles_round_up_to_their_bucket():
+    """
+    Percentiles are within a quarter of the recorded durations.
+    """
+    histogram = Histogram()
+    for nanoseconds in range(1000, 101000, 1000):
+        histogram.record(nanoseconds)
+
+    summary = histogram.summary()
+
+    assert summary['count'] == 100
+    assert 50e-6 <= summary['p50'] <= 50e-6 * 1.25
+    assert 99e-6 <= summary['p99'] <= 100e-6
+    assert summary['max'] == 100e-6
+
+def test_instrumented_bus_counts_events_and_handlers():
+    """
+    Events are counted even without subscribers, and each handler is timed.
+    """
+    def greet(event):
+        pass
+
+    bus = EventBus().subscribe(EventEnum.AW_EVENT_AVATAR_ADD, greet)
+    assert bus.stats() == {'instrumented': False, 'published': 0}
+
+    bus.instrument()
+    for _ in range(3):
+        bus.publish(EventEnum.AW_EVENT_AVATAR_ADD)
+    bus.publish(EventEnum.AW_EVENT_CHAT)
+    stats = bus.stats()
+
+    assert stats['events']['AW_EVENT_AVATAR_ADD']['count'] == 3
+    assert stats['events']['AW_EVENT_AVATAR_ADD']['translation']['count'] == 3
+    assert stats['events']['AW_EVENT_AVATAR_ADD']['dispatch']['count'] == 3
+    assert stats['events']['AW_EVENT_CHAT']['dispatch']['count'] == 0
+    assert stats['handlers']['test_instrumented_bus_counts_events_and_handlers.<locals>.greet']['count'] == 3
@@ -0,0 +1,82 @@
+# Copyright (c) 2021-2022 Johnathan P. Irvin
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+from korth_spirit.cache import WorldObjectCache
+from korth_spirit.data import ObjectCreateData, ObjectDeleteData
+from korth_spirit.instance import Instance
+from korth_spirit.sdk import aw_wait
+
+
+def test_cache_answers_spatial_queries(simulator):
+    """
+    Box, radius and nearest queries match a search of every object.
+    """
+    world = simulator.worlds['sim']
+    everything = list(world.objects.values())
+    distance = lambda found: (found.x - 150) ** 2 + (found.z + 2300) ** 2
+
+    with Instance('Bot', domain='127.0.0.1') as bot:
+        bot.login(1, 'password').enter('sim')
+
+        with WorldObjectCache(bot) as cache:
+            box = cache.box(-1500, -3000, 2500, 1000)
+            within = cache.within(150, -2300, 1800)
+            nearest = cache.nearest(150, -2300, k=7)
+            assert cache.nearest(150, -2300, k=0) == []
+
+    assert len(cache.objects) == len(world.objects)
+    assert {found.number for found in box} == {
+        found.number for found in everything if -1500 <= found.x <= 2500 and -3000 <= found.z <= 1000
+    }
+    assert [found.number for found in within] == [
+        found.number for found in sorted(everything, key=lambda found: (distance(found), found.number))
+        if distance(found) <= 1800 ** 2
+    ]
+    assert [distance(found) for found in nearest] == sorted(map(distance, everything))[:7]
+    assert (cache.hits, cache.misses) == (4, 0)
+    assert cache.stale
+
+
+def test_cache_follows_changes_and_ages(simulator):
+    """
+    Objects other bots build and delete are applied, and an old scan is refreshed.
+    """
+    now = [0.0]
+
+    with Instance('A', domain='127.0.0.1') as a, Instance('B', domain='127.0.0.1') as b:
+        a.login(1, 'password').enter('sim')
+        b.login(2, 'password').enter('sim').move_to(0, 0, 0)
+        cache = WorldObjectCache(a, max_age=60, clock=lambda: now[0]).start()
+        before, applied = len(cache.objects), cache.applied
+
+        built = list(b.write_objects([ObjectCreateData(x=50000, y=0, z=50000, model='far.rwx')]))[0]
+        aw_wait(1)
+        assert [found.model for found in cache.nearest(50000, 50000)] == ['far.rwx']
+
+        list(b.write_objects([ObjectDeleteData(number=built.number, x=50000, z=50000)]))
+        aw_wait(1)
+        assert len(cache.objects) == before and cache.applied == applied + 2
+
+        now[0] = 61.0
+        assert cache.stale
+        cache.within(0, 0, 100)
+        assert not cache.stale and cache.stats()['misses'] == 1
+
+        cache.stop()
@@ -0,0 +1,58 @@
+# Copyright (c) 2021-2022 Johnathan P. Irvin
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+from korth_spirit.instance import Instance
+from korth_spirit.query import QueryEnum
+from korth_spirit.sdk import EventEnum
+
+
+def test_stream_yields_objects_and_cells(simulator):
+    """
+    A streamed query yields every object, or every cell, in batches as they arrive.
+    """
+    world = simulator.worlds['sim']
+    progress = []
+
+    with Instance('Bot', domain='127.0.0.1') as bot:
+        bot.login(1, 'password').enter('sim')
+
+        objects = list(bot.query(QueryEnum.OBJECT, stream=True, progress=progress.append))
+        cells = list(bot.query(QueryEnum.OBJECT, stream=True, cells=True))
+
+    assert sorted(found.id for found in objects) == sorted(world.objects)
+    assert progress[-1].cells == len(world.cells) and progress[-1].objects == len(world.objects)
+    assert progress[-1].iterator == -1
+    assert {(cell.x, cell.z) for cell in cells} == set(world.cells)
+    assert all(len(cell.objects) == len(world.cells[cell.x, cell.z]) for cell in cells)
+
+
+def test_stream_unsubscribes_when_closed_early(simulator):
+    """
+    Breaking out of a stream ends the query without leaving subscribers behind.
+    """
+    with Instance('Bot', domain='127.0.0.1') as bot:
+        bot.login(1, 'password').enter('sim')
+
+        for found in bot.query(QueryEnum.OBJECT, stream=True):
+            break
+
+        assert found.model
+        assert EventEnum.AW_EVENT_CELL_OBJECT not in bot.bus._subscribers
+        assert EventEnum.AW_EVENT_CELL_BEGIN not in bot.bus._subscribers
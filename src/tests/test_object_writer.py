@@ -0,0 +1,111 @@
+# Copyright (c) 2021-2022 Johnathan P. Irvin
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+from types import SimpleNamespace
+
+from korth_spirit.bulk import ObjectWriter, object_writer
+from korth_spirit.data import ObjectCreateData
+from korth_spirit.sdk.errors import RC_TIMEOUT
+
+
+class FakeBus:
+    def __init__(self):
+        self.subscribers = []
+
+    def subscribe(self, event, callback):
+        self.subscribers.append(callback)
+
+    def unsubscribe(self, event, callback):
+        self.subscribers.remove(callback)
+
+
+class FakeWorld:
+    """
+    Answers every request on the next wait, timing out the first attempt of object 0.
+    """
+    def __init__(self, bus):
+        self.bus = bus
+        self.pending = []
+        self.peak = 0
+        self.attempts = {}
+
+    def send(self, operation, reference):
+        self.pending.append((operation, reference))
+        self.peak = max(self.peak, len(self.pending))
+        return 0
+
+    def wait(self, milliseconds):
+        pending, self.pending = self.pending, []
+
+        for operation, reference in pending:
+            attempt = self.attempts[operation.x] = self.attempts.get(operation.x, 0) + 1
+            rc = RC_TIMEOUT if operation.x == 0 and attempt == 1 else 0
+            event = SimpleNamespace(
+                rc=rc,
+                object_callback_reference=reference,
+                object_number=operation.x,
+                object_id=operation.x + 1000,
+                cell_x=0,
+                cell_z=0,
+            )
+            for subscriber in self.bus.subscribers:
+                subscriber(event)
+
+
+def test_writer_keeps_window_and_retries(monkeypatch):
+    """
+    The writer never exceeds its window, correlates results and retries transient failures.
+    """
+    instance = SimpleNamespace(bus=FakeBus(), _instance=1)
+    world = FakeWorld(instance.bus)
+    monkeypatch.setattr(object_writer, 'send_operation', world.send)
+    monkeypatch.setattr(object_writer, 'aw_wait', world.wait)
+    monkeypatch.setattr(object_writer, 'aw_instance_set', lambda instance: None)
+
+    writer = ObjectWriter(instance, window=8, backoff=0)
+    results = list(writer.write(ObjectCreateData(x=x) for x in range(50)))
+
+    assert world.peak == 8
+    assert sorted(result.id for result in results) == [x + 1000 for x in range(50)]
+    assert all(result.ok and result.number == result.operation.x for result in results)
+    assert writer.stats.succeeded == 50
+    assert writer.stats.retried == 1
+    assert writer.stats.sent == 51
+    assert instance.bus.subscribers == []
+
+
+def test_writer_drops_results_of_a_stopped_write(monkeypatch):
+    """
+    Results left over when a consumer stops early are not yielded by the next write.
+    """
+    instance = SimpleNamespace(bus=FakeBus(), _instance=1)
+    world = FakeWorld(instance.bus)
+    monkeypatch.setattr(object_writer, 'send_operation', world.send)
+    monkeypatch.setattr(object_writer, 'aw_wait', world.wait)
+    monkeypatch.setattr(object_writer, 'aw_instance_set', lambda instance: None)
+
+    writer = ObjectWriter(instance, window=8, backoff=0)
+    results = writer.write(ObjectCreateData(x=x) for x in range(1, 50))
+    next(results)
+    results.close()
+
+    results = list(writer.write(ObjectCreateData(x=x) for x in range(100, 103)))
+
+    assert sorted(result.number for result in results) == [100, 101, 102]
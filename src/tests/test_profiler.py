@@ -0,0 +1,62 @@
+# Copyright (c) 2021-2022 Johnathan P. Irvin
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import time
+
+from korth_spirit.events import EventBus
+from korth_spirit.sdk import SDK, EventEnum, aw_wait
+from korth_spirit.sdk.profiler import Profiler
+
+
+def test_main_loop_time_is_split_between_wait_sdk_and_handlers(sdk):
+    """
+    SDK calls made by handlers within aw_wait are not counted as waiting.
+    """
+    bus = EventBus()
+    bus.subscribe(EventEnum.AW_EVENT_AVATAR_DELETE, lambda event: time.sleep(0.002) or event.avatar_name)
+    sdk.aw_int = lambda attribute: 1
+    sdk.aw_string = lambda attribute: time.sleep(0.002) or b'Bob'
+
+    def wait(milliseconds):
+        time.sleep(0.002)
+        bus.publish(EventEnum.AW_EVENT_AVATAR_DELETE)
+        return 0
+
+    sdk.aw_wait = wait
+    original = EventBus.publish
+
+    with Profiler() as profiler:
+        for _ in range(3):
+            aw_wait(0)
+            bus.flush()
+
+    assert EventBus.publish is original
+    assert SDK.aw_wait is wait
+
+    stats = profiler.stats()
+    loop = stats['main_loop']
+
+    assert stats['calls']['aw_wait']['count'] == 3
+    assert stats['calls']['aw_wait']['rcs'] == {0: 3}
+    assert stats['calls']['aw_string']['count'] == 3
+    assert 'rcs' not in stats['calls']['aw_string']
+    assert loop['iterations']['count'] == 2
+    for category in ('wait', 'sdk', 'handlers'):
+        assert 0.005 < loop[category] < 0.05
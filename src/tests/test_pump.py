@@ -0,0 +1,62 @@
+# Copyright (c) 2021-2022 Johnathan P. Irvin
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from korth_spirit.instance import pump
+from korth_spirit.instance.pump import Pump
+
+
+def test_pump_raises_its_error_from_the_next_wait(monkeypatch):
+    """
+    An error no call was waiting for is raised by the next wait, which restarts the pump.
+    """
+    failures = [RuntimeError('connection lost')]
+
+    def aw_wait(milliseconds):
+        if failures:
+            raise failures.pop()
+
+    monkeypatch.setattr(pump, 'aw_wait', aw_wait)
+    instance = SimpleNamespace(bus=SimpleNamespace(published=0, flush=lambda: None))
+
+    async def run():
+        pumping = Pump()
+        pumping.attach(instance)
+        await asyncio.sleep(0.01)
+
+        stopped = pumping._task
+        assert stopped.done() and stopped.exception() is None
+        assert pumping.pumps == 0
+
+        with pytest.raises(RuntimeError, match='connection lost'):
+            with pumping.waiting():
+                pass
+
+        with pumping.waiting():
+            await asyncio.sleep(0.01)
+
+        assert pumping._task is not stopped and not pumping._task.done()
+        assert pumping.pumps > 0
+        pumping.detach(instance)
+
+    asyncio.run(run())
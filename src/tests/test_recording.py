@@ -0,0 +1,106 @@
+# Copyright (c) 2021-2022 Johnathan P. Irvin
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+from array import array
+
+from korth_spirit.events import EventBus
+from korth_spirit.recording import EventRecorder, EventReplayer
+from korth_spirit.recording.replayer import replay_library
+from korth_spirit.sdk import SDK, AttributeEnum, EventEnum
+
+
+def test_replay_publishes_the_recorded_events(sdk, tmp_path):
+    """
+    A recorded log replays the same events, with coordinates delta encoded.
+    """
+    path = tmp_path / 'events.log'
+    values = {}
+    sdk.aw_int = lambda attribute: values.get(AttributeEnum(attribute), 0)
+    sdk.aw_string = lambda attribute: values.get(AttributeEnum(attribute), 'Bob').encode('utf-8')
+    sdk.aw_bool = lambda attribute: 0
+    clock = iter(range(0, 10**9, 10**6))
+
+    bus = EventBus()
+    with EventRecorder(bus, path, [EventEnum.AW_EVENT_AVATAR_CHANGE, EventEnum.AW_EVENT_CHAT], lambda: next(clock)) as recorder:
+        for step in range(100):
+            values.update({
+                AttributeEnum.AW_AVATAR_SESSION: step % 2,
+                AttributeEnum.AW_AVATAR_X: 100000 + step,
+                AttributeEnum.AW_AVATAR_Z: -100000 - step,
+            })
+            bus.publish(EventEnum.AW_EVENT_AVATAR_CHANGE)
+        values[AttributeEnum.AW_CHAT_MESSAGE] = 'hello'
+        bus.publish(EventEnum.AW_EVENT_CHAT)
+
+    assert recorder.recorded == 101
+    assert recorder.size < 101 * 24
+
+    received = []
+    replay_bus = EventBus()
+    replay_bus.subscribe(EventEnum.AW_EVENT_AVATAR_CHANGE, lambda e: received.append((e.avatar_session, e.avatar_x, e.avatar_z, e.avatar_name)))
+    replay_bus.subscribe(EventEnum.AW_EVENT_CHAT, lambda e: received.append(e.chat_message))
+    replayer = EventReplayer(path)
+    stats = replayer.replay(replay_bus, speed=None)
+
+    assert stats['events'] == 101
+    assert replayer.duration == 0.1
+    assert received[:2] == [(0, 100000, -100000, 'Bob'), (1, 100001, -100001, 'Bob')]
+    assert received[99:] == [(1, 100099, -100099, 'Bob'), 'hello']
+
+
+def test_replay_keeps_strings_and_typed_data(sdk, tmp_path):
+    """
+    Fields typed by ATTRIBUTE_TYPES, and terrain arrays, survive a round trip.
+    """
+    path = tmp_path / 'events.log'
+    library = replay_library()
+    SDK.use(library)
+    heights = [array('i', range(size * size)) for size in (2, 3)]
+    received = []
+
+    bus = EventBus()
+    with EventRecorder(bus, path, [EventEnum.AW_EVENT_OBJECT_CLICK, EventEnum.AW_EVENT_TERRAIN_DATA]):
+        library.values = {attribute.value: 0 for attribute in AttributeEnum}
+        library.values.update({
+            AttributeEnum.AW_AVATAR_NAME.value: b'Bob',
+            AttributeEnum.AW_OBJECT_MODEL.value: b'wall.rwx',
+            AttributeEnum.AW_OBJECT_DESCRIPTION.value: b'',
+            AttributeEnum.AW_OBJECT_ACTION.value: b'',
+            AttributeEnum.AW_OBJECT_DATA.value: b'data',
+        })
+        bus.publish(EventEnum.AW_EVENT_OBJECT_CLICK)
+
+        for size, node in zip((2, 3), heights):
+            library.values[AttributeEnum.AW_TERRAIN_NODE_SIZE.value] = size
+            library.values[AttributeEnum.AW_TERRAIN_NODE_HEIGHTS.value] = node
+            library.values[AttributeEnum.AW_TERRAIN_NODE_TEXTURES.value] = array('H', [7] * size * size)
+            bus.publish(EventEnum.AW_EVENT_TERRAIN_DATA)
+
+    replay_bus = EventBus()
+    replay_bus.subscribe(EventEnum.AW_EVENT_OBJECT_CLICK, lambda e: received.append((e.avatar_name, e.object_model, e.object_data)))
+    replay_bus.subscribe(EventEnum.AW_EVENT_TERRAIN_DATA, lambda e: received.append((e.terrain_node_heights, e.terrain_node_textures)))
+    stats = EventReplayer(path).replay(replay_bus, speed=None)
+
+    assert stats['events'] == 3
+    assert received == [
+        ('Bob', 'wall.rwx', b'data'),
+        (heights[0], array('H', [7] * 4)),
+        (heights[1], array('H', [7] * 9)),
+    ]
@@ -0,0 +1,72 @@
+# Copyright (c) 2021-2022 Johnathan P. Irvin
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import pytest
+from korth_spirit.events import ROUTER, EventBus
+from korth_spirit.sdk import EventEnum
+
+
+@pytest.fixture
+def instances(sdk):
+    """
+    Makes the fake SDK keep a current instance and per instance handlers.
+    """
+    sdk.current = None
+    sdk.handlers = {}
+
+    def instance_set(instance):
+        sdk.current = instance
+        return 0
+
+    def instance_event_set(event, handler):
+        sdk.handlers[sdk.current, event] = handler
+        return 0
+
+    sdk.aw_instance = lambda: sdk.current
+    sdk.aw_instance_set = instance_set
+    sdk.aw_instance_event_set = instance_event_set
+
+    return sdk
+
+def test_events_reach_the_bus_of_their_instance(instances, monkeypatch):
+    """
+    Buses share one handler per event type and only receive their instance's events.
+    """
+    monkeypatch.setattr(EventBus, 'publish', lambda bus, event: bus.received.append(event))
+    buses = []
+
+    for instance in (1, 2, 3):
+        bus = EventBus()
+        bus.received = []
+        bus.subscribe(EventEnum.AW_EVENT_CHAT, print)
+        bus.bind(instance)
+        buses.append(bus)
+
+    assert len({id(handler) for handler in instances.handlers.values()}) == 1
+
+    instances.current = 2
+    instances.handlers[2, EventEnum.AW_EVENT_CHAT.value]()
+
+    assert [bus.received for bus in buses] == [[], [EventEnum.AW_EVENT_CHAT], []]
+
+    for bus in buses:
+        bus.unbind()
+
+    assert ROUTER.instances == 0
@@ -0,0 +1,54 @@
+# Copyright (c) 2021-2022 Johnathan P. Irvin
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+from korth_spirit.cache import SectorSync, WorldObjectCache
+from korth_spirit.instance import Instance
+from korth_spirit.sdk.simulator import SimObject
+
+
+def test_sync_fetches_only_changes_across_restarts(simulator, tmp_path):
+    """
+    Syncing again fetches only changed cells, also after a restart from the saved state.
+    """
+    world = simulator.world('big').populate(cells=32, per_cell=2)
+    path = tmp_path / 'big.json'
+    cached = lambda cache: {number: (found.x, found.z, found.model) for number, found in cache.objects.items()}
+    actual = lambda: {number: (found.x, found.z, found.model) for number, found in world.objects.items()}
+
+    with Instance('Bot', domain='127.0.0.1') as bot:
+        bot.login(1, 'password').enter('big')
+
+        with SectorSync(WorldObjectCache(bot), path) as sync:
+            assert sync.sync_area(-2, -2, 2, 2) == len(world.cells)
+            assert cached(sync.cache) == actual()
+            assert sync.refresh() == 0
+            assert not sync.cache.stale
+
+            simulator.build(world, SimObject(x=5500, z=-7100, model='new.rwx'))
+            simulator.demolish(world, 1)
+            assert sync.refresh() == 2
+            assert cached(sync.cache) == actual()
+
+        simulator.build(world, SimObject(x=-12000, z=3000, model='offline.rwx'))
+
+        with SectorSync(WorldObjectCache(bot), path) as restarted:
+            assert restarted.cells == 1
+            assert cached(restarted.cache) == actual()
+            assert restarted.stats()['zones'] == 4
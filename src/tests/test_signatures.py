@@ -0,0 +1,61 @@
+# Copyright (c) 2021-2022 Johnathan P. Irvin
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+from ctypes import CFUNCTYPE
+from types import SimpleNamespace
+
+from korth_spirit.sdk import (SDK, AttributeEnum, aw_bool, aw_int,
+                              aw_int_set, aw_terrain_query)
+from korth_spirit.sdk.signatures import SIGNATURES
+
+
+def typed_library(**functions):
+    """
+    Builds a library of foreign functions from Python ones, bound like the SDK.
+    """
+    library = SimpleNamespace()
+    for name, function in functions.items():
+        restype, argtypes = SIGNATURES[name]
+        setattr(library, name, CFUNCTYPE(restype, *argtypes)(function))
+
+    return library
+
+
+def test_wrappers_call_functions_with_bound_argtypes(sdk):
+    """
+    The wrappers only pass values the bound argument types accept.
+    """
+    values, queries = {}, []
+    library = typed_library(
+        aw_int=lambda attribute: values.get(attribute, 0),
+        aw_bool=lambda attribute: values.get(attribute, 0),
+        aw_int_set=lambda attribute, value: values.__setitem__(attribute, value) or 0,
+        aw_terrain_query=lambda x, z, sequence: queries.append((x, z, sequence)) or 0,
+    )
+    SDK.use(library)
+
+    aw_int_set(AttributeEnum.AW_TERRAIN_COMPLETE, 1)
+    assert aw_int(AttributeEnum.AW_TERRAIN_COMPLETE) == 1
+    assert aw_bool(AttributeEnum.AW_TERRAIN_COMPLETE)
+
+    assert aw_terrain_query(1, -2, None)
+    assert aw_terrain_query(1, -2)
+    assert aw_terrain_query(3, 4, 17)
+    assert queries == [(1, -2, 0), (1, -2, 0), (3, 4, 17)]
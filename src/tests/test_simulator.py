@@ -0,0 +1,74 @@
+# Copyright (c) 2021-2022 Johnathan P. Irvin
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+from korth_spirit.data import ObjectCreateData
+from korth_spirit.instance import Instance
+from korth_spirit.query import QueryEnum
+from korth_spirit.sdk import EventEnum, aw_query, aw_wait
+from korth_spirit.sdk.simulator import ScriptedLoad
+
+
+def test_queries_see_the_simulated_world(simulator):
+    """
+    Object and terrain queries return what the world holds.
+    """
+    world = simulator.worlds['sim']
+
+    with Instance('Bot', domain='127.0.0.1') as bot:
+        bot.login(1, 'password').enter('sim')
+
+        objects = bot.query(QueryEnum.OBJECT)
+        page = bot.query(QueryEnum.TERRAIN, x=0, z=0)
+        terrain = bot.query(QueryEnum.TERRAIN)
+
+        cells = []
+        bot.bus.subscribe(EventEnum.AW_EVENT_CELL_BEGIN, lambda event: cells.append(event.cell_sequence))
+        aw_query(0, 0, [[0] * 3] * 3)
+        aw_wait(1)
+
+    assert sorted(o.number for o in objects) == sorted(world.objects)
+    assert len(page) == 16 and len(page[0].heights) == 32 * 32
+    assert len(terrain) == 4 * 16
+    assert len(cells) == len(world.cells) and all(cells)
+    assert not simulator.unsupported
+
+
+def test_bots_see_each_other(simulator):
+    """
+    Chat, avatars and built objects reach the other bots in the world.
+    """
+    seen = []
+    simulator.loads.append(ScriptedLoad([
+        (10, lambda sim: sim.add_avatar(sim.worlds['sim'], 'Visitor', x=500)),
+    ]))
+
+    with Instance('A', domain='127.0.0.1') as a, Instance('B', domain='127.0.0.1') as b:
+        a.login(1, 'password').enter('sim')
+        b.login(2, 'password').enter('sim')
+        b.bus.subscribe(EventEnum.AW_EVENT_AVATAR_ADD, lambda event: seen.append(event.avatar_name))
+        b.bus.subscribe(EventEnum.AW_EVENT_CHAT, lambda event: seen.append(event.chat_message))
+        b.bus.subscribe(EventEnum.AW_EVENT_OBJECT_ADD, lambda event: seen.append(event.object_model))
+
+        a.move_to(0, 0, 0).say('hello')
+        results = list(a.write_objects([ObjectCreateData(x=100, y=0, z=100, model='wall.rwx')]))
+        aw_wait(10)
+
+    assert results[0].rc == 0 and results[0].number in simulator.worlds['sim'].objects
+    assert seen == ['[A]', 'hello', 'wall.rwx', 'Visitor']
@@ -0,0 +1,82 @@
+# Copyright (c) 2021-2022 Johnathan P. Irvin
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import pytest
+from korth_spirit.events import EventBus
+from korth_spirit.sdk import AttributeEnum, EventEnum
+
+
+def test_filtered_subscribers_only_receive_matching_events(sdk):
+    """
+    Events go to the unfiltered subscribers and to those whose filter matches.
+    """
+    session = {'value': 420}
+    reads = []
+
+    def aw_int(attribute):
+        reads.append(AttributeEnum(attribute))
+        return session['value']
+
+    sdk.aw_int = aw_int
+    received = []
+    bus = EventBus()
+    bus.subscribe(EventEnum.AW_EVENT_CHAT, lambda event: received.append('all'))
+    for chat_session in range(100):
+        bus.subscribe(
+            EventEnum.AW_EVENT_CHAT,
+            lambda event, chat_session=chat_session: received.append(chat_session),
+            where={'chat_session': chat_session},
+        )
+
+    bus.publish(EventEnum.AW_EVENT_CHAT)
+    session['value'] = 7
+    bus.publish(EventEnum.AW_EVENT_CHAT)
+
+    assert received == ['all', 'all', 7]
+    assert reads == [AttributeEnum.AW_CHAT_SESSION] * 2
+
+    with pytest.raises(ValueError):
+        bus.subscribe(EventEnum.AW_EVENT_CHAT, print, where={'object_id': 1})
+
+def test_removing_the_last_subscription_releases_the_hook(sdk):
+    """
+    Handles remove their subscription, and the AW handler goes with the last one.
+    """
+    sdk.current = None
+    sdk.handlers = {}
+    sdk.aw_instance = lambda: sdk.current
+    sdk.aw_instance_set = lambda instance: sdk.__setattr__('current', instance) or 0
+    sdk.aw_instance_event_set = lambda event, handler: sdk.handlers.__setitem__(event, handler) or 0
+
+    bus = EventBus().bind(1)
+    first = bus.on(EventEnum.AW_EVENT_CHAT, print, where={'chat_session': 1})
+    second = bus.on(EventEnum.AW_EVENT_CHAT, print)
+    hooked = sdk.handlers[EventEnum.AW_EVENT_CHAT.value]
+
+    first.unsubscribe()
+    first.unsubscribe()
+    assert sdk.handlers[EventEnum.AW_EVENT_CHAT.value] is hooked
+
+    bus.unsubscribe(EventEnum.AW_EVENT_CHAT, print)
+    assert not second.active
+    assert sdk.handlers[EventEnum.AW_EVENT_CHAT.value] is None
+    assert not bus._subscribers
+
+    bus.unbind()
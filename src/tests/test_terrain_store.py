@@ -0,0 +1,55 @@
+# Copyright (c) 2021-2022 Johnathan P. Irvin
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import mmap
+from array import array
+
+from korth_spirit.instance import Instance
+from korth_spirit.terrain import TerrainStore
+
+
+def test_store_only_downloads_changed_pages(simulator, tmp_path):
+    """
+    Pages are mapped from disk, and synced again only when their sequence changed.
+    """
+    world = simulator.worlds['sim']
+    pages = sorted(world.pages)
+
+    with Instance('Bot', domain='127.0.0.1') as bot:
+        bot.login(1, 'password').enter('sim')
+
+        with TerrainStore(tmp_path) as store:
+            assert store.sync(bot, pages) == 4
+            assert store.sync(bot, pages) == 0 and store.skipped == 4
+
+        page = world.pages[-1, 0]
+        node = page.nodes[5]
+        node.heights = array('i', [1234] * node.size ** 2).tobytes()
+        page.sequence = world.sequence = world.sequence + 1
+
+        with TerrainStore(tmp_path) as store:
+            assert store.pages == pages
+            assert store.refresh(bot) == 1
+            assert store.sequence(-1, 0) == page.sequence
+
+            heights = store.heights(-1, 0)
+            cell = (node.z + 2) * 128 + node.x + 3
+            assert heights[cell] == 1234 and isinstance(heights.obj, mmap.mmap)
+            heights.release()